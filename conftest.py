@@ -0,0 +1,109 @@
+"""
+Shared pytest fixtures for the offline training tests.
+
+Provides deterministic synthetic OHLCV+ATR datasets so backtest and
+strategy parity tests run without a database.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+# Root-level scripts that need a live API/database are not pytest suites
+collect_ignore = [
+    'test_job_creation.py',
+    'test_progress_tracking.py',
+    'test_seed_reproducibility.py',
+    'test_sl_tp_bug.py',
+    'test_strategy_signals.py',
+    'test_training_pipeline.py',
+]
+collect_ignore_glob = ['archive/*']
+
+
+def make_synthetic_ohlcv(
+    num_candles: int = 5000,
+    seed: int = 7,
+    start_price: float = 30000.0,
+    interval_ms: int = 300_000
+) -> pd.DataFrame:
+    """
+    Build a deterministic OHLCV DataFrame with a 14-period ATR column.
+
+    Alternates calm consolidation regimes with volatile stretches and
+    injects occasional panic candles (large body + volume explosion) so
+    every training strategy produces some signals.
+    """
+    rng = np.random.default_rng(seed)
+
+    regime = np.repeat(rng.choice([0.0008, 0.003, 0.008], size=num_candles // 200 + 1), 200)[:num_candles]
+    returns = rng.normal(0, regime)
+    panic = rng.random(num_candles) < 0.004
+    returns[panic] += rng.choice([-1, 1], size=panic.sum()) * rng.uniform(0.01, 0.03, size=panic.sum())
+
+    close = start_price * np.exp(np.cumsum(returns))
+    open_ = np.concatenate([[start_price], close[:-1]])
+    body_high = np.maximum(open_, close)
+    body_low = np.minimum(open_, close)
+    high = body_high * (1 + np.abs(rng.normal(0, regime * 0.6)))
+    low = body_low * (1 - np.abs(rng.normal(0, regime * 0.6)))
+
+    volume = rng.lognormal(mean=3.0, sigma=0.4, size=num_candles)
+    volume[panic] *= rng.uniform(3, 8, size=panic.sum())
+
+    df = pd.DataFrame({
+        'timestamp': 1_700_000_000_000 + np.arange(num_candles, dtype=np.int64) * interval_ms,
+        'open': open_,
+        'high': high,
+        'low': low,
+        'close': close,
+        'volume': volume,
+    })
+
+    prev_close = df['close'].shift(1)
+    tr = np.maximum(
+        df['high'] - df['low'],
+        np.maximum((df['high'] - prev_close).abs(), (df['low'] - prev_close).abs())
+    )
+    df['atr'] = tr.rolling(window=14).mean().bfill()
+
+    return df
+
+
+@pytest.fixture
+def synthetic_ohlcv():
+    """Factory fixture: synthetic_ohlcv(num_candles, seed=...) -> DataFrame."""
+    return make_synthetic_ohlcv
+
+
+class EpisodeCounter:
+    """
+    Redis-free stand-in for rq_jobs.ProgressCallback's episode bookkeeping.
+
+    A fraction below 1.0 marks the episode in flight; 1.0 counts it as
+    completed only if it was in flight, exactly like the Redis keys.
+    """
+
+    def __init__(self):
+        self.in_flight = {}
+        self.completed_count = 0
+        self.calls = []
+
+    def __call__(self, episode_index, intra_progress, stage='signal_generation'):
+        self.calls.append((episode_index, intra_progress, stage))
+        if intra_progress >= 1.0:
+            if self.in_flight.pop(episode_index, None) is not None:
+                self.completed_count += 1
+        else:
+            self.in_flight[episode_index] = float(intra_progress)
+
+
+@pytest.fixture
+def episode_counter():
+    """Fresh EpisodeCounter (ProgressCallback-style completed counter)."""
+    return EpisodeCounter()
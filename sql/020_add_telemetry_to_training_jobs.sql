@@ -0,0 +1,17 @@
+-- Migration 020: Add telemetry column to training_jobs table
+-- Purpose: Store per-phase timing histograms (signal generation, trade
+--          simulation, metrics, strategy phases) aggregated across optimizer workers
+
+ALTER TABLE training_jobs
+ADD COLUMN IF NOT EXISTS telemetry JSONB;
+
+COMMENT ON COLUMN training_jobs.telemetry IS
+'Per-phase timing histograms from training.telemetry: {track_allocations, phases: {"<component>.<phase>": {count, total_seconds, mean_seconds, min_seconds, max_seconds, candles, candles_per_sec, alloc_peak_bytes, alloc_mean_bytes, share, histogram_ms}}}';
+
+-- Example: dominant phase per strategy and timeframe
+-- SELECT strategy, timeframe, phase.key AS phase,
+--        AVG((phase.value->>'share')::float) AS avg_share
+-- FROM training_jobs, jsonb_each(telemetry->'phases') AS phase
+-- WHERE telemetry IS NOT NULL
+-- GROUP BY strategy, timeframe, phase.key
+-- ORDER BY strategy, timeframe, avg_share DESC;
@@ -0,0 +1,24 @@
+-- Migration 021: Add Monte Carlo robustness bands to trained_configurations
+-- Purpose: Store confidence bands (net profit, max drawdown, Sharpe) from
+--          training.monte_carlo next to the point metrics of each configuration
+
+ALTER TABLE trained_configurations
+ADD COLUMN IF NOT EXISTS monte_carlo_var NUMERIC(15,2);
+
+ALTER TABLE trained_configurations
+ADD COLUMN IF NOT EXISTS monte_carlo_json JSONB;
+
+COMMENT ON COLUMN trained_configurations.monte_carlo_var IS
+'Net profit % at the 5th percentile of Monte Carlo paths (negative = loss)';
+
+COMMENT ON COLUMN trained_configurations.monte_carlo_json IS
+'Monte Carlo summary from training.monte_carlo: {n_simulations, n_trades, method, var_level, prob_loss, var_pct, cvar_pct, seconds, bands: {net_profit_pct|max_drawdown_pct|sharpe_ratio: {p5, p25, p50, p75, p95, mean, std}}}';
+
+-- Example: configurations whose pessimistic band is still profitable
+-- SELECT strategy_name, pair, timeframe, net_profit,
+--        (monte_carlo_json->'bands'->'net_profit_pct'->>'p5')::float AS net_profit_p5,
+--        (monte_carlo_json->'bands'->'max_drawdown_pct'->>'p5')::float AS max_drawdown_p5
+-- FROM trained_configurations
+-- WHERE monte_carlo_json IS NOT NULL
+--   AND (monte_carlo_json->'bands'->'net_profit_pct'->>'p5')::float > 0
+-- ORDER BY net_profit_p5 DESC;
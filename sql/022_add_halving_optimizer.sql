@@ -0,0 +1,13 @@
+-- Migration 022: Allow the successive halving optimizer on training_jobs
+-- Purpose: training.optimizers.successive_halving is registered as the
+--          'halving' job optimizer; the CHECK constraint only knew grid,
+--          random and bayesian
+
+ALTER TABLE training_jobs
+DROP CONSTRAINT IF EXISTS valid_optimizer;
+
+ALTER TABLE training_jobs
+ADD CONSTRAINT valid_optimizer CHECK (optimizer IN ('grid', 'random', 'bayesian', 'halving'));
+
+COMMENT ON COLUMN training_jobs.optimizer IS
+'Job optimizer name from training.registry: grid, random, bayesian or halving (successive halving over recent data windows)';
@@ -0,0 +1,12 @@
+-- Migration 023: Allow the TPE optimizer on training_jobs
+-- Purpose: training.optimizers.tpe is registered as the 'tpe' job
+--          optimizer
+
+ALTER TABLE training_jobs
+DROP CONSTRAINT IF EXISTS valid_optimizer;
+
+ALTER TABLE training_jobs
+ADD CONSTRAINT valid_optimizer CHECK (optimizer IN ('grid', 'random', 'bayesian', 'halving', 'tpe'));
+
+COMMENT ON COLUMN training_jobs.optimizer IS
+'Job optimizer name from training.registry: grid, random, bayesian, halving (successive halving over recent data windows) or tpe (Tree-structured Parzen Estimator with checkpoint pruning)';
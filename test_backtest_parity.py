@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Parity tests for the array-based BacktestEngine trade simulation.
+
+Replays recorded (deterministic synthetic) datasets through the original
+iterrows()-based simulation loop and the array-based core, and checks
+that both produce the same trades and exit reasons.
+
+Run with: python -m pytest -q test_backtest_parity.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from training.backtest_engine import BacktestEngine
+from training.strategies.liquidity_sweep import LiquiditySweepStrategy
+
+
+def legacy_simulate_trades(engine, data, signals, strategy_params, position_size_pct=1.0):
+    """Original per-row BacktestEngine._simulate_trades (reference implementation)."""
+    trades = []
+    current_position = None
+
+    df = data.copy()
+    df = df.merge(signals, on='timestamp', how='left')
+    df['signal'] = df['signal'].fillna('HOLD')
+
+    max_holding = strategy_params.get('max_holding_periods', 50)
+
+    for idx, row in df.iterrows():
+        timestamp = int(row['timestamp'])
+
+        if current_position is not None:
+            holding_periods = idx - current_position['entry_idx']
+            exit_price = None
+            exit_reason = None
+
+            if current_position['side'] == 'LONG':
+                if row['low'] <= current_position['stop_loss']:
+                    exit_price = current_position['stop_loss']
+                    exit_reason = 'SL'
+                elif row['high'] >= current_position['take_profit']:
+                    exit_price = current_position['take_profit']
+                    exit_reason = 'TP'
+            else:
+                if row['high'] >= current_position['stop_loss']:
+                    exit_price = current_position['stop_loss']
+                    exit_reason = 'SL'
+                elif row['low'] <= current_position['take_profit']:
+                    exit_price = current_position['take_profit']
+                    exit_reason = 'TP'
+
+            if exit_price is None and holding_periods >= max_holding:
+                exit_price = row['close']
+                exit_reason = 'MAX_HOLD'
+
+            if exit_price is None and row['signal'] in ['BUY', 'SELL']:
+                if (row['signal'] == 'SELL' and current_position['side'] == 'LONG') or \
+                   (row['signal'] == 'BUY' and current_position['side'] == 'SHORT'):
+                    exit_price = row['close']
+                    exit_reason = 'SIGNAL'
+
+            if exit_price is not None:
+                trades.append(engine._execute_exit(
+                    position=current_position,
+                    exit_time=timestamp,
+                    exit_price=exit_price,
+                    exit_reason=exit_reason,
+                    holding_periods=holding_periods
+                ))
+                current_position = None
+
+        if current_position is None and row['signal'] in ['BUY', 'SELL']:
+            current_position = engine._execute_entry(
+                entry_idx=idx,
+                entry_time=timestamp,
+                entry_price=row['close'],
+                side='LONG' if row['signal'] == 'BUY' else 'SHORT',
+                stop_loss=row.get('stop_loss', 0),
+                take_profit=row.get('take_profit', 0),
+                atr=row['atr'],
+                position_size_pct=position_size_pct
+            )
+
+    if current_position is not None:
+        last_row = df.iloc[-1]
+        trades.append(engine._execute_exit(
+            position=current_position,
+            exit_time=int(last_row['timestamp']),
+            exit_price=last_row['close'],
+            exit_reason='END_OF_DATA',
+            holding_periods=len(df) - 1 - current_position['entry_idx']
+        ))
+
+    return trades
+
+
+def random_signals(data, seed, density=0.02, sl_mult=1.5, rr=2.0, start=50):
+    """Random BUY/SELL signals with ATR-based SL/TP (exercises every exit path)."""
+    rng = np.random.default_rng(seed)
+    sub = data.iloc[start:]
+    draws = rng.random(len(sub))
+    signal = np.where(draws < density / 2, 'BUY', np.where(draws < density, 'SELL', 'HOLD'))
+    close = sub['close'].to_numpy()
+    atr = sub['atr'].to_numpy()
+    direction = np.where(signal == 'BUY', 1.0, np.where(signal == 'SELL', -1.0, 0.0))
+
+    return pd.DataFrame({
+        'timestamp': sub['timestamp'].to_numpy(),
+        'signal': signal,
+        'stop_loss': np.where(direction != 0, close - direction * atr * sl_mult, 0.0),
+        'take_profit': np.where(direction != 0, close + direction * atr * sl_mult * rr, 0.0),
+    })
+
+
+def assert_trades_equal(actual, expected):
+    assert len(actual) == len(expected)
+    for got, ref in zip(actual, expected):
+        assert got.entry_time == ref.entry_time
+        assert got.exit_time == ref.exit_time
+        assert got.side == ref.side
+        assert got.exit_reason == ref.exit_reason
+        assert got.holding_periods == ref.holding_periods
+        assert got.entry_price == pytest.approx(ref.entry_price, rel=1e-12)
+        assert got.exit_price == pytest.approx(ref.exit_price, rel=1e-12)
+        assert got.size == pytest.approx(ref.size, rel=1e-12)
+        assert got.pnl == pytest.approx(ref.pnl, rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+@pytest.mark.parametrize('max_holding', [5, 30, 200, 10_000])
+def test_random_signal_parity(synthetic_ohlcv, seed, max_holding):
+    data = synthetic_ohlcv(4000, seed=seed)
+    signals = random_signals(data, seed=seed + 100, density=0.05)
+    params = {'max_holding_periods': max_holding}
+    engine = BacktestEngine()
+
+    expected = legacy_simulate_trades(engine, data, signals, params)
+    actual = engine._simulate_trades(data, signals, params, position_size_pct=1.0)
+
+    assert_trades_equal(actual, expected)
+    assert {t.exit_reason for t in expected} >= {'SL', 'TP'}
+
+
+def test_exit_reason_coverage(synthetic_ohlcv):
+    data = synthetic_ohlcv(3000, seed=11)
+    # Wide SL/TP + short max hold forces MAX_HOLD and SIGNAL exits
+    signals = random_signals(data, seed=5, density=0.2, sl_mult=50.0)
+    params = {'max_holding_periods': 8}
+    engine = BacktestEngine()
+
+    expected = legacy_simulate_trades(engine, data, signals, params, position_size_pct=0.5)
+    actual = engine._simulate_trades(data, signals, params, position_size_pct=0.5)
+
+    assert_trades_equal(actual, expected)
+    assert {t.exit_reason for t in expected} >= {'MAX_HOLD', 'SIGNAL'}
+
+
+def test_end_of_data_and_no_signals(synthetic_ohlcv):
+    data = synthetic_ohlcv(500, seed=4)
+    engine = BacktestEngine()
+
+    empty = pd.DataFrame({'timestamp': data['timestamp'], 'signal': 'HOLD',
+                          'stop_loss': 0.0, 'take_profit': 0.0})
+    assert engine._simulate_trades(data, empty, {}, 1.0) == []
+
+    last = empty.copy()
+    last.loc[len(last) - 3, ['signal', 'stop_loss', 'take_profit']] = ['BUY', 1.0, 1e9]
+    expected = legacy_simulate_trades(engine, data, last, {})
+    actual = engine._simulate_trades(data, last, {}, 1.0)
+    assert_trades_equal(actual, expected)
+    assert actual[-1].exit_reason == 'END_OF_DATA'
+
+
+def test_strategy_signal_parity(synthetic_ohlcv):
+    data = synthetic_ohlcv(3000, seed=21)
+    params = {
+        'pierce_depth': 0.0005,
+        'volume_spike_threshold': 1.5,
+        'reversal_candles': 1,
+        'min_distance_from_level': 0.003,
+        'atr_multiplier_sl': 1.5,
+        'risk_reward_ratio': 2.0,
+        'max_holding_periods': 30,
+        'key_level_lookback': 50,
+        'min_level_touches': 2,
+    }
+    strategy = LiquiditySweepStrategy(params)
+    signals = strategy.generate_signals(data)
+    engine = BacktestEngine()
+
+    expected = legacy_simulate_trades(engine, data, signals, params)
+    actual = engine._simulate_trades(data, signals, params, position_size_pct=1.0)
+
+    assert_trades_equal(actual, expected)
+
+
+def test_run_batch_matches_run_backtest(synthetic_ohlcv):
+    data = synthetic_ohlcv(1500, seed=8)
+    engine = BacktestEngine()
+    params_list = [
+        {'pierce_depth': 0.0005, 'volume_spike_threshold': 1.5, 'reversal_candles': rc,
+         'min_distance_from_level': 0.003, 'max_holding_periods': hold,
+         'key_level_lookback': 50, 'min_level_touches': 2}
+        for rc, hold in [(1, 30), (2, 75), (1, 150)]
+    ]
+
+    signals_list = [LiquiditySweepStrategy(p).generate_signals(data) for p in params_list]
+    batch_metrics = engine.run_batch(
+        data, engine.build_signal_matrix(data, signals_list), params_list
+    )
+
+    for params, metrics in zip(params_list, batch_metrics):
+        single = engine.run_backtest(data, LiquiditySweepStrategy(params))
+        assert metrics == single.metrics
+
+
+def test_lazy_backtest_result(synthetic_ohlcv):
+    import pickle
+
+    data = synthetic_ohlcv(1500, seed=8)
+    signals = random_signals(data, seed=9, density=0.05)
+    engine = BacktestEngine()
+    params = {'max_holding_periods': 30}
+
+    class FixedSignals:
+        def __init__(self, params):
+            self.params = params
+
+        def generate_signals(self, data, progress_callback=None):
+            return signals
+
+    result = engine.run_backtest(data, FixedSignals(params))
+    expected = legacy_simulate_trades(engine, data, signals, params)
+
+    # Metrics come straight from the trade log arrays
+    assert result.metrics == engine._calculate_metrics(expected, data)
+
+    restored = pickle.loads(pickle.dumps(result))
+    assert_trades_equal(restored.trades, expected)
+    pd.testing.assert_frame_equal(
+        restored.equity_curve.astype({'timestamp': 'int64'}),
+        engine._generate_equity_curve(expected, data).astype({'timestamp': 'int64'})
+    )
+
+
+def test_budget_pruning(synthetic_ohlcv):
+    from training.backtest_engine import BacktestBudget
+
+    data = synthetic_ohlcv(3000, seed=12)
+    signals = random_signals(data, seed=13, density=0.05)
+    engine = BacktestEngine()
+    params = {'max_holding_periods': 30}
+
+    class FixedSignals:
+        def __init__(self, params):
+            self.params = params
+
+        def generate_signals(self, data, progress_callback=None):
+            return signals
+
+    full = engine.run_backtest(data, FixedSignals(params))
+    assert not full.pruned
+
+    # Budgets the full run satisfies leave the result untouched
+    loose = BacktestBudget(max_drawdown_pct=1000.0, min_trades=1,
+                           objective='net_profit_pct',
+                           best_objective=full.metrics['net_profit_pct'] - 1)
+    assert engine.run_backtest(data, FixedSignals(params), budget=loose).metrics == full.metrics
+
+    # Drawdown breach stops early with a prefix of the full trade log
+    dd = engine.run_backtest(data, FixedSignals(params),
+                             budget=BacktestBudget(max_drawdown_pct=0.5))
+    assert dd.pruned and dd.prune_reason == 'max_drawdown' and dd.metrics['pruned']
+    assert 0 < len(dd.trade_log) < len(full.trade_log)
+    assert_trades_equal(dd.trades, full.trades[:len(dd.trades)])
+
+    # Unreachable min_trades and an unbeatable best objective
+    few = engine.run_backtest(data, FixedSignals(params),
+                              budget=BacktestBudget(min_trades=10_000))
+    assert few.prune_reason == 'min_trades' and len(few.trade_log) == 0
+    for objective in ('net_profit_pct', 'total_trades'):
+        bound = engine.run_backtest(data, FixedSignals(params), budget=BacktestBudget(
+            objective=objective, best_objective=full.metrics[objective] + 1e6))
+        assert bound.prune_reason == 'objective_bound'
+        assert len(bound.trade_log) < len(full.trade_log)
+
+
+def test_intrabar_resolution(synthetic_ohlcv, tmp_path):
+    import pickle
+    from training.intrabar import IntrabarData
+
+    minute = synthetic_ohlcv(20_000, seed=21, interval_ms=60_000)
+    bars = minute.groupby(np.arange(len(minute)) // 5).agg(
+        {'timestamp': 'first', 'open': 'first', 'high': 'max',
+         'low': 'min', 'close': 'last', 'volume': 'sum'}
+    )
+    bars['atr'] = (bars['high'] - bars['low']).rolling(14).mean().bfill()
+
+    path = str(tmp_path / 'BTC_USDT_1m.npy')
+    IntrabarData.save(path, minute)
+    intrabar = pickle.loads(pickle.dumps(IntrabarData(path)))
+    assert len(intrabar) == len(minute)
+
+    # Tight SL/TP so many bars touch both levels
+    signals = random_signals(bars, seed=22, density=0.05, sl_mult=0.4, rr=1.0)
+    params = {'max_holding_periods': 30}
+    plain = BacktestEngine()._simulate_trades(bars, signals, params, position_size_pct=1.0)
+    resolved = BacktestEngine(intrabar=intrabar)._simulate_trades(bars, signals, params, position_size_pct=1.0)
+
+    def first_level_1m(trade, sl, tp):
+        window = minute[(minute['timestamp'] >= trade.exit_time) &
+                        (minute['timestamp'] < trade.exit_time + 300_000)]
+        for _, row in window.iterrows():
+            sl_hit = row['low'] <= sl if trade.side == 'LONG' else row['high'] >= sl
+            tp_hit = row['high'] >= tp if trade.side == 'LONG' else row['low'] <= tp
+            if sl_hit or tp_hit:
+                return 'SL' if sl_hit else 'TP'
+
+    sl_tp = signals.set_index('timestamp')[['stop_loss', 'take_profit']]
+    ambiguous = 0
+    for trade in resolved:
+        sl, tp = sl_tp.loc[trade.entry_time]
+        bar = bars[bars['timestamp'] == trade.exit_time].iloc[0]
+        if trade.exit_reason in ('SL', 'TP') and bar['low'] <= min(sl, tp) and bar['high'] >= max(sl, tp):
+            ambiguous += 1
+            assert trade.exit_reason == first_level_1m(trade, sl, tp)
+
+    assert ambiguous > 0
+    assert sum(t.exit_reason == 'TP' for t in resolved) > sum(t.exit_reason == 'TP' for t in plain)
+    # Trades before the first ambiguous bar are unaffected
+    first_diff = next(i for i, (a, b) in enumerate(zip(resolved, plain)) if a.exit_reason != b.exit_reason)
+    assert_trades_equal(resolved[:first_diff], plain[:first_diff])
+
+
+def test_mark_to_market_equity(synthetic_ohlcv):
+    data = synthetic_ohlcv(3000, seed=31)
+    signals = random_signals(data, seed=32, density=0.03, sl_mult=4.0)
+    params = {'max_holding_periods': 120}
+
+    class FixedSignals:
+        def __init__(self, params):
+            self.params = params
+
+        def generate_signals(self, data, progress_callback=None):
+            return signals
+
+    plain = BacktestEngine().run_backtest(data, FixedSignals(params))
+    engine = BacktestEngine(mark_to_market=True)
+    result = engine.run_backtest(data, FixedSignals(params))
+
+    # Per-candle reference: realized P&L at exit plus open position marked at close
+    ts = data['timestamp'].to_numpy()
+    close = data['close'].to_numpy()
+    expected = np.full(len(data), engine.initial_capital)
+    for t in result.trades:
+        entry, exit_ = np.searchsorted(ts, [t.entry_time, t.exit_time])
+        direction = 1 if t.side == 'LONG' else -1
+        expected[exit_:] += t.pnl
+        for k in range(entry, exit_):
+            expected[k] += t.size * (direction * (close[k] - t.entry_price) / t.entry_price - engine.fee_rate)
+
+    curve = result.equity_curve
+    assert len(curve) == len(data) and result.bar_equity.dtype == np.float32
+    np.testing.assert_allclose(curve['equity'].to_numpy(), expected, rtol=1e-6)
+
+    assert result.trades == plain.trades
+    assert result.metrics['net_profit_pct'] == plain.metrics['net_profit_pct']
+    assert result.metrics['max_drawdown_pct'] <= plain.metrics['max_drawdown_pct']
+
+    # Downsampled storage keeps full-resolution metrics
+    coarse = BacktestEngine(mark_to_market=True, equity_downsample=60).run_backtest(data, FixedSignals(params))
+    assert coarse.metrics == result.metrics
+    assert len(coarse.equity_curve) == 51
+    assert coarse.equity_curve['timestamp'].iloc[-1] == ts[-1]
+
+    batch = engine.run_batch(data, engine.build_signal_matrix(data, [signals]), [params])
+    assert batch[0] == result.metrics
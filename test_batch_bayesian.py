@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for batched ask/tell Bayesian optimization (BayesianOptimizer with
+points_per_round > 1).
+
+Run with: python -m pytest -q test_batch_bayesian.py
+"""
+
+import pytest
+
+pytest.importorskip('skopt')
+
+from training.backtest_engine import BacktestEngine
+from training.optimizers.bayesian import BayesianOptimizer
+from training.strategies.liquidity_sweep import LiquiditySweepStrategy
+
+
+SPACE = {'reversal_candles': [1, 2, 3], 'pierce_depth': (0.0003, 0.003), 'key_level_lookback': (30, 80)}
+
+
+def run(data, **kwargs):
+    return BayesianOptimizer(random_state=3, verbose=False).optimize(
+        backtest_engine=BacktestEngine(),
+        data=data,
+        strategy_class=LiquiditySweepStrategy,
+        parameter_space=SPACE,
+        n_calls=10,
+        n_initial_points=4,
+        min_trades=0,
+        **kwargs
+    )
+
+
+def test_single_point_rounds_match_gp_minimize(synthetic_ohlcv):
+    data = synthetic_ohlcv(2000, seed=2)
+    optimizer = BayesianOptimizer(random_state=3, verbose=False)
+    dimensions, names = optimizer._build_skopt_space(SPACE)
+
+    result, _ = optimizer._optimize_batched(
+        BacktestEngine(), data, LiquiditySweepStrategy, dimensions, names, [],
+        n_calls=10, n_initial_points=4, objective='sharpe_ratio', min_trades=0,
+        acq_func='gp_hedge', progress_callback=None, n_workers=1, points_per_round=1,
+        liar_strategy='cl_min', early_abort=False, max_drawdown_pct=None,
+        track_allocations=False, evaluation_cache=None
+    )
+
+    assert [-y for y in result.func_vals] == run(data, points_per_round=1)['convergence_trace']
+
+
+@pytest.mark.parametrize('n_candles, data_seed, points_per_round, budget', [
+    (2000, 2, 3, {}),
+    # Bounded objective: points are pruned against earlier rounds only
+    (3000, 5, 4, {'objective': 'net_profit_pct', 'early_abort': True})
+])
+def test_rounds_are_seeded_and_independent_of_workers(synthetic_ohlcv, n_candles, data_seed, points_per_round, budget):
+    data = synthetic_ohlcv(n_candles, seed=data_seed)
+
+    inline = run(data, n_jobs=1, points_per_round=points_per_round, **budget)
+    parallel = run(data, n_jobs=2, points_per_round=points_per_round, **budget)
+    again = run(data, n_jobs=2, points_per_round=points_per_round, **budget)
+
+    assert inline['points_per_round'] == points_per_round
+    assert len(inline['convergence_trace']) == 10
+    assert parallel['convergence_trace'] == inline['convergence_trace'] == again['convergence_trace']
+    assert parallel['best_parameters'] == inline['best_parameters']
+
+
+def test_progress_callback_contract(synthetic_ohlcv):
+    data = synthetic_ohlcv(2000, seed=2)
+    calls = []
+    result = run(data, n_jobs=1, points_per_round=4, progress_callback=lambda *args: calls.append(args))
+
+    # Per-episode completion (0-indexed), then (iteration, total, score) per evaluation
+    completed = [args[0] for args in calls if args[1:] == (1.0, 'completed')]
+    finished = [args for args in calls if args[1] == 10]
+    assert sorted(completed) == list(range(10))
+    assert [args[0] for args in finished] == list(range(1, 11))
+    assert [args[2] for args in finished] == result['convergence_trace']
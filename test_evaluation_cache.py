@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent cross-job evaluation cache (training.evaluation_cache).
+
+Run with: python -m pytest -q test_evaluation_cache.py
+"""
+
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from training.backtest_engine import BacktestEngine
+from training import backtest_engine
+from training.evaluation_cache import EvaluationCache, params_hash
+from training.optimizers.batch_evaluation import evaluate_batch
+from training.optimizers.random_search import RandomSearchOptimizer
+from training.source_digest import module_sources
+from training.strategies import CapitulationReversalStrategy, LiquiditySweepStrategy
+
+
+SPACE = {'reversal_candles': [1, 2], 'key_level_lookback': [40, 60],
+         'min_level_touches': [2], 'pierce_depth': [0.0005, 0.001]}
+
+
+def search(data, scope, n_jobs=1, seed=5):
+    return RandomSearchOptimizer(seed=seed, verbose=False).optimize(
+        backtest_engine=BacktestEngine(),
+        data=data,
+        strategy_class=LiquiditySweepStrategy,
+        parameter_space=SPACE,
+        n_iterations=8,
+        min_trades=0,
+        n_jobs=n_jobs,
+        batch_size=2,
+        evaluation_cache=scope
+    )
+
+
+def sorted_results(result):
+    return result['all_results'].sort_values('objective_value').reset_index(drop=True)
+
+
+def test_params_hash_is_canonical():
+    assert params_hash({'a': 1, 'b': 0.5}) == params_hash({'b': np.float64(0.5), 'a': np.int64(1)})
+    assert params_hash({'a': 0.1}) != params_hash({'a': 0.1 + 1e-12})
+
+
+def test_code_version_follows_training_imports():
+    sources = {path.name for path in module_sources([Path(backtest_engine.__file__)])}
+
+    # Imported by the engine and the strategy context, not listed by hand
+    assert {'trade_simulator.py', 'intrabar.py', 'feature_cache.py', 'telemetry.py', 'signals.py'} <= sources
+    assert 'rq_jobs.py' not in sources
+
+
+def test_scope_covers_data_engine_filter_and_strategy(synthetic_ohlcv, tmp_path):
+    cache = EvaluationCache(str(tmp_path / 'cache.sqlite'))
+    data = synthetic_ohlcv(500, seed=1)
+    changed = data.copy()
+    changed.loc[10, 'close'] *= 1.001
+
+    base = cache.scope(LiquiditySweepStrategy, data, BacktestEngine()).prefix
+    assert base == cache.scope(LiquiditySweepStrategy, data.copy(), BacktestEngine()).prefix
+    assert base != cache.scope(LiquiditySweepStrategy, changed, BacktestEngine()).prefix
+    assert base != cache.scope(LiquiditySweepStrategy, data, BacktestEngine(fee_rate=0.002)).prefix
+    assert base != cache.scope(LiquiditySweepStrategy, data, BacktestEngine(), {'enable_filtering': True}).prefix
+    assert base != cache.scope(CapitulationReversalStrategy, data, BacktestEngine()).prefix
+
+
+def test_resubmitted_search_is_served_from_cache(synthetic_ohlcv, tmp_path):
+    data = synthetic_ohlcv(2000, seed=2)
+    scope = EvaluationCache(str(tmp_path / 'cache.sqlite')).scope(LiquiditySweepStrategy, data, BacktestEngine())
+
+    first = search(data, scope)
+    second = search(data, pickle.loads(pickle.dumps(scope)))
+    assert first['evaluation_cache']['hits'] == 0
+    assert second['evaluation_cache'] == {'hits': first['evaluation_cache']['misses'], 'misses': 0, 'hit_rate': 1.0}
+    assert 'backtest.signals' not in second['telemetry']['phases']
+    pd.testing.assert_frame_equal(sorted_results(second), sorted_results(first))
+
+    # loky workers open the same file and report their hits
+    parallel = search(data, scope, n_jobs=2)
+    assert parallel['evaluation_cache']['hit_rate'] == 1.0
+    pd.testing.assert_frame_equal(sorted_results(parallel), sorted_results(first))
+
+    # Overlapping search (another seed): only new configurations run
+    other = search(data, scope, seed=11)
+    assert other['evaluation_cache']['hits'] > 0
+
+
+def test_pruned_metrics_are_not_stored(tmp_path):
+    scope = EvaluationCache(str(tmp_path / 'cache.sqlite')).scope(
+        LiquiditySweepStrategy, pd.DataFrame({'close': [1.0]}), BacktestEngine()
+    )
+    scope.put({'a': 1}, {'total_trades': 0, 'pruned': True})
+    scope.put({'a': 2}, {'total_trades': 3, 'sharpe_ratio': float('inf')})
+
+    assert scope.get({'a': 1}) is None
+    assert scope.get({'a': 2}) == {'total_trades': 3, 'sharpe_ratio': float('inf')}
+
+
+def test_row_budget_drops_least_recently_used(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    cache = EvaluationCache(path)
+    for n in range(5):
+        cache.put_many([(f"k{n}", {'n': n})])
+    cache.get_many(['k0'])  # refresh k0
+    cache.close()
+
+    bounded = EvaluationCache(path, max_rows=2)
+    assert len(bounded) == 2
+    assert set(bounded.get_many([f"k{n}" for n in range(5)])) == {'k0', 'k4'}
+
+
+def test_broken_store_is_a_miss(tmp_path):
+    cache = EvaluationCache(str(tmp_path))  # a directory, not a database
+    cache.put_many([('k', {'n': 1})])
+    assert cache.get_many(['k']) == {}
+
+
+def test_cache_hits_advance_completed_count(synthetic_ohlcv, tmp_path, episode_counter):
+    data = synthetic_ohlcv(1500, seed=3)
+    scope = EvaluationCache(str(tmp_path / 'cache.sqlite')).scope(LiquiditySweepStrategy, data, BacktestEngine())
+    batch = list(enumerate([{'reversal_candles': 1}, {'reversal_candles': 2}, {'pierce_depth': 0.002}]))
+
+    first = evaluate_batch(BacktestEngine(), data, LiquiditySweepStrategy, batch, 'sharpe_ratio', 0, cache=scope)
+    second = evaluate_batch(BacktestEngine(), data, LiquiditySweepStrategy, batch, 'sharpe_ratio', 0,
+                            progress_callback=episode_counter, cache=scope)
+
+    assert all(stage == 'cached' for _, fraction, stage in episode_counter.calls if fraction < 1.0)
+    assert episode_counter.completed_count == len(batch)
+    assert [result['objective_value'] for result in second] == [result['objective_value'] for result in first]
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for the cross-iteration indicator cache (training.feature_cache).
+
+Run with: python -m pytest -q test_feature_cache.py
+"""
+
+import os
+import pickle
+
+import numpy as np
+import pytest
+from joblib import Parallel, delayed
+
+from training import feature_cache
+from training.feature_cache import FeatureCache, dataset_fingerprint, feature_code_version
+from training.strategies import (
+    LiquiditySweepStrategy,
+    CapitulationReversalStrategy,
+    FailedBreakdownStrategy
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Process-wide cache in a temporary directory (restored afterwards)."""
+    previous = feature_cache._default_cache
+    cache = FeatureCache(directory=str(tmp_path / 'features'))
+    feature_cache.set_feature_cache(cache)
+    yield cache
+    feature_cache.set_feature_cache(previous)
+
+
+def lookup(cache, fingerprint):
+    """Worker-side read of an entry written by the parent process."""
+    return cache.get_or_compute(fingerprint, 'x', {}, lambda: np.zeros(1)).sum(), cache.hits
+
+
+def test_get_or_compute_hits_read_only_entry(tmp_path):
+    cache = FeatureCache(directory=str(tmp_path))
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return np.arange(100, dtype=np.float64)
+
+    first = cache.get_or_compute('fp', 'ma', {'window': 20}, compute)
+    second = cache.get_or_compute('fp', 'ma', {'window': 20}, compute)
+    other = cache.get_or_compute('fp', 'ma', {'window': 50}, compute)
+
+    assert len(calls) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+    np.testing.assert_array_equal(first, second)
+    np.testing.assert_array_equal(first, other)
+    assert not second.flags.writeable
+
+
+def test_code_version_is_part_of_the_key(tmp_path):
+    cache = FeatureCache(directory=str(tmp_path))
+    edited = FeatureCache(directory=str(tmp_path), version='edited')
+    cache.get_or_compute('fp', 'ma', {}, lambda: np.zeros(10))
+
+    values = edited.get_or_compute('fp', 'ma', {}, lambda: np.ones(10))
+
+    assert cache.version == feature_code_version()
+    assert edited.misses == 1 and values.sum() == 10.0
+    assert pickle.loads(pickle.dumps(edited)).version == 'edited'
+
+
+def test_lru_eviction_by_bytes(tmp_path):
+    entry = np.zeros(1000)  # 8000 bytes + .npy header
+    cache = FeatureCache(directory=str(tmp_path), max_bytes=3 * 8200)
+
+    for name in ('a', 'b', 'c'):
+        cache.get_or_compute('fp', name, {}, lambda: entry)
+        os.utime(cache._path(cache._key('fp', name, {})), ns=(0, {'a': 1, 'b': 2, 'c': 3}[name]))
+
+    # Refresh 'a', so 'b' is the least recently used entry
+    cache.get_or_compute('fp', 'a', {}, lambda: entry)
+    cache.get_or_compute('fp', 'd', {}, lambda: entry)
+
+    stored = {os.path.basename(path) for path, _, _ in cache._entries()}
+    assert stored == {f"{cache._key('fp', name, {})}.npy" for name in ('a', 'c', 'd')}
+    assert cache.size_bytes() <= cache.max_bytes
+
+
+def test_worker_processes_share_entries(tmp_path):
+    cache = FeatureCache(directory=str(tmp_path))
+    cache.get_or_compute('fp', 'x', {}, lambda: np.ones(10))
+
+    results = Parallel(n_jobs=2, backend='loky')(delayed(lookup)(cache, 'fp') for _ in range(2))
+
+    assert results == [(10.0, 1), (10.0, 1)]
+
+
+def test_fingerprint_tracks_content(synthetic_ohlcv):
+    data = synthetic_ohlcv(500, seed=1)
+    changed = data.copy()
+    changed.loc[100, 'close'] *= 1.001
+
+    assert dataset_fingerprint(data) == dataset_fingerprint(data.copy())
+    assert dataset_fingerprint(data) != dataset_fingerprint(changed)
+
+
+@pytest.mark.parametrize('strategy_class, params', [
+    (LiquiditySweepStrategy, {'pierce_depth': 0.0005, 'volume_spike_threshold': 1.5, 'reversal_candles': 1,
+                              'min_distance_from_level': 0.003, 'key_level_lookback': 50, 'min_level_touches': 2}),
+    (CapitulationReversalStrategy, {'volume_explosion_threshold': 1.5, 'price_velocity_threshold': 0.006,
+                                    'atr_explosion_threshold': 1.3, 'exhaustion_wick_ratio': 1.5,
+                                    'rsi_extreme_threshold': 35, 'lookback_periods': 50}),
+    (FailedBreakdownStrategy, {'range_lookback_periods': 30, 'range_tightness_threshold': 0.15,
+                               'breakdown_depth': 0.002, 'breakdown_volume_threshold': 0.9,
+                               'spring_max_duration': 20, 'recovery_volume_threshold': 1.0,
+                               'accumulation_score_minimum': 0.2}),
+])
+def test_strategies_identical_through_cache(cache, synthetic_ohlcv, strategy_class, params):
+    data = synthetic_ohlcv(1500, seed=2)
+
+    feature_cache.set_feature_cache(None)
+    uncached = strategy_class(params).generate_signals(data)
+
+    feature_cache.set_feature_cache(cache)
+    cold = strategy_class(params).generate_signals(data)
+    misses = cache.misses
+    warm = strategy_class(params).generate_signals(data)
+
+    assert misses > 0
+    assert cache.misses == misses and cache.hits >= misses
+    assert (uncached['signal'] != 'HOLD').sum() > 0
+    for signals in (cold, warm):
+        assert signals.equals(uncached)
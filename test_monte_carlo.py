@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for Monte Carlo robustness bands (training.monte_carlo).
+
+Run with: python -m pytest -q test_monte_carlo.py
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from training.backtest_engine import BacktestEngine, BacktestResult, TradeLog
+from training.monte_carlo import MonteCarloAnalyzer, BAND_METRICS
+
+
+def make_result(n_trades: int, seed: int = 0) -> BacktestResult:
+    """BacktestResult with random per-trade returns at a fixed position size."""
+    rng = np.random.default_rng(seed)
+    pnl_pct = rng.normal(0.002, 0.02, n_trades)
+    size = np.full(n_trades, 2000.0)
+
+    trade_log = TradeLog.empty()
+    trade_log.pnl_pct = pnl_pct
+    trade_log.size = size
+    trade_log.pnl = size * pnl_pct
+    trade_log.holding_periods = np.ones(n_trades, dtype=np.int64)
+
+    engine = BacktestEngine(initial_capital=10000.0)
+    metrics = engine._metrics_from_trade_log(trade_log)
+    return BacktestResult(metrics, {}, trade_log, engine.initial_capital, 0)
+
+
+def test_shuffle_without_cost_noise_keeps_point_metrics():
+    result = make_result(200)
+    mc = MonteCarloAnalyzer(
+        n_simulations=500, method='shuffle', fee_jitter=0, slippage_jitter=0, seed=1
+    ).analyze(result)
+
+    # Order does not change net profit or Sharpe, only the drawdown path
+    for metric in ('net_profit_pct', 'sharpe_ratio'):
+        band = mc.bands[metric]
+        assert band['p5'] == band['p95'] == pytest.approx(result.metrics[metric], abs=0.01)
+
+    drawdown = mc.bands['max_drawdown_pct']
+    assert drawdown['p5'] <= result.metrics['max_drawdown_pct'] <= drawdown['p95'] <= 0
+
+
+def test_bands_ordered_and_deterministic():
+    result = make_result(300)
+    analyzer = MonteCarloAnalyzer(n_simulations=2000, seed=7)
+
+    first = analyzer.analyze(result)
+    second = analyzer.analyze(result)
+    assert first.bands == second.bands
+
+    for metric in BAND_METRICS:
+        band = first.bands[metric]
+        assert band['p5'] <= band['p25'] <= band['p50'] <= band['p75'] <= band['p95']
+
+    assert first.var_pct == pytest.approx(first.bands['net_profit_pct']['p5'], abs=0.01)
+    assert first.cvar_pct <= first.var_pct
+    assert 0 <= first.prob_loss <= 1
+
+
+def test_empty_trade_log():
+    result = BacktestResult({'total_trades': 0}, {}, TradeLog.empty(), 10000.0, 0)
+    mc = MonteCarloAnalyzer(n_simulations=100, seed=1).analyze(result)
+
+    assert mc.n_trades == 0
+    assert mc.prob_loss == 0
+    assert all(band['p50'] == 0 for band in mc.bands.values())
+
+
+def test_ten_thousand_simulations_fast():
+    result = make_result(500)
+    analyzer = MonteCarloAnalyzer(n_simulations=10_000, seed=3)
+    analyzer.analyze(make_result(10))  # warm-up
+
+    start = time.perf_counter()
+    mc = analyzer.analyze(result)
+    elapsed = time.perf_counter() - start
+
+    assert mc.n_simulations == 10_000
+    assert elapsed < 1.0
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for the lazy strategy / optimizer registry (training.registry).
+
+Run with: python -m pytest -q test_registry.py
+"""
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from training import registry
+
+
+def test_builtin_strategies():
+    assert registry.available_strategies()[:3] == ['LIQUIDITY_SWEEP', 'CAPITULATION_REVERSAL', 'FAILED_BREAKDOWN']
+    assert registry.strategy_spec('FAILED_BREAKDOWN').min_trades == 3
+    assert registry.strategy_spec('LIQUIDITY_SWEEP').min_trades == 5
+
+    from training.strategies.liquidity_sweep import LiquiditySweepStrategy
+    assert registry.load_strategy('LIQUIDITY_SWEEP') is LiquiditySweepStrategy
+
+
+@pytest.mark.parametrize('name', ['LIQUIDITY_SWEEP', 'CAPITULATION_REVERSAL', 'FAILED_BREAKDOWN'])
+def test_parameter_space_without_instance(name):
+    strategy_class = registry.load_strategy(name)
+    space = registry.strategy_parameter_space(name)
+    assert space and space == strategy_class({}).get_parameter_space()
+
+
+def test_module_path_and_registered_targets(monkeypatch):
+    monkeypatch.setenv('TRAINING_STRATEGY_MODULES', 'training.strategies')
+    target = 'training.strategies.capitulation_reversal:CapitulationReversalStrategy'
+    assert registry.load_strategy(target) is registry.load_strategy('CAPITULATION_REVERSAL')
+
+    registry.register_strategy('TEST_ALIAS', target, min_trades=7)
+    try:
+        assert registry.strategy_spec('TEST_ALIAS').min_trades == 7
+        assert registry.load_strategy('TEST_ALIAS') is registry.load_strategy('CAPITULATION_REVERSAL')
+    finally:
+        registry._STRATEGIES.pop('TEST_ALIAS')
+
+
+@pytest.mark.parametrize('name', ['UNKNOWN', 'training.strategies:Missing', 'no_such_module:Strategy'])
+def test_unknown_strategy(name, monkeypatch):
+    monkeypatch.setenv('TRAINING_STRATEGY_MODULES', 'training,no_such_module')
+    with pytest.raises(ValueError):
+        registry.load_strategy(name)
+
+
+@pytest.mark.parametrize('allowed', [None, 'training.strategies', 'os.pathx'])
+def test_module_path_outside_allowed_prefixes_is_rejected(allowed, monkeypatch):
+    if allowed is None:
+        monkeypatch.delenv('TRAINING_STRATEGY_MODULES', raising=False)
+    else:
+        monkeypatch.setenv('TRAINING_STRATEGY_MODULES', allowed)
+    with pytest.raises(ValueError, match='not allowed'):
+        registry.load_strategy('os.path:join')
+
+
+@pytest.mark.parametrize('target', [
+    'training.strategies.liquidity_sweep:log',
+    'training.strategies.liquidity_sweep:StrategyContext'
+])
+def test_non_strategy_attribute_is_rejected(target, monkeypatch):
+    monkeypatch.setenv('TRAINING_STRATEGY_MODULES', 'training.strategies')
+    with pytest.raises(ValueError, match='not a class'):
+        registry.load_strategy(target)
+    assert target not in registry._loaded
+
+
+def test_create_optimizer_seeds():
+    assert registry.create_optimizer('random', seed=7).seed == 7
+    assert registry.optimizer_spec('random').iterations_arg == 'n_iterations'
+    assert registry.optimizer_spec('grid').min_trades == 10
+    with pytest.raises(ValueError):
+        registry.create_optimizer('annealing')
+
+
+def test_loading_one_strategy_imports_only_its_module():
+    script = textwrap.dedent("""
+        import sys
+        from training import registry
+        registry.load_strategy('LIQUIDITY_SWEEP')
+        registry.create_optimizer('random', seed=1)
+        print(','.join(sorted(name for name in sys.modules if name.startswith(('training.', 'skopt')))))
+    """)
+    output = subprocess.run(
+        [sys.executable, '-c', script], capture_output=True, text=True, check=True
+    ).stdout.strip().split(',')
+
+    assert 'training.strategies.liquidity_sweep' in output
+    assert 'training.optimizers.random_search' in output
+    for module in ('training.strategies.capitulation_reversal', 'training.strategies.failed_breakdown',
+                   'training.optimizers.bayesian', 'training.optimizers.grid_search', 'skopt'):
+        assert module not in output
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for higher-timeframe bars resampled from 1m candles (training.resampler).
+
+Run with: python -m pytest -q test_resampler.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from training.resampler import (
+    MultiTimeframeResampler,
+    latest_closed_bar,
+    resample_ohlcv,
+    timeframe_ms
+)
+
+
+COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def make_1m(n, seed=0, gaps=True):
+    """1m candles starting mid-week, optionally with missing minutes."""
+    rng = np.random.default_rng(seed)
+    steps = rng.choice([1, 1, 1, 1, 2, 5], n) if gaps else np.ones(n, dtype=np.int64)
+    timestamps = 1_700_000_040_000 + np.cumsum(steps) * 60_000
+    close = 30000 + np.cumsum(rng.normal(0, 5, n))
+    open_ = close + rng.normal(0, 2, n)
+    return pd.DataFrame({
+        'timestamp': timestamps,
+        'open': open_,
+        'high': np.maximum(open_, close) + rng.uniform(0, 3, n),
+        'low': np.minimum(open_, close) - rng.uniform(0, 3, n),
+        'close': close,
+        'volume': rng.uniform(1, 10, n)
+    })
+
+
+@pytest.mark.parametrize('timeframe, rule', [
+    ('5m', '5min'), ('15m', '15min'), ('1h', '1h'), ('4h', '4h'), ('1d', '1D'), ('1w', 'W-MON')
+])
+def test_matches_pandas_resample(timeframe, rule):
+    data = make_1m(20000)
+    index = pd.to_datetime(data['timestamp'], unit='ms').astype('datetime64[ns]')
+    expected = data.set_index(index).resample(rule, label='left', closed='left').agg(
+        {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}
+    ).dropna()
+
+    bars = resample_ohlcv(data, timeframe, include_partial=True)
+
+    np.testing.assert_array_equal(bars['timestamp'], expected.index.asi8 // 10**6)
+    np.testing.assert_allclose(bars[COLUMNS].to_numpy(), expected[COLUMNS].to_numpy())
+
+
+def test_partial_bar_handling():
+    data = make_1m(150, gaps=False)  # 1_700_000_100_000 is 22:15 UTC
+    first_hour = 1_700_002_800_000   # 23:00 UTC
+
+    bars = resample_ohlcv(data, '1h')
+    with_partial = resample_ohlcv(data, '1h', include_partial=True)
+
+    # The 22:00 bar is missing its first candles but is over; 00:00 is still open
+    assert bars['timestamp'].tolist() == [first_hour - 3_600_000, first_hour]
+    assert with_partial.attrs['partial'] and not bars.attrs['partial']
+    assert with_partial['timestamp'].iloc[-1] == first_hour + 3_600_000
+
+    # The last 1m candle of a bar closes it
+    last_minute = data[data['timestamp'] < first_hour + 3_600_000]
+    assert not resample_ohlcv(last_minute, '1h', include_partial=True).attrs['partial']
+
+
+def test_incremental_matches_vectorized():
+    data = make_1m(8000, seed=3)
+    timeframes = ['5m', '1h', '4h', '1d']
+    resampler = MultiTimeframeResampler.from_history(data.iloc[:3000], timeframes)
+
+    closed_counts = {tf: len(resampler.bars(tf)) for tf in timeframes}
+    for candle in data.iloc[3000:].to_dict('records'):
+        for tf in resampler.update(candle):
+            closed_counts[tf] = len(resampler.bars(tf))
+    assert resampler.update(data.iloc[-1].to_dict()) == []  # re-sent candle
+
+    for tf in timeframes:
+        for include_partial in (False, True):
+            actual = resampler.bars(tf, include_partial=include_partial)
+            expected = resample_ohlcv(data, tf, include_partial=include_partial)
+            assert actual.attrs['partial'] == expected.attrs['partial']
+            np.testing.assert_array_equal(actual['timestamp'], expected['timestamp'])
+            np.testing.assert_allclose(actual[COLUMNS].to_numpy(), expected[COLUMNS].to_numpy())
+        assert closed_counts[tf] == len(resample_ohlcv(data, tf))
+
+
+def test_latest_closed_bar_has_no_lookahead():
+    data = make_1m(600, gaps=False)
+    bars = resample_ohlcv(data, '1h', include_partial=True)
+    index = latest_closed_bar(bars['timestamp'], data['timestamp'], '1h')
+
+    bar_close = bars['timestamp'].to_numpy()[np.maximum(index, 0)] + timeframe_ms('1h')
+    candle_close = data['timestamp'].to_numpy() + timeframe_ms('1m')
+    assert np.all(bar_close[index >= 0] <= candle_close[index >= 0])
+    assert (index == -1).sum() > 0
+    # Each bar becomes visible on its own last minute
+    assert np.array_equal(np.unique(index[index >= 0]), np.arange(len(bars) - 1))
+
+
+@pytest.mark.parametrize('timeframe', ['7', '0m', '1M', 'h'])
+def test_invalid_timeframes(timeframe):
+    with pytest.raises(ValueError):
+        timeframe_ms(timeframe)
+
+
+def test_rejects_unsorted_candles_and_uneven_timeframes():
+    data = make_1m(100)
+    with pytest.raises(ValueError):
+        resample_ohlcv(data.iloc[::-1], '5m')
+    with pytest.raises(ValueError):
+        resample_ohlcv(data, '7m', base_timeframe='5m')
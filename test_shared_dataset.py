@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the memory-mapped dataset shared with optimizer workers
+(training.shared_dataset).
+
+Run with: python -m pytest -q test_shared_dataset.py
+"""
+
+import os
+import pickle
+
+import pandas as pd
+import pytest
+from joblib import Parallel, delayed
+
+from training.backtest_engine import BacktestEngine
+from training.optimizers.random_search import RandomSearchOptimizer
+from training.shared_dataset import SharedDataset, attach_dataset, resolve_dataset
+from training.strategies.liquidity_sweep import LiquiditySweepStrategy
+
+
+def describe(handle):
+    """Worker task: checksum, read-only flag and process id of the attached frame."""
+    data = resolve_dataset(handle)
+    values = data['close'].to_numpy()
+    return float(values.sum()), values.flags.writeable, os.getpid(), data is resolve_dataset(handle)
+
+
+def test_round_trip_is_read_only_and_small(synthetic_ohlcv, tmp_path):
+    data = synthetic_ohlcv(20000, seed=1)
+    data.attrs['timeframe'] = '5m'
+
+    with SharedDataset(data, directory=str(tmp_path)) as shared:
+        payload = pickle.dumps(shared.handle)
+        frame = attach_dataset(pickle.loads(payload))
+
+        pd.testing.assert_frame_equal(frame, data)
+        assert frame.attrs == {'timeframe': '5m'}
+        assert len(payload) < 2048
+        with pytest.raises(ValueError):
+            frame.loc[0, 'close'] = 1.0
+        # Copies are writable as usual
+        copy = frame.copy()
+        copy['close'] *= 2
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_object_columns_travel_inline(synthetic_ohlcv, tmp_path):
+    data = synthetic_ohlcv(500, seed=2)
+    data['symbol'] = 'BTCUSDT'
+    with SharedDataset(data, directory=str(tmp_path)) as shared:
+        assert shared.handle.mapped[-1] is False
+        pd.testing.assert_frame_equal(shared.handle.frame(), data)
+
+
+def test_non_range_index(synthetic_ohlcv, tmp_path):
+    data = synthetic_ohlcv(500, seed=2).set_index('timestamp', drop=False)
+    with SharedDataset(data, directory=str(tmp_path)) as shared:
+        pd.testing.assert_frame_equal(shared.handle.frame(), data)
+
+
+def test_workers_attach_by_name(synthetic_ohlcv, tmp_path):
+    data = synthetic_ohlcv(5000, seed=3)
+    with SharedDataset(data, directory=str(tmp_path)) as shared:
+        results = Parallel(n_jobs=2, backend='loky')(delayed(describe)(shared.handle) for _ in range(6))
+
+    for checksum, writeable, pid, reused in results:
+        assert checksum == pytest.approx(data['close'].sum())
+        assert not writeable and reused
+        assert pid != os.getpid()
+
+
+def test_stale_datasets_are_removed(synthetic_ohlcv, tmp_path):
+    stale = tmp_path / '999999999-deadbeef'
+    stale.mkdir()
+    with SharedDataset(synthetic_ohlcv(100), directory=str(tmp_path)) as shared:
+        assert sorted(os.listdir(tmp_path)) == [shared.handle.name]
+
+
+def test_parallel_search_matches_sequential(synthetic_ohlcv, tmp_path, monkeypatch):
+    monkeypatch.setenv('SHARED_DATASET_DIR', str(tmp_path))
+    data = synthetic_ohlcv(2000, seed=2)
+    kwargs = dict(
+        backtest_engine=BacktestEngine(),
+        data=data,
+        strategy_class=LiquiditySweepStrategy,
+        parameter_space={'reversal_candles': [1, 2], 'key_level_lookback': [40, 60],
+                         'min_level_touches': [2], 'pierce_depth': [0.0005, 0.001]},
+        n_iterations=8,
+        min_trades=0,
+        batch_size=2
+    )
+
+    sequential = RandomSearchOptimizer(seed=5, verbose=False).optimize(n_jobs=1, **kwargs)
+    parallel = RandomSearchOptimizer(seed=5, verbose=False).optimize(n_jobs=2, **kwargs)
+
+    pd.testing.assert_frame_equal(
+        parallel['all_results'].sort_values('objective_value').reset_index(drop=True),
+        sequential['all_results'].sort_values('objective_value').reset_index(drop=True)
+    )
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for sparse strategy signals (training.strategies.signals) and their
+index-aligned consumption by BacktestEngine.
+
+Run with: python -m pytest -q test_sparse_signals.py
+"""
+
+import numpy as np
+import pytest
+
+from training.backtest_engine import BacktestEngine
+from training.strategies import (
+    LiquiditySweepStrategy,
+    CapitulationReversalStrategy,
+    FailedBreakdownStrategy
+)
+from training.strategies.signals import SparseSignals
+
+
+STRATEGIES = [
+    (LiquiditySweepStrategy, {'pierce_depth': 0.0005, 'volume_spike_threshold': 1.2, 'reversal_candles': 1,
+                              'min_distance_from_level': 0.003, 'key_level_lookback': 50, 'min_level_touches': 2}),
+    (CapitulationReversalStrategy, {'volume_explosion_threshold': 1.2, 'price_velocity_threshold': 0.004,
+                                    'atr_explosion_threshold': 1.1, 'exhaustion_wick_ratio': 1.0,
+                                    'rsi_extreme_threshold': 40, 'lookback_periods': 20}),
+    (FailedBreakdownStrategy, {'range_lookback_periods': 30, 'range_tightness_threshold': 0.15,
+                               'breakdown_depth': 0.002, 'breakdown_volume_threshold': 0.9,
+                               'spring_max_duration': 20, 'recovery_volume_threshold': 1.0,
+                               'accumulation_score_minimum': 0.2}),
+]
+
+
+@pytest.mark.parametrize('strategy_class, params', STRATEGIES)
+def test_sparse_matches_dense(synthetic_ohlcv, strategy_class, params):
+    data = synthetic_ohlcv(2000, seed=2)
+    strategy = strategy_class(params)
+    sparse = strategy.evaluate_sparse(strategy_class.prepare(data))
+    dense = strategy.generate_signals(data)
+
+    entries = dense[dense['signal'] != 'HOLD']
+    assert len(sparse) == len(entries) > 0
+    assert sparse.n_candles == len(data)
+    assert np.all(np.diff(sparse.index) > 0)
+    np.testing.assert_array_equal(data['timestamp'].to_numpy()[sparse.index], entries['timestamp'])
+    np.testing.assert_array_equal(np.where(sparse.side == 1, 'BUY', 'SELL'), entries['signal'])
+    np.testing.assert_array_equal(sparse.stop_loss, entries['stop_loss'])
+    np.testing.assert_array_equal(sparse.take_profit, entries['take_profit'])
+
+    # Index alignment prices the same trades as the timestamp merge
+    engine = BacktestEngine()
+    expected = engine._simulate_trades(data, dense, params, position_size_pct=1.0)
+    assert engine._simulate_trades(data, sparse, params, position_size_pct=1.0) == expected
+
+
+def test_signal_matrix_from_sparse(synthetic_ohlcv):
+    data = synthetic_ohlcv(2000, seed=2)
+    strategy_class, base = STRATEGIES[0]
+    params_list = [dict(base, pierce_depth=depth) for depth in (0.0005, 0.001, 0.002)]
+    context = strategy_class.prepare(data)
+
+    engine = BacktestEngine()
+    dense = engine.build_signal_matrix(data, [strategy_class(p).evaluate(context) for p in params_list])
+    sparse = engine.build_signal_matrix(data, [strategy_class(p).evaluate_sparse(context) for p in params_list])
+
+    for key in ('signal', 'stop_loss', 'take_profit'):
+        np.testing.assert_array_equal(sparse[key], dense[key])
+
+
+def test_sparse_signals_reject_other_candles(synthetic_ohlcv):
+    data = synthetic_ohlcv(300, seed=1)
+    signals = SparseSignals.from_entries(
+        n_candles=len(data) + 1, start=0, index=[10], side=[1], stop_loss=[1.0], take_profit=[2.0]
+    )
+    engine = BacktestEngine()
+
+    with pytest.raises(ValueError):
+        engine._align_signals(data, signals)
+    with pytest.raises(ValueError):
+        engine.build_signal_matrix(data, [signals])
+
+
+def test_to_frame_fill():
+    signals = SparseSignals.from_entries(
+        n_candles=6, start=2, index=[3, 5], side=[1, -1], stop_loss=[9.0, 11.0], take_profit=[12.0, 8.0],
+        score=np.array([0.5, 0.7]), phase=np.array(['D', 'C'], dtype=object)
+    )
+    frame = signals.to_frame(np.arange(6) * 1000, fill={'phase': 'UNKNOWN'})
+
+    assert frame['timestamp'].tolist() == [2000, 3000, 4000, 5000]
+    assert frame['signal'].tolist() == ['HOLD', 'BUY', 'HOLD', 'SELL']
+    assert frame['score'].tolist() == [0.0, 0.5, 0.0, 0.7]
+    assert frame['phase'].tolist() == ['UNKNOWN', 'D', 'UNKNOWN', 'C']
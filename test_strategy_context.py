@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for the two-stage prepare/evaluate strategy API (training.strategies.context).
+
+Run with: python -m pytest -q test_strategy_context.py
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from training.backtest_engine import BacktestEngine
+from training.optimizers.batch_evaluation import evaluate_batch, chunk_configs
+from training.strategies import (
+    LiquiditySweepStrategy,
+    CapitulationReversalStrategy,
+    FailedBreakdownStrategy
+)
+from training.strategies.context import clear_contexts, prepared_context
+
+
+def grid(**space):
+    """All combinations of a small parameter grid."""
+    return [dict(zip(space, values)) for values in itertools.product(*space.values())]
+
+
+@pytest.mark.parametrize('strategy_class, configs, memo_hits', [
+    (LiquiditySweepStrategy, grid(
+        pierce_depth=[0.0005, 0.001], reversal_candles=[1, 2], volume_spike_threshold=[1.5],
+        min_distance_from_level=[0.003], key_level_lookback=[50], min_level_touches=[2]
+    ), 3),
+    (CapitulationReversalStrategy, grid(
+        volume_explosion_threshold=[1.5], price_velocity_threshold=[0.006], atr_explosion_threshold=[1.3],
+        exhaustion_wick_ratio=[1.5], rsi_extreme_threshold=[35], lookback_periods=[20, 50],
+        atr_multiplier_sl=[1.2, 2.0]
+    ), 3),
+    (FailedBreakdownStrategy, grid(
+        range_lookback_periods=[30], range_tightness_threshold=[0.15], breakdown_depth=[0.001, 0.002],
+        breakdown_volume_threshold=[0.9], recovery_volume_threshold=[1.0, 1.2], accumulation_score_minimum=[0.2]
+    ), 3),
+])
+def test_evaluate_matches_generate_signals(synthetic_ohlcv, strategy_class, configs, memo_hits):
+    data = synthetic_ohlcv(1500, seed=2)
+    context = strategy_class.prepare(data)
+
+    for params in configs:
+        expected = strategy_class(params).generate_signals(data)
+        assert strategy_class(params).evaluate(context).equals(expected)
+
+    # Configurations sharing the memoized parameter subset reuse the structure
+    assert context.hits == memo_hits
+    assert context.misses == 1
+
+    # The prepared frame is not modified by evaluations
+    assert context.df['close'].equals(data['close'])
+
+
+def test_prepared_context_keyed_by_content(synthetic_ohlcv):
+    clear_contexts()
+    data = synthetic_ohlcv(500, seed=1)
+
+    context = prepared_context(CapitulationReversalStrategy, data)
+    assert prepared_context(CapitulationReversalStrategy, data.copy()) is context
+    assert prepared_context(FailedBreakdownStrategy, data) is not context
+
+    # Optional columns are part of the key (read by evaluate)
+    with_orderbook = data.copy()
+    with_orderbook['orderbook_imbalance'] = np.linspace(-1, 1, len(data))
+    assert prepared_context(CapitulationReversalStrategy, with_orderbook) is not context
+    clear_contexts()
+
+
+def test_batches_prepare_once(synthetic_ohlcv, monkeypatch):
+    clear_contexts()
+    data = synthetic_ohlcv(1500, seed=21)
+    calls = []
+    prepare = LiquiditySweepStrategy.prepare.__func__
+
+    def counting_prepare(cls, frame):
+        calls.append(len(frame))
+        return prepare(cls, frame)
+
+    monkeypatch.setattr(LiquiditySweepStrategy, 'prepare', classmethod(counting_prepare))
+
+    configs = grid(
+        pierce_depth=[0.0005, 0.001, 0.002], reversal_candles=[1, 2], volume_spike_threshold=[1.5],
+        min_distance_from_level=[0.003], key_level_lookback=[50], min_level_touches=[2]
+    )
+    engine = BacktestEngine(initial_capital=10000.0)
+    results = []
+    for batch in chunk_configs(configs, 2):
+        results.extend(evaluate_batch(engine, data, LiquiditySweepStrategy, batch, 'sharpe_ratio', 0))
+
+    # Engine fallback path shares the same context
+    engine.run_backtest(data, LiquiditySweepStrategy(configs[0]))
+
+    assert calls == [len(data)]
+    assert all(result is not None for result in results)
+    clear_contexts()
+
+
+@pytest.mark.parametrize('strategy_class', [
+    LiquiditySweepStrategy, CapitulationReversalStrategy, FailedBreakdownStrategy
+])
+def test_signal_progress_starts_before_it_completes(synthetic_ohlcv, strategy_class):
+    data = synthetic_ohlcv(800, seed=4)
+    fractions = []
+
+    strategy_class({}).generate_signals(data, progress_callback=lambda current, total, stage: fractions.append(current / total))
+
+    assert fractions and fractions[0] < 1.0
+
+
+def test_evaluate_batch_advances_completed_count(synthetic_ohlcv, episode_counter):
+    data = synthetic_ohlcv(1500, seed=2)
+    configs = grid(pierce_depth=[0.0005, 0.001], reversal_candles=[1, 2], min_level_touches=[2])
+    engine = BacktestEngine(initial_capital=10000.0)
+    results = []
+    for batch in chunk_configs(configs, 3):
+        results.extend(evaluate_batch(engine, data, LiquiditySweepStrategy, batch, 'sharpe_ratio', 0,
+                                      progress_callback=episode_counter))
+
+    assert episode_counter.completed_count == sum(result is not None for result in results) == len(configs)
+    assert not episode_counter.in_flight
+    clear_contexts()
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Parity tests for the vectorized training strategies.
+
+Replays deterministic synthetic datasets through the original per-candle
+signal loops and the vectorized implementations, and checks that both emit
+the same BUY/SELL signals with the same stop-loss and take-profit levels.
+
+Run with: python -m pytest -q test_strategy_parity.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from training.strategies.liquidity_sweep import LiquiditySweepStrategy
+from training.strategies.capitulation_reversal import CapitulationReversalStrategy
+from training.strategies.failed_breakdown import FailedBreakdownStrategy
+from training.strategies.levels import cluster_prices
+
+
+def legacy_liquidity_sweep_signals(strategy, data):
+    """Original per-candle LiquiditySweepStrategy.generate_signals (reference implementation)."""
+    df = data.copy()
+    key_levels = strategy._identify_key_levels(df)
+    df['volume_ma'] = df['volume'].rolling(window=20).mean()
+
+    def long_sweep(current, previous, level):
+        pierce_distance = level.price * strategy.pierce_depth
+        window = previous.tail(strategy.reversal_candles + 1)
+        if not any(row['low'] <= (level.price - pierce_distance) for _, row in window.iterrows()):
+            return False
+        if not any(
+            row['volume'] >= (row.get('volume_ma', row['volume']) * strategy.volume_spike_threshold)
+            for _, row in window.iterrows()
+        ):
+            return False
+        if current['close'] <= level.price:
+            return False
+        reversal_count = sum(
+            1 for _, row in previous.tail(strategy.reversal_candles).iterrows() if row['close'] > row['open']
+        )
+        if current['close'] > current['open']:
+            reversal_count += 1
+        return reversal_count >= strategy.reversal_candles
+
+    def short_sweep(current, previous, level):
+        pierce_distance = level.price * strategy.pierce_depth
+        window = previous.tail(strategy.reversal_candles + 1)
+        if not any(row['high'] >= (level.price + pierce_distance) for _, row in window.iterrows()):
+            return False
+        if not any(
+            row['volume'] >= (row.get('volume_ma', row['volume']) * strategy.volume_spike_threshold)
+            for _, row in window.iterrows()
+        ):
+            return False
+        if current['close'] >= level.price:
+            return False
+        reversal_count = sum(
+            1 for _, row in previous.tail(strategy.reversal_candles).iterrows() if row['close'] < row['open']
+        )
+        if current['close'] < current['open']:
+            reversal_count += 1
+        return reversal_count >= strategy.reversal_candles
+
+    signals = []
+    price_tolerance = df['atr'].median() * 3
+    for idx in range(strategy.key_level_lookback, len(df)):
+        row = df.iloc[idx]
+        prev_rows = df.iloc[max(0, idx - 10):idx]
+        signal_data = {'timestamp': int(row['timestamp']), 'signal': 'HOLD', 'stop_loss': 0.0, 'take_profit': 0.0}
+
+        price_min = row['close'] - price_tolerance
+        price_max = row['close'] + price_tolerance
+        for level in [lvl for lvl in key_levels if price_min <= lvl.price <= price_max]:
+            if level.type == 'SUPPORT' and long_sweep(row, prev_rows, level):
+                signal_data['signal'] = 'BUY'
+                signal_data['stop_loss'] = row['close'] - (row['atr'] * strategy.atr_multiplier_sl)
+                signal_data['take_profit'] = row['close'] + (
+                    row['atr'] * strategy.atr_multiplier_sl * strategy.risk_reward_ratio
+                )
+                break
+            if level.type == 'RESISTANCE' and short_sweep(row, prev_rows, level):
+                signal_data['signal'] = 'SELL'
+                signal_data['stop_loss'] = row['close'] + (row['atr'] * strategy.atr_multiplier_sl)
+                signal_data['take_profit'] = row['close'] - (
+                    row['atr'] * strategy.atr_multiplier_sl * strategy.risk_reward_ratio
+                )
+                break
+        signals.append(signal_data)
+
+    return pd.DataFrame(signals)
+
+
+def legacy_capitulation_signals(strategy, data):
+    """Original per-candle CapitulationReversalStrategy.generate_signals (reference implementation)."""
+    df = strategy._calculate_indicators(data.copy())
+
+    panics = []
+    for idx in range(20, len(df)):
+        row = df.iloc[idx]
+        rsi_extreme = (row['rsi'] <= strategy.rsi_extreme_threshold or
+                       row['rsi'] >= (100 - strategy.rsi_extreme_threshold))
+        panic_score = sum([
+            (row['volume_ratio'] >= strategy.volume_explosion_threshold) * 0.3,
+            (row['price_velocity'] >= strategy.price_velocity_threshold) * 0.25,
+            (row['atr_ratio'] >= strategy.atr_explosion_threshold) * 0.2,
+            (row['wick_ratio'] >= strategy.exhaustion_wick_ratio) * 0.15,
+            rsi_extreme * 0.1
+        ])
+        if panic_score >= 0.4:
+            panics.append((int(row['timestamp']), panic_score))
+
+    def reversal(current, previous, pressure, is_entry, rsi_was, rsi_now, imbalance_ok):
+        recent_timestamps = previous.tail(15)['timestamp'].values
+        recent = [score for ts, score in panics if ts in recent_timestamps]
+        if not recent:
+            return False, 0.0
+        if sum(1 for _, row in previous.tail(15).iterrows() if row[pressure]) < 3:
+            return False, 0.0
+        if not is_entry(current):
+            return False, 0.0
+        if 'orderbook_imbalance' in current and pd.notna(current['orderbook_imbalance']):
+            if not imbalance_ok(current['orderbook_imbalance']):
+                return False, 0.0
+        recent_rsi = previous.tail(5)['rsi'].values
+        if any(rsi_was(rsi) for rsi in recent_rsi if pd.notna(rsi)) and rsi_now(current['rsi']):
+            return True, max(recent)
+        return False, 0.0
+
+    threshold = strategy.orderbook_imbalance_threshold
+    signals = []
+    for idx in range(strategy.lookback_periods, len(df)):
+        row = df.iloc[idx]
+        prev_rows = df.iloc[max(0, idx - 20):idx]
+        signal_data = {'timestamp': int(row['timestamp']), 'signal': 'HOLD',
+                       'stop_loss': 0.0, 'take_profit': 0.0, 'panic_score': 0.0}
+
+        is_long, score = reversal(row, prev_rows, 'bearish', lambda c: c['close'] > c['open'],
+                                  lambda rsi: rsi < 35, lambda rsi: rsi >= 25, lambda imb: imb >= threshold)
+        if is_long:
+            signal_data.update(signal='BUY', panic_score=score,
+                               stop_loss=row['close'] - (row['atr'] * strategy.atr_multiplier_sl),
+                               take_profit=row['close'] + (row['atr'] * strategy.atr_multiplier_sl * strategy.risk_reward_ratio))
+        else:
+            is_short, score = reversal(row, prev_rows, 'bullish', lambda c: c['close'] < c['open'],
+                                       lambda rsi: rsi > 65, lambda rsi: rsi <= 75, lambda imb: imb <= -threshold)
+            if is_short:
+                signal_data.update(signal='SELL', panic_score=score,
+                                   stop_loss=row['close'] + (row['atr'] * strategy.atr_multiplier_sl),
+                                   take_profit=row['close'] - (row['atr'] * strategy.atr_multiplier_sl * strategy.risk_reward_ratio))
+        signals.append(signal_data)
+
+    return pd.DataFrame(signals)
+
+
+def legacy_failed_breakdown_springs(strategy, df):
+    """Original per-window FailedBreakdownStrategy range and spring scan (reference implementation).
+
+    Returns:
+        (window end of every valid range, [(recovery index, support, accumulation score)] in scan order)
+    """
+    lookback = strategy.range_lookback_periods
+    ranges = []
+    for idx in range(lookback, len(df)):
+        window = df.iloc[idx - lookback:idx]
+        high, low = window['high'].max(), window['low'].min()
+        if (high - low) / low > strategy.range_tightness_threshold:
+            continue
+        if not window.iloc[lookback // 2:]['volume'].mean() < window.iloc[:lookback // 2]['volume'].mean() * 0.8:
+            continue
+        touches_support, touches_resistance = sum(window['low'] <= low * 1.005), sum(window['high'] >= high * 0.995)
+        if touches_support < 3 or touches_resistance < 3:
+            continue
+        ranges.append((idx, low, window['volume'].mean(), touches_support + touches_resistance))
+
+    springs = []
+    for end, support, volume_avg, touches in ranges:
+        for idx in range(end, min(end + 50, len(df))):
+            row = df.iloc[idx]
+            breakdown_volume = row['volume'] / volume_avg
+            if (support - row['low']) / support < strategy.breakdown_depth:
+                continue
+            if breakdown_volume > strategy.breakdown_volume_threshold:
+                continue
+            for j in range(idx + 1, min(idx + strategy.spring_max_duration, len(df))):
+                if df.iloc[j]['close'] > support:
+                    recovery_volume = df.iloc[j]['volume'] / volume_avg
+                    if recovery_volume >= strategy.recovery_volume_threshold:
+                        score = (
+                            max(0, 1 - breakdown_volume / strategy.breakdown_volume_threshold) * 0.25
+                            + min(1.0, recovery_volume / (strategy.recovery_volume_threshold * 1.5)) * 0.30
+                            + max(0, 1 - (j - idx) / strategy.spring_max_duration) * 0.20
+                            + min(1.0, touches / 10) * 0.15
+                        )
+                        springs.append((j, support, min(1.0, score)))
+                    break
+
+    return [end for end, _, _, _ in ranges], springs
+
+
+def legacy_failed_breakdown_signals(strategy, df, springs):
+    """Original FailedBreakdownStrategy entries from the per-window springs (reference implementation)."""
+    signals = []
+    for idx in range(strategy.range_lookback_periods, len(df)):
+        row = df.iloc[idx]
+        signal_data = dict(timestamp=int(row['timestamp']), signal='HOLD', stop_loss=0.0, take_profit=0.0)
+        matching = [spring for spring in springs if spring[0] == idx]
+        if matching:
+            _, support, score = max(matching, key=lambda spring: spring[2])
+            if score >= strategy.accumulation_score_minimum and (row['close'] - support) / support <= 0.03:
+                stop_loss = support - row['atr'] * strategy.atr_multiplier_sl
+                signal_data.update(signal='BUY', stop_loss=stop_loss,
+                                   take_profit=row['close'] + (row['close'] - stop_loss) * strategy.risk_reward_ratio)
+        signals.append(signal_data)
+
+    return pd.DataFrame(signals)
+
+
+def legacy_cluster_prices(prices, min_distance):
+    """Original LiquiditySweepStrategy._cluster_prices (reference implementation)."""
+    if len(prices) == 0:
+        return []
+
+    prices_sorted = np.sort(prices)
+    clusters = []
+    current_cluster = [prices_sorted[0]]
+
+    for price in prices_sorted[1:]:
+        if abs(price - np.mean(current_cluster)) / np.mean(current_cluster) <= min_distance:
+            current_cluster.append(price)
+        else:
+            clusters.append((np.mean(current_cluster), len(current_cluster)))
+            current_cluster = [price]
+
+    clusters.append((np.mean(current_cluster), len(current_cluster)))
+    return clusters
+
+
+def assert_signals_equal(actual, expected):
+    assert len(actual) == len(expected)
+    np.testing.assert_array_equal(actual['timestamp'].to_numpy(), expected['timestamp'].to_numpy())
+    np.testing.assert_array_equal(actual['signal'].to_numpy(), expected['signal'].to_numpy())
+    np.testing.assert_allclose(actual['stop_loss'].to_numpy(), expected['stop_loss'].to_numpy(), rtol=1e-12)
+    np.testing.assert_allclose(actual['take_profit'].to_numpy(), expected['take_profit'].to_numpy(), rtol=1e-12)
+    if 'panic_score' in expected:
+        np.testing.assert_allclose(actual['panic_score'].to_numpy(), expected['panic_score'].to_numpy())
+
+
+@pytest.mark.parametrize('seed, params', [
+    (21, {'pierce_depth': 0.0005, 'volume_spike_threshold': 1.5, 'reversal_candles': 1,
+          'min_distance_from_level': 0.003, 'key_level_lookback': 50, 'min_level_touches': 2}),
+    (4, {'pierce_depth': 0.001, 'volume_spike_threshold': 1.2, 'reversal_candles': 2,
+         'min_distance_from_level': 0.002, 'key_level_lookback': 100, 'min_level_touches': 3}),
+    (9, {'pierce_depth': 0.0002, 'volume_spike_threshold': 1.1, 'reversal_candles': 0,
+         'min_distance_from_level': 0.005, 'key_level_lookback': 5, 'min_level_touches': 2}),
+])
+def test_liquidity_sweep_parity(synthetic_ohlcv, seed, params):
+    data = synthetic_ohlcv(1500, seed=seed)
+    strategy = LiquiditySweepStrategy(params)
+
+    actual = strategy.generate_signals(data)
+    expected = legacy_liquidity_sweep_signals(strategy, data)
+
+    assert (expected['signal'] != 'HOLD').sum() > 0
+    assert_signals_equal(actual, expected)
+
+
+@pytest.mark.parametrize('seed, params, with_orderbook', [
+    (5, {'volume_explosion_threshold': 1.5, 'price_velocity_threshold': 0.006, 'atr_explosion_threshold': 1.3,
+         'exhaustion_wick_ratio': 1.5, 'rsi_extreme_threshold': 35, 'lookback_periods': 50}, False),
+    (12, {'volume_explosion_threshold': 2.0, 'price_velocity_threshold': 0.01, 'atr_explosion_threshold': 1.5,
+          'exhaustion_wick_ratio': 2.5, 'rsi_extreme_threshold': 30, 'lookback_periods': 10}, False),
+    (5, {'volume_explosion_threshold': 1.5, 'price_velocity_threshold': 0.006, 'atr_explosion_threshold': 1.3,
+         'exhaustion_wick_ratio': 1.5, 'rsi_extreme_threshold': 35, 'lookback_periods': 50,
+         'orderbook_imbalance_threshold': 0.5}, True),
+])
+def test_capitulation_reversal_parity(synthetic_ohlcv, seed, params, with_orderbook):
+    data = synthetic_ohlcv(1500, seed=seed)
+    if with_orderbook:
+        imbalance = np.random.default_rng(seed).uniform(-1, 1, len(data))
+        imbalance[::3] = np.nan  # L2 data missing for some candles
+        data['orderbook_imbalance'] = imbalance
+    strategy = CapitulationReversalStrategy(params)
+
+    actual = strategy.generate_signals(data)
+    expected = legacy_capitulation_signals(strategy, data)
+
+    assert (expected['signal'] != 'HOLD').sum() > 0
+    assert_signals_equal(actual, expected)
+
+
+@pytest.mark.parametrize('seed, params', [
+    (2, {'range_lookback_periods': 30, 'range_tightness_threshold': 0.15, 'breakdown_depth': 0.002,
+         'breakdown_volume_threshold': 0.9, 'spring_max_duration': 20, 'recovery_volume_threshold': 1.0,
+         'accumulation_score_minimum': 0.2}),
+    (3, {'range_lookback_periods': 25, 'range_tightness_threshold': 0.10, 'breakdown_depth': 0.001,
+         'breakdown_volume_threshold': 0.8, 'spring_max_duration': 15, 'recovery_volume_threshold': 1.2,
+         'accumulation_score_minimum': 0.3}),
+])
+def test_failed_breakdown_merged_ranges(synthetic_ohlcv, seed, params):
+    data = synthetic_ohlcv(1500, seed=seed)
+    strategy = FailedBreakdownStrategy(params)
+    df = strategy._calculate_indicators(data.copy())
+
+    ranges = strategy._identify_ranges(df)
+    springs = strategy._detect_springs(df, ranges)
+    legacy_ends, legacy_springs = legacy_failed_breakdown_springs(strategy, df)
+
+    # Same valid lookback windows, merged into non-redundant intervals
+    assert sorted(int(end) for r in ranges for end in r.window_ends) == legacy_ends
+    assert len(ranges) < len(legacy_ends)
+    for r in ranges:
+        assert r.start_idx == r.window_ends[0] - strategy.range_lookback_periods
+        assert r.end_idx == r.window_ends[-1]
+        assert (r.resistance - r.support) / r.support <= strategy.range_tightness_threshold
+
+    # Every spring is one the per-window scan finds, one per recovery candle and range
+    timestamps = df['timestamp'].to_numpy()
+    found = {(s.timestamp, round(s.support_level, 6)) for s in springs}
+    assert len(found) == len(springs) > 0
+    assert found <= {(int(timestamps[j]), round(support, 6)) for j, support, _ in legacy_springs}
+    assert {s.recovery_idx for s in springs} == {j for j, _, _ in legacy_springs}
+
+    # Same entries as the per-window scan
+    signals = strategy.generate_signals(data)
+    assert_signals_equal(signals, legacy_failed_breakdown_signals(strategy, df, legacy_springs))
+    buys = signals[signals['signal'] == 'BUY']
+    assert len(buys) > 0
+    closes = data.set_index('timestamp').loc[buys['timestamp'], 'close'].to_numpy()
+    assert (buys['stop_loss'].to_numpy() < closes).all()
+    assert (buys['take_profit'].to_numpy() > closes).all()
+
+
+@pytest.mark.parametrize('n, min_distance', [(0, 0.003), (1, 0.003), (2000, 0.001), (2000, 0.01), (5000, 0.05)])
+def test_cluster_prices_parity(n, min_distance):
+    rng = np.random.default_rng(n)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+
+    level_prices, counts = cluster_prices(prices, min_distance)
+    expected = legacy_cluster_prices(prices, min_distance)
+
+    assert len(level_prices) == len(counts) == len(expected)
+    assert counts.sum() == n
+    np.testing.assert_array_equal(counts, [count for _, count in expected])
+    np.testing.assert_allclose(level_prices, [price for price, _ in expected], rtol=1e-12)
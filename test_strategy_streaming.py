@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental signal generation (on_candle) of the training strategies.
+
+Run with: python -m pytest -q test_strategy_streaming.py
+"""
+
+import numpy as np
+import pytest
+
+from training import feature_cache
+from training.strategies import (
+    LiquiditySweepStrategy,
+    CapitulationReversalStrategy,
+    FailedBreakdownStrategy
+)
+from training.strategies.streaming import RollingWindow, RunningMedian
+
+
+@pytest.fixture
+def no_feature_cache():
+    """Truncated-history replays would fill the cache with one entry set per prefix."""
+    previous = feature_cache._default_cache
+    feature_cache.set_feature_cache(None)
+    yield
+    feature_cache.set_feature_cache(previous)
+
+
+def stream(strategy, data):
+    """on_candle() row of every candle."""
+    return [strategy.on_candle(candle) for candle in data.to_dict('records')]
+
+
+def assert_rows_equal(row, expected, columns):
+    for column in columns:
+        if isinstance(expected[column], str):
+            assert row[column] == expected[column], column
+        else:
+            assert np.isclose(row[column], expected[column], equal_nan=True), column
+
+
+def assert_truncated_parity(strategy_class, params, data, start, columns):
+    """Row t of the stream equals the last batch row on candles [0, t]."""
+    rows = stream(strategy_class(params), data)
+    assert all(row is None for row in rows[:start])
+
+    signals = 0
+    for t in range(start, len(data)):
+        expected = strategy_class(params).generate_signals(data.iloc[:t + 1]).iloc[-1]
+        assert_rows_equal(rows[t], expected, columns)
+        signals += expected['signal'] != 'HOLD'
+    assert signals > 0
+
+
+def test_rolling_primitives():
+    window = RollingWindow(3)
+    for value in (1.0, 5.0):
+        window.append(value)
+    assert np.isnan(window.mean())
+    window.append(3.0)
+    window.append(4.0)
+    assert (window.mean(), window.max(), window.min(), window.sum(), len(window)) == (4.0, 5.0, 3.0, 12.0, 3)
+
+    median = RunningMedian()
+    assert np.isnan(median.median())
+    for value, expected in [(5.0, 5.0), (1.0, 3.0), (np.nan, 3.0), (9.0, 5.0), (2.0, 3.5)]:
+        median.add(value)
+        assert median.median() == expected
+
+
+@pytest.mark.parametrize('params, orderbook', [
+    ({'volume_explosion_threshold': 1.5, 'price_velocity_threshold': 0.006, 'atr_explosion_threshold': 1.3,
+      'exhaustion_wick_ratio': 1.5, 'rsi_extreme_threshold': 35, 'lookback_periods': 50}, False),
+    ({'volume_explosion_threshold': 1.2, 'price_velocity_threshold': 0.004, 'atr_explosion_threshold': 1.1,
+      'exhaustion_wick_ratio': 1.0, 'rsi_extreme_threshold': 40, 'lookback_periods': 20}, False),
+    ({'volume_explosion_threshold': 1.2, 'price_velocity_threshold': 0.004, 'atr_explosion_threshold': 1.1,
+      'exhaustion_wick_ratio': 1.0, 'rsi_extreme_threshold': 40, 'lookback_periods': 20}, True),
+])
+def test_capitulation_stream_matches_batch(synthetic_ohlcv, params, orderbook):
+    data = synthetic_ohlcv(3000, seed=2)
+    if orderbook:
+        rng = np.random.default_rng(4)
+        data['orderbook_imbalance'] = rng.uniform(-1, 1, len(data))
+        data['orderbook_spread_bps'] = rng.uniform(1, 20, len(data))
+        data.loc[::7, 'orderbook_imbalance'] = np.nan
+
+    # Capitulation signals only look back, so the full batch run is the reference
+    expected = CapitulationReversalStrategy(params).generate_signals(data)
+    rows = stream(CapitulationReversalStrategy(params), data)
+    start = params['lookback_periods']
+
+    # Batch rows start after the warm-up candles
+    assert all(row is None for row in rows[:start])
+    assert len(expected) == len(data) - start
+    assert (expected['signal'] != 'HOLD').sum() > 0
+    for row, (_, batch_row) in zip(rows[start:], expected.iterrows()):
+        assert_rows_equal(row, batch_row, list(row))
+
+
+def test_liquidity_sweep_stream_matches_batch(synthetic_ohlcv, no_feature_cache):
+    params = {'pierce_depth': 0.0005, 'volume_spike_threshold': 1.2, 'reversal_candles': 2,
+              'min_distance_from_level': 0.003, 'key_level_lookback': 50, 'min_level_touches': 2}
+    data = synthetic_ohlcv(400, seed=2)
+    assert_truncated_parity(
+        LiquiditySweepStrategy, params, data, params['key_level_lookback'],
+        ['timestamp', 'signal', 'stop_loss', 'take_profit']
+    )
+
+
+def test_failed_breakdown_stream_matches_batch(synthetic_ohlcv, no_feature_cache):
+    params = {'range_lookback_periods': 30, 'range_tightness_threshold': 0.15, 'breakdown_depth': 0.002,
+              'breakdown_volume_threshold': 0.9, 'spring_max_duration': 20,
+              'recovery_volume_threshold': 1.0, 'accumulation_score_minimum': 0.2}
+    data = synthetic_ohlcv(1200, seed=2)
+    assert_truncated_parity(
+        FailedBreakdownStrategy, params, data, params['range_lookback_periods'],
+        ['timestamp', 'signal', 'stop_loss', 'take_profit', 'accumulation_score', 'wyckoff_phase']
+    )
+
+
+def test_reset_stream(synthetic_ohlcv):
+    params = {'lookback_periods': 20}
+    data = synthetic_ohlcv(100, seed=3)
+    strategy = CapitulationReversalStrategy(params)
+    first = stream(strategy, data)
+
+    strategy.reset_stream()
+    assert stream(strategy, data) == first
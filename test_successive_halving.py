@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for multi-fidelity random search (training.optimizers.successive_halving).
+
+Run with: python -m pytest -q test_successive_halving.py
+"""
+
+import pytest
+
+from training import registry
+from training.backtest_engine import BacktestEngine
+from training.optimizers.random_search import RandomSearchOptimizer
+from training.optimizers.successive_halving import (
+    SuccessiveHalvingOptimizer,
+    plan_rungs,
+    rung_fractions,
+    rung_sizes
+)
+from training.strategies.liquidity_sweep import LiquiditySweepStrategy
+
+
+def run(optimizer, data, min_trades=5, **kwargs):
+    return optimizer.optimize(
+        backtest_engine=BacktestEngine(),
+        data=data,
+        strategy_class=LiquiditySweepStrategy,
+        parameter_space=LiquiditySweepStrategy.get_parameter_space(),
+        n_iterations=40,
+        min_trades=min_trades,
+        **kwargs
+    )
+
+
+def test_rung_plan():
+    assert rung_fractions(0.1, 3) == [1 / 9, 1 / 3, 1.0]
+    assert rung_fractions(1.0, 3) == [1.0]
+    assert rung_fractions(0.25, 2) == [0.25, 0.5, 1.0]
+    assert rung_sizes(100, 3, 3) == [100, 34, 12]
+    assert plan_rungs(20000, 0.1, 3, 500) == [1 / 9, 1 / 3, 1.0]
+    assert plan_rungs(3000, 0.1, 3, 500) == [1 / 3, 1.0]
+    assert plan_rungs(300, 0.1, 3, 500) == [1.0]
+    assert SuccessiveHalvingOptimizer.planned_evaluations(100, 20000) == 146
+    assert SuccessiveHalvingOptimizer.planned_evaluations(100, 3000) == 134
+
+    with pytest.raises(ValueError):
+        rung_fractions(0, 3)
+    with pytest.raises(ValueError):
+        rung_fractions(0.1, 1)
+
+
+def test_finds_random_search_best_with_less_budget(synthetic_ohlcv):
+    data = synthetic_ohlcv(20000, seed=5)
+
+    baseline = run(RandomSearchOptimizer(seed=7, verbose=False), data, n_jobs=1)
+    result = run(SuccessiveHalvingOptimizer(seed=7, verbose=False), data, n_jobs=1)
+
+    assert result['optimizer'] == 'successive_halving'
+    assert result['best_parameters'] == baseline['best_parameters']
+    assert result['best_score'] == baseline['best_score']
+    assert result['budget_fraction'] < 0.4
+
+    rungs = result['rungs']
+    assert [rung['candles'] for rung in rungs] == [2222, 6667, 20000]
+    assert [rung['evaluated'] for rung in rungs] == [40, 14, 5]
+    assert [rung['min_trades'] for rung in rungs] == [1, 2, 5]
+    assert result['total_evaluations'] == SuccessiveHalvingOptimizer.planned_evaluations(40, len(data)) == 59
+    assert len(result['all_results']) == result['valid_evaluations'] <= 5
+
+
+def test_short_data_skips_small_rungs(synthetic_ohlcv):
+    data = synthetic_ohlcv(3000, seed=5)
+
+    result = run(SuccessiveHalvingOptimizer(seed=7, verbose=False), data, n_jobs=1, min_trades=1)
+
+    # 1/9 of 3000 candles is below min_window_candles
+    assert [rung['candles'] for rung in result['rungs']] == [1000, 3000]
+    assert [rung['evaluated'] for rung in result['rungs']] == [40, 14]
+    assert result['total_evaluations'] == SuccessiveHalvingOptimizer.planned_evaluations(40, len(data)) == 54
+
+
+def test_registered_and_parallel_matches_sequential(synthetic_ohlcv):
+    data = synthetic_ohlcv(6000, seed=5)
+
+    optimizer = registry.create_optimizer('halving', seed=7)
+    assert isinstance(optimizer, SuccessiveHalvingOptimizer)
+    optimizer.verbose = False
+
+    parallel = run(optimizer, data, n_jobs=2, min_trades=1)
+    sequential = run(SuccessiveHalvingOptimizer(seed=7, verbose=False), data, n_jobs=1, min_trades=1)
+
+    assert parallel['best_parameters'] == sequential['best_parameters']
+    assert parallel['rungs'] == sequential['rungs']
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for phase-timing telemetry (training.telemetry).
+
+Run with: python -m pytest -q test_telemetry.py
+"""
+
+import pickle
+
+import numpy as np
+
+from training.backtest_engine import BacktestEngine
+from training.strategies.liquidity_sweep import LiquiditySweepStrategy
+from training.strategies.context import clear_contexts
+from training.telemetry import TimingCollector, collect, timed, TIME_BUCKETS_MS
+
+
+def test_timed_outside_collect_only_measures():
+    with timed('backtest.signals', 100) as phase:
+        sum(range(1000))
+    assert phase.seconds > 0
+
+    with collect() as timings:
+        pass
+    assert timings.phases == {}
+
+
+def test_backtest_phases_recorded(synthetic_ohlcv):
+    data = synthetic_ohlcv(800, seed=3)
+    engine = BacktestEngine()
+    clear_contexts()
+
+    with collect() as timings:
+        for _ in range(2):
+            engine.run_backtest(data, LiquiditySweepStrategy({'key_level_lookback': 50}))
+
+    report = timings.to_dict()['phases']
+    for phase in ('backtest.signals', 'backtest.trades', 'backtest.metrics',
+                  'liquidity_sweep.levels', 'liquidity_sweep.sweep'):
+        assert report[phase]['count'] == 2
+        assert report[phase]['candles'] == 2 * len(data)
+        assert sum(report[phase]['histogram_ms'].values()) == 2
+
+    # Parameter-independent preparation runs once per dataset
+    assert report['liquidity_sweep.prepare']['count'] == 1
+
+    # Shares are relative to the component (prefix) total
+    sweep_shares = [v['share'] for k, v in report.items() if k.startswith('liquidity_sweep.')]
+    assert np.isclose(sum(sweep_shares), 1.0, atol=1e-3)
+
+
+def test_merge_and_pickle():
+    a, b = TimingCollector(), TimingCollector()
+    a.record('backtest.trades', 0.0005, candles=10)
+    b.record('backtest.trades', 0.25, candles=20)
+    b.record('backtest.metrics', 100.0)
+
+    merged = TimingCollector().merge(pickle.loads(pickle.dumps(a))).merge(b)
+    trades = merged.to_dict()['phases']['backtest.trades']
+    assert trades['count'] == 2 and trades['candles'] == 30
+    assert trades['min_seconds'] == 0.0005 and trades['max_seconds'] == 0.25
+    assert trades['histogram_ms'] == {'<=1ms': 1, '<=500ms': 1}
+    assert merged.to_dict()['phases']['backtest.metrics']['histogram_ms'] == {
+        f'>{TIME_BUCKETS_MS[-1]}ms': 1
+    }
+
+
+def test_nested_allocation_tracking():
+    with collect(TimingCollector(track_allocations=True)) as timings:
+        with timed('outer.phase'):
+            big = np.ones(2_000_000)
+            with timed('inner.phase'):
+                small = np.ones(1_000)
+            del big, small
+
+    phases = timings.to_dict()['phases']
+    assert phases['outer.phase']['alloc_peak_bytes'] >= 16_000_000
+    assert 8_000 <= phases['inner.phase']['alloc_peak_bytes'] < 1_000_000
+
+
+def test_optimizer_result_carries_telemetry(synthetic_ohlcv):
+    from training.optimizers.random_search import RandomSearchOptimizer
+
+    data = synthetic_ohlcv(600, seed=4)
+    result = RandomSearchOptimizer(seed=1, verbose=False).optimize(
+        backtest_engine=BacktestEngine(),
+        data=data,
+        strategy_class=LiquiditySweepStrategy,
+        parameter_space={'reversal_candles': [1, 2], 'key_level_lookback': [40, 60],
+                         'min_level_touches': [2]},
+        n_iterations=4,
+        min_trades=0,
+        n_jobs=1,
+        batch_size=2
+    )
+
+    phases = result['telemetry']['phases']
+    evaluated = phases['backtest.signals']['count']
+    assert 0 < evaluated <= result['total_evaluations']
+    assert phases['backtest.trades']['count'] == evaluated
+    assert phases['liquidity_sweep.sweep']['count'] == evaluated
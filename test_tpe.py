@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Tests for BacktestBudget checkpoints and the TPE optimizer
+(training.optimizers.tpe).
+
+Run with: python -m pytest -q test_tpe.py
+"""
+
+import numpy as np
+import pandas as pd
+
+from training import registry
+from training.backtest_engine import BacktestBudget, BacktestEngine, checkpoint_index, checkpoint_key
+from training.optimizers.tpe import MedianPruner, TPEOptimizer, TPESampler
+from training.strategies.liquidity_sweep import LiquiditySweepStrategy
+from training.telemetry import TimingCollector, collect
+
+
+CHECKPOINTS = (0.25, 0.5, 0.75)
+
+
+class FixedSignals:
+    def __init__(self, signals, params):
+        self.signals = signals
+        self.params = params
+
+    def generate_signals(self, data, progress_callback=None):
+        return self.signals
+
+
+def fixed_signals(data, seed):
+    rng = np.random.default_rng(seed)
+    side = rng.choice(['BUY', 'SELL', 'HOLD'], len(data), p=[0.03, 0.03, 0.94])
+    close = data['close'].to_numpy()
+    long = side == 'BUY'
+    return pd.DataFrame({
+        'timestamp': data['timestamp'],
+        'signal': side,
+        'stop_loss': np.where(long, close * 0.99, close * 1.01),
+        'take_profit': np.where(long, close * 1.02, close * 0.98)
+    })
+
+
+def test_checkpoints_report_running_metrics(synthetic_ohlcv):
+    data = synthetic_ohlcv(3000, seed=12)
+    engine = BacktestEngine()
+    strategy = FixedSignals(fixed_signals(data, seed=13), {'max_holding_periods': 30})
+
+    seen = {}
+
+    def record(fraction, metrics):
+        seen[fraction] = metrics
+        return False
+
+    budget = BacktestBudget(objective='net_profit_pct', checkpoints=CHECKPOINTS, checkpoint_callback=record)
+    result = engine.run_backtest(data, strategy, budget=budget)
+    full = engine.run_backtest(data, strategy)
+
+    assert not result.pruned and set(seen) == set(CHECKPOINTS)
+    timestamps = data['timestamp'].to_numpy()
+    for fraction in CHECKPOINTS:
+        before = full.trade_log.exit_time < timestamps[checkpoint_index(fraction, len(data))]
+        assert 0 < before.sum() < len(full.trade_log)
+        assert seen[fraction]['total_trades'] == before.sum()
+        expected = round(full.trade_log.pnl[before].sum() / engine.initial_capital * 100, 2)
+        assert seen[fraction]['net_profit_pct'] == expected
+        assert result.metrics[checkpoint_key('net_profit_pct', fraction)] == expected
+
+    # Checkpoint values are extra keys; the rest of the metrics is unchanged
+    assert {k: v for k, v in result.metrics.items() if '_at_' not in k} == full.metrics
+
+
+def test_checkpoint_callback_prunes(synthetic_ohlcv):
+    data = synthetic_ohlcv(3000, seed=12)
+    engine = BacktestEngine()
+    strategy = FixedSignals(fixed_signals(data, seed=13), {'max_holding_periods': 30})
+    full = engine.run_backtest(data, strategy)
+
+    budget = BacktestBudget(
+        objective='sharpe_ratio', checkpoints=CHECKPOINTS,
+        checkpoint_callback=lambda fraction, metrics: fraction >= 0.5
+    )
+    with collect(TimingCollector()) as telemetry:
+        pruned = engine.run_backtest(data, strategy, budget=budget)
+
+    assert pruned.prune_reason == 'checkpoint' and pruned.metrics['pruned']
+    assert 0 < len(pruned.trade_log) < len(full.trade_log)
+    assert telemetry.counters == {'backtest.pruned.checkpoint': 1}
+
+
+def test_median_pruner():
+    metrics = [{'sharpe_ratio_at_25pct': v, 'sharpe_ratio_at_50pct': 2 * v} for v in range(6)]
+    metrics[0].pop('sharpe_ratio_at_50pct')
+
+    pruner = MedianPruner.from_trials(metrics, 'sharpe_ratio', (0.25, 0.5, 0.75), min_trials=6)
+
+    assert pruner.thresholds == {0.25: 2.5}
+    assert pruner(0.25, {'sharpe_ratio': 2.0}) and not pruner(0.25, {'sharpe_ratio': 2.5})
+    assert not pruner(0.5, {'sharpe_ratio': -10.0})
+
+
+def test_sampler_concentrates_on_good_region():
+    space = {'x': (0.0, 10.0), 'n': (1, 50), 'mode': ['a', 'b', 'c', 'd']}
+
+    def score(params):
+        return -abs(params['x'] - 7.0) - abs(params['n'] - 12) / 5 + (2.0 if params['mode'] == 'c' else 0.0)
+
+    sampler = TPESampler(space, seed=3)
+    for _ in range(80):
+        params = sampler.ask()
+        assert 0.0 <= params['x'] <= 10.0 and 1 <= params['n'] <= 50 and isinstance(params['n'], int)
+        sampler.tell(params, score(params) if params['x'] < 9.5 else None)
+
+    late = [params for params, _ in sampler.trials[-30:]]
+    assert sum(p['mode'] == 'c' for p in late) > 15
+    assert np.median([abs(p['x'] - 7.0) for p in late]) < 1.5
+    best = max(score(p) for p, value in sampler.trials if value is not None)
+    assert best > 1.0
+
+
+def test_optimizer_is_registered_and_independent_of_workers(synthetic_ohlcv):
+    data = synthetic_ohlcv(4000, seed=5)
+    space = LiquiditySweepStrategy.get_parameter_space()
+
+    def run(optimizer, n_jobs):
+        return optimizer.optimize(
+            backtest_engine=BacktestEngine(),
+            data=data,
+            strategy_class=LiquiditySweepStrategy,
+            parameter_space=space,
+            n_iterations=24,
+            n_startup_trials=8,
+            min_trades=1,
+            n_jobs=n_jobs,
+            points_per_round=6
+        )
+
+    optimizer = registry.create_optimizer('tpe', seed=4)
+    assert isinstance(optimizer, TPEOptimizer)
+    optimizer.verbose = False
+
+    parallel = run(optimizer, 2)
+    inline = run(TPEOptimizer(seed=4, verbose=False), 1)
+
+    assert parallel['convergence_trace'] == inline['convergence_trace']
+    assert parallel['best_parameters'] == inline['best_parameters']
+    assert len(inline['convergence_trace']) == 24
+    assert inline['pruned_evaluations'] > 0
+    assert inline['valid_evaluations'] + inline['pruned_evaluations'] <= 24
+
+    # Bounded objective: trials are pruned against earlier rounds only
+    def run_bounded(n_jobs):
+        return TPEOptimizer(seed=4, verbose=False).optimize(
+            backtest_engine=BacktestEngine(),
+            data=synthetic_ohlcv(3000, seed=5),
+            strategy_class=LiquiditySweepStrategy,
+            parameter_space=space,
+            n_iterations=32,
+            objective='net_profit_pct',
+            n_jobs=n_jobs,
+            early_abort=True,
+            checkpoints=()
+        )
+
+    bounded_inline = run_bounded(1)
+    bounded_parallel = run_bounded(2)
+    assert bounded_parallel['convergence_trace'] == bounded_inline['convergence_trace']
+    assert bounded_parallel['valid_evaluations'] == bounded_inline['valid_evaluations']
+
+
+def test_progress_uses_episode_contract(synthetic_ohlcv, episode_counter):
+    data = synthetic_ohlcv(3000, seed=5)
+    result = TPEOptimizer(seed=4, verbose=False).optimize(
+        backtest_engine=BacktestEngine(),
+        data=data,
+        strategy_class=LiquiditySweepStrategy,
+        parameter_space=LiquiditySweepStrategy.get_parameter_space(),
+        n_iterations=12,
+        n_startup_trials=6,
+        min_trades=0,
+        progress_callback=episode_counter,
+        n_jobs=1,
+        points_per_round=6,
+        checkpoints=()
+    )
+
+    # Only evaluate_batch's (episode_index, fraction, stage) calls
+    assert all(isinstance(stage, str) and 0.0 <= fraction <= 1.0 for _, fraction, stage in episode_counter.calls)
+    assert episode_counter.completed_count == result['valid_evaluations']
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Backtest and Strategy Micro-Benchmarks
+
+Times signal generation for the training strategies and
+BacktestEngine.run_backtest on deterministic synthetic OHLCV+ATR data
+(tools.seed_market_data.generate_ohlcv_frame) and reports candles/sec and
+peak traced memory per component. Runs fully offline - no database.
+
+Results are written as JSON so runs can be compared over time:
+
+    python -m tools.benchmark_backtest --sizes 10000 100000 1000000
+    python -m tools.benchmark_backtest --compare benchmark_results/previous.json
+
+Components whose run at one size exceeds --time-limit are skipped at the
+larger sizes (recorded as skipped in the JSON).
+
+The shared feature cache (training.feature_cache) is disabled while
+benchmarking: its entries survive in /dev/shm across runs and repeats, so
+timings would otherwise measure cache reads instead of the indicators.
+Pass --feature-cache to time the warm-cache path instead.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.seed_market_data import generate_ohlcv_frame
+from training.backtest_engine import BacktestEngine
+from training.feature_cache import get_feature_cache, set_feature_cache
+from training.strategies import (
+    LiquiditySweepStrategy,
+    CapitulationReversalStrategy,
+    FailedBreakdownStrategy
+)
+
+STRATEGIES = {
+    'liquidity_sweep': LiquiditySweepStrategy,
+    'capitulation_reversal': CapitulationReversalStrategy,
+    'failed_breakdown': FailedBreakdownStrategy
+}
+
+COMPONENTS = list(STRATEGIES) + ['run_backtest']
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+
+class FixedSignals:
+    """Strategy stand-in returning precomputed signals (isolates the engine)."""
+
+    def __init__(self, signals: pd.DataFrame, params: dict):
+        self.signals = signals
+        self.params = params
+
+    def generate_signals(self, data, progress_callback=None):
+        return self.signals
+
+
+def synthetic_signals(data: pd.DataFrame, seed: int, density: float = 0.02) -> pd.DataFrame:
+    """Random BUY/SELL signals with ATR-based SL/TP at the given density."""
+    rng = np.random.default_rng(seed)
+    draws = rng.random(len(data))
+    signal = np.where(draws < density / 2, 'BUY', np.where(draws < density, 'SELL', 'HOLD'))
+    close = data['close'].to_numpy()
+    atr = data['atr'].to_numpy()
+    direction = np.where(signal == 'BUY', 1.0, np.where(signal == 'SELL', -1.0, 0.0))
+
+    return pd.DataFrame({
+        'timestamp': data['timestamp'].to_numpy(),
+        'signal': signal,
+        'stop_loss': np.where(direction != 0, close - direction * atr * 1.5, 0.0),
+        'take_profit': np.where(direction != 0, close + direction * atr * 3.0, 0.0)
+    })
+
+
+def make_runner(component: str, data: pd.DataFrame, seed: int):
+    """Zero-argument callable running one component over data."""
+    if component == 'run_backtest':
+        engine = BacktestEngine()
+        strategy = FixedSignals(synthetic_signals(data, seed), {'max_holding_periods': 50})
+        return lambda: engine.run_backtest(data, strategy)
+
+    strategy = STRATEGIES[component]({})
+    return lambda: strategy.generate_signals(data)
+
+
+def measure(runner, repeat: int, memory: bool) -> dict:
+    """Best-of-N wall time, plus peak traced memory from one extra run."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        runner()
+        timings.append(time.perf_counter() - start)
+
+    peak_mb = None
+    if memory:
+        # Separate run: tracemalloc overhead must not leak into the timings
+        tracemalloc.start()
+        try:
+            runner()
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+        finally:
+            tracemalloc.stop()
+
+    return {'seconds': min(timings), 'all_seconds': timings, 'peak_mb': peak_mb}
+
+
+def run_benchmarks(
+    sizes, components, repeat: int = 3, memory: bool = True,
+    time_limit: float = 60.0, seed: int = 42, feature_cache: bool = False
+) -> dict:
+    """
+    Run every component at every size; returns the JSON-ready report.
+
+    The process-wide feature cache is disabled for the run (and restored
+    afterwards) unless feature_cache is True.
+    """
+    report = {
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'environment': environment_info(),
+        'config': {
+            'sizes': sizes, 'components': components, 'repeat': repeat,
+            'memory': memory, 'time_limit': time_limit, 'seed': seed,
+            'feature_cache': feature_cache
+        },
+        'results': []
+    }
+
+    previous_cache = get_feature_cache()
+    if not feature_cache:
+        set_feature_cache(None)
+    try:
+        _run_sizes(report, sizes, components, repeat, memory, time_limit, seed)
+    finally:
+        set_feature_cache(previous_cache)
+
+    return report
+
+
+def _run_sizes(report: dict, sizes, components, repeat: int, memory: bool, time_limit: float, seed: int):
+    """Measure every component at every size into report['results']."""
+    over_limit = set()
+
+    for size in sorted(sizes):
+        data = generate_ohlcv_frame('BTC/USDT', 45000, size, seed=seed)
+
+        for component in components:
+            entry = {'component': component, 'candles': size}
+
+            if component in over_limit:
+                entry['skipped'] = 'time_limit'
+                report['results'].append(entry)
+                print(f"  {component:<24} {size:>9,} candles  skipped (exceeded time limit)")
+                continue
+
+            stats = measure(make_runner(component, data, seed), repeat, memory)
+            entry.update(stats)
+            entry['candles_per_sec'] = size / stats['seconds'] if stats['seconds'] > 0 else None
+            report['results'].append(entry)
+
+            if stats['seconds'] > time_limit:
+                over_limit.add(component)
+
+            peak = f"{stats['peak_mb']:8.1f} MB" if stats['peak_mb'] is not None else ''
+            print(
+                f"  {component:<24} {size:>9,} candles  "
+                f"{stats['seconds']:8.3f}s  {entry['candles_per_sec']:>12,.0f} candles/s  {peak}"
+            )
+
+
+def environment_info() -> dict:
+    """Interpreter, library versions and git revision for the report."""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'git_commit': commit
+    }
+
+
+def compare_reports(current: dict, baseline: dict) -> None:
+    """Print per-component speedups of current vs a previous report."""
+    previous = {
+        (r['component'], r['candles']): r for r in baseline['results'] if 'seconds' in r
+    }
+
+    print(f"\nCompared with {baseline.get('environment', {}).get('git_commit')} "
+          f"({baseline.get('created_at')}):")
+    for r in current['results']:
+        old = previous.get((r['component'], r['candles']))
+        if old is None or 'seconds' not in r:
+            continue
+        speedup = old['seconds'] / r['seconds'] if r['seconds'] > 0 else float('inf')
+        print(f"  {r['component']:<24} {r['candles']:>9,} candles  {speedup:6.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Candle counts to benchmark')
+    parser.add_argument('--components', nargs='+', choices=COMPONENTS, default=COMPONENTS)
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per measurement (best is kept)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the peak memory run')
+    parser.add_argument('--time-limit', type=float, default=60.0,
+                        help='Skip larger sizes of a component once a run exceeds this many seconds')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--feature-cache', action='store_true',
+                        help='Keep the shared feature cache enabled (times warm-cache reads)')
+    parser.add_argument('--output', help='JSON output path (default: benchmark_results/backtest_<timestamp>.json)')
+    parser.add_argument('--compare', help='Previous JSON report to compare against')
+    args = parser.parse_args()
+
+    # Strategy and engine INFO logs would dominate the output
+    logging.basicConfig(level=logging.WARNING)
+
+    print(f"Benchmarking {', '.join(args.components)} on {args.sizes} candles")
+    report = run_benchmarks(
+        sizes=args.sizes,
+        components=args.components,
+        repeat=args.repeat,
+        memory=not args.no_memory,
+        time_limit=args.time_limit,
+        seed=args.seed,
+        feature_cache=args.feature_cache
+    )
+
+    output = Path(args.output or f"benchmark_results/backtest_{datetime.now():%Y%m%d_%H%M%S}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nResults saved to {output}")
+
+    if args.compare:
+        compare_reports(report, json.loads(Path(args.compare).read_text()))
+
+
+if __name__ == '__main__':
+    main()
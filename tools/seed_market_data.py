@@ -5,14 +5,16 @@ Populates the market_data table with realistic OHLCV data for training
 """
 
 import os
-import psycopg2
-import psycopg2.extras
 from datetime import datetime, timedelta
 import random
 import math
 
+import numpy as np
+import pandas as pd
+
 def get_db_connection():
     """Get database connection"""
+    import psycopg2  # Only needed for seeding; data generation runs offline
     return psycopg2.connect(
         host=os.getenv("DB_HOST", "localhost"),
         port=os.getenv("DB_PORT", "5432"),
@@ -21,11 +23,17 @@ def get_db_connection():
         password=os.getenv("DB_PASSWORD", "password")
     )
 
-def generate_realistic_ohlcv(symbol, start_price, num_candles=2000):
-    """Generate realistic OHLCV data for a symbol"""
+def generate_realistic_ohlcv(symbol, start_price, num_candles=2000, seed=None,
+                             interval=timedelta(hours=1), start_time=None):
+    """Generate realistic OHLCV data for a symbol
+
+    Pass a seed (and start_time) for a deterministic series; interval sets
+    the candle spacing (hourly by default).
+    """
+    rng = _random_source(seed)
     data = []
     current_price = start_price
-    current_time = datetime.now() - timedelta(hours=num_candles)
+    current_time = start_time or datetime.now() - interval * num_candles
     
     # Symbol-specific parameters
     if "BTC" in symbol:
@@ -43,7 +51,7 @@ def generate_realistic_ohlcv(symbol, start_price, num_candles=2000):
     
     for i in range(num_candles):
         # Generate price movement (random walk with drift)
-        price_change = random.gauss(0, volatility)
+        price_change = rng.gauss(0, volatility)
         drift = 0.0001  # Slight upward drift
         
         # Apply change
@@ -55,13 +63,13 @@ def generate_realistic_ohlcv(symbol, start_price, num_candles=2000):
         if new_price > current_price:  # Bullish candle
             open_price = current_price
             close_price = new_price
-            high_price = close_price + random.uniform(0, price_range * 0.3)
-            low_price = open_price - random.uniform(0, price_range * 0.2)
+            high_price = close_price + rng.uniform(0, price_range * 0.3)
+            low_price = open_price - rng.uniform(0, price_range * 0.2)
         else:  # Bearish candle
             open_price = current_price
             close_price = new_price
-            high_price = open_price + random.uniform(0, price_range * 0.2)
-            low_price = close_price - random.uniform(0, price_range * 0.3)
+            high_price = open_price + rng.uniform(0, price_range * 0.2)
+            low_price = close_price - rng.uniform(0, price_range * 0.3)
         
         # Ensure prices are positive and logical
         low_price = max(0.01, low_price)
@@ -69,10 +77,10 @@ def generate_realistic_ohlcv(symbol, start_price, num_candles=2000):
         
         # Generate volume (higher volume on bigger moves)
         volume_multiplier = 1 + abs(price_change) * 10
-        volume = int(volume_base * volume_multiplier * random.uniform(0.5, 2.0))
+        volume = int(volume_base * volume_multiplier * rng.uniform(0.5, 2.0))
         
         data.append({
-            'timestamp': int((current_time + timedelta(hours=i)).timestamp()),
+            'timestamp': int((current_time + interval * i).timestamp()),
             'symbol': symbol,
             'exchange': 'binance',  # Default exchange
             'open': round(open_price, 2),
@@ -86,6 +94,35 @@ def generate_realistic_ohlcv(symbol, start_price, num_candles=2000):
     
     return data
 
+def _random_source(seed):
+    """Module-level random (seed=None) or an isolated seeded generator"""
+    return random if seed is None else random.Random(seed)
+
+def generate_ohlcv_frame(symbol, start_price, num_candles, seed=42,
+                         interval=timedelta(minutes=5), atr_period=14):
+    """Deterministic OHLCV+ATR DataFrame in the training pipeline format
+
+    Wraps generate_realistic_ohlcv() with a fixed start time and returns
+    millisecond timestamps plus the rolling-mean ATR column the training
+    strategies expect. No database access.
+    """
+    candles = generate_realistic_ohlcv(
+        symbol, start_price, num_candles, seed=seed,
+        interval=interval, start_time=datetime(2024, 1, 1)
+    )
+    df = pd.DataFrame(candles, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+    df['timestamp'] = df['timestamp'].astype(np.int64) * 1000
+    df['volume'] = df['volume'].astype(np.float64)
+
+    prev_close = df['close'].shift(1)
+    tr = np.maximum(
+        df['high'] - df['low'],
+        np.maximum((df['high'] - prev_close).abs(), (df['low'] - prev_close).abs())
+    )
+    df['atr'] = tr.rolling(window=atr_period).mean().bfill()
+
+    return df
+
 def seed_market_data():
     """Seed the database with market data for training"""
     print("🚀 Starting market data seeding...")
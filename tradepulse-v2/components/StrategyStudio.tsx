@@ -673,10 +673,14 @@ export const StrategyStudio: React.FC<StrategyStudioProps> = ({ currentUser, onT
                         >
                             <option value="bayesian">Bayesian Optimization (Recommended)</option>
                             <option value="random">Random Search</option>
+                            <option value="halving">Successive Halving</option>
+                            <option value="tpe">TPE (Tree-structured Parzen Estimator)</option>
                         </select>
                         <p className="text-xs text-brand-text-secondary mt-1">
                             {optimizer === 'bayesian' && 'Smart search using probability models - fastest convergence'}
                             {optimizer === 'random' && 'Random parameter exploration - good for broad search'}
+                            {optimizer === 'halving' && 'Random search that drops weak configs on recent data first - fraction of the CPU time'}
+                            {optimizer === 'tpe' && 'Model-based search for mixed categorical/continuous parameters - stops trailing trials mid-backtest'}
                         </p>
                     </div>
 
@@ -9,15 +9,29 @@ Key Features:
 - Walk-forward compatible
 - 15+ performance metrics
 - Circuit breaker simulation
+- Optional intrabar SL/TP resolution from 1m candles
+- Optional per-candle mark-to-market equity curve
 """
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, replace
 from datetime import datetime
 import logging
 
+from .trade_simulator import (
+    SimulatedTrades,
+    simulate_trades,
+    encode_signals,
+    SIGNAL_BUY,
+    EXIT_REASONS
+)
+from .intrabar import IntrabarData
+from .telemetry import timed, count
+from .strategies.context import strategy_signals
+from .strategies.signals import SparseSignals
+
 log = logging.getLogger(__name__)
 
 
@@ -37,12 +51,188 @@ class Trade:
 
 
 @dataclass
+class TradeLog:
+    """
+    Column-oriented trade log (one NumPy array per Trade field).
+    
+    Metrics are computed straight from these arrays; Trade records are
+    only materialized on demand via to_trades() / indexing.
+    """
+    entry_time: np.ndarray       # int64 Unix timestamp ms
+    exit_time: np.ndarray        # int64 Unix timestamp ms
+    entry_price: np.ndarray      # float64 (after slippage)
+    exit_price: np.ndarray       # float64 (after slippage)
+    side: np.ndarray             # int8: 1 = LONG, -1 = SHORT
+    size: np.ndarray             # float64 position size (quote currency)
+    pnl: np.ndarray              # float64 profit/loss (absolute)
+    pnl_pct: np.ndarray          # float64 profit/loss (fraction)
+    holding_periods: np.ndarray  # int64 candles held
+    exit_reason: np.ndarray      # int8 code into EXIT_REASONS
+    
+    def __len__(self) -> int:
+        return len(self.pnl)
+    
+    def __getitem__(self, k: int) -> Trade:
+        return Trade(
+            entry_time=int(self.entry_time[k]),
+            entry_price=float(self.entry_price[k]),
+            exit_time=int(self.exit_time[k]),
+            exit_price=float(self.exit_price[k]),
+            side='LONG' if self.side[k] == SIGNAL_BUY else 'SHORT',
+            size=float(self.size[k]),
+            pnl=float(self.pnl[k]),
+            pnl_pct=float(self.pnl_pct[k]),
+            holding_periods=int(self.holding_periods[k]),
+            exit_reason=EXIT_REASONS[self.exit_reason[k]]
+        )
+    
+    def to_trades(self) -> List[Trade]:
+        """Materialize Trade records."""
+        return [self[k] for k in range(len(self))]
+    
+    def equity_curve(self, initial_capital: float, start_timestamp: int) -> pd.DataFrame:
+        """
+        Equity after each trade exit (plus the starting point).
+        
+        Returns DataFrame with columns: timestamp, equity
+        """
+        return pd.DataFrame({
+            'timestamp': np.concatenate([[start_timestamp], self.exit_time]),
+            'equity': np.cumsum(np.concatenate([[initial_capital], self.pnl]))
+        })
+    
+    @classmethod
+    def empty(cls) -> 'TradeLog':
+        """Trade log with no trades."""
+        floats = np.empty(0, dtype=np.float64)
+        ints = np.empty(0, dtype=np.int64)
+        codes = np.empty(0, dtype=np.int8)
+        return cls(
+            entry_time=ints, exit_time=ints, entry_price=floats, exit_price=floats,
+            side=codes, size=floats, pnl=floats, pnl_pct=floats,
+            holding_periods=ints, exit_reason=codes
+        )
+
+
+@dataclass
+class BacktestBudget:
+    """
+    Optional early-abort conditions for optimizer backtests.
+    
+    Trades are checked as they close; once a condition proves the
+    configuration cannot be useful the simulation stops and the result is
+    marked pruned (see BacktestResult.pruned).
+    
+    Checkpoints report intermediate results: once the simulation passes
+    each candle fraction, checkpoint_callback(fraction, running_metrics)
+    gets the metrics of the trades closed so far and returns True to
+    prune. Unpruned results carry the running objective at every
+    checkpoint (see checkpoint_key()).
+    """
+    max_drawdown_pct: Optional[float] = None   # Abort when drawdown exceeds this (e.g. 30.0)
+    min_trades: Optional[int] = None           # Abort when fewer trades are still possible
+    objective: Optional[str] = None            # Objective being maximized
+    best_objective: Optional[float] = None     # Abort when the objective can no longer beat this
+    checkpoints: Tuple[float, ...] = ()        # Candle fractions with running metrics (e.g. 0.25, 0.5, 0.75)
+    checkpoint_callback: Optional[Callable[[float, Dict[str, float]], bool]] = None  # True = prune
+    running_best: bool = True                  # run_batch raises best_objective as columns beat it
+    
+    @property
+    def bounds_objective(self) -> bool:
+        """True if an upper bound can be derived for the objective."""
+        return self.best_objective is not None and self.objective in BOUNDED_OBJECTIVES
+
+
+# Objectives with a cheap upper bound during simulation
+BOUNDED_OBJECTIVES = ('net_profit_pct', 'total_trades')
+
+# BacktestBudget abort reasons
+PRUNE_DRAWDOWN = 'max_drawdown'
+PRUNE_MIN_TRADES = 'min_trades'
+PRUNE_OBJECTIVE = 'objective_bound'
+PRUNE_CHECKPOINT = 'checkpoint'
+
+
+def checkpoint_index(fraction: float, n_candles: int) -> int:
+    """First candle past a checkpoint (trades exiting before it count towards it)."""
+    return min(int(fraction * n_candles), n_candles)
+
+
+def checkpoint_key(objective: str, fraction: float) -> str:
+    """Metrics key of the running objective at a checkpoint (e.g. 'sharpe_ratio_at_25pct')."""
+    return f"{objective}_at_{int(round(fraction * 100))}pct"
+
+
 class BacktestResult:
-    """Complete backtest results."""
-    trades: List[Trade]
-    metrics: Dict[str, float]
-    equity_curve: pd.DataFrame
-    parameters: Dict[str, Any]
+    """
+    Complete backtest results.
+    
+    Only metrics, parameters and the compact TradeLog are stored (and
+    pickled back from loky workers). The Trade list and the equity curve
+    are built on first access. With mark-to-market enabled the per-candle
+    equity is kept as a (downsampled) float32 array.
+    """
+    
+    def __init__(
+        self,
+        metrics: Dict[str, float],
+        parameters: Dict[str, Any],
+        trade_log: TradeLog,
+        initial_capital: float,
+        start_timestamp: Optional[int],
+        timestamps: Optional[np.ndarray] = None,
+        prune_reason: Optional[str] = None,
+        bar_equity: Optional[np.ndarray] = None
+    ):
+        self.metrics = metrics
+        self.parameters = parameters
+        self.trade_log = trade_log
+        self.initial_capital = initial_capital
+        self.start_timestamp = start_timestamp
+        self.timestamps = timestamps
+        self.prune_reason = prune_reason
+        self.bar_equity = bar_equity  # float32 mark-to-market equity at self.timestamps
+        self._trades = None
+        self._equity_curve = None
+    
+    @property
+    def pruned(self) -> bool:
+        """True if a BacktestBudget stopped the backtest early (metrics are partial)."""
+        return self.prune_reason is not None
+    
+    @property
+    def trades(self) -> List[Trade]:
+        """Trade records (materialized from trade_log on first access)."""
+        if self._trades is None:
+            self._trades = self.trade_log.to_trades()
+        return self._trades
+    
+    @property
+    def equity_curve(self) -> pd.DataFrame:
+        """Equity curve DataFrame (timestamp, equity), built on first access."""
+        if self._equity_curve is None:
+            if self.bar_equity is not None:
+                self._equity_curve = pd.DataFrame({
+                    'timestamp': self.timestamps,
+                    'equity': self.bar_equity
+                })
+            elif len(self.trade_log) == 0:
+                self._equity_curve = pd.DataFrame({
+                    'timestamp': self.timestamps if self.timestamps is not None else [self.start_timestamp],
+                    'equity': self.initial_capital
+                })
+            else:
+                self._equity_curve = self.trade_log.equity_curve(
+                    self.initial_capital, self.start_timestamp
+                )
+        return self._equity_curve
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Lazily built views are cheap to rebuild; don't ship them between processes
+        state = self.__dict__.copy()
+        state['_trades'] = None
+        state['_equity_curve'] = None
+        return state
 
 
 class BacktestEngine:
@@ -75,7 +265,10 @@ class BacktestEngine:
         initial_capital: float = 10000.0,
         fee_rate: float = 0.001,        # 0.1%
         slippage_rate: float = 0.0005,  # 0.05%
-        risk_per_trade: float = 0.02    # 2% of capital per trade
+        risk_per_trade: float = 0.02,   # 2% of capital per trade
+        intrabar: Optional[IntrabarData] = None,
+        mark_to_market: bool = False,
+        equity_downsample: int = 1
     ):
         """
         Initialize BacktestEngine.
@@ -85,17 +278,30 @@ class BacktestEngine:
             fee_rate: Trading fee (0.001 = 0.1%)
             slippage_rate: Slippage estimate (0.0005 = 0.05%)
             risk_per_trade: Risk per trade as fraction of capital
+            intrabar: Optional 1m series of the backtested symbol; candles
+                      touching both SL and TP are resolved from it instead
+                      of assuming SL hit first
+            mark_to_market: Mark open positions to market on every candle;
+                            drawdown metrics and the equity curve then use the
+                            per-candle series instead of trade-exit equity
+            equity_downsample: Keep every Nth candle of the stored
+                               mark-to-market curve (metrics always use the
+                               full-resolution series)
         """
         self.initial_capital = initial_capital
         self.fee_rate = fee_rate
         self.slippage_rate = slippage_rate
         self.risk_per_trade = risk_per_trade
+        self.intrabar = intrabar
+        self.mark_to_market = mark_to_market
+        self.equity_downsample = max(int(equity_downsample), 1)
         
         log.info(
             f"BacktestEngine initialized: "
             f"${initial_capital:.0f} capital, "
             f"{fee_rate*100:.2f}% fees, "
             f"{slippage_rate*100:.3f}% slippage"
+            + (f", intrabar SL/TP from {intrabar.path}" if intrabar is not None else "")
         )
     
     def run_backtest(
@@ -103,7 +309,8 @@ class BacktestEngine:
         data: pd.DataFrame,
         strategy_instance: Any,
         position_size_pct: float = 1.0,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        budget: Optional[BacktestBudget] = None
     ) -> BacktestResult:
         """
         Run backtest simulation.
@@ -112,190 +319,563 @@ class BacktestEngine:
             data: OHLCV DataFrame with indicators
                   Required columns: timestamp, open, high, low, close, volume, atr
             strategy_instance: Strategy object with generate_signals() method
+                               (prepare()/evaluate() strategies reuse the
+                               process-wide prepared context of data)
             position_size_pct: Position sizing multiplier (1.0 = full risk_per_trade)
             progress_callback: Optional callback(current, total, stage)
                              Called periodically during backtest phases
+            budget: Optional BacktestBudget; the simulation stops as soon as
+                    the configuration is hopeless and the result is pruned
         
         Returns:
-            BacktestResult with trades, metrics, equity curve
+            BacktestResult with metrics, trade log and (lazy) trades / equity curve
         """
         import time
         backtest_start = time.time()
+        n_candles = len(data)
         
-        log.info(f"Running backtest: {len(data)} candles")
+        log.info(f"Running backtest: {n_candles} candles")
         
         # Validate data
-        required_cols = ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'atr']
-        missing = [col for col in required_cols if col not in data.columns]
-        if missing:
-            raise ValueError(f"Missing required columns: {missing}")
+        self._validate_data(data)
         
         # Generate signals from strategy
-        signal_start = time.time()
-        signals = strategy_instance.generate_signals(data, progress_callback=progress_callback)
-        signal_time = time.time() - signal_start
-        log.info(f"⏱️  Signal generation took {signal_time:.2f}s ({len(data)} candles)")
+        with timed('backtest.signals', n_candles) as signal_phase:
+            signals = strategy_signals(
+                strategy_instance, data, progress_callback=progress_callback, sparse=True
+            )
+        signal_time = signal_phase.seconds
+        log.info(f"⏱️  Signal generation took {signal_time:.2f}s ({n_candles} candles)")
         
         # Simulate trades
-        trade_start = time.time()
-        trades = self._simulate_trades(
-            data=data,
-            signals=signals,
-            strategy_params=strategy_instance.params,
-            position_size_pct=position_size_pct
-        )
-        trade_time = time.time() - trade_start
+        with timed('backtest.trades', n_candles) as trade_phase:
+            arrays = self._align_signals(data, signals)
+            trade_log, prune_reason, equity = self._run_simulation(
+                arrays=arrays,
+                max_holding=strategy_instance.params.get('max_holding_periods', 50),
+                position_size_pct=position_size_pct,
+                budget=budget
+            )
+        trade_time = trade_phase.seconds
         log.info(f"⏱️  Trade simulation took {trade_time:.2f}s")
         
-        # Calculate metrics
-        metrics_start = time.time()
-        metrics = self._calculate_metrics(trades, data)
-        metrics_time = time.time() - metrics_start
+        # Calculate metrics (straight from the trade log arrays)
+        with timed('backtest.metrics', n_candles) as metrics_phase:
+            metrics = self._metrics_from_trade_log(trade_log, equity)
+        metrics_time = metrics_phase.seconds
         log.info(f"⏱️  Metrics calculation took {metrics_time:.2f}s")
         
-        # Generate equity curve
-        equity_start = time.time()
-        equity_curve = self._generate_equity_curve(trades, data)
-        equity_time = time.time() - equity_start
-        log.info(f"⏱️  Equity curve generation took {equity_time:.2f}s")
+        if prune_reason is not None:
+            metrics['pruned'] = True
+            count(f'backtest.pruned.{prune_reason}')
+            log.info(f"✂️  Backtest pruned ({prune_reason}) after {len(trade_log)} trades")
+        elif budget is not None and budget.checkpoints:
+            metrics.update(self._checkpoint_metrics(trade_log, arrays['timestamp'], budget))
         
         total_time = time.time() - backtest_start
         
         log.info(
-            f"✅ Backtest complete: {len(trades)} trades, "
+            f"✅ Backtest complete: {len(trade_log)} trades, "
             f"Sharpe {metrics.get('sharpe_ratio', 0):.2f}, "
             f"Total time: {total_time:.2f}s "
             f"(signals: {signal_time/total_time*100:.1f}%, "
             f"trades: {trade_time/total_time*100:.1f}%, "
-            f"metrics: {metrics_time/total_time*100:.1f}%, "
-            f"equity: {equity_time/total_time*100:.1f}%)"
+            f"metrics: {metrics_time/total_time*100:.1f}%)"
         )
         
+        # Per-candle equity is stored compactly; downsampled on request
+        bar_equity, bar_timestamps = None, None
+        if equity is not None:
+            with timed('backtest.equity', n_candles):
+                bar_equity, bar_timestamps = self._compact_equity(equity, arrays['timestamp'])
+        elif len(trade_log) == 0:
+            bar_timestamps = data['timestamp'].to_numpy()
+        
+        # Equity curve and Trade records are built lazily on access
         return BacktestResult(
-            trades=trades,
             metrics=metrics,
-            equity_curve=equity_curve,
-            parameters=strategy_instance.params
+            parameters=strategy_instance.params,
+            trade_log=trade_log,
+            initial_capital=self.initial_capital,
+            start_timestamp=int(data['timestamp'].iloc[0]) if len(data) > 0 else None,
+            timestamps=bar_timestamps,
+            prune_reason=prune_reason,
+            bar_equity=bar_equity
         )
     
+    def run_batch(
+        self,
+        data: pd.DataFrame,
+        signal_matrix: Dict[str, np.ndarray],
+        params_list: List[Dict[str, Any]],
+        position_size_pct: float = 1.0,
+        budget: Optional[BacktestBudget] = None
+    ) -> List[Dict[str, float]]:
+        """
+        Backtest N signal configurations over the same candles in one pass.
+        
+        Validation and candle array extraction happen once; each column of
+        the signal matrix is then simulated, priced and scored against the
+        shared arrays. Use build_signal_matrix() to stack strategy outputs.
+        
+        Args:
+            data: OHLCV DataFrame with indicators (same as run_backtest)
+            signal_matrix: Dict with (n_candles × N) arrays:
+                - 'signal': int8 codes (1 = BUY, -1 = SELL, 0 = HOLD)
+                - 'stop_loss': float stop-loss levels
+                - 'take_profit': float take-profit levels
+            params_list: N strategy parameter dicts (for max_holding_periods)
+            position_size_pct: Position sizing multiplier
+            budget: Optional BacktestBudget applied to every configuration.
+                    best_objective is raised as columns beat it, so later
+                    columns are pruned against the running best of the batch
+                    (unless budget.running_best is False).
+        
+        Returns:
+            List of N metric dicts (same keys as BacktestResult.metrics;
+            pruned configurations carry 'pruned': True)
+        """
+        self._validate_data(data)
+        
+        signal = np.asarray(signal_matrix['signal'])
+        if signal.ndim == 1:
+            signal = signal[:, None]
+        
+        n_candles, n_configs = signal.shape
+        if n_candles != len(data):
+            raise ValueError(
+                f"Signal matrix has {n_candles} rows, data has {len(data)} candles"
+            )
+        if n_configs != len(params_list):
+            raise ValueError(
+                f"Signal matrix has {n_configs} columns, got {len(params_list)} parameter sets"
+            )
+        
+        stop_loss = np.asarray(signal_matrix['stop_loss'], dtype=np.float64).reshape(n_candles, n_configs)
+        take_profit = np.asarray(signal_matrix['take_profit'], dtype=np.float64).reshape(n_candles, n_configs)
+        
+        # Shared candle arrays (extracted once for the whole batch)
+        timestamps = data['timestamp'].to_numpy()
+        high = data['high'].to_numpy(dtype=np.float64)
+        low = data['low'].to_numpy(dtype=np.float64)
+        close = data['close'].to_numpy(dtype=np.float64)
+        
+        # Column-major copies so every configuration's column is contiguous
+        signal = np.asfortranarray(signal, dtype=np.int8)
+        stop_loss = np.asfortranarray(stop_loss)
+        take_profit = np.asfortranarray(take_profit)
+        
+        if budget is not None:
+            budget = replace(budget)  # running best is local to this batch
+        
+        results = []
+        for col, params in enumerate(params_list):
+            with timed('backtest.trades', n_candles):
+                trade_log, prune_reason, equity = self._run_simulation(
+                    arrays={
+                        'timestamp': timestamps,
+                        'high': high,
+                        'low': low,
+                        'close': close,
+                        'signal': signal[:, col],
+                        'stop_loss': stop_loss[:, col],
+                        'take_profit': take_profit[:, col]
+                    },
+                    max_holding=params.get('max_holding_periods', 50),
+                    position_size_pct=position_size_pct,
+                    budget=budget
+                )
+            with timed('backtest.metrics', n_candles):
+                metrics = self._metrics_from_trade_log(trade_log, equity)
+            
+            if prune_reason is not None:
+                metrics['pruned'] = True
+                count(f'backtest.pruned.{prune_reason}')
+            else:
+                if budget is not None and budget.checkpoints:
+                    metrics.update(self._checkpoint_metrics(trade_log, timestamps, budget))
+                if budget is not None and budget.running_best and budget.bounds_objective:
+                    value = metrics.get(budget.objective, 0)
+                    if len(trade_log) >= (budget.min_trades or 0) and value > budget.best_objective:
+                        budget.best_objective = value
+            
+            results.append(metrics)
+        
+        log.info(f"Batch backtest complete: {n_configs} configurations, {n_candles} candles")
+        
+        return results
+    
+    def build_signal_matrix(
+        self,
+        data: pd.DataFrame,
+        signals_list: List[Union[pd.DataFrame, SparseSignals]]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Align N strategy signal sets to the candles as one matrix.
+        
+        SparseSignals are placed by candle index; signal DataFrames are
+        matched on timestamp.
+        
+        Args:
+            data: OHLCV DataFrame the signals were generated from
+            signals_list: Outputs of strategy.evaluate_sparse() or
+                          strategy.generate_signals()
+        
+        Returns:
+            signal_matrix dict for run_batch()
+        """
+        n_candles, n_configs = len(data), len(signals_list)
+        signal = np.zeros((n_candles, n_configs), dtype=np.int8, order='F')
+        stop_loss = np.zeros((n_candles, n_configs), dtype=np.float64, order='F')
+        take_profit = np.zeros((n_candles, n_configs), dtype=np.float64, order='F')
+        timestamps = None
+        
+        for col, signals in enumerate(signals_list):
+            if isinstance(signals, SparseSignals):
+                self._check_sparse(data, signals)
+                signal[signals.index, col] = signals.side
+                stop_loss[signals.index, col] = signals.stop_loss
+                take_profit[signals.index, col] = signals.take_profit
+                continue
+            if len(signals) == 0:
+                continue
+            
+            if timestamps is None:
+                timestamps = pd.Index(data['timestamp'])
+                if not timestamps.is_unique:
+                    raise ValueError("Batch backtests require unique candle timestamps")
+            
+            rows = timestamps.get_indexer(signals['timestamp'])
+            matched = rows >= 0
+            rows = rows[matched]
+            
+            signal[rows, col] = encode_signals(signals['signal'].to_numpy()[matched])
+            if 'stop_loss' in signals:
+                stop_loss[rows, col] = signals['stop_loss'].to_numpy(dtype=np.float64)[matched]
+            if 'take_profit' in signals:
+                take_profit[rows, col] = signals['take_profit'].to_numpy(dtype=np.float64)[matched]
+        
+        return {
+            'signal': signal,
+            'stop_loss': stop_loss,
+            'take_profit': take_profit
+        }
+    
+    def _validate_data(self, data: pd.DataFrame):
+        """Raise ValueError if required OHLCV columns are missing."""
+        required_cols = ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'atr']
+        missing = [col for col in required_cols if col not in data.columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {missing}")
+    
     def _simulate_trades(
         self,
         data: pd.DataFrame,
-        signals: pd.DataFrame,
+        signals: Union[pd.DataFrame, SparseSignals],
         strategy_params: Dict[str, Any],
         position_size_pct: float
     ) -> List[Trade]:
         """
         Simulate trade execution based on signals.
         
+        Returns:
+            List of executed trades (see _simulate_trade_log for the array form)
+        """
+        return self._simulate_trade_log(
+            data, signals, strategy_params, position_size_pct
+        ).to_trades()
+    
+    def _simulate_trade_log(
+        self,
+        data: pd.DataFrame,
+        signals: Union[pd.DataFrame, SparseSignals],
+        strategy_params: Dict[str, Any],
+        position_size_pct: float
+    ) -> TradeLog:
+        """
+        Simulate trade execution based on signals.
+        
+        Signals are aligned to the candles once, then the array-based
+        simulation core resolves every entry/exit and the resulting trades
+        are priced (slippage, sizing, fees) in a single vectorized pass.
+        
         Args:
             data: OHLCV data
             signals: DataFrame with columns: timestamp, signal, stop_loss, take_profit
+                     (or SparseSignals generated from data)
             strategy_params: Strategy parameters (for max_holding_periods)
             position_size_pct: Position size multiplier
         
         Returns:
-            List of executed trades
+            TradeLog of executed trades
         """
-        trades = []
-        current_position = None
+        trade_log, _, _ = self._run_simulation(
+            arrays=self._align_signals(data, signals),
+            max_holding=strategy_params.get('max_holding_periods', 50),
+            position_size_pct=position_size_pct
+        )
+        return trade_log
+    
+    def _align_signals(
+        self,
+        data: pd.DataFrame,
+        signals: Union[pd.DataFrame, SparseSignals]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Align signals to the candles and extract the simulator arrays.
         
-        # Merge signals with data
-        df = data.copy()
-        df = df.merge(signals, on='timestamp', how='left')
-        df['signal'].fillna('HOLD', inplace=True)
+        SparseSignals are scattered by candle index; signal DataFrames are
+        merged on timestamp.
         
-        max_holding = strategy_params.get('max_holding_periods', 50)
+        Returns:
+            Dict of aligned arrays: timestamp, high, low, close, signal
+            (int8 codes), stop_loss, take_profit
+        """
+        if isinstance(signals, SparseSignals):
+            self._check_sparse(data, signals)
+            signal, stop_loss, take_profit = signals.dense()
+            return {
+                'timestamp': data['timestamp'].to_numpy(),
+                'high': data['high'].to_numpy(dtype=np.float64),
+                'low': data['low'].to_numpy(dtype=np.float64),
+                'close': data['close'].to_numpy(dtype=np.float64),
+                'signal': signal,
+                'stop_loss': stop_loss,
+                'take_profit': take_profit
+            }
         
-        for idx, row in df.iterrows():
-            timestamp = int(row['timestamp'])
-            
-            # Check if we have an open position
-            if current_position is not None:
-                holding_periods = idx - current_position['entry_idx']
-                
-                # Check exit conditions
-                exit_price = None
-                exit_reason = None
-                
-                # Different exit logic for LONG vs SHORT positions
-                if current_position['side'] == 'LONG':
-                    # LONG: Stop-loss below entry, Take-profit above entry
-                    
-                    # 1. Stop-loss hit (price drops to or below SL)
-                    if row['low'] <= current_position['stop_loss']:
-                        exit_price = current_position['stop_loss']
-                        exit_reason = 'SL'
-                    
-                    # 2. Take-profit hit (price rises to or above TP)
-                    elif row['high'] >= current_position['take_profit']:
-                        exit_price = current_position['take_profit']
-                        exit_reason = 'TP'
-                
-                else:  # SHORT position
-                    # SHORT: Stop-loss above entry, Take-profit below entry
-                    
-                    # 1. Stop-loss hit (price rises to or above SL)
-                    if row['high'] >= current_position['stop_loss']:
-                        exit_price = current_position['stop_loss']
-                        exit_reason = 'SL'
-                    
-                    # 2. Take-profit hit (price drops to or below TP)
-                    elif row['low'] <= current_position['take_profit']:
-                        exit_price = current_position['take_profit']
-                        exit_reason = 'TP'
-                
-                # 3. Maximum holding period (applies to both LONG and SHORT)
-                if exit_price is None and holding_periods >= max_holding:
-                    exit_price = row['close']
-                    exit_reason = 'MAX_HOLD'
-                
-                # 4. Opposite signal (applies to both LONG and SHORT)
-                if exit_price is None and row['signal'] in ['BUY', 'SELL']:
-                    if (row['signal'] == 'SELL' and current_position['side'] == 'LONG') or \
-                       (row['signal'] == 'BUY' and current_position['side'] == 'SHORT'):
-                        exit_price = row['close']
-                        exit_reason = 'SIGNAL'
-                
-                # Execute exit
-                if exit_price is not None:
-                    trade = self._execute_exit(
-                        position=current_position,
-                        exit_time=timestamp,
-                        exit_price=exit_price,
-                        exit_reason=exit_reason,
-                        holding_periods=holding_periods
-                    )
-                    trades.append(trade)
-                    current_position = None
-            
-            # Check for new entry signal
-            if current_position is None and row['signal'] in ['BUY', 'SELL']:
-                current_position = self._execute_entry(
-                    entry_idx=idx,
-                    entry_time=timestamp,
-                    entry_price=row['close'],
-                    side='LONG' if row['signal'] == 'BUY' else 'SHORT',
-                    stop_loss=row.get('stop_loss', 0),
-                    take_profit=row.get('take_profit', 0),
-                    atr=row['atr'],
-                    position_size_pct=position_size_pct
-                )
+        # Merge signals with data (only the columns the simulator needs)
+        signal_cols = ['timestamp', 'signal'] + [
+            col for col in ('stop_loss', 'take_profit') if col in signals.columns
+        ]
+        df = data[['timestamp', 'high', 'low', 'close', 'atr']].merge(
+            signals[signal_cols], on='timestamp', how='left'
+        )
         
-        # Close any remaining position at end of data
-        if current_position is not None:
-            last_row = df.iloc[-1]
-            holding_periods = len(df) - 1 - current_position['entry_idx']
-            trade = self._execute_exit(
-                position=current_position,
-                exit_time=int(last_row['timestamp']),
-                exit_price=last_row['close'],
-                exit_reason='END_OF_DATA',
-                holding_periods=holding_periods
+        return {
+            'timestamp': df['timestamp'].to_numpy(),
+            'high': df['high'].to_numpy(dtype=np.float64),
+            'low': df['low'].to_numpy(dtype=np.float64),
+            'close': df['close'].to_numpy(dtype=np.float64),
+            'signal': encode_signals(df['signal'].to_numpy()),
+            'stop_loss': df['stop_loss'].to_numpy(dtype=np.float64) if 'stop_loss' in df else np.zeros(len(df)),
+            'take_profit': df['take_profit'].to_numpy(dtype=np.float64) if 'take_profit' in df else np.zeros(len(df))
+        }
+    
+    def _check_sparse(self, data: pd.DataFrame, signals: SparseSignals):
+        """Raise ValueError if sparse signals were generated from other candles."""
+        if signals.n_candles != len(data):
+            raise ValueError(
+                f"Signals were generated from {signals.n_candles} candles, data has {len(data)}"
             )
-            trades.append(trade)
+    
+    def _run_simulation(
+        self,
+        arrays: Dict[str, np.ndarray],
+        max_holding: int,
+        position_size_pct: float,
+        budget: Optional[BacktestBudget] = None
+    ) -> Tuple[TradeLog, Optional[str], Optional[np.ndarray]]:
+        """
+        Simulate and price trades over aligned arrays, honouring a budget.
+        
+        Returns:
+            (TradeLog, prune_reason, equity) - prune_reason is None unless the
+            budget stopped the simulation early; equity is the per-candle
+            mark-to-market series (None unless mark_to_market is enabled)
+        """
+        if len(arrays['close']) == 0:
+            return TradeLog.empty(), None, None
         
-        return trades
+        monitor = None
+        if budget is not None:
+            monitor = _BudgetMonitor(self, budget, arrays, position_size_pct)
+            # Not enough entry signals to ever reach min_trades: skip simulation
+            if monitor.prune_reason is not None:
+                return TradeLog.empty(), monitor.prune_reason, None
+        
+        simulated = simulate_trades(
+            high=arrays['high'],
+            low=arrays['low'],
+            close=arrays['close'],
+            signal=arrays['signal'],
+            stop_loss=arrays['stop_loss'],
+            take_profit=arrays['take_profit'],
+            max_holding=max_holding,
+            on_trade=monitor,
+            intrabar=self.intrabar.resolver(arrays['timestamp']) if self.intrabar is not None else None
+        )
+        
+        trade_log = self._price_trades(
+            simulated=simulated,
+            timestamps=arrays['timestamp'],
+            position_size_pct=position_size_pct
+        )
+        
+        equity = None
+        if self.mark_to_market:
+            equity = self._mark_to_market_equity(simulated, trade_log, arrays['close'])
+        
+        return trade_log, monitor.prune_reason if monitor is not None else None, equity
+    
+    def _checkpoint_metrics(
+        self,
+        trade_log: TradeLog,
+        timestamps: np.ndarray,
+        budget: BacktestBudget
+    ) -> Dict[str, float]:
+        """
+        Running objective at each budget checkpoint of a finished simulation.
+        
+        Same trades as the in-simulation checkpoint callback sees: those
+        that exited before the checkpoint candle.
+        """
+        objective = budget.objective or 'sharpe_ratio'
+        values = {}
+        for fraction in budget.checkpoints:
+            index = checkpoint_index(fraction, len(timestamps))
+            if index < len(timestamps):
+                before = trade_log.exit_time < timestamps[index]
+            else:
+                before = np.ones(len(trade_log), dtype=bool)
+            running = self._metrics_from_arrays(
+                pnls=trade_log.pnl[before],
+                pnl_pcts=trade_log.pnl_pct[before],
+                holding_periods=trade_log.holding_periods[before]
+            )
+            values[checkpoint_key(objective, fraction)] = running.get(objective, 0)
+        return values
+    
+    def _mark_to_market_equity(
+        self,
+        simulated: SimulatedTrades,
+        trade_log: TradeLog,
+        close: np.ndarray
+    ) -> np.ndarray:
+        """
+        Per-candle equity with the open position marked at each close.
+        
+        Realized P&L is booked on the exit candle and accumulated with a
+        cumulative sum; open candles [entry, exit) of every trade are
+        expanded with np.repeat and marked against the (slipped) entry
+        price net of the entry fee. Positions never overlap, so each candle
+        carries at most one unrealized P&L.
+        
+        Returns:
+            float64 equity array aligned with close
+        """
+        n = len(close)
+        realized = np.zeros(n)
+        np.add.at(realized, simulated.exit_idx, trade_log.pnl)
+        equity = self.initial_capital + np.cumsum(realized)
+        
+        if len(trade_log) == 0:
+            return equity
+        
+        # Candle indexes of every open position (trade k spans [entry_k, exit_k))
+        lengths = simulated.exit_idx - simulated.entry_idx
+        owner = np.repeat(np.arange(len(lengths)), lengths)
+        starts = np.cumsum(lengths) - lengths
+        candles = simulated.entry_idx[owner] + np.arange(len(owner)) - starts[owner]
+        
+        entry_price = trade_log.entry_price[owner]
+        equity[candles] += trade_log.size[owner] * (
+            trade_log.side[owner] * (close[candles] - entry_price) / entry_price - self.fee_rate
+        )
+        
+        return equity
+    
+    def _compact_equity(
+        self,
+        equity: np.ndarray,
+        timestamps: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Downsample (every equity_downsample-th candle plus the last) and cast
+        the mark-to-market series to float32 for storage.
+        
+        Returns:
+            (float32 equity, int64 timestamps)
+        """
+        idx = np.arange(0, len(equity), self.equity_downsample)
+        if len(equity) > 0 and idx[-1] != len(equity) - 1:
+            idx = np.append(idx, len(equity) - 1)
+        return equity[idx].astype(np.float32), np.asarray(timestamps[idx], dtype=np.int64)
+    
+    def _price_trades(
+        self,
+        simulated: SimulatedTrades,
+        timestamps: np.ndarray,
+        position_size_pct: float
+    ) -> TradeLog:
+        """
+        Apply slippage, risk-based sizing and fees to simulated trades.
+        
+        Vectorized equivalent of _execute_entry() + _execute_exit().
+        """
+        is_long = simulated.side == SIGNAL_BUY
+        
+        # Apply slippage to entry and exit
+        entry_price_adj = simulated.entry_price * np.where(
+            is_long, 1 + self.slippage_rate, 1 - self.slippage_rate
+        )
+        exit_price_adj = simulated.exit_price * np.where(
+            is_long, 1 - self.slippage_rate, 1 + self.slippage_rate
+        )
+        
+        # Position size = risk_amount / stop_loss_distance (see _execute_entry)
+        risk_amount = self.initial_capital * self.risk_per_trade * position_size_pct
+        sl_distance = np.abs(simulated.entry_price - simulated.stop_loss) / simulated.entry_price
+        sl_distance = np.where(sl_distance == 0, 0.02, sl_distance)
+        position_size = np.minimum(risk_amount / sl_distance, self.initial_capital)
+        
+        # Calculate P&L (entry + exit fees)
+        pnl_pct = np.where(
+            is_long,
+            (exit_price_adj - entry_price_adj) / entry_price_adj,
+            (entry_price_adj - exit_price_adj) / entry_price_adj
+        )
+        pnl_pct -= 2 * self.fee_rate
+        pnl = position_size * pnl_pct
+        
+        return TradeLog(
+            entry_time=np.asarray(timestamps[simulated.entry_idx], dtype=np.int64),
+            exit_time=np.asarray(timestamps[simulated.exit_idx], dtype=np.int64),
+            entry_price=entry_price_adj,
+            exit_price=exit_price_adj,
+            side=simulated.side,
+            size=position_size,
+            pnl=pnl,
+            pnl_pct=pnl_pct,
+            holding_periods=simulated.exit_idx - simulated.entry_idx,
+            exit_reason=simulated.exit_reason
+        )
+    
+    def _trade_result(
+        self,
+        side: int,
+        entry_price: float,
+        exit_price: float,
+        stop_loss: float,
+        position_size_pct: float
+    ) -> Tuple[float, float]:
+        """(pnl, pnl_pct) of one raw trade (same arithmetic as _price_trades)."""
+        if side == SIGNAL_BUY:
+            entry_price_adj = entry_price * (1 + self.slippage_rate)
+            exit_price_adj = exit_price * (1 - self.slippage_rate)
+            pnl_pct = (exit_price_adj - entry_price_adj) / entry_price_adj
+        else:
+            entry_price_adj = entry_price * (1 - self.slippage_rate)
+            exit_price_adj = exit_price * (1 + self.slippage_rate)
+            pnl_pct = (entry_price_adj - exit_price_adj) / entry_price_adj
+        pnl_pct -= 2 * self.fee_rate
+        
+        risk_amount = self.initial_capital * self.risk_per_trade * position_size_pct
+        sl_distance = abs(entry_price - stop_loss) / entry_price
+        if sl_distance == 0:
+            sl_distance = 0.02
+        
+        return min(risk_amount / sl_distance, self.initial_capital) * pnl_pct, pnl_pct
     
     def _execute_entry(
         self,
@@ -400,23 +980,52 @@ class BacktestEngine:
         - avg_holding_periods
         - expectancy
         """
-        if not trades:
+        return self._metrics_from_arrays(
+            pnls=np.array([t.pnl for t in trades]),
+            pnl_pcts=np.array([t.pnl_pct for t in trades]),
+            holding_periods=np.array([t.holding_periods for t in trades])
+        )
+    
+    def _metrics_from_trade_log(
+        self,
+        trade_log: TradeLog,
+        equity: Optional[np.ndarray] = None
+    ) -> Dict[str, float]:
+        """Calculate performance metrics from a TradeLog (and optional per-candle equity)."""
+        return self._metrics_from_arrays(
+            pnls=trade_log.pnl,
+            pnl_pcts=trade_log.pnl_pct,
+            holding_periods=trade_log.holding_periods,
+            equity=equity
+        )
+    
+    def _metrics_from_arrays(
+        self,
+        pnls: np.ndarray,
+        pnl_pcts: np.ndarray,
+        holding_periods: np.ndarray,
+        equity: Optional[np.ndarray] = None
+    ) -> Dict[str, float]:
+        """
+        Calculate performance metrics straight from per-trade arrays.
+        
+        See _calculate_metrics() for the returned keys. The drawdown metrics
+        use the per-candle mark-to-market equity when given, otherwise the
+        trade-exit equity curve (initial capital + cumulative P&L).
+        """
+        if len(pnls) == 0:
             return {
                 'net_profit_pct': 0,
                 'sharpe_ratio': 0,
                 'total_trades': 0
             }
         
-        # Convert trades to arrays
-        pnls = np.array([t.pnl for t in trades])
-        pnl_pcts = np.array([t.pnl_pct for t in trades])
-        
         # Win/Loss separation
         wins = pnl_pcts[pnl_pcts > 0]
         losses = pnl_pcts[pnl_pcts < 0]
         
         # Basic metrics
-        total_trades = len(trades)
+        total_trades = len(pnls)
         winning_trades = len(wins)
         losing_trades = len(losses)
         gross_win_rate = winning_trades / total_trades if total_trades > 0 else 0
@@ -451,16 +1060,17 @@ class BacktestEngine:
             sharpe_ratio = 0
             sortino_ratio = 0
         
-        # Drawdown metrics
-        equity_curve = self._generate_equity_curve(trades, data)
-        max_drawdown_pct = self._calculate_max_drawdown(equity_curve)
-        avg_drawdown_pct = self._calculate_avg_drawdown(equity_curve)
+        # Drawdown metrics (per-candle equity, or equity after each trade exit)
+        if equity is None:
+            equity = np.cumsum(np.concatenate([[self.initial_capital], pnls]))
+        max_drawdown_pct = self._max_drawdown_from_equity(equity)
+        avg_drawdown_pct = self._avg_drawdown_from_equity(equity)
         
         # Calmar ratio
         calmar_ratio = (net_profit_pct / abs(max_drawdown_pct)) if max_drawdown_pct != 0 else 0
         
         # Holding period
-        avg_holding_periods = np.mean([t.holding_periods for t in trades])
+        avg_holding_periods = np.mean(holding_periods)
         
         return {
             'net_profit_pct': round(net_profit_pct, 2),
@@ -514,10 +1124,13 @@ class BacktestEngine:
         
         Drawdown = (Trough - Peak) / Peak
         """
-        if len(equity_curve) < 2:
+        return self._max_drawdown_from_equity(equity_curve['equity'].values)
+    
+    def _max_drawdown_from_equity(self, equity: np.ndarray) -> float:
+        """Maximum drawdown percentage of an equity array."""
+        if len(equity) < 2:
             return 0.0
         
-        equity = equity_curve['equity'].values
         running_max = np.maximum.accumulate(equity)
         drawdown = (equity - running_max) / running_max * 100
         
@@ -525,10 +1138,13 @@ class BacktestEngine:
     
     def _calculate_avg_drawdown(self, equity_curve: pd.DataFrame) -> float:
         """Calculate average drawdown percentage."""
-        if len(equity_curve) < 2:
+        return self._avg_drawdown_from_equity(equity_curve['equity'].values)
+    
+    def _avg_drawdown_from_equity(self, equity: np.ndarray) -> float:
+        """Average drawdown percentage of an equity array."""
+        if len(equity) < 2:
             return 0.0
         
-        equity = equity_curve['equity'].values
         running_max = np.maximum.accumulate(equity)
         drawdown = (equity - running_max) / running_max * 100
         
@@ -536,3 +1152,110 @@ class BacktestEngine:
         drawdowns = drawdown[drawdown < 0]
         
         return drawdowns.mean() if len(drawdowns) > 0 else 0.0
+
+
+class _BudgetMonitor:
+    """
+    simulate_trades() on_trade hook enforcing a BacktestBudget.
+    
+    Tracks running equity per closed trade and bounds what the rest of the
+    data can still deliver: every future trade needs its own entry signal
+    at or after the last exit candle, and no trade can gain more than a
+    full-capital position moving from the lowest remaining low to the
+    highest remaining high. Checkpoints are reported when the first trade
+    exiting past them closes.
+    """
+    
+    def __init__(
+        self,
+        engine: BacktestEngine,
+        budget: BacktestBudget,
+        arrays: Dict[str, np.ndarray],
+        position_size_pct: float
+    ):
+        self.engine = engine
+        self.budget = budget
+        self.position_size_pct = position_size_pct
+        self.close = arrays['close']
+        self.stop_loss = arrays['stop_loss']
+        self.signal_idx = np.flatnonzero(arrays['signal'])
+        
+        self.trades = 0
+        self.net_pnl = 0.0
+        self.peak = engine.initial_capital
+        self.prune_reason = None
+        
+        if budget.bounds_objective and budget.objective == 'net_profit_pct':
+            # Best possible per-trade return from each candle onwards
+            suffix_high = np.maximum.accumulate(arrays['high'][::-1])[::-1]
+            suffix_low = np.minimum.accumulate(arrays['low'][::-1])[::-1]
+            self.max_return = suffix_high / suffix_low - 1
+        
+        if budget.min_trades and len(self.signal_idx) < budget.min_trades:
+            self.prune_reason = PRUNE_MIN_TRADES
+        
+        # Pending (fraction, candle index) checkpoints and the trades behind them
+        self.checkpoints = sorted(
+            (fraction, checkpoint_index(fraction, len(self.close))) for fraction in budget.checkpoints
+        )
+        self.pnls: List[float] = []
+        self.pnl_pcts: List[float] = []
+        self.holding_periods: List[int] = []
+    
+    def __call__(self, entry_idx: int, exit_idx: int, side: int, exit_price: float) -> bool:
+        budget = self.budget
+        capital = self.engine.initial_capital
+        
+        # Checkpoints passed before this trade closed
+        while self.checkpoints and exit_idx >= self.checkpoints[0][1]:
+            fraction, _ = self.checkpoints.pop(0)
+            if budget.checkpoint_callback is not None and budget.checkpoint_callback(
+                fraction, self.running_metrics()
+            ):
+                self.prune_reason = PRUNE_CHECKPOINT
+                return True
+        
+        pnl, pnl_pct = self.engine._trade_result(
+            side, self.close[entry_idx], exit_price,
+            self.stop_loss[entry_idx], self.position_size_pct
+        )
+        self.trades += 1
+        self.net_pnl += pnl
+        if budget.checkpoints:
+            self.pnls.append(pnl)
+            self.pnl_pcts.append(pnl_pct)
+            self.holding_periods.append(exit_idx - entry_idx)
+        
+        equity = capital + self.net_pnl
+        self.peak = max(self.peak, equity)
+        if budget.max_drawdown_pct is not None:
+            if (self.peak - equity) / self.peak * 100 > budget.max_drawdown_pct:
+                self.prune_reason = PRUNE_DRAWDOWN
+                return True
+        
+        # A signal on the exit candle can still open a trade
+        remaining = len(self.signal_idx) - int(np.searchsorted(self.signal_idx, exit_idx, side='left'))
+        
+        if budget.min_trades and self.trades + remaining < budget.min_trades:
+            self.prune_reason = PRUNE_MIN_TRADES
+            return True
+        
+        if budget.bounds_objective:
+            if budget.objective == 'total_trades':
+                bound = self.trades + remaining
+            else:
+                best_gain = remaining * capital * max(self.max_return[exit_idx], 0.0)
+                bound = (self.net_pnl + best_gain) / capital * 100
+            if bound <= budget.best_objective:
+                self.prune_reason = PRUNE_OBJECTIVE
+                return True
+        
+        return False
+    
+    def running_metrics(self) -> Dict[str, float]:
+        """Metrics of the trades closed so far (trade-exit equity)."""
+        return self.engine._metrics_from_arrays(
+            pnls=np.array(self.pnls, dtype=np.float64),
+            pnl_pcts=np.array(self.pnl_pcts, dtype=np.float64),
+            holding_periods=np.array(self.holding_periods, dtype=np.int64)
+        )
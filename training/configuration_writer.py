@@ -24,6 +24,7 @@ import numpy as np
 
 from .backtest_engine import BacktestResult
 from .validator import ValidationResult
+from .monte_carlo import MonteCarloAnalyzer
 
 log = logging.getLogger(__name__)
 
@@ -64,14 +65,21 @@ class ConfigurationWriter:
         print(f"Configuration saved: {config_id}")
     """
     
-    def __init__(self, db_url: Optional[str] = None):
+    def __init__(self, db_url: Optional[str] = None, monte_carlo_simulations: int = 10_000):
         """
         Initialize ConfigurationWriter.
         
         Args:
             db_url: PostgreSQL connection URL (default: from config)
+            monte_carlo_simulations: Monte Carlo paths for the robustness
+                                     bands stored with each configuration (0 = skip)
         """
         self.db_url = db_url or self._get_db_url()
+        # Fixed seed: configurations are compared on the same random draws
+        self.monte_carlo = (
+            MonteCarloAnalyzer(n_simulations=monte_carlo_simulations, seed=42)
+            if monte_carlo_simulations > 0 else None
+        )
         log.info("ConfigurationWriter initialized")
     
     def _get_db_url(self) -> str:
@@ -136,7 +144,7 @@ class ConfigurationWriter:
             parameters: Strategy parameters dict
             backtest_result: BacktestResult from training
             validation_result: Optional ValidationResult from walk-forward
-            optimizer: Optimizer used ('grid', 'random', 'bayesian')
+            optimizer: Optimizer used ('grid', 'random', 'bayesian', 'halving', 'tpe')
             metadata: Optional additional metadata
         
         Returns:
@@ -322,6 +330,7 @@ class ConfigurationWriter:
             Complete V3 JSON dict
         """
         timestamp = datetime.now(timezone.utc)
+        monte_carlo = self._run_monte_carlo(backtest_result)
         
         # Base structure
         config = {
@@ -366,7 +375,8 @@ class ConfigurationWriter:
                 "sortino_ratio": backtest_result.metrics.get('sortino_ratio', 0),
                 "p_value": 0.05,  # Placeholder (future: statistical testing)
                 "z_score": 0.0,
-                "monte_carlo_var": 0.0,
+                "monte_carlo_var": monte_carlo['var_pct'] if monte_carlo else 0.0,
+                "monte_carlo": monte_carlo or {},
                 "stability_score": validation_result.stability_score if validation_result else 0.0,
                 "drawdown_duration": 0,
                 "trade_clustering": 0.0,
@@ -412,6 +422,30 @@ class ConfigurationWriter:
         
         return config
     
+    def _run_monte_carlo(self, backtest_result: BacktestResult) -> Optional[Dict[str, Any]]:
+        """
+        Monte Carlo confidence bands for net profit, max drawdown and Sharpe.
+        
+        Returns:
+            MonteCarloResult.to_dict(), or None when disabled or failed
+        """
+        if self.monte_carlo is None:
+            return None
+        
+        try:
+            mc = self.monte_carlo.analyze(backtest_result)
+        except Exception as e:
+            log.warning(f"Monte Carlo analysis failed, saving point metrics only: {e}")
+            return None
+        
+        log.info(
+            f"Monte Carlo ({mc.n_simulations} paths, {mc.seconds:.2f}s): "
+            f"net profit p5/p50/p95 = {mc.bands['net_profit_pct']['p5']}/"
+            f"{mc.bands['net_profit_pct']['p50']}/{mc.bands['net_profit_pct']['p95']}%, "
+            f"P(loss) {mc.prob_loss:.1%}"
+        )
+        return mc.to_dict()
+    
     def _get_stage_allocation(self, stage: str) -> float:
         """Get maximum allocation percentage for lifecycle stage."""
         allocations = {
@@ -503,10 +537,12 @@ class ConfigurationWriter:
                     metadata_json,
                     data_filter_config,
                     job_id,
+                    monte_carlo_var,
+                    monte_carlo_json,
                     created_at,
                     updated_at
                 ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, $23, $24, $25
+                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, $23, $24, $25, $26, $27
                 )
                 RETURNING id
             """
@@ -557,6 +593,8 @@ class ConfigurationWriter:
                 json.dumps(convert_numpy_types(config_json['metadata'])),  # metadata_json
                 filter_config_json,  # data_filter_config (NEW)
                 job_id,  # job_id from metadata
+                float(stats.get('monte_carlo_var', 0) or 0),  # monte_carlo_var
+                json.dumps(convert_numpy_types(stats['monte_carlo'])) if stats.get('monte_carlo') else None,  # monte_carlo_json
                 datetime.now(timezone.utc),  # created_at
                 datetime.now(timezone.utc)  # updated_at
             )
@@ -17,6 +17,8 @@ from typing import Optional, Dict, List
 import logging
 import asyncpg
 
+from .resampler import resample_ohlcv, timeframe_ms
+
 log = logging.getLogger(__name__)
 
 
@@ -219,6 +221,76 @@ class DataCollector:
         
         return df
     
+    async def fetch_multi_timeframe(
+        self,
+        symbol: str,
+        exchange: str,
+        timeframes: List[str],
+        lookback_candles: int,
+        end_date: Optional[datetime] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch several timeframes with a single 1m database read.
+        
+        Every timeframe is resampled from the 1m candles (see
+        training.resampler), so only 1m data has to be backfilled and
+        additional timeframes cost no extra query.
+        
+        Args:
+            symbol: Trading pair (e.g., 'BTC/USDT')
+            exchange: Exchange name (e.g., 'binance')
+            timeframes: Candlestick intervals (e.g., ['5m', '1h', '4h'])
+            lookback_candles: Number of complete candles per timeframe
+            end_date: End date (default: now)
+        
+        Returns:
+            Dict timeframe -> DataFrame with the fetch_ohlcv() columns
+        
+        Raises:
+            ValueError: If a timeframe gets fewer than 100 complete candles
+        """
+        if end_date is None:
+            end_date = datetime.utcnow()
+        
+        # 1m history covering the longest timeframe's lookback
+        longest_ms = max(timeframe_ms(timeframe) for timeframe in timeframes)
+        lookback_days = int(lookback_candles * longest_ms / 86_400_000) + 1
+        start_date = end_date - timedelta(days=lookback_days)
+        
+        log.info(
+            f"Fetching {symbol} on {exchange} 1m for {', '.join(timeframes)} "
+            f"({lookback_candles} candles each ≈ {lookback_days} days)"
+        )
+        
+        candles_1m = await self._fetch_from_database(
+            symbol=symbol,
+            exchange=exchange,
+            timeframe='1m',
+            start_date=start_date,
+            end_date=end_date
+        )
+        
+        frames = {}
+        for timeframe in timeframes:
+            bars = resample_ohlcv(candles_1m, timeframe) if not candles_1m.empty else pd.DataFrame()
+            if len(bars) < 100:
+                raise ValueError(
+                    f"Insufficient 1m data in database for training: {symbol} on {exchange} {timeframe} "
+                    f"(resampled {len(bars)} candles, need at least 100). "
+                    f"Please run data backfill before training: "
+                    f"python data/historical_data_backfill.py --symbol {symbol} --exchange {exchange} --timeframe 1m"
+                )
+            if len(bars) > lookback_candles:
+                bars = bars.tail(lookback_candles).reset_index(drop=True)
+            frames[timeframe] = self._calculate_indicators(bars)
+        
+        log.info(
+            f"✅ Resampled {len(candles_1m)} 1m candles: "
+            + ", ".join(f"{timeframe}={len(df)}" for timeframe, df in frames.items())
+        )
+        
+        return frames
+    
     async def _fetch_from_database(
         self,
         symbol: str,
@@ -0,0 +1,356 @@
+"""
+Evaluation Cache - Backtest Metrics Persisted Across Optimization Jobs
+
+Users resubmit the same strategy / pair / timeframe with overlapping
+parameter spaces (or the same seed), and every configuration used to be
+backtested again. Optimizers now look each configuration up in a
+persistent SQLite store first and only backtest the misses. The key is
+
+    (strategy code version, dataset fingerprint, data filter config,
+     engine settings, canonical params hash)
+
+where the code version hashes the strategy's package, the backtest engine
+and every training module they import (training.source_digest), so
+editing a strategy, the engine or a shared helper such as the intrabar
+simulator invalidates its entries without manual bumps. Only complete (unpruned) metrics are
+stored; the optimizer applies min_trades / objective on top as usual.
+
+    scope = get_evaluation_cache().scope(strategy_class, data, engine, filter_config)
+    optimizer.optimize(..., evaluation_cache=scope)
+
+Scopes are picklable (path + key prefix), so loky workers open their own
+connection to the same file. Lookups count hits and misses through
+training.telemetry, and optimizers report them as result['evaluation_cache'].
+
+Configuration (inherited by worker processes):
+    EVALUATION_CACHE_PATH       SQLite file (default: ~/.cache/trad/evaluations.sqlite)
+    EVALUATION_CACHE_MAX_ROWS   Rows kept, least recently used dropped (default: 1000000,
+                                0 disables caching)
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .feature_cache import dataset_fingerprint
+from .source_digest import source_digest
+from .telemetry import TimingCollector, count
+
+log = logging.getLogger(__name__)
+
+
+# Bump when the stored metrics change meaning without a source change
+CACHE_VERSION = 1
+
+DEFAULT_MAX_ROWS = 1_000_000
+
+# Engine modules whose source (and imports) is part of every code version
+ENGINE_MODULES = ('backtest_engine.py', 'trade_simulator.py')
+
+# Telemetry counters
+HITS_COUNTER = 'evaluation_cache.hits'
+MISSES_COUNTER = 'evaluation_cache.misses'
+
+# Variables bound per SQLite statement (stays below SQLITE_MAX_VARIABLE_NUMBER)
+_SQL_CHUNK = 500
+
+
+def default_cache_path() -> str:
+    return os.path.join(os.path.expanduser('~'), '.cache', 'trad', 'evaluations.sqlite')
+
+
+def params_hash(params: Dict[str, Any]) -> str:
+    """
+    Canonical hash of a parameter configuration.
+
+    Key order and NumPy scalar types do not matter; float values are
+    hashed exactly (unlike RandomSearchOptimizer._hash_params, which rounds
+    for duplicate detection).
+    """
+    canonical = json.dumps(params, sort_keys=True, default=_json_default, separators=(',', ':'))
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+def code_version(strategy_class: Any) -> str:
+    """
+    Digest of the strategy's package, the backtest engine and the training
+    modules they import (see training.source_digest).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{CACHE_VERSION}|{strategy_class.__module__}.{strategy_class.__qualname__}".encode())
+    digest.update(str(getattr(strategy_class, 'VERSION', '')).encode())
+
+    try:
+        strategy_dir = Path(inspect.getfile(strategy_class)).parent
+        sources = sorted(strategy_dir.glob('*.py'))
+    except (TypeError, OSError):
+        sources = []
+    engine_dir = Path(__file__).parent
+    sources += [engine_dir / name for name in ENGINE_MODULES]
+
+    digest.update(source_digest(sources).encode())
+    return digest.hexdigest()
+
+
+def engine_settings(backtest_engine: Any) -> Dict[str, Any]:
+    """Engine settings that change metrics (fees, slippage, sizing, intrabar data)."""
+    settings = {
+        'initial_capital': backtest_engine.initial_capital,
+        'fee_rate': backtest_engine.fee_rate,
+        'slippage_rate': backtest_engine.slippage_rate,
+        'risk_per_trade': backtest_engine.risk_per_trade,
+        'mark_to_market': getattr(backtest_engine, 'mark_to_market', False)
+    }
+    intrabar = getattr(backtest_engine, 'intrabar', None)
+    if intrabar is not None:
+        stat = os.stat(intrabar.path)
+        settings['intrabar'] = [os.path.abspath(intrabar.path), stat.st_size, stat.st_mtime_ns]
+    return settings
+
+
+class EvaluationScope:
+    """
+    Cache entries of one (strategy version, dataset, filter config, engine).
+
+    Built once per optimization by EvaluationCache.scope(); lookups only
+    hash the parameters.
+    """
+
+    def __init__(self, cache: 'EvaluationCache', prefix: str):
+        self.cache = cache
+        self.prefix = prefix
+
+    def key(self, params: Dict[str, Any]) -> str:
+        return f"{self.prefix}:{params_hash(params)}"
+
+    def get_many(self, params_list: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        """
+        Cached metrics by position in params_list (misses are absent).
+
+        Hits and misses are counted into the active telemetry collector.
+        """
+        keys = [self.key(params) for params in params_list]
+        found = self.cache.get_many(keys)
+        hits = {position: found[key] for position, key in enumerate(keys) if key in found}
+        count(HITS_COUNTER, len(hits))
+        count(MISSES_COUNTER, len(params_list) - len(hits))
+        return hits
+
+    def get(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return self.get_many([params]).get(0)
+
+    def put_many(self, evaluations: Iterable[tuple]):
+        """Store (params, metrics) pairs; pruned metrics are skipped."""
+        self.cache.put_many([
+            (self.key(params), metrics)
+            for params, metrics in evaluations
+            if metrics is not None and not metrics.get('pruned')
+        ])
+
+    def put(self, params: Dict[str, Any], metrics: Dict[str, Any]):
+        self.put_many([(params, metrics)])
+
+
+class EvaluationCache:
+    """
+    SQLite store of backtest metrics keyed by EvaluationScope keys.
+
+    Picklable (only the path and row budget are state that matters);
+    every process opens its own connection. Storage errors are logged and
+    treated as misses, so a broken cache never fails an optimization.
+
+    Example:
+        cache = EvaluationCache('/var/lib/trad/evaluations.sqlite')
+        scope = cache.scope(LiquiditySweepStrategy, data, engine)
+        metrics = scope.get(params)
+    """
+
+    def __init__(self, path: Optional[str] = None, max_rows: int = DEFAULT_MAX_ROWS):
+        """
+        Initialize EvaluationCache.
+
+        Args:
+            path: SQLite file shared by all processes (directories created if missing)
+            max_rows: Rows kept; least recently used rows are dropped on open
+        """
+        self.path = path or default_cache_path()
+        self.max_rows = max_rows
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'path': self.path, 'max_rows': self.max_rows}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(state['path'], state['max_rows'])
+
+    def scope(
+        self,
+        strategy_class: Any,
+        data: pd.DataFrame,
+        backtest_engine: Any,
+        filter_config: Optional[Dict[str, Any]] = None
+    ) -> EvaluationScope:
+        """
+        Scope of one optimization (hashes the dataset once).
+
+        Args:
+            strategy_class: Strategy class being optimized
+            data: OHLCV DataFrame the configurations are backtested on
+            backtest_engine: BacktestEngine running the backtests
+            filter_config: Data quality filter config the data was cleaned with
+
+        Returns:
+            EvaluationScope
+        """
+        parts = {
+            'code': code_version(strategy_class),
+            # Every column, like prepared_context(): strategies may read optional ones
+            'data': dataset_fingerprint(data, columns=sorted(map(str, data.columns))),
+            'filter': filter_config or {},
+            'engine': engine_settings(backtest_engine)
+        }
+        raw = json.dumps(parts, sort_keys=True, default=_json_default)
+        return EvaluationScope(self, hashlib.blake2b(raw.encode(), digest_size=16).hexdigest())
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Stored metrics for the keys that have an entry."""
+        if not keys:
+            return {}
+        try:
+            connection = self._connect()
+            found = {}
+            for k in range(0, len(keys), _SQL_CHUNK):
+                chunk = keys[k:k + _SQL_CHUNK]
+                placeholders = ','.join('?' * len(chunk))
+                rows = connection.execute(
+                    f"SELECT key, metrics FROM evaluations WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                found.update((key, json.loads(metrics)) for key, metrics in rows)
+            if found:
+                with connection:
+                    connection.executemany(
+                        "UPDATE evaluations SET used_at = ? WHERE key = ?",
+                        [(time.time(), key) for key in found]
+                    )
+            return found
+        except sqlite3.Error as e:
+            log.debug(f"Evaluation cache read failed ({e})")
+            return {}
+
+    def put_many(self, items: List[tuple]):
+        """Store (key, metrics) pairs."""
+        if not items:
+            return
+        now = time.time()
+        try:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO evaluations (key, metrics, used_at) VALUES (?, ?, ?)",
+                    [(key, json.dumps(metrics, default=_json_default), now) for key, metrics in items]
+                )
+        except sqlite3.Error as e:
+            log.debug(f"Evaluation cache write failed ({e})")
+
+    def __len__(self) -> int:
+        try:
+            return self._connect().execute("SELECT COUNT(*) FROM evaluations").fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+    def clear(self):
+        """Remove every entry."""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM evaluations")
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """This process's connection (schema created and row budget enforced on open)."""
+        if self._connection is not None and self._pid == os.getpid():
+            return self._connection
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS evaluations ("
+                "key TEXT PRIMARY KEY, metrics TEXT NOT NULL, used_at REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS evaluations_used_at ON evaluations (used_at)")
+            connection.execute(
+                "DELETE FROM evaluations WHERE key IN ("
+                "SELECT key FROM evaluations ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_rows,)
+            )
+
+        self._connection = connection
+        self._pid = os.getpid()
+        return connection
+
+
+# Process-wide cache used by training jobs (False = not configured yet)
+_default_cache: Any = False
+
+
+def get_evaluation_cache() -> Optional[EvaluationCache]:
+    """Process-wide EvaluationCache configured from the environment (None = disabled)."""
+    global _default_cache
+
+    if _default_cache is False:
+        max_rows = int(os.getenv('EVALUATION_CACHE_MAX_ROWS', DEFAULT_MAX_ROWS))
+        if max_rows <= 0:
+            _default_cache = None
+        else:
+            _default_cache = EvaluationCache(
+                path=os.getenv('EVALUATION_CACHE_PATH') or None,
+                max_rows=max_rows
+            )
+
+    return _default_cache
+
+
+def set_evaluation_cache(cache: Optional[EvaluationCache]):
+    """Replace the process-wide cache (None disables caching)."""
+    global _default_cache
+    _default_cache = cache
+
+
+def cache_report(telemetry: TimingCollector) -> Optional[Dict[str, Any]]:
+    """
+    Hit rate of an optimization from its merged telemetry.
+
+    Returns:
+        Dict with hits, misses, hit_rate (None when no lookups were made)
+    """
+    hits = telemetry.counters.get(HITS_COUNTER, 0)
+    misses = telemetry.counters.get(MISSES_COUNTER, 0)
+    if hits + misses == 0:
+        return None
+    hit_rate = hits / (hits + misses)
+    log.info(f"Evaluation cache: {hits}/{hits + misses} hits ({hit_rate:.0%})")
+    return {'hits': hits, 'misses': misses, 'hit_rate': round(hit_rate, 4)}
+
+
+def _json_default(value: Any) -> Any:
+    """JSON encoding of NumPy scalars / arrays (params and metrics)."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
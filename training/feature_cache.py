@@ -0,0 +1,336 @@
+"""
+Feature Cache - Parameter-Independent Indicators Shared Across Iterations
+
+Optimizers run the same strategy hundreds of times per job on one dataset,
+and every run used to recompute indicators that do not depend on the
+strategy parameters (volume / ATR moving averages, RSI, wick ratios, swing
+highs/lows, rolling highs/lows). The strategies now read those through a
+FeatureCache keyed by
+
+    (feature code version, dataset fingerprint, indicator name, indicator params)
+
+where the code version hashes the strategies package and the training
+modules it imports (training.source_digest), so entries written by older
+feature code are never served after an edit; they age out of the LRU.
+
+Entries are .npy files in a shared directory (tmpfs /dev/shm when
+available) loaded as read-only memory maps, so every loky worker process
+on the machine hits the same entries and the pages are shared instead of
+copied. The directory is bounded by an LRU byte budget: hits refresh the
+file's mtime, and writes evict the least recently used files.
+
+    df = data.copy()
+    attach_fingerprint(df)
+    volume_ma = cached_feature(
+        df, 'volume_ma', {'window': 20},
+        lambda: df['volume'].rolling(20).mean().to_numpy()
+    )
+
+The fingerprint travels with the strategy's working copy in df.attrs, so
+helpers receiving the DataFrame read through the cache; frames without a
+fingerprint (e.g. helpers called directly) compute as before.
+
+Configuration (inherited by worker processes):
+    FEATURE_CACHE_DIR       Cache directory (default: /dev/shm/trad-feature-cache)
+    FEATURE_CACHE_MAX_MB    LRU byte budget in MB (default: 512, 0 disables caching)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .source_digest import source_digest
+
+log = logging.getLogger(__name__)
+
+
+# Columns a cached feature may be derived from (covered by the fingerprint)
+FINGERPRINT_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume', 'atr')
+
+# df.attrs key holding the dataset fingerprint
+FINGERPRINT_ATTR = 'feature_fingerprint'
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Memory maps kept open per process (avoids reopening hot entries)
+_OPEN_ENTRIES = 256
+
+
+def default_cache_dir() -> str:
+    """Shared-memory directory when available, else the temp directory."""
+    base = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+    return os.path.join(base, 'trad-feature-cache')
+
+
+@lru_cache(maxsize=None)
+def feature_code_version() -> str:
+    """Digest of the code computing cached features (once per process)."""
+    strategies_dir = Path(__file__).resolve().parent / 'strategies'
+    return source_digest([Path(__file__)] + sorted(strategies_dir.glob('*.py')))
+
+
+def dataset_fingerprint(data: pd.DataFrame, columns: Optional[Iterable[str]] = None) -> str:
+    """
+    Content hash of the dataset columns features are derived from.
+
+    Args:
+        data: OHLCV DataFrame
+        columns: Columns to hash (default: FINGERPRINT_COLUMNS)
+
+    Returns:
+        Hex digest identifying the dataset (same data -> same fingerprint)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(len(data)).encode())
+    for column in (FINGERPRINT_COLUMNS if columns is None else columns):
+        if column not in data.columns:
+            continue
+        values = np.ascontiguousarray(data[column].to_numpy())
+        digest.update(f"{column}:{values.dtype.str}".encode())
+        digest.update(values.tobytes() if values.dtype != object else str(values.tolist()).encode())
+    return digest.hexdigest()
+
+
+def attach_fingerprint(df: pd.DataFrame) -> str:
+    """Fingerprint a strategy's working copy and store it in df.attrs."""
+    fingerprint = dataset_fingerprint(df)
+    df.attrs[FINGERPRINT_ATTR] = fingerprint
+    return fingerprint
+
+
+class FeatureCache:
+    """
+    Memory-mapped feature store with an LRU byte budget.
+
+    Picklable (only the directory, budget and code version are state that
+    matters), so the same cache can be handed to worker processes.
+
+    Example:
+        cache = FeatureCache(max_bytes=256 * 1024 * 1024)
+        rsi = cache.get_or_compute(fingerprint, 'rsi', {'period': 14}, compute_rsi)
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        version: Optional[str] = None
+    ):
+        """
+        Initialize FeatureCache.
+
+        Args:
+            directory: Cache directory shared by all processes (created if missing)
+            max_bytes: LRU byte budget for all entries in the directory
+            version: Code version mixed into every key (default: feature_code_version())
+        """
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.version = version or feature_code_version()
+        self.hits = 0
+        self.misses = 0
+        self._open: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'directory': self.directory, 'max_bytes': self.max_bytes, 'version': self.version}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(state['directory'], state['max_bytes'], state['version'])
+
+    def get_or_compute(
+        self,
+        fingerprint: str,
+        name: str,
+        params: Dict[str, Any],
+        compute: Callable[[], Any]
+    ) -> np.ndarray:
+        """
+        Cached feature array, computed and stored on a miss.
+
+        Args:
+            fingerprint: dataset_fingerprint() of the source data
+            name: Indicator name
+            params: Indicator parameters (JSON-serializable)
+            compute: Returns the feature as a 1-D array-like
+
+        Returns:
+            Read-only array (memory-mapped on a hit)
+        """
+        key = self._key(fingerprint, name, params)
+
+        values = self.get(key)
+        if values is not None:
+            self.hits += 1
+            return values
+
+        self.misses += 1
+        values = np.asarray(compute())
+        if values.dtype == object:
+            return values
+        self.put(key, values)
+        return values
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Entry for a key (None on a miss)."""
+        path = self._path(key)
+        values = self._open.get(key)
+
+        try:
+            if values is None:
+                values = np.load(path, mmap_mode='r', allow_pickle=False)
+            # Refresh the LRU position shared with the other processes
+            os.utime(path)
+        except (FileNotFoundError, ValueError, OSError):
+            # Evicted by another process (or a partial file): drop it
+            self._open.pop(key, None)
+            return None
+
+        self._open[key] = values
+        self._open.move_to_end(key)
+        if len(self._open) > _OPEN_ENTRIES:
+            self._open.popitem(last=False)
+        return values
+
+    def put(self, key: str, values: np.ndarray):
+        """Store an entry (atomic rename, so readers never see partial files)."""
+        if values.nbytes > self.max_bytes:
+            return
+
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.save(f, values, allow_pickle=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.debug(f"Feature cache write failed ({e})")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+
+        self._evict()
+
+    def size_bytes(self) -> int:
+        """Total bytes of all entries in the directory."""
+        return sum(size for _, size, _ in self._entries())
+
+    def clear(self):
+        """Remove every entry."""
+        self._open.clear()
+        for path, _, _ in self._entries():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def _evict(self):
+        """Remove least recently used entries until within max_bytes."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def _entries(self):
+        """(path, size, mtime) of every entry file."""
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith('.npy'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def _key(self, fingerprint: str, name: str, params: Dict[str, Any]) -> str:
+        raw = f"{self.version}|{fingerprint}|{name}|{json.dumps(params, sort_keys=True, default=str)}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npy")
+
+
+# Process-wide cache used by cached_feature() (False = not configured yet)
+_default_cache: Any = False
+
+
+def get_feature_cache() -> Optional[FeatureCache]:
+    """Process-wide FeatureCache configured from the environment (None = disabled)."""
+    global _default_cache
+
+    if _default_cache is False:
+        max_mb = float(os.getenv('FEATURE_CACHE_MAX_MB', DEFAULT_MAX_BYTES / (1024 * 1024)))
+        if max_mb <= 0:
+            _default_cache = None
+        else:
+            try:
+                _default_cache = FeatureCache(
+                    directory=os.getenv('FEATURE_CACHE_DIR') or None,
+                    max_bytes=int(max_mb * 1024 * 1024)
+                )
+            except OSError as e:
+                log.warning(f"⚠️  Feature cache disabled: {e}")
+                _default_cache = None
+
+    return _default_cache
+
+
+def set_feature_cache(cache: Optional[FeatureCache]):
+    """Replace the process-wide cache (None disables caching)."""
+    global _default_cache
+    _default_cache = cache
+
+
+def cached_feature(
+    df: pd.DataFrame,
+    name: str,
+    params: Dict[str, Any],
+    compute: Callable[[], Any]
+) -> np.ndarray:
+    """
+    Feature of a fingerprinted DataFrame from the process-wide cache.
+
+    Computed directly when caching is disabled or df carries no
+    fingerprint (see attach_fingerprint).
+
+    Args:
+        df: Strategy working copy
+        name: Indicator name
+        params: Indicator parameters (JSON-serializable)
+        compute: Returns the feature as a 1-D array-like
+
+    Returns:
+        Feature array (read-only when served from the cache)
+    """
+    fingerprint = df.attrs.get(FINGERPRINT_ATTR)
+    cache = get_feature_cache() if fingerprint else None
+    if cache is None:
+        return np.asarray(compute())
+    return cache.get_or_compute(fingerprint, name, params, compute)
@@ -0,0 +1,152 @@
+"""
+Intrabar SL/TP Resolution from 1m Candles
+
+When a single candle touches both the stop-loss and the take-profit, the
+bar alone cannot tell which was hit first and the simulator conservatively
+assumes SL. IntrabarData holds a per-symbol 1m series (memory-mapped .npy)
+and replays only the 1m candles inside such an ambiguous bar to find the
+level that was actually touched first.
+
+Lookups are binary searches on the sorted 1m timestamps, so the extra cost
+applies to ambiguous bars only - every other bar never touches the 1m data.
+
+File format: one structured .npy per symbol with int64 'timestamp'
+(candle open, Unix ms) and float64 'high' / 'low' fields, sorted by
+timestamp. Write it with IntrabarData.save().
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from typing import Callable
+import logging
+
+from .trade_simulator import SIGNAL_BUY, EXIT_SL, EXIT_TP
+
+log = logging.getLogger(__name__)
+
+
+INTRABAR_DTYPE = np.dtype([
+    ('timestamp', np.int64),
+    ('high', np.float64),
+    ('low', np.float64)
+])
+
+
+class IntrabarData:
+    """
+    Memory-mapped 1m high/low series for one symbol.
+
+    Pickles by path, so optimizer workers re-open the memory map instead
+    of copying the 1m history into every task.
+
+    Example:
+        IntrabarData.save('data/1m/BTC_USDT.npy', candles_1m)
+        engine = BacktestEngine(intrabar=IntrabarData('data/1m/BTC_USDT.npy'))
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a 1m series written by IntrabarData.save().
+
+        Args:
+            path: Path to the structured .npy file
+        """
+        self.path = path
+        self._open()
+
+    def _open(self):
+        candles = np.load(self.path, mmap_mode='r')
+        if candles.dtype != INTRABAR_DTYPE:
+            raise ValueError(
+                f"{self.path}: expected fields {INTRABAR_DTYPE.names}, got {candles.dtype}"
+            )
+        self.timestamp = candles['timestamp']
+        self.high = candles['high']
+        self.low = candles['low']
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def __getstate__(self):
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.path = state['path']
+        self._open()
+
+    @staticmethod
+    def save(path: str, candles: pd.DataFrame) -> None:
+        """
+        Write 1m candles (timestamp, high, low columns) as a structured .npy.
+
+        Rows are sorted and de-duplicated by timestamp.
+        """
+        candles = candles.sort_values('timestamp').drop_duplicates('timestamp')
+
+        records = np.empty(len(candles), dtype=INTRABAR_DTYPE)
+        records['timestamp'] = candles['timestamp'].to_numpy(dtype=np.int64)
+        records['high'] = candles['high'].to_numpy(dtype=np.float64)
+        records['low'] = candles['low'].to_numpy(dtype=np.float64)
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        np.save(path, records)
+        log.info(f"Saved {len(records)} 1m candles to {path}")
+
+    def first_hit(
+        self,
+        bar_start: int,
+        bar_end: int,
+        side: int,
+        sl: float,
+        tp: float
+    ) -> int:
+        """
+        Resolve which level the 1m candles in [bar_start, bar_end) hit first.
+
+        Returns:
+            EXIT_TP if take-profit was touched strictly before stop-loss,
+            otherwise EXIT_SL (also when both land on the same 1m candle
+            or the bar has no 1m coverage)
+        """
+        lo = int(np.searchsorted(self.timestamp, bar_start, side='left'))
+        hi = int(np.searchsorted(self.timestamp, bar_end, side='left'))
+        if lo >= hi:
+            return EXIT_SL
+
+        high = self.high[lo:hi]
+        low = self.low[lo:hi]
+        if side == SIGNAL_BUY:
+            sl_hit = low <= sl
+            tp_hit = high >= tp
+        else:
+            sl_hit = high >= sl
+            tp_hit = low <= tp
+
+        hit = sl_hit | tp_hit
+        if not hit.any():
+            return EXIT_SL
+
+        first = int(hit.argmax())
+        return EXIT_SL if sl_hit[first] else EXIT_TP
+
+    def resolver(self, timestamps: np.ndarray) -> Callable[[int, int, float, float], int]:
+        """
+        Build a simulate_trades() intrabar hook for a bar series.
+
+        Args:
+            timestamps: Bar open timestamps (Unix ms) of the simulated candles
+
+        Returns:
+            Callable(bar_idx, side, sl, tp) -> EXIT_SL / EXIT_TP
+        """
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        # Bar length from the typical spacing (gaps must not widen a bar)
+        bar_ms = int(np.median(np.diff(timestamps))) if len(timestamps) > 1 else 60_000
+
+        def resolve(bar_idx: int, side: int, sl: float, tp: float) -> int:
+            bar_start = int(timestamps[bar_idx])
+            return self.first_hit(bar_start, bar_start + bar_ms, side, sl, tp)
+
+        return resolve
+
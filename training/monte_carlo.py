@@ -0,0 +1,252 @@
+"""
+Monte Carlo Robustness Analysis of Backtest Trades
+
+A single backtest gives one path through one ordering of trades at one set
+of execution costs. MonteCarloAnalyzer replays the trade log of a
+BacktestResult thousands of times:
+
+- bootstrap: trades resampled with replacement (new trade mix per path)
+- shuffle:   trades permuted (same trades, different order - stresses drawdown)
+
+and perturbs execution costs on every path (fee tier per path, slippage per
+trade). Each run is a (simulations x trades) NumPy matrix, processed in
+chunks of simulations to bound memory, so 10k simulations of a few hundred
+trades take well under a second.
+
+The output is a set of percentile bands for net profit, max drawdown and
+Sharpe (same definitions as BacktestEngine metrics), plus the probability
+of a losing path and the value-at-risk / expected shortfall of net profit:
+
+    analyzer = MonteCarloAnalyzer(n_simulations=10_000, seed=42)
+    mc = analyzer.analyze(backtest_result)
+    mc.bands['max_drawdown_pct']['p5']   # 5th percentile drawdown
+"""
+
+import time
+import numpy as np
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+import logging
+
+from .backtest_engine import BacktestResult
+
+log = logging.getLogger(__name__)
+
+
+METHODS = ('bootstrap', 'shuffle')
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+BAND_METRICS = ('net_profit_pct', 'max_drawdown_pct', 'sharpe_ratio')
+
+
+@dataclass
+class MonteCarloResult:
+    """Confidence bands from one Monte Carlo run."""
+    n_simulations: int
+    n_trades: int
+    method: str
+    bands: Dict[str, Dict[str, float]]   # metric -> {'p5': ..., 'p50': ..., 'mean': ...}
+    prob_loss: float                     # Fraction of paths with net profit < 0
+    var_pct: float                       # Net profit % at the VaR percentile
+    cvar_pct: float                      # Mean net profit % of paths at or below VaR
+    var_level: float = 0.05
+    seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready summary (stored by ConfigurationWriter)."""
+        return {
+            'n_simulations': self.n_simulations,
+            'n_trades': self.n_trades,
+            'method': self.method,
+            'var_level': self.var_level,
+            'prob_loss': round(self.prob_loss, 4),
+            'var_pct': round(self.var_pct, 2),
+            'cvar_pct': round(self.cvar_pct, 2),
+            'bands': self.bands,
+            'seconds': round(self.seconds, 4)
+        }
+
+
+class MonteCarloAnalyzer:
+    """
+    Vectorized Monte Carlo over a BacktestResult's trade log.
+
+    Cost perturbation works on the per-trade returns in the TradeLog, which
+    already include the engine's fees and slippage (2 legs each):
+
+    - fees: one fee rate per path, uniform in fee_rate * (1 +/- fee_jitter)
+    - slippage: per trade, slippage_rate times a mean-1 factor
+      1 + slippage_jitter * (Exp(1) - 1), so occasional fills are much worse
+
+    Example:
+        analyzer = MonteCarloAnalyzer(n_simulations=10_000, method='shuffle')
+        mc = analyzer.analyze(result)
+        print(mc.bands['net_profit_pct'])
+    """
+
+    def __init__(
+        self,
+        n_simulations: int = 10_000,
+        method: str = 'bootstrap',
+        fee_rate: float = 0.001,          # Rate the backtest was run with
+        slippage_rate: float = 0.0005,    # Rate the backtest was run with
+        fee_jitter: float = 0.25,
+        slippage_jitter: float = 0.5,
+        percentiles: Tuple[float, ...] = DEFAULT_PERCENTILES,
+        var_level: float = 0.05,
+        seed: Optional[int] = None,
+        chunk_elements: int = 250_000
+    ):
+        """
+        Initialize MonteCarloAnalyzer.
+
+        Args:
+            n_simulations: Number of simulated paths
+            method: 'bootstrap' (resample with replacement) or 'shuffle' (permute)
+            fee_rate: Fee rate used by the backtest (0.001 = 0.1%)
+            slippage_rate: Slippage rate used by the backtest (0.0005 = 0.05%)
+            fee_jitter: Relative +/- range of the per-path fee rate (0 = fixed)
+            slippage_jitter: Spread of per-trade slippage, 0..1 (0 = fixed)
+            percentiles: Percentiles reported per metric
+            var_level: Tail probability for VaR / CVaR of net profit
+            seed: Random seed (None = non-deterministic)
+            chunk_elements: Max matrix elements per chunk of simulations
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown Monte Carlo method '{method}' (expected one of {METHODS})")
+        if n_simulations < 1:
+            raise ValueError("n_simulations must be >= 1")
+        if not 0 <= slippage_jitter <= 1:
+            raise ValueError("slippage_jitter must be within [0, 1]")
+
+        self.n_simulations = n_simulations
+        self.method = method
+        self.fee_rate = fee_rate
+        self.slippage_rate = slippage_rate
+        self.fee_jitter = fee_jitter
+        self.slippage_jitter = slippage_jitter
+        self.percentiles = tuple(percentiles)
+        self.var_level = var_level
+        self.seed = seed
+        self.chunk_elements = chunk_elements
+
+    def analyze(self, result: BacktestResult) -> MonteCarloResult:
+        """
+        Run the simulations for one backtest.
+
+        Args:
+            result: BacktestResult whose trade_log is replayed
+
+        Returns:
+            MonteCarloResult with bands for BAND_METRICS
+        """
+        start = time.perf_counter()
+        trade_log = result.trade_log
+        n_trades = len(trade_log)
+
+        if n_trades == 0:
+            zeros = np.zeros(self.n_simulations)
+            metrics = {metric: zeros for metric in BAND_METRICS}
+        else:
+            metrics = self._simulate(
+                np.asarray(trade_log.pnl_pct, dtype=np.float64),
+                np.asarray(trade_log.size, dtype=np.float64),
+                float(result.initial_capital)
+            )
+
+        net_profit = metrics['net_profit_pct']
+        var_pct = float(np.percentile(net_profit, self.var_level * 100))
+        tail = net_profit[net_profit <= var_pct]
+
+        mc = MonteCarloResult(
+            n_simulations=self.n_simulations,
+            n_trades=n_trades,
+            method=self.method,
+            bands={metric: self._band(values) for metric, values in metrics.items()},
+            prob_loss=float((net_profit < 0).mean()),
+            var_pct=var_pct,
+            cvar_pct=float(tail.mean()) if len(tail) else var_pct,
+            var_level=self.var_level,
+            seconds=time.perf_counter() - start
+        )
+
+        log.debug(
+            f"Monte Carlo: {self.n_simulations} x {n_trades} trades ({self.method}) "
+            f"in {mc.seconds:.3f}s, P(loss) {mc.prob_loss:.1%}"
+        )
+        return mc
+
+    def _simulate(
+        self,
+        pnl_pct: np.ndarray,
+        size: np.ndarray,
+        initial_capital: float
+    ) -> Dict[str, np.ndarray]:
+        """Per-path metrics, computed in chunks of simulations."""
+        n_trades = len(pnl_pct)
+        rng = np.random.default_rng(self.seed)
+        chunk = max(1, self.chunk_elements // n_trades)
+
+        net_profit = np.empty(self.n_simulations)
+        max_drawdown = np.empty(self.n_simulations)
+        sharpe = np.empty(self.n_simulations)
+
+        for lo in range(0, self.n_simulations, chunk):
+            hi = min(lo + chunk, self.n_simulations)
+            rows = hi - lo
+
+            # Trade order / mix per path
+            if self.method == 'bootstrap':
+                idx = rng.integers(0, n_trades, size=(rows, n_trades))
+            else:
+                idx = rng.permuted(np.tile(np.arange(n_trades), (rows, 1)), axis=1)
+            returns = pnl_pct[idx]
+
+            # Execution cost perturbation (both legs pay fee and slippage)
+            if self.fee_jitter > 0:
+                fee = self.fee_rate * (1 + rng.uniform(-self.fee_jitter, self.fee_jitter, size=rows))
+                returns -= 2 * (fee - self.fee_rate)[:, None]
+            if self.slippage_jitter > 0:
+                # factor - 1 = jitter * (Exp(1) - 1): mean 0, long adverse tail
+                excess = rng.standard_exponential((rows, n_trades), dtype=np.float32)
+                excess -= 1
+                returns -= (2 * self.slippage_rate * self.slippage_jitter) * excess
+
+            equity = size[idx]
+            equity *= returns
+            np.cumsum(equity, axis=1, out=equity)
+            equity += initial_capital
+
+            # Net profit
+            net_profit[lo:hi] = (equity[:, -1] - initial_capital) / initial_capital * 100
+
+            # Max drawdown of the trade-exit equity path (incl. the starting point)
+            running_max = np.maximum.accumulate(equity, axis=1)
+            np.maximum(running_max, initial_capital, out=running_max)
+            np.divide(equity, running_max, out=running_max)
+            max_drawdown[lo:hi] = np.minimum(running_max.min(axis=1) - 1, 0.0) * 100
+
+            # Sharpe (per-trade returns, annualized like BacktestEngine)
+            if n_trades > 1:
+                std = returns.std(axis=1)
+                mean = returns.mean(axis=1)
+                sharpe[lo:hi] = np.divide(
+                    mean, std, out=np.zeros(rows), where=std > 0
+                ) * np.sqrt(252)
+            else:
+                sharpe[lo:hi] = 0.0
+
+        return {
+            'net_profit_pct': net_profit,
+            'max_drawdown_pct': max_drawdown,
+            'sharpe_ratio': sharpe
+        }
+
+    def _band(self, values: np.ndarray) -> Dict[str, float]:
+        """Percentiles plus mean/std of one metric across paths."""
+        points = np.percentile(values, self.percentiles)
+        band = {f"p{p:g}": round(float(v), 2) for p, v in zip(self.percentiles, points)}
+        band['mean'] = round(float(values.mean()), 2)
+        band['std'] = round(float(values.std()), 2)
+        return band
@@ -5,14 +5,35 @@ Available optimizers:
 - GridSearchOptimizer: Exhaustive search through parameter grid
 - RandomSearchOptimizer: Random sampling of parameter space
 - BayesianOptimizer: ML-powered intelligent search (Gaussian Process)
+- SuccessiveHalvingOptimizer: Random search pruned on short recent windows
+- TPEOptimizer: Tree-structured Parzen Estimator with mid-backtest pruning
+
+Optimizer modules are imported on first attribute access, so random or
+grid search jobs never import scikit-optimize.
 """
 
-from .grid_search import GridSearchOptimizer
-from .random_search import RandomSearchOptimizer
-from .bayesian import BayesianOptimizer
+from importlib import import_module
+
+_MODULES = {
+    'GridSearchOptimizer': '.grid_search',
+    'RandomSearchOptimizer': '.random_search',
+    'BayesianOptimizer': '.bayesian',
+    'SuccessiveHalvingOptimizer': '.successive_halving',
+    'TPEOptimizer': '.tpe'
+}
 
 __all__ = [
     'GridSearchOptimizer',
     'RandomSearchOptimizer',
-    'BayesianOptimizer'
+    'BayesianOptimizer',
+    'SuccessiveHalvingOptimizer',
+    'TPEOptimizer'
 ]
+
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,245 @@
+"""
+Batch Evaluation - Chunked configuration scoring through BacktestEngine.run_batch
+
+Optimizers hand a chunk of (episode_index, params) pairs to evaluate_batch().
+Signals are generated per configuration, stacked into one signal matrix and
+backtested together, so validation, candle extraction and metric setup are
+paid once per chunk instead of once per configuration.
+
+An optional BacktestBudget lets hopeless configurations stop early; pruned
+configurations are dropped like too-few-trades ones. Budget checkpoints add
+the running objective at fixed candle fractions to the metrics.
+
+Phases are timed with training.telemetry.timed(); optimizers wrap each
+chunk in telemetry.collect() and merge the per-chunk collectors.
+
+Strategies with prepare()/evaluate() stages share one prepared context per
+dataset and worker process (training.strategies.context).
+
+With an EvaluationScope (training.evaluation_cache), configurations
+backtested by an earlier job are served from the cache and only the misses
+are backtested (and stored).
+
+Progress callback contract is unchanged: callback(episode_index, fraction, stage)
+during signal generation and callback(episode_index, 1.0, 'completed') when a
+configuration has been scored. Every episode is reported in progress (fraction
+0.0) before it completes, since rq_jobs.ProgressCallback only counts
+completions of episodes it has seen start.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+
+import pandas as pd
+
+from ..backtest_engine import BacktestEngine, BacktestBudget
+from ..evaluation_cache import EvaluationScope
+from ..telemetry import timed
+from ..strategies.context import prepared_context, strategy_signals
+
+log = logging.getLogger(__name__)
+
+
+def chunk_configs(
+    configs: List[Dict[str, Any]],
+    batch_size: int
+) -> List[List[Tuple[int, Dict[str, Any]]]]:
+    """Split configurations into chunks of (episode_index, params) pairs."""
+    indexed = list(enumerate(configs))
+    return [indexed[k:k + batch_size] for k in range(0, len(indexed), batch_size)]
+
+
+def auto_batch_size(n_configs: int, n_jobs: int, max_batch: int = 16) -> int:
+    """Pick a chunk size that still gives every worker several chunks."""
+    return max(1, min(max_batch, n_configs // (max(n_jobs, 1) * 4)))
+
+
+def make_budget(
+    early_abort: bool,
+    max_drawdown_pct: Optional[float],
+    objective: str,
+    min_trades: int,
+    best_objective: Optional[float] = None,
+    checkpoints: Tuple[float, ...] = (),
+    checkpoint_callback: Optional[Callable[[float, Dict[str, float]], bool]] = None,
+    running_best: bool = True
+) -> Optional[BacktestBudget]:
+    """
+    Build the BacktestBudget for an optimizer run (None when disabled).
+
+    early_abort enables the min_trades and objective-bound checks;
+    max_drawdown_pct adds a drawdown limit on its own; checkpoints report
+    the running objective (and may prune through checkpoint_callback).
+    running_best=False keeps best_objective fixed within a chunk, so
+    pruning does not depend on how configurations are split into chunks.
+    """
+    if not early_abort and max_drawdown_pct is None and not checkpoints:
+        return None
+    return BacktestBudget(
+        max_drawdown_pct=max_drawdown_pct,
+        min_trades=min_trades if early_abort else None,
+        objective=objective if early_abort or checkpoints else None,
+        best_objective=best_objective if early_abort else None,
+        checkpoints=tuple(checkpoints),
+        checkpoint_callback=checkpoint_callback,
+        running_best=running_best
+    )
+
+
+def evaluate_batch(
+    backtest_engine: BacktestEngine,
+    data: pd.DataFrame,
+    strategy_class: Any,
+    batch: List[Tuple[int, Dict[str, Any]]],
+    objective: str,
+    min_trades: int,
+    progress_callback: Optional[Callable] = None,
+    budget: Optional[BacktestBudget] = None,
+    cache: Optional[EvaluationScope] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Evaluate a chunk of configurations with a single batched backtest.
+
+    Args:
+        backtest_engine: BacktestEngine instance
+        data: OHLCV DataFrame with indicators
+        strategy_class: Strategy class to instantiate
+        batch: List of (episode_index, params) pairs
+        objective: Metric to maximize
+        min_trades: Minimum trades required for valid configuration
+        progress_callback: Optional callback(episode_index, fraction, stage)
+        budget: Optional BacktestBudget (see make_budget)
+        cache: Optional EvaluationScope consulted before backtesting
+
+    Returns:
+        List aligned with batch: result dict (parameters, metrics,
+        objective_value) or None for failed / too-few-trades / pruned configs
+    """
+    signals_list = []
+    generated = []
+
+    # Configurations already backtested (by this or an earlier job)
+    metrics_by_episode = {}
+    if cache is not None:
+        cached = cache.get_many([params for _, params in batch])
+        metrics_by_episode = {batch[position][0]: metrics for position, metrics in cached.items()}
+        if progress_callback:
+            for i in metrics_by_episode:
+                progress_callback(i, 0.0, 'cached')
+    if len(metrics_by_episode) == len(batch):
+        return _score(batch, metrics_by_episode, objective, min_trades, progress_callback)
+
+    # Parameter-independent preparation, shared by every config (and chunk)
+    context = None
+    if hasattr(strategy_class, 'prepare'):
+        try:
+            context = prepared_context(strategy_class, data)
+        except Exception as e:
+            log.debug(f"Strategy preparation failed ({e}), generating signals per config")
+
+    for i, params in batch:
+        if i in metrics_by_episode:
+            continue
+        if progress_callback:
+            progress_callback(i, 0.0, 'signal_generation')
+        try:
+            strategy = strategy_class(params)
+            with timed('backtest.signals', len(data)):
+                signals_list.append(strategy_signals(
+                    strategy,
+                    data,
+                    progress_callback=_episode_callback(progress_callback, i),
+                    context=context,
+                    sparse=True
+                ))
+            generated.append((i, params))
+        except Exception as e:
+            log.debug(f"Signal generation failed for params {params}: {e}")
+
+    if generated:
+        try:
+            with timed('backtest.signal_matrix', len(data) * len(signals_list)):
+                signal_matrix = backtest_engine.build_signal_matrix(data, signals_list)
+            metrics_list = backtest_engine.run_batch(
+                data=data,
+                signal_matrix=signal_matrix,
+                params_list=[params for _, params in generated],
+                budget=budget
+            )
+            backtested = {
+                i: metrics for (i, _), metrics in zip(generated, metrics_list)
+            }
+        except Exception as e:
+            log.debug(f"Batch backtest failed ({e}), falling back to per-config backtests")
+            backtested = _evaluate_individually(
+                backtest_engine, data, strategy_class, generated, budget
+            )
+        metrics_by_episode.update(backtested)
+        if cache is not None:
+            cache.put_many((params, backtested.get(i)) for i, params in generated)
+
+    return _score(batch, metrics_by_episode, objective, min_trades, progress_callback)
+
+
+def _score(
+    batch: List[Tuple[int, Dict[str, Any]]],
+    metrics_by_episode: Dict[int, Dict[str, float]],
+    objective: str,
+    min_trades: int,
+    progress_callback: Optional[Callable] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """Result dicts aligned with batch (None for missing / too-few-trades / pruned)."""
+    results = []
+    for i, params in batch:
+        metrics = metrics_by_episode.get(i)
+        if metrics is None:
+            results.append(None)
+            continue
+
+        # Mark episode as complete
+        if progress_callback:
+            progress_callback(i, 1.0, 'completed')
+
+        if metrics['total_trades'] >= min_trades and not metrics.get('pruned'):
+            results.append({
+                'parameters': params.copy(),
+                'metrics': metrics,
+                'objective_value': metrics.get(objective, 0)
+            })
+        else:
+            results.append(None)
+
+    return results
+
+
+def _evaluate_individually(
+    backtest_engine: BacktestEngine,
+    data: pd.DataFrame,
+    strategy_class: Any,
+    generated: List[Tuple[int, Dict[str, Any]]],
+    budget: Optional[BacktestBudget] = None
+) -> Dict[int, Dict[str, float]]:
+    """Per-config run_backtest fallback (e.g. duplicate candle timestamps)."""
+    metrics_by_episode = {}
+    for i, params in generated:
+        try:
+            result = backtest_engine.run_backtest(
+                data=data,
+                strategy_instance=strategy_class(params),
+                budget=budget
+            )
+            metrics_by_episode[i] = result.metrics
+        except Exception as e:
+            log.debug(f"Backtest failed for params {params}: {e}")
+    return metrics_by_episode
+
+
+def _episode_callback(
+    progress_callback: Optional[Callable],
+    episode_index: int
+) -> Callable[[int, int, str], None]:
+    """Nested callback translating intra-episode progress to a fraction."""
+    def nested_callback(intra_current, intra_total, stage):
+        if progress_callback and intra_total > 0:
+            progress_callback(episode_index, intra_current / intra_total, stage)
+    return nested_callback
@@ -15,9 +15,14 @@ Best for:
 Typically finds near-optimal solutions in 50-200 evaluations vs.
 thousands required by grid search.
 
-Note: Bayesian optimization is inherently SEQUENTIAL - each iteration depends
-on previous results to decide where to search next. For parallel execution,
-use RandomSearchOptimizer instead.
+Each iteration depends on previous results to decide where to search next.
+By default the optimizer runs ask/tell rounds instead of gp_minimize: the
+GP proposes points_per_round points per round (constant liar: pending
+points are told a fake objective so the proposals spread out), the round
+is backtested in parallel on the loky pool, and the whole batch is told
+to the surrogate before the next round. The round size is fixed (not
+derived from n_jobs), so a seeded run proposes the same points on any
+number of workers; points_per_round=1 falls back to sequential gp_minimize.
 
 Requires: scikit-optimize (pip install scikit-optimize)
 """
@@ -29,7 +34,9 @@ import logging
 from tqdm import tqdm
 
 try:
-    from skopt import gp_minimize
+    from skopt import gp_minimize, Optimizer
+    from skopt.utils import cook_estimator, normalize_dimensions
+    from sklearn.utils import check_random_state
     from skopt.space import Real, Integer, Categorical
     from skopt.utils import use_named_args
     SKOPT_AVAILABLE = True
@@ -41,7 +48,14 @@ except ImportError:
         "Install with: pip install scikit-optimize"
     )
 
+from joblib import Parallel, delayed
+
 from ..backtest_engine import BacktestEngine, BacktestResult
+from ..utils.cpu_config import get_cached_training_workers
+from ..shared_dataset import share_dataset, resolve_dataset
+from .batch_evaluation import evaluate_batch, make_budget
+from ..telemetry import TimingCollector, collect
+from ..evaluation_cache import EvaluationScope, cache_report
 
 log = logging.getLogger(__name__)
 
@@ -109,7 +123,13 @@ class BayesianOptimizer:
         min_trades: int = 10,
         acq_func: str = 'gp_hedge',
         progress_callback: Optional[Callable[[int, int, float], None]] = None,
-        n_jobs: int = 1
+        n_jobs: int = 1,
+        early_abort: bool = False,
+        max_drawdown_pct: Optional[float] = None,
+        track_allocations: bool = False,
+        evaluation_cache: Optional[EvaluationScope] = None,
+        points_per_round: int = 8,
+        liar_strategy: str = 'cl_min'
     ) -> Dict[str, Any]:
         """
         Run Bayesian optimization using Gaussian Process.
@@ -142,6 +162,21 @@ class BayesianOptimizer:
                 - 'LCB': Lower Confidence Bound
                 - 'PI': Probability of Improvement
             progress_callback: Optional callback(iteration, total, score) for progress updates
+            n_jobs: Parallel backtests per round (-1 = all training workers)
+            early_abort: Stop backtests early once a configuration cannot reach
+                min_trades or beat the running best (pruned configs get the
+                same penalty as too-few-trades ones)
+            max_drawdown_pct: Optional drawdown limit; breaching configs are pruned
+            track_allocations: Also record peak traced allocations per phase
+                in the telemetry (slower; for profiling runs)
+            evaluation_cache: Optional EvaluationScope; configurations already
+                backtested by earlier jobs are served from it (see
+                training.evaluation_cache)
+            points_per_round: Points proposed and backtested per ask/tell round
+                (independent of n_jobs so seeded runs are reproducible;
+                1 = sequential gp_minimize)
+            liar_strategy: Fake objective told for pending points while
+                proposing a round ('cl_min', 'cl_mean' or 'cl_max')
         
         Returns:
             Dict with:
@@ -152,6 +187,8 @@ class BayesianOptimizer:
                 - search_stats: Statistics about search process
                 - convergence_trace: Objective values over iterations
                 - gp_model: Trained Gaussian Process model (for analysis)
+                - telemetry: Per-phase timing histograms (training.telemetry)
+                - evaluation_cache: Cache hits / misses / hit_rate (None without a cache)
         """
         log.info(
             f"Starting Bayesian Optimization: {n_calls} evaluations "
@@ -166,82 +203,44 @@ class BayesianOptimizer:
             f"({', '.join(param_names)})"
         )
         
+        n_workers = get_cached_training_workers() if n_jobs == -1 else max(n_jobs, 1)
+        points_per_round = max(points_per_round, 1)
+        
         # Track all results
         all_evaluations = []
-        iteration_counter = [0]  # Mutable for closure
-        
-        # Define objective function for skopt
-        @use_named_args(dimensions=dimensions)
-        def objective_function(**params):
-            """
-            Objective function for Bayesian optimization.
-            
-            Returns NEGATIVE objective (skopt minimizes, we want to maximize).
-            """
-            iteration_counter[0] += 1
-            
-            if self.verbose:
-                print(f"\rIteration {iteration_counter[0]}/{n_calls}", end='')
-            
-            try:
-                # Create strategy instance
-                strategy = strategy_class(params)
-                
-                # Create nested callback for cumulative progress tracking
-                def nested_callback(intra_current, intra_total, stage):
-                    if progress_callback and intra_total > 0:
-                        current_iter = iteration_counter[0] - 1  # 0-indexed
-                        intra_fraction = intra_current / intra_total
-                        progress_callback(current_iter, intra_fraction, stage)
-                
-                backtest_result = backtest_engine.run_backtest(
-                    data=data,
-                    strategy_instance=strategy,
-                    progress_callback=nested_callback
-                )
-                
-                # Mark episode as complete
-                if progress_callback:
-                    progress_callback(iteration_counter[0] - 1, 1.0, 'completed')
-                
-                # Check minimum trades
-                if backtest_result.metrics['total_trades'] < min_trades:
-                    # Penalize configurations with too few trades
-                    objective_value = -999
-                else:
-                    objective_value = backtest_result.metrics.get(objective, 0)
-                
-                # Record evaluation
-                all_evaluations.append({
-                    'iteration': iteration_counter[0],
-                    'parameters': params.copy(),
-                    'metrics': backtest_result.metrics,
-                    'objective_value': objective_value
-                })
-                
-                # Call progress callback (iteration complete)
-                if progress_callback:
-                    progress_callback(iteration_counter[0], n_calls, objective_value)
-                
-                # Return negative (skopt minimizes)
-                return -objective_value
-                
-            except Exception as e:
-                log.debug(f"Backtest failed for params {params}: {e}")
-                # Return large penalty
-                return 999
         
-        # Run Gaussian Process optimization
-        result = gp_minimize(
-            func=objective_function,
-            dimensions=dimensions,
-            n_calls=n_calls,
-            n_initial_points=n_initial_points,
-            acq_func=acq_func,
-            random_state=self.random_state,
-            n_jobs=n_jobs,  # Parallelize initial random points and some internal operations
-            verbose=False  # We handle progress ourselves
-        )
+        if points_per_round > 1:
+            result, telemetry = self._optimize_batched(
+                backtest_engine, data, strategy_class, dimensions, param_names, all_evaluations,
+                n_calls=n_calls,
+                n_initial_points=n_initial_points,
+                objective=objective,
+                min_trades=min_trades,
+                acq_func=acq_func,
+                progress_callback=progress_callback,
+                n_workers=n_workers,
+                points_per_round=points_per_round,
+                liar_strategy=liar_strategy,
+                early_abort=early_abort,
+                max_drawdown_pct=max_drawdown_pct,
+                track_allocations=track_allocations,
+                evaluation_cache=evaluation_cache
+            )
+        else:
+            result, telemetry = self._optimize_sequential(
+                backtest_engine, data, strategy_class, dimensions, all_evaluations,
+                n_calls=n_calls,
+                n_initial_points=n_initial_points,
+                objective=objective,
+                min_trades=min_trades,
+                acq_func=acq_func,
+                progress_callback=progress_callback,
+                n_jobs=n_jobs,
+                early_abort=early_abort,
+                max_drawdown_pct=max_drawdown_pct,
+                track_allocations=track_allocations,
+                evaluation_cache=evaluation_cache
+            )
         
         if self.verbose:
             print()  # New line after progress
@@ -300,9 +299,257 @@ class BayesianOptimizer:
             'total_evaluations': n_calls,
             'valid_evaluations': len(valid_evals),
             'gp_model': result.models[-1] if result.models else None,
-            'acquisition_function': acq_func
+            'acquisition_function': acq_func,
+            'points_per_round': points_per_round,
+            'telemetry': telemetry.to_dict(),
+            'evaluation_cache': cache_report(telemetry)
         }
     
+    def _optimize_sequential(
+        self,
+        backtest_engine: BacktestEngine,
+        data: pd.DataFrame,
+        strategy_class: Any,
+        dimensions: List,
+        all_evaluations: List[Dict[str, Any]],
+        n_calls: int,
+        n_initial_points: int,
+        objective: str,
+        min_trades: int,
+        acq_func: str,
+        progress_callback: Optional[Callable],
+        n_jobs: int,
+        early_abort: bool,
+        max_drawdown_pct: Optional[float],
+        track_allocations: bool,
+        evaluation_cache: Optional[EvaluationScope]
+    ) -> Tuple[Any, TimingCollector]:
+        """One backtest per gp_minimize call (returns skopt result, telemetry)."""
+        iteration_counter = [0]  # Mutable for closure
+        
+        # Define objective function for skopt
+        @use_named_args(dimensions=dimensions)
+        def objective_function(**params):
+            """
+            Objective function for Bayesian optimization.
+            
+            Returns NEGATIVE objective (skopt minimizes, we want to maximize).
+            """
+            iteration_counter[0] += 1
+            
+            if self.verbose:
+                print(f"\rIteration {iteration_counter[0]}/{n_calls}", end='')
+            
+            try:
+                # Configuration backtested by an earlier job
+                metrics = evaluation_cache.get(params) if evaluation_cache is not None else None
+                pruned = False
+                
+                if metrics is None:
+                    # Create strategy instance
+                    strategy = strategy_class(params)
+                    
+                    # Create nested callback for cumulative progress tracking
+                    def nested_callback(intra_current, intra_total, stage):
+                        if progress_callback and intra_total > 0:
+                            current_iter = iteration_counter[0] - 1  # 0-indexed
+                            intra_fraction = intra_current / intra_total
+                            progress_callback(current_iter, intra_fraction, stage)
+                    
+                    valid_scores = [e['objective_value'] for e in all_evaluations if e['objective_value'] > -999]
+                    backtest_result = backtest_engine.run_backtest(
+                        data=data,
+                        strategy_instance=strategy,
+                        progress_callback=nested_callback,
+                        budget=make_budget(
+                            early_abort, max_drawdown_pct, objective, min_trades,
+                            max(valid_scores) if valid_scores else None
+                        )
+                    )
+                    metrics = backtest_result.metrics
+                    pruned = backtest_result.pruned
+                    if evaluation_cache is not None and not pruned:
+                        evaluation_cache.put(params, metrics)
+                
+                # Mark episode as complete
+                if progress_callback:
+                    progress_callback(iteration_counter[0] - 1, 1.0, 'completed')
+                
+                # Check minimum trades
+                if pruned or metrics['total_trades'] < min_trades:
+                    # Penalize configurations with too few trades (or pruned early)
+                    objective_value = -999
+                else:
+                    objective_value = metrics.get(objective, 0)
+                
+                # Record evaluation
+                all_evaluations.append({
+                    'iteration': iteration_counter[0],
+                    'parameters': params.copy(),
+                    'metrics': metrics,
+                    'objective_value': objective_value
+                })
+                
+                # Call progress callback (iteration complete)
+                if progress_callback:
+                    progress_callback(iteration_counter[0], n_calls, objective_value)
+                
+                # Return negative (skopt minimizes)
+                return -objective_value
+                
+            except Exception as e:
+                log.debug(f"Backtest failed for params {params}: {e}")
+                # Return large penalty
+                return 999
+        
+        # Run Gaussian Process optimization (objective runs in-process, so
+        # one collector sees every backtest phase)
+        with collect(TimingCollector(track_allocations)) as telemetry:
+            result = gp_minimize(
+                func=objective_function,
+                dimensions=dimensions,
+                n_calls=n_calls,
+                n_initial_points=n_initial_points,
+                acq_func=acq_func,
+                random_state=self.random_state,
+                n_jobs=n_jobs,  # Parallelize initial random points and some internal operations
+                verbose=False  # We handle progress ourselves
+            )
+        
+        return result, telemetry
+    
+    def _optimize_batched(
+        self,
+        backtest_engine: BacktestEngine,
+        data: pd.DataFrame,
+        strategy_class: Any,
+        dimensions: List,
+        param_names: List[str],
+        all_evaluations: List[Dict[str, Any]],
+        n_calls: int,
+        n_initial_points: int,
+        objective: str,
+        min_trades: int,
+        acq_func: str,
+        progress_callback: Optional[Callable],
+        n_workers: int,
+        points_per_round: int,
+        liar_strategy: str,
+        early_abort: bool,
+        max_drawdown_pct: Optional[float],
+        track_allocations: bool,
+        evaluation_cache: Optional[EvaluationScope]
+    ) -> Tuple[Any, TimingCollector]:
+        """
+        Ask/tell rounds of points_per_round parallel backtests (returns skopt result, telemetry).
+        
+        The surrogate is built like gp_minimize's (same seeded GP, acquisition
+        settings and random stream), and rounds are told in ask order, so
+        results depend on the seed and points_per_round only, not on
+        n_jobs or worker timing. With early_abort, every point of a round
+        is pruned against the best of earlier rounds only (the bound is not
+        raised within a chunk, whose size depends on n_jobs).
+        """
+        rng = check_random_state(self.random_state)
+        space = normalize_dimensions(dimensions)
+        base_estimator = cook_estimator(
+            'GP',
+            space=space,
+            random_state=rng.randint(0, np.iinfo(np.int32).max),
+            noise='gaussian'
+        )
+        opt = Optimizer(
+            space,
+            base_estimator,
+            n_initial_points=n_initial_points,
+            acq_func=acq_func,
+            acq_optimizer='auto',
+            random_state=rng,
+            acq_optimizer_kwargs={'n_points': 10000, 'n_restarts_optimizer': 5, 'n_jobs': 1},
+            acq_func_kwargs={'xi': 0.01, 'kappa': 1.96}
+        )
+        
+        log.info(f"Ask/tell rounds of {points_per_round} points on {n_workers} worker(s) ({liar_strategy})")
+        
+        def evaluate_chunk(batch, dataset, best_objective):
+            """Backtest a chunk of (episode_index, params) pairs (returns results, phase timings)."""
+            with collect(TimingCollector(track_allocations)) as timings:
+                chunk_results = evaluate_batch(
+                    backtest_engine=backtest_engine,
+                    data=resolve_dataset(dataset),
+                    strategy_class=strategy_class,
+                    batch=batch,
+                    objective=objective,
+                    min_trades=min_trades,
+                    progress_callback=progress_callback,
+                    budget=make_budget(
+                        early_abort, max_drawdown_pct, objective, min_trades, best_objective,
+                        running_best=False
+                    ),
+                    cache=evaluation_cache
+                )
+            return chunk_results, timings
+        
+        telemetry = TimingCollector(track_allocations)
+        result = None
+        best_objective = None
+        
+        # Workers attach to one memory-mapped copy instead of unpickling data per task
+        shared = share_dataset(data) if n_workers > 1 else None
+        dataset = shared.handle if shared is not None else data
+        
+        try:
+            with Parallel(n_jobs=n_workers, backend='loky') as parallel:
+                while len(opt.Xi) < n_calls:
+                    n_points = min(points_per_round, n_calls - len(opt.Xi))
+                    with collect(telemetry):
+                        # ask(n_points=1) would still draw a seed for its liar copy
+                        xs = opt.ask(n_points=n_points, strategy=liar_strategy) if n_points > 1 else [opt.ask()]
+                    batch = [
+                        (len(opt.Xi) + k, dict(zip(param_names, x)))
+                        for k, x in enumerate(xs)
+                    ]
+                    
+                    # One chunk per worker; the budget prunes against earlier rounds only
+                    chunk_size = -(-len(batch) // n_workers)
+                    chunks = [batch[k:k + chunk_size] for k in range(0, len(batch), chunk_size)]
+                    if n_workers > 1:
+                        outputs = parallel(
+                            delayed(evaluate_chunk)(chunk, dataset, best_objective)
+                            for chunk in chunks
+                        )
+                    else:
+                        outputs = [evaluate_chunk(chunk, dataset, best_objective) for chunk in chunks]
+                    
+                    round_results = []
+                    for chunk_results, timings in outputs:
+                        telemetry.merge(timings)
+                        round_results.extend(chunk_results)
+                    
+                    ys = []
+                    for (i, params), evaluation in zip(batch, round_results):
+                        # Failed, too-few-trades and pruned configs get the sequential penalty
+                        objective_value = evaluation['objective_value'] if evaluation is not None else -999
+                        ys.append(-objective_value)
+                        if evaluation is not None:
+                            all_evaluations.append({'iteration': i + 1, **evaluation})
+                            if best_objective is None or objective_value > best_objective:
+                                best_objective = objective_value
+                        if progress_callback:
+                            progress_callback(i + 1, n_calls, objective_value)
+                    
+                    if self.verbose:
+                        print(f"\rIteration {len(opt.Xi) + len(xs)}/{n_calls}", end='')
+                    
+                    # Update the surrogate with the whole round
+                    with collect(telemetry):
+                        result = opt.tell(xs, ys)
+        finally:
+            if shared is not None:
+                shared.close()
+        
+        return result, telemetry
+    
     def _build_skopt_space(
         self,
         parameter_space: Dict[str, Any]
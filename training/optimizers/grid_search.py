@@ -20,7 +20,12 @@ from tqdm import tqdm
 from joblib import delayed
 
 from ..backtest_engine import BacktestEngine, BacktestResult
+from ..utils.cpu_config import get_cached_training_workers
+from ..shared_dataset import share_dataset, resolve_dataset
 from .progress_parallel import ProgressParallel
+from .batch_evaluation import evaluate_batch, chunk_configs, auto_batch_size, make_budget
+from ..telemetry import TimingCollector, collect
+from ..evaluation_cache import EvaluationScope, cache_report
 
 log = logging.getLogger(__name__)
 
@@ -65,7 +70,12 @@ class GridSearchOptimizer:
         objective: str = 'sharpe_ratio',
         min_trades: int = 10,
         progress_callback: Optional[Callable[[int, int, float], None]] = None,
-        n_jobs: int = 1
+        n_jobs: int = 1,
+        batch_size: Optional[int] = None,
+        early_abort: bool = False,
+        max_drawdown_pct: Optional[float] = None,
+        track_allocations: bool = False,
+        evaluation_cache: Optional[EvaluationScope] = None
     ) -> Dict[str, Any]:
         """
         Run grid search optimization.
@@ -84,6 +94,17 @@ class GridSearchOptimizer:
                 Total combinations: 3 × 2 × 3 = 18
             objective: Metric to maximize ('sharpe_ratio', 'net_profit_pct', etc.)
             min_trades: Minimum trades required for valid configuration
+            batch_size: Configurations per BacktestEngine.run_batch() call
+                (None = auto, 1 = one backtest per task)
+            early_abort: Stop backtests early once a configuration cannot reach
+                min_trades or beat the running best (bounded objectives only)
+            max_drawdown_pct: Optional drawdown limit; configurations breaching
+                it are pruned
+            track_allocations: Also record peak traced allocations per phase
+                in the telemetry (slower; for profiling runs)
+            evaluation_cache: Optional EvaluationScope; configurations already
+                backtested by earlier jobs are served from it (see
+                training.evaluation_cache)
         
         Returns:
             Dict with:
@@ -92,6 +113,8 @@ class GridSearchOptimizer:
                 - best_metrics: Full metrics for best config
                 - all_results: DataFrame of all tested combinations
                 - search_stats: Statistics about search process
+                - telemetry: Per-phase timing histograms (training.telemetry)
+                - evaluation_cache: Cache hits / misses / hit_rate (None without a cache)
         """
         log.info("Starting Grid Search optimization...")
         
@@ -118,72 +141,76 @@ class GridSearchOptimizer:
             f"({n_jobs if n_jobs > 0 else 'all'} workers)"
         )
         
+        # Chunk configurations so each task backtests several at once
+        if batch_size is None:
+            batch_size = auto_batch_size(
+                total_combinations,
+                get_cached_training_workers() if n_jobs == -1 else max(n_jobs, 1)
+            )
+        batches = chunk_configs(param_grid, batch_size)
+        
         # Define evaluation function
-        def evaluate_params(params_tuple):
-            i, params = params_tuple
-            try:
-                strategy = strategy_class(params)
-                
-                # Create nested callback for cumulative progress tracking
-                def nested_callback(intra_current, intra_total, stage):
-                    if progress_callback and intra_total > 0:
-                        intra_fraction = intra_current / intra_total
-                        progress_callback(i, intra_fraction, stage)
-                
-                backtest_result = backtest_engine.run_backtest(
-                    data=data,
-                    strategy_instance=strategy,
-                    progress_callback=nested_callback
+        def evaluate_chunk(batch, dataset, best_objective=None):
+            with collect(TimingCollector(track_allocations)) as timings:
+                chunk_results = evaluate_batch(
+                    backtest_engine=backtest_engine,
+                    data=resolve_dataset(dataset),
+                    strategy_class=strategy_class,
+                    batch=batch,
+                    objective=objective,
+                    min_trades=min_trades,
+                    progress_callback=progress_callback,
+                    budget=make_budget(early_abort, max_drawdown_pct, objective, min_trades, best_objective),
+                    cache=evaluation_cache
                 )
-                
-                # Mark episode as complete
-                if progress_callback:
-                    progress_callback(i, 1.0, 'completed')
-                
-                objective_value = backtest_result.metrics.get(objective, 0)
-                
-                if backtest_result.metrics['total_trades'] >= min_trades:
-                    # Fire progress callback immediately (for parallel execution)
-                    if progress_callback:
-                        progress_callback(i + 1, total_combinations, objective_value)
-                    
-                    return {
-                        'parameters': params.copy(),
-                        'metrics': backtest_result.metrics,
-                        'objective_value': objective_value
-                    }
-                return None
-                
-            except Exception as e:
-                log.debug(f"Backtest failed for params {params}: {e}")
-                return None
+            
+            # Fire progress callback immediately (for parallel execution)
+            if progress_callback:
+                for (i, _), result in zip(batch, chunk_results):
+                    if result is not None:
+                        progress_callback(i + 1, total_combinations, result['objective_value'])
+            
+            return chunk_results, timings
+        
+        # Phase timings aggregated across all chunks / workers
+        telemetry = TimingCollector(track_allocations)
         
         # Run evaluations (parallel or sequential)
         if use_parallel:
             # Parallel execution with progress tracking
-            results_raw = ProgressParallel(
-                n_jobs=n_jobs,
-                verbose=1,  # Enable verbose to trigger print_progress callbacks
-                progress_callback=progress_callback,
-                total=total_combinations
-            )(
-                delayed(evaluate_params)((i, params))
-                for i, params in enumerate(param_grid)
-            )
-            results = [r for r in results_raw if r is not None]
+            # Workers attach to one memory-mapped copy instead of unpickling data per task
+            shared = share_dataset(data)
+            dataset = shared.handle if shared is not None else data
+            try:
+                results_raw = ProgressParallel(
+                    n_jobs=n_jobs,
+                    verbose=1,  # Enable verbose to trigger print_progress callbacks
+                    progress_callback=progress_callback,
+                    total=len(batches)
+                )(
+                    delayed(evaluate_chunk)(batch, dataset)
+                    for batch in batches
+                )
+            finally:
+                if shared is not None:
+                    shared.close()
+            results = [r for chunk, _ in results_raw for r in chunk if r is not None]
+            for _, timings in results_raw:
+                telemetry.merge(timings)
         else:
             # Sequential execution with progress bar
             results = []
-            iterator = tqdm(enumerate(param_grid), total=total_combinations, desc="Grid Search") if self.verbose else enumerate(param_grid)
-            for i, params in iterator:
-                result = evaluate_params((i, params))
-                if result is not None:
-                    results.append(result)
-            
-            for params_tuple in iterator:
-                result = evaluate_params(params_tuple)
-                if result is not None:
-                    results.append(result)
+            iterator = tqdm(batches, total=len(batches), desc="Grid Search") if self.verbose else batches
+            best_objective = None
+            for batch in iterator:
+                # Later chunks are pruned against the running best
+                chunk_results, timings = evaluate_chunk(batch, data, best_objective)
+                telemetry.merge(timings)
+                for result in chunk_results:
+                    if result is not None:
+                        results.append(result)
+                        if best_objective is None or result['objective_value'] > best_objective:
+                            best_objective = result['objective_value']
         
         if not results:
             raise ValueError(
@@ -225,7 +252,9 @@ class GridSearchOptimizer:
             'search_stats': search_stats,
             'optimizer': 'grid_search',
             'total_evaluations': total_combinations,
-            'valid_evaluations': len(results)
+            'valid_evaluations': len(results),
+            'telemetry': telemetry.to_dict(),
+            'evaluation_cache': cache_report(telemetry)
         }
     
     def _build_parameter_grid(
@@ -78,6 +78,19 @@ class ProgressParallel(Parallel):
             except Exception as e:
                 log.warning(f"Progress callback failed: {e}")
     
+    def _track_best(self, result: Any) -> None:
+        """
+        Update best_score from a result dict, a list of result dicts, or a
+        (list of result dicts, telemetry) chunk tuple.
+        """
+        if isinstance(result, tuple):
+            result = result[0]
+        for item in (result if isinstance(result, list) else [result]):
+            if item and isinstance(item, dict):
+                obj_value = item.get('objective_value', float('-inf'))
+                if obj_value > self.best_score:
+                    self.best_score = obj_value
+    
     def __call__(self, iterable: Iterable) -> list:
         """
         Execute tasks and track progress.
@@ -111,11 +124,8 @@ class ProgressParallel(Parallel):
         for i, result in enumerate(results):
             self.completed = i + 1
             
-            # Track best score (if result is a dict with objective_value)
-            if result and isinstance(result, dict):
-                obj_value = result.get('objective_value', float('-inf'))
-                if obj_value > self.best_score:
-                    self.best_score = obj_value
+            # Track best score (result dicts with objective_value, or chunks of them)
+            self._track_best(result)
             
             # Fire progress callback
             self._print_progress()
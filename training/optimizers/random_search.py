@@ -10,7 +10,7 @@ Best for:
 - Large parameter spaces
 - When you want quick results
 - Exploration before refined optimization
-- Parallel execution (unlike Bayesian which is sequential)
+- Fully parallel execution (Bayesian parallelizes only within a round)
 
 Research shows random search often outperforms grid search with
 fewer evaluations (Bergstra & Bengio, 2012).
@@ -25,7 +25,11 @@ from joblib import delayed
 
 from ..backtest_engine import BacktestEngine, BacktestResult
 from ..utils.cpu_config import get_cached_training_workers
+from ..shared_dataset import share_dataset, resolve_dataset
 from .progress_parallel import ProgressParallel
+from .batch_evaluation import evaluate_batch, chunk_configs, auto_batch_size, make_budget
+from ..telemetry import TimingCollector, collect
+from ..evaluation_cache import EvaluationScope, cache_report
 
 log = logging.getLogger(__name__)
 
@@ -79,7 +83,12 @@ class RandomSearchOptimizer:
         objective: str = 'sharpe_ratio',
         min_trades: int = 10,
         progress_callback: Optional[Callable[[int, int, float], None]] = None,
-        n_jobs: Optional[int] = None
+        n_jobs: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        early_abort: bool = False,
+        max_drawdown_pct: Optional[float] = None,
+        track_allocations: bool = False,
+        evaluation_cache: Optional[EvaluationScope] = None
     ) -> Dict[str, Any]:
         """
         Run random search optimization with optional parallel evaluation.
@@ -105,9 +114,22 @@ class RandomSearchOptimizer:
             objective: Metric to maximize
             min_trades: Minimum trades required for valid configuration
             n_jobs: Number of parallel jobs (-1 = all cores, None = auto-detect with safety margin)
+            batch_size: Configurations per BacktestEngine.run_batch() call
+                (None = auto, 1 = one backtest per task)
+            early_abort: Stop backtests early once a configuration cannot reach
+                min_trades or beat the running best (bounded objectives only)
+            max_drawdown_pct: Optional drawdown limit; configurations breaching
+                it are pruned
+            track_allocations: Also record peak traced allocations per phase
+                in the telemetry (slower; for profiling runs)
+            evaluation_cache: Optional EvaluationScope; configurations already
+                backtested by earlier jobs are served from it (see
+                training.evaluation_cache)
         
         Returns:
-            Dict with best_parameters, best_score, best_metrics, all_results, search_stats
+            Dict with best_parameters, best_score, best_metrics, all_results, search_stats,
+            telemetry (per-phase timing histograms, see training.telemetry),
+            evaluation_cache (hits / misses / hit_rate, None without a cache)
         """
         # Determine number of parallel jobs
         if n_jobs is None:
@@ -140,71 +162,73 @@ class RandomSearchOptimizer:
         
         log.info(f"Generated {len(all_params)} unique configurations")
         
+        # Chunk configurations so each task backtests several at once
+        if batch_size is None:
+            batch_size = auto_batch_size(len(all_params), n_jobs if use_parallel else 1)
+        batches = chunk_configs(all_params, batch_size)
+        log.info(f"Evaluating in {len(batches)} batches of up to {batch_size} configurations")
+        
         # Define evaluation function
-        def evaluate_config(params_tuple):
-            """Evaluate a single parameter configuration."""
-            i, params = params_tuple
-            try:
-                strategy = strategy_class(params)
-                
-                # Create nested callback for cumulative progress tracking
-                def nested_callback(intra_current, intra_total, stage):
-                    if progress_callback and intra_total > 0:
-                        # Calculate intra-episode progress (0.0 to 1.0)
-                        intra_fraction = intra_current / intra_total
-                        # Call with episode index and fraction
-                        progress_callback(i, intra_fraction, stage)
-                
-                backtest_result = backtest_engine.run_backtest(
-                    data=data,
-                    strategy_instance=strategy,
-                    progress_callback=nested_callback
+        def evaluate_chunk(batch, dataset, best_objective=None):
+            """Evaluate a chunk of parameter configurations (returns results, phase timings)."""
+            with collect(TimingCollector(track_allocations)) as timings:
+                chunk_results = evaluate_batch(
+                    backtest_engine=backtest_engine,
+                    data=resolve_dataset(dataset),
+                    strategy_class=strategy_class,
+                    batch=batch,
+                    objective=objective,
+                    min_trades=min_trades,
+                    progress_callback=progress_callback,
+                    budget=make_budget(early_abort, max_drawdown_pct, objective, min_trades, best_objective),
+                    cache=evaluation_cache
                 )
-                
-                # Mark episode as complete
-                if progress_callback:
-                    progress_callback(i, 1.0, 'completed')
-                
-                if backtest_result.metrics['total_trades'] >= min_trades:
-                    objective_value = backtest_result.metrics.get(objective, 0)
-                    
-                    return {
-                        'parameters': params.copy(),
-                        'metrics': backtest_result.metrics,
-                        'objective_value': objective_value
-                    }
-                return None
-                
-            except Exception as e:
-                log.debug(f"Backtest failed for params {params}: {e}")
-                return None
+            return chunk_results, timings
+        
+        # Phase timings aggregated across all chunks / workers
+        telemetry = TimingCollector(track_allocations)
         
         # Execute evaluations (parallel or sequential)
         if use_parallel:
             log.info(f"Running parallel evaluation with {n_jobs} workers...")
-            results = ProgressParallel(
-                n_jobs=n_jobs, 
-                backend='loky', 
-                verbose=1,  # Enable verbose to trigger print_progress callbacks
-                progress_callback=progress_callback,
-                total=len(all_params)
-            )(
-                delayed(evaluate_config)((i, params)) 
-                for i, params in enumerate(all_params)
-            )
-            # Filter out None results
-            results = [r for r in results if r is not None]
+            # Workers attach to one memory-mapped copy instead of unpickling data per task
+            shared = share_dataset(data)
+            dataset = shared.handle if shared is not None else data
+            try:
+                batch_results = ProgressParallel(
+                    n_jobs=n_jobs, 
+                    backend='loky', 
+                    verbose=1,  # Enable verbose to trigger print_progress callbacks
+                    progress_callback=progress_callback,
+                    total=len(batches)
+                )(
+                    delayed(evaluate_chunk)(batch, dataset) 
+                    for batch in batches
+                )
+            finally:
+                if shared is not None:
+                    shared.close()
+            # Flatten chunks, filter out None results and merge worker timings
+            results = [r for chunk, _ in batch_results for r in chunk if r is not None]
+            for _, timings in batch_results:
+                telemetry.merge(timings)
         else:
             log.info("Running sequential evaluation...")
-            iterator = tqdm(enumerate(all_params), desc="Random Search", total=len(all_params)) if self.verbose else enumerate(all_params)
+            iterator = tqdm(batches, desc="Random Search", total=len(batches)) if self.verbose else batches
             results = []
-            for i, params in iterator:
-                result = evaluate_config((i, params))
-                if result is not None:
-                    results.append(result)
-                    # Fire progress callback in sequential mode too
-                    if progress_callback:
-                        progress_callback(len(results), len(all_params), result['objective_value'])
+            best_objective = None
+            for batch in iterator:
+                # Later chunks are pruned against the running best
+                chunk_results, timings = evaluate_chunk(batch, data, best_objective)
+                telemetry.merge(timings)
+                for result in chunk_results:
+                    if result is not None:
+                        if best_objective is None or result['objective_value'] > best_objective:
+                            best_objective = result['objective_value']
+                        results.append(result)
+                        # Fire progress callback in sequential mode too
+                        if progress_callback:
+                            progress_callback(len(results), len(all_params), result['objective_value'])
         
         if not results:
             raise ValueError(
@@ -246,7 +270,9 @@ class RandomSearchOptimizer:
             'search_stats': search_stats,
             'optimizer': 'random_search',
             'total_evaluations': n_iterations,
-            'valid_evaluations': len(results)
+            'valid_evaluations': len(results),
+            'telemetry': telemetry.to_dict(),
+            'evaluation_cache': cache_report(telemetry)
         }
     
     def _validate_parameter_space(self, parameter_space: Dict[str, Any]):
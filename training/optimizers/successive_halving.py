@@ -0,0 +1,441 @@
+"""
+SuccessiveHalvingOptimizer - Multi-Fidelity Random Search
+
+Most randomly sampled configurations are clearly bad after a short slice
+of the data. Successive halving (the inner loop of Hyperband, Li et al.,
+2018) spends the backtest budget accordingly:
+
+1. Sample n configurations exactly like RandomSearchOptimizer (same seed,
+   same candidates)
+2. Backtest all of them on the most recent window (1/eta^k of the data,
+   down to about min_fraction of lookback_candles)
+3. Promote the top 1/eta to a window eta times longer and repeat
+4. Only the finalists are backtested on the full history, and the best
+   full-history configuration is returned
+
+With the defaults (eta=3, min_fraction=0.1) the rungs are 1/9, 1/3 and
+all of the data, and 100 configurations cost about 34 full-history
+backtests instead of 100.
+
+Windows are recent slices of the same data, so low-fidelity scores
+reflect the current regime. min_trades scales with the window length on
+the shorter rungs; configurations without a score there rank last but
+still fill promotion slots when fewer are valid than promoted.
+
+Each rung is evaluated like random search (chunked evaluate_batch,
+parallel over loky with one shared dataset). Only the full-history rung
+uses the evaluation cache, whose keys are bound to the full dataset.
+
+Best for:
+- Large parameter spaces where most configurations are poor
+- Long lookbacks (the shortest windows still hold enough trades)
+"""
+
+import math
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, List, Tuple, Callable, Optional
+import logging
+from tqdm import tqdm
+from joblib import delayed
+
+from ..backtest_engine import BacktestEngine
+from ..utils.cpu_config import get_cached_training_workers
+from ..shared_dataset import share_dataset, resolve_dataset
+from .progress_parallel import ProgressParallel
+from .random_search import RandomSearchOptimizer
+from .batch_evaluation import evaluate_batch, auto_batch_size, make_budget
+from ..telemetry import TimingCollector, collect
+from ..evaluation_cache import EvaluationScope, cache_report
+
+log = logging.getLogger(__name__)
+
+
+def rung_fractions(min_fraction: float, eta: int) -> List[float]:
+    """
+    Data fraction of each rung, shortest first (the last rung is 1.0).
+    
+    Args:
+        min_fraction: Smallest window as a fraction of the data (0 < f <= 1)
+        eta: Window growth (and promotion) factor between rungs (>= 2)
+    
+    Raises:
+        ValueError: If min_fraction or eta is out of range
+    """
+    if not 0 < min_fraction <= 1:
+        raise ValueError(f"min_fraction must be in (0, 1], got {min_fraction}")
+    if eta < 2:
+        raise ValueError(f"eta must be >= 2, got {eta}")
+    
+    n_rungs = int(math.floor(math.log(1 / min_fraction, eta) + 1e-9)) + 1
+    return [float(eta) ** -(n_rungs - 1 - k) for k in range(n_rungs)]
+
+
+def rung_sizes(n_configs: int, n_rungs: int, eta: int) -> List[int]:
+    """Configurations evaluated per rung (top ceil(n / eta) are promoted)."""
+    sizes = [n_configs]
+    for _ in range(n_rungs - 1):
+        sizes.append(max(1, math.ceil(sizes[-1] / eta)))
+    return sizes
+
+
+def plan_rungs(n_candles: int, min_fraction: float, eta: int, min_window_candles: int) -> List[float]:
+    """
+    Rung fractions used on n_candles of data, shortest first.
+    
+    Rungs whose windows are shorter than min_window_candles are skipped
+    (too short for the indicators); the full-history rung is always kept.
+    """
+    return [
+        fraction for fraction in rung_fractions(min_fraction, eta)
+        if fraction == 1.0 or fraction * n_candles >= min_window_candles
+    ]
+
+
+class SuccessiveHalvingOptimizer(RandomSearchOptimizer):
+    """
+    Random search that backtests on growing recent windows and keeps the top 1/eta.
+    
+    Example:
+        optimizer = SuccessiveHalvingOptimizer(seed=42)
+        
+        result = optimizer.optimize(
+            backtest_engine=engine,
+            data=df,
+            strategy_class=LiquiditySweepStrategy,
+            parameter_space=LiquiditySweepStrategy.get_parameter_space(),
+            n_iterations=200,
+            objective='sharpe_ratio'
+        )
+        
+        # 200 configurations on the last ~11% of candles, 67 on the
+        # last third, 23 on the full history
+        result['rungs']
+    """
+    
+    def __init__(self, seed: int = None, verbose: bool = True):
+        """
+        Initialize SuccessiveHalvingOptimizer.
+        
+        Args:
+            seed: Random seed for reproducibility (same samples as RandomSearchOptimizer)
+            verbose: Show progress bar during optimization
+        """
+        super().__init__(seed=seed, verbose=verbose)
+    
+    @staticmethod
+    def planned_evaluations(
+        n_iterations: int,
+        n_candles: int,
+        min_fraction: float = 0.1,
+        eta: int = 3,
+        min_window_candles: int = 500
+    ) -> int:
+        """
+        Backtests run for n_iterations samples across all rungs (progress total).
+        
+        Takes the same rung arguments as optimize() and skips the same short
+        rungs. Duplicate samples are dropped before the first rung, so the
+        actual count can be lower.
+        
+        Args:
+            n_iterations: Number of random samples entering the first rung
+            n_candles: Length of the data passed to optimize()
+        """
+        n_rungs = len(plan_rungs(n_candles, min_fraction, eta, min_window_candles))
+        return sum(rung_sizes(n_iterations, n_rungs, eta))
+    
+    def optimize(
+        self,
+        backtest_engine: BacktestEngine,
+        data: pd.DataFrame,
+        strategy_class: Any,
+        parameter_space: Dict[str, Any],
+        n_iterations: int = 100,
+        objective: str = 'sharpe_ratio',
+        min_trades: int = 10,
+        progress_callback: Optional[Callable[[int, int, float], None]] = None,
+        n_jobs: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        early_abort: bool = False,
+        max_drawdown_pct: Optional[float] = None,
+        track_allocations: bool = False,
+        evaluation_cache: Optional[EvaluationScope] = None,
+        min_fraction: float = 0.1,
+        eta: int = 3,
+        min_window_candles: int = 500
+    ) -> Dict[str, Any]:
+        """
+        Run successive halving over random samples of the parameter space.
+        
+        Args:
+            backtest_engine: BacktestEngine instance
+            data: OHLCV DataFrame with indicators (oldest first)
+            strategy_class: Strategy class to instantiate
+            parameter_space: Dict of parameter names to ranges/choices
+                (same formats as RandomSearchOptimizer)
+            n_iterations: Number of random samples entering the first rung
+            objective: Metric to maximize
+            min_trades: Minimum trades on the full history (scaled down
+                with the window on shorter rungs)
+            progress_callback: Episode progress callback (episodes are
+                numbered across rungs, see planned_evaluations())
+            n_jobs: Number of parallel jobs (-1 = all cores, None = auto-detect with safety margin)
+            batch_size: Configurations per BacktestEngine.run_batch() call
+                (None = auto per rung)
+            early_abort: Stop backtests early once a configuration cannot reach
+                min_trades; in sequential mode, on the full-history rung also
+                once it cannot beat the running best (shorter rungs need every
+                score for ranking; parallel workers have no running best)
+            max_drawdown_pct: Optional drawdown limit; configurations breaching
+                it are pruned
+            track_allocations: Also record peak traced allocations per phase
+                in the telemetry (slower; for profiling runs)
+            evaluation_cache: Optional EvaluationScope for the full dataset;
+                used on the full-history rung only
+            min_fraction: Shortest window as a fraction of the data
+            eta: Window growth factor; the top 1/eta of each rung is promoted
+            min_window_candles: Shortest window in candles (short lookbacks
+                get fewer, longer rungs)
+        
+        Returns:
+            Dict with best_parameters, best_score, best_metrics, all_results
+            (full-history rung), search_stats, rungs (per-rung window,
+            evaluated / valid / promoted counts and best score),
+            budget_fraction (candles backtested relative to random search
+            over the same samples), telemetry, evaluation_cache
+        """
+        # Determine number of parallel jobs
+        if n_jobs is None or n_jobs == -1:
+            n_jobs = get_cached_training_workers()
+        
+        use_parallel = n_jobs > 1
+        
+        # Validate parameter space and sample like random search
+        self._validate_parameter_space(parameter_space)
+        
+        all_params = []
+        tested_configs = set()
+        
+        for _ in range(n_iterations):
+            params = self._sample_parameters(parameter_space)
+            params_hash = self._hash_params(params)
+            
+            if params_hash not in tested_configs:
+                tested_configs.add(params_hash)
+                all_params.append(params)
+        
+        # Rungs whose windows are too short for the indicators are skipped
+        n_candles = len(data)
+        fractions = plan_rungs(n_candles, min_fraction, eta, min_window_candles)
+        sizes = rung_sizes(len(all_params), len(fractions), eta)
+        
+        log.info(
+            f"Starting Successive Halving: {len(all_params)} unique configurations, "
+            f"rungs {', '.join(f'{size}@{fraction:.0%}' for size, fraction in zip(sizes, fractions))} "
+            f"{'in parallel' if use_parallel else 'sequentially'} "
+            f"({n_jobs} worker{'s' if n_jobs > 1 else ''})"
+        )
+        
+        # Phase timings aggregated across all rungs, chunks and workers
+        telemetry = TimingCollector(track_allocations)
+        
+        candidates = all_params
+        rungs = []
+        episode_offset = 0
+        candles_backtested = 0
+        
+        for rung, (fraction, size) in enumerate(zip(fractions, sizes)):
+            full_history = fraction == 1.0
+            candidates = candidates[:size]
+            window = data if full_history else data.iloc[-int(round(fraction * n_candles)):]
+            rung_min_trades = min_trades if full_history else int(math.ceil(min_trades * fraction))
+            
+            results = self._evaluate_rung(
+                backtest_engine=backtest_engine,
+                data=window,
+                strategy_class=strategy_class,
+                configs=candidates,
+                episode_offset=episode_offset,
+                objective=objective,
+                min_trades=rung_min_trades,
+                progress_callback=progress_callback,
+                n_jobs=n_jobs,
+                batch_size=batch_size,
+                budget_args=(early_abort, max_drawdown_pct, full_history),
+                track_allocations=track_allocations,
+                evaluation_cache=evaluation_cache if full_history else None,
+                telemetry=telemetry,
+                desc=f"Halving rung {rung + 1}/{len(fractions)}"
+            )
+            episode_offset += len(candidates)
+            candles_backtested += len(candidates) * len(window)
+            
+            # Rank by objective; configurations without a score rank last
+            scores = np.array([
+                r['objective_value'] if r is not None else -np.inf for r in results
+            ])
+            order = np.argsort(-scores, kind='stable')
+            valid = [r for r in results if r is not None]
+            
+            rungs.append({
+                'rung': rung,
+                'fraction': fraction,
+                'candles': len(window),
+                'min_trades': rung_min_trades,
+                'evaluated': len(candidates),
+                'valid': len(valid),
+                'promoted': sizes[rung + 1] if not full_history else 0,
+                'best_score': float(scores.max()) if valid else None
+            })
+            log.info(
+                f"Rung {rung + 1}/{len(fractions)}: {len(valid)}/{len(candidates)} valid "
+                f"on {len(window)} candles"
+                + (f", best {objective} = {scores.max():.3f}" if valid else "")
+            )
+            
+            candidates = [candidates[i] for i in order]
+        
+        if not valid:
+            raise ValueError(
+                f"No valid configurations found (min_trades={min_trades}). "
+                f"Try lowering min_trades or expanding parameter space."
+            )
+        
+        # Best configuration on the full history
+        best_result = max(valid, key=lambda x: x['objective_value'])
+        
+        all_results_df = pd.DataFrame([
+            {
+                **r['parameters'],
+                **{f"metric_{k}": v for k, v in r['metrics'].items()},
+                'objective_value': r['objective_value']
+            }
+            for r in valid
+        ])
+        
+        search_stats = self._calculate_search_stats(
+            all_results_df,
+            objective,
+            n_iterations
+        )
+        
+        budget_fraction = candles_backtested / max(len(all_params) * n_candles, 1)
+        
+        log.info(
+            f"✅ Successive Halving complete: "
+            f"Best {objective} = {best_result['objective_value']:.3f} "
+            f"({len(valid)}/{len(candidates)} valid finalists, "
+            f"{budget_fraction:.0%} of the random search budget)"
+        )
+        
+        return {
+            'best_parameters': best_result['parameters'],
+            'best_score': best_result['objective_value'],
+            'best_metrics': best_result['metrics'],
+            'all_results': all_results_df,
+            'search_stats': search_stats,
+            'optimizer': 'successive_halving',
+            'total_evaluations': episode_offset,
+            'valid_evaluations': len(valid),
+            'rungs': rungs,
+            'budget_fraction': budget_fraction,
+            'telemetry': telemetry.to_dict(),
+            'evaluation_cache': cache_report(telemetry)
+        }
+    
+    def _evaluate_rung(
+        self,
+        backtest_engine: BacktestEngine,
+        data: pd.DataFrame,
+        strategy_class: Any,
+        configs: List[Dict[str, Any]],
+        episode_offset: int,
+        objective: str,
+        min_trades: int,
+        progress_callback: Optional[Callable],
+        n_jobs: int,
+        batch_size: Optional[int],
+        budget_args: Tuple[bool, Optional[float], bool],
+        track_allocations: bool,
+        evaluation_cache: Optional[EvaluationScope],
+        telemetry: TimingCollector,
+        desc: str
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Evaluate one rung's configurations on one window.
+        
+        budget_args is (early_abort, max_drawdown_pct, prune_against_best).
+        prune_against_best only applies in sequential mode, where chunks
+        run in order and a running best exists; parallel chunks are
+        budgeted on min_trades and drawdown alone, as in random search.
+        
+        Returns:
+            Results aligned with configs (None for invalid or pruned ones)
+        """
+        early_abort, max_drawdown_pct, prune_against_best = budget_args
+        use_parallel = n_jobs > 1
+        
+        # Episode indices continue across rungs so progress keys stay unique
+        indexed = [(episode_offset + k, params) for k, params in enumerate(configs)]
+        if batch_size is None:
+            rung_batch_size = auto_batch_size(len(configs), n_jobs if use_parallel else 1)
+        else:
+            rung_batch_size = batch_size
+        batches = [indexed[k:k + rung_batch_size] for k in range(0, len(indexed), rung_batch_size)]
+        
+        def evaluate_chunk(batch, dataset, best_objective=None):
+            """Evaluate a chunk of parameter configurations (returns results, phase timings)."""
+            with collect(TimingCollector(track_allocations)) as timings:
+                chunk_results = evaluate_batch(
+                    backtest_engine=backtest_engine,
+                    data=resolve_dataset(dataset),
+                    strategy_class=strategy_class,
+                    batch=batch,
+                    objective=objective,
+                    min_trades=min_trades,
+                    progress_callback=progress_callback,
+                    budget=make_budget(early_abort, max_drawdown_pct, objective, min_trades, best_objective),
+                    cache=evaluation_cache
+                )
+            return chunk_results, timings
+        
+        if use_parallel:
+            # Workers attach to one memory-mapped copy of the window
+            shared = share_dataset(data)
+            dataset = shared.handle if shared is not None else data
+            try:
+                batch_results = ProgressParallel(
+                    n_jobs=n_jobs,
+                    backend='loky',
+                    verbose=1,
+                    progress_callback=progress_callback,
+                    total=len(batches)
+                )(
+                    # No running best across workers, so no best_objective bound
+                    delayed(evaluate_chunk)(batch, dataset)
+                    for batch in batches
+                )
+            finally:
+                if shared is not None:
+                    shared.close()
+            for _, timings in batch_results:
+                telemetry.merge(timings)
+            return [r for chunk, _ in batch_results for r in chunk]
+        
+        iterator = tqdm(batches, desc=desc, total=len(batches)) if self.verbose else batches
+        results = []
+        best_objective = None
+        for batch in iterator:
+            # Only the full-history rung prunes against the running best
+            chunk_results, timings = evaluate_chunk(
+                batch, data, best_objective if prune_against_best else None
+            )
+            telemetry.merge(timings)
+            for result in chunk_results:
+                if result is not None and (
+                    best_objective is None or result['objective_value'] > best_objective
+                ):
+                    best_objective = result['objective_value']
+            results.extend(chunk_results)
+        return results
@@ -0,0 +1,528 @@
+"""
+TPEOptimizer - Tree-structured Parzen Estimator with Checkpoint Pruning
+
+Model-based search like BayesianOptimizer, but the surrogate is a pair of
+Parzen (kernel) densities per parameter instead of a Gaussian Process
+(Bergstra et al., 2011):
+
+- l(x): density of the best gamma fraction of completed trials
+- g(x): density of all other trials (failed / pruned ones included)
+- the next point maximizes l(x) / g(x) among candidates drawn from l(x)
+
+Each parameter is modelled on its own, so categorical choices
+(reversal_candles), integer ranges (key_level_lookback) and continuous
+ranges mix without a shared kernel, and proposing a point is cheap.
+Rounds of points_per_round proposals are backtested in parallel on the
+loky pool and told together.
+
+Trials are pruned mid-backtest: BacktestEngine reports the running
+metrics at 25/50/75% of the candles (BacktestBudget checkpoints) and a
+MedianPruner stops the simulation when the running objective is below the
+median of earlier completed trials at the same checkpoint. Pruned trials
+are told to the model as failures. Pruning saves trade simulation and
+metrics time; signals are still generated over the whole data first.
+
+Results depend on the seed and points_per_round only, not on n_jobs: the
+pruner thresholds, the early_abort bound and the model are updated between
+rounds (never within the per-worker chunks of a round).
+
+Best for:
+- Mixed categorical / integer / continuous parameter spaces
+- Many workers (proposals do not need a fitted GP)
+"""
+
+import math
+import pandas as pd
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Tuple, Callable, Optional
+import logging
+from joblib import Parallel, delayed
+from scipy.special import logsumexp, ndtr, ndtri
+
+from ..backtest_engine import BacktestEngine, PRUNE_CHECKPOINT, checkpoint_key
+from ..utils.cpu_config import get_cached_training_workers
+from ..shared_dataset import share_dataset, resolve_dataset
+from .batch_evaluation import evaluate_batch, make_budget
+from ..telemetry import TimingCollector, collect
+from ..evaluation_cache import EvaluationScope, cache_report
+
+log = logging.getLogger(__name__)
+
+
+# Candle fractions at which running results are reported
+CHECKPOINTS = (0.25, 0.5, 0.75)
+
+
+@dataclass(frozen=True)
+class MedianPruner:
+    """
+    BacktestBudget checkpoint callback: prune below the median of earlier trials.
+    
+    A snapshot of the thresholds at the start of a round, so it pickles to
+    workers and every trial of the round is judged against the same
+    medians whatever the worker timing.
+    """
+    objective: str
+    thresholds: Dict[float, float] = field(default_factory=dict)  # checkpoint -> median
+    
+    @classmethod
+    def from_trials(
+        cls,
+        metrics_list: List[Dict[str, float]],
+        objective: str,
+        checkpoints: Tuple[float, ...],
+        min_trials: int = 5
+    ) -> 'MedianPruner':
+        """
+        Pruner from the metrics of completed trials.
+        
+        Args:
+            metrics_list: Metrics of completed trials (with checkpoint keys)
+            objective: Objective being maximized
+            checkpoints: Candle fractions to prune at
+            min_trials: Completed trials a checkpoint needs before it prunes
+        """
+        thresholds = {}
+        for fraction in checkpoints:
+            key = checkpoint_key(objective, fraction)
+            values = [metrics[key] for metrics in metrics_list if key in metrics]
+            if len(values) >= min_trials:
+                thresholds[fraction] = float(np.median(values))
+        return cls(objective=objective, thresholds=thresholds)
+    
+    def __call__(self, fraction: float, metrics: Dict[str, float]) -> bool:
+        threshold = self.thresholds.get(fraction)
+        return threshold is not None and metrics.get(self.objective, 0) < threshold
+
+
+@dataclass(frozen=True)
+class _Dimension:
+    """One parameter of the search space."""
+    name: str
+    kind: str                        # 'float', 'int' or 'categorical'
+    low: float = 0.0
+    high: float = 0.0
+    choices: Tuple[Any, ...] = ()
+
+
+class _ParzenEstimator:
+    """Mixture of truncated Gaussians on [low, high], one per observation plus a wide prior."""
+    
+    def __init__(self, values: np.ndarray, low: float, high: float):
+        width = high - low
+        self.low, self.high = low, high
+        self.mus = np.append(np.asarray(values, dtype=np.float64), 0.5 * (low + high))
+        
+        # Bandwidth: distance to the farther neighbour (hyperopt's adaptive Parzen)
+        order = np.argsort(self.mus, kind='stable')
+        ordered = self.mus[order]
+        gaps = np.maximum(np.diff(ordered, prepend=low), np.diff(ordered, append=high))
+        sigmas = np.empty_like(gaps)
+        sigmas[order] = gaps
+        sigmas = np.clip(sigmas, width / min(100.0, 1.0 + len(self.mus)), width)
+        sigmas[-1] = width  # Prior component
+        self.sigmas = sigmas
+        
+        self.cdf_low = ndtr((low - self.mus) / self.sigmas)
+        self.cdf_high = ndtr((high - self.mus) / self.sigmas)
+        self.log_mass = np.log(np.maximum(self.cdf_high - self.cdf_low, 1e-12))
+    
+    def sample(self, rng: np.random.RandomState, n: int) -> np.ndarray:
+        """n draws (inverse CDF of the truncated components)."""
+        components = rng.randint(len(self.mus), size=n)
+        u = rng.uniform(self.cdf_low[components], self.cdf_high[components])
+        u = np.clip(u, 1e-12, 1 - 1e-12)
+        x = self.mus[components] + self.sigmas[components] * ndtri(u)
+        return np.clip(x, self.low, self.high)
+    
+    def log_pdf(self, x: np.ndarray) -> np.ndarray:
+        z = (x[:, None] - self.mus[None, :]) / self.sigmas[None, :]
+        log_components = (
+            -0.5 * z ** 2 - np.log(self.sigmas * math.sqrt(2 * math.pi)) - self.log_mass
+        )
+        return logsumexp(log_components, axis=1) - math.log(len(self.mus))
+
+
+class TPESampler:
+    """
+    Independent (per-parameter) TPE proposals from told trials.
+    
+    Example:
+        sampler = TPESampler(parameter_space, seed=42)
+        params = sampler.ask()
+        sampler.tell(params, objective_value)   # None for failed / pruned trials
+    """
+    
+    def __init__(
+        self,
+        parameter_space: Dict[str, Any],
+        seed: Optional[int] = None,
+        n_startup_trials: int = 10,
+        n_ei_candidates: int = 24,
+        gamma: float = 0.1
+    ):
+        """
+        Initialize TPESampler.
+        
+        Args:
+            parameter_space: Dict of parameter names to ranges/choices
+                ((min, max) tuple = int or float range, list = categorical)
+            seed: Random seed for reproducibility
+            n_startup_trials: Trials sampled at random before modelling
+            n_ei_candidates: Candidates drawn from l(x) per parameter
+            gamma: Fraction of trials forming l(x) (capped at 25 trials)
+        """
+        self.dimensions = _build_dimensions(parameter_space)
+        self.rng = np.random.RandomState(seed)
+        self.n_startup_trials = n_startup_trials
+        self.n_ei_candidates = n_ei_candidates
+        self.gamma = gamma
+        self.trials: List[Tuple[Dict[str, Any], Optional[float]]] = []
+    
+    def ask(self) -> Dict[str, Any]:
+        """Next parameters to evaluate."""
+        valid = [(params, value) for params, value in self.trials if value is not None]
+        if len(self.trials) < self.n_startup_trials or not valid:
+            return {d.name: self._sample_prior(d) for d in self.dimensions}
+        
+        # Best trials form l(x); the rest (failed / pruned included) form g(x)
+        n_below = min(max(int(math.ceil(self.gamma * len(self.trials))), 1), 25, len(valid))
+        ranked = sorted(range(len(valid)), key=lambda k: -valid[k][1])
+        below = [valid[k][0] for k in ranked[:n_below]]
+        above = [valid[k][0] for k in ranked[n_below:]]
+        above += [params for params, value in self.trials if value is None]
+        
+        return {d.name: self._sample_dimension(d, below, above) for d in self.dimensions}
+    
+    def tell(self, params: Dict[str, Any], value: Optional[float]):
+        """Record a finished trial (value None = failed, too few trades or pruned)."""
+        self.trials.append((params, value))
+    
+    def _sample_prior(self, dimension: _Dimension) -> Any:
+        if dimension.kind == 'categorical':
+            return dimension.choices[self.rng.randint(len(dimension.choices))]
+        if dimension.kind == 'int':
+            return int(self.rng.randint(dimension.low, dimension.high + 1))
+        return float(self.rng.uniform(dimension.low, dimension.high))
+    
+    def _sample_dimension(
+        self,
+        dimension: _Dimension,
+        below: List[Dict[str, Any]],
+        above: List[Dict[str, Any]]
+    ) -> Any:
+        """Candidate from l(x) with the highest l(x) / g(x)."""
+        if dimension.kind == 'categorical':
+            n_choices = len(dimension.choices)
+            p_below = self._choice_weights(dimension, below)
+            p_above = self._choice_weights(dimension, above)
+            candidates = self.rng.choice(n_choices, size=self.n_ei_candidates, p=p_below)
+            score = np.log(p_below[candidates]) - np.log(p_above[candidates])
+            return dimension.choices[int(candidates[np.argmax(score)])]
+        
+        # Integers are modelled on [low - 0.5, high + 0.5] and rounded
+        pad = 0.5 if dimension.kind == 'int' else 0.0
+        low, high = dimension.low - pad, dimension.high + pad
+        l_density = _ParzenEstimator([params[dimension.name] for params in below], low, high)
+        g_density = _ParzenEstimator([params[dimension.name] for params in above], low, high)
+        
+        candidates = l_density.sample(self.rng, self.n_ei_candidates)
+        if dimension.kind == 'int':
+            candidates = np.clip(np.round(candidates), dimension.low, dimension.high)
+        score = l_density.log_pdf(candidates) - g_density.log_pdf(candidates)
+        best = candidates[np.argmax(score)]
+        return int(best) if dimension.kind == 'int' else float(best)
+    
+    def _choice_weights(self, dimension: _Dimension, trials: List[Dict[str, Any]]) -> np.ndarray:
+        """Choice frequencies with one prior count per choice."""
+        counts = np.ones(len(dimension.choices))
+        for params in trials:
+            counts[_choice_index(dimension, params[dimension.name])] += 1
+        return counts / counts.sum()
+
+
+class TPEOptimizer:
+    """
+    Tree-structured Parzen Estimator search with median checkpoint pruning.
+    
+    Example:
+        optimizer = TPEOptimizer(seed=42)
+        
+        result = optimizer.optimize(
+            backtest_engine=engine,
+            data=df,
+            strategy_class=LiquiditySweepStrategy,
+            parameter_space=LiquiditySweepStrategy.get_parameter_space(),
+            n_iterations=200,
+            objective='sharpe_ratio'
+        )
+        
+        # Trials trailing the median at 25/50/75% of the candles stop early
+        result['pruned_evaluations']
+    """
+    
+    def __init__(self, seed: int = None, verbose: bool = True):
+        """
+        Initialize TPEOptimizer.
+        
+        Args:
+            seed: Random seed for reproducibility
+            verbose: Show progress during optimization
+        """
+        self.seed = seed
+        self.verbose = verbose
+        
+        log.info(f"TPEOptimizer initialized (seed={seed})")
+    
+    def optimize(
+        self,
+        backtest_engine: BacktestEngine,
+        data: pd.DataFrame,
+        strategy_class: Any,
+        parameter_space: Dict[str, Any],
+        n_iterations: int = 100,
+        n_startup_trials: int = 10,
+        objective: str = 'sharpe_ratio',
+        min_trades: int = 10,
+        progress_callback: Optional[Callable] = None,
+        n_jobs: Optional[int] = None,
+        points_per_round: int = 8,
+        checkpoints: Tuple[float, ...] = CHECKPOINTS,
+        prune_after: int = 5,
+        early_abort: bool = False,
+        max_drawdown_pct: Optional[float] = None,
+        track_allocations: bool = False,
+        evaluation_cache: Optional[EvaluationScope] = None
+    ) -> Dict[str, Any]:
+        """
+        Run TPE optimization with checkpoint pruning.
+        
+        Args:
+            backtest_engine: BacktestEngine instance
+            data: OHLCV DataFrame with indicators
+            strategy_class: Strategy class to instantiate
+            parameter_space: Dict of parameter names to ranges/choices
+                (same formats as BayesianOptimizer)
+            n_iterations: Total number of trials (including startup)
+            n_startup_trials: Random trials before TPE proposals
+            objective: Metric to maximize
+            min_trades: Minimum trades required for valid configuration
+            progress_callback: Episode progress callback(episode_index, fraction,
+                stage), driven by evaluate_batch (episodes are trial indices)
+            n_jobs: Parallel backtests per round (-1 / None = all training workers)
+            points_per_round: Trials proposed and backtested per round
+                (fixed, so results do not depend on n_jobs)
+            checkpoints: Candle fractions with running results (() disables pruning)
+            prune_after: Completed trials a checkpoint needs before it prunes
+            early_abort: Stop backtests early once a configuration cannot reach
+                min_trades or beat the running best
+            max_drawdown_pct: Optional drawdown limit; breaching configs are pruned
+            track_allocations: Also record peak traced allocations per phase
+                in the telemetry (slower; for profiling runs)
+            evaluation_cache: Optional EvaluationScope; configurations already
+                backtested by earlier jobs are served from it (see
+                training.evaluation_cache)
+        
+        Returns:
+            Dict with best_parameters, best_score, best_metrics, all_results,
+            search_stats, convergence_trace (objective per trial, None for
+            failed / pruned), pruned_evaluations, telemetry, evaluation_cache
+        """
+        n_workers = get_cached_training_workers() if n_jobs in (None, -1) else max(n_jobs, 1)
+        checkpoints = tuple(sorted(checkpoints))
+        
+        sampler = TPESampler(parameter_space, seed=self.seed, n_startup_trials=n_startup_trials)
+        
+        log.info(
+            f"Starting TPE Optimization: {n_iterations} trials "
+            f"({n_startup_trials} random), rounds of {points_per_round} on {n_workers} worker(s), "
+            f"pruning at {', '.join(f'{c:.0%}' for c in checkpoints) or 'no checkpoints'}"
+        )
+        
+        def evaluate_chunk(batch, dataset, best_objective, pruner):
+            """Backtest a chunk of (episode_index, params) pairs (returns results, phase timings)."""
+            with collect(TimingCollector(track_allocations)) as timings:
+                chunk_results = evaluate_batch(
+                    backtest_engine=backtest_engine,
+                    data=resolve_dataset(dataset),
+                    strategy_class=strategy_class,
+                    batch=batch,
+                    objective=objective,
+                    min_trades=min_trades,
+                    progress_callback=progress_callback,
+                    budget=make_budget(
+                        early_abort, max_drawdown_pct, objective, min_trades, best_objective,
+                        checkpoints=checkpoints, checkpoint_callback=pruner, running_best=False
+                    ),
+                    cache=evaluation_cache
+                )
+            return chunk_results, timings
+        
+        telemetry = TimingCollector(track_allocations)
+        all_evaluations = []
+        convergence_trace = []
+        best_objective = None
+        
+        # Workers attach to one memory-mapped copy instead of unpickling data per task
+        shared = share_dataset(data) if n_workers > 1 else None
+        dataset = shared.handle if shared is not None else data
+        
+        try:
+            with Parallel(n_jobs=n_workers, backend='loky') as parallel:
+                while len(sampler.trials) < n_iterations:
+                    n_points = min(points_per_round, n_iterations - len(sampler.trials))
+                    batch = [
+                        (len(sampler.trials) + k, sampler.ask())
+                        for k in range(n_points)
+                    ]
+                    
+                    # Medians of the trials completed before this round
+                    pruner = None
+                    if checkpoints:
+                        pruner = MedianPruner.from_trials(
+                            [e['metrics'] for e in all_evaluations], objective, checkpoints, prune_after
+                        )
+                    
+                    # One chunk per worker
+                    chunk_size = -(-len(batch) // n_workers)
+                    chunks = [batch[k:k + chunk_size] for k in range(0, len(batch), chunk_size)]
+                    if n_workers > 1:
+                        outputs = parallel(
+                            delayed(evaluate_chunk)(chunk, dataset, best_objective, pruner)
+                            for chunk in chunks
+                        )
+                    else:
+                        outputs = [evaluate_chunk(chunk, dataset, best_objective, pruner) for chunk in chunks]
+                    
+                    round_results = []
+                    for chunk_results, timings in outputs:
+                        telemetry.merge(timings)
+                        round_results.extend(chunk_results)
+                    
+                    for (i, params), evaluation in zip(batch, round_results):
+                        # Failed, too-few-trades and pruned trials are told as failures
+                        objective_value = evaluation['objective_value'] if evaluation is not None else None
+                        sampler.tell(params, objective_value)
+                        convergence_trace.append(objective_value)
+                        if evaluation is not None:
+                            all_evaluations.append({'iteration': i + 1, **evaluation})
+                            if best_objective is None or objective_value > best_objective:
+                                best_objective = objective_value
+                    
+                    if self.verbose:
+                        print(f"\rIteration {len(sampler.trials)}/{n_iterations}", end='')
+        finally:
+            if shared is not None:
+                shared.close()
+        
+        if self.verbose:
+            print()  # New line after progress
+        
+        if not all_evaluations:
+            raise ValueError(
+                f"No valid configurations found (min_trades={min_trades}). "
+                f"Try lowering min_trades or expanding parameter space."
+            )
+        
+        best_eval = max(all_evaluations, key=lambda x: x['objective_value'])
+        pruned = telemetry.counters.get(f'backtest.pruned.{PRUNE_CHECKPOINT}', 0)
+        
+        all_results_df = pd.DataFrame([
+            {
+                'iteration': e['iteration'],
+                **e['parameters'],
+                **{f"metric_{k}": v for k, v in e['metrics'].items()},
+                'objective_value': e['objective_value']
+            }
+            for e in all_evaluations
+        ])
+        
+        search_stats = self._calculate_search_stats(
+            all_results_df,
+            n_iterations,
+            n_startup_trials,
+            pruned
+        )
+        
+        log.info(
+            f"✅ TPE Optimization complete: "
+            f"Best {objective} = {best_eval['objective_value']:.3f} "
+            f"({len(all_evaluations)}/{n_iterations} valid configs, {pruned} pruned at checkpoints)"
+        )
+        
+        return {
+            'best_parameters': best_eval['parameters'],
+            'best_score': best_eval['objective_value'],
+            'best_metrics': best_eval['metrics'],
+            'all_results': all_results_df,
+            'search_stats': search_stats,
+            'convergence_trace': convergence_trace,
+            'optimizer': 'tpe',
+            'total_evaluations': n_iterations,
+            'valid_evaluations': len(all_evaluations),
+            'pruned_evaluations': pruned,
+            'points_per_round': points_per_round,
+            'checkpoints': list(checkpoints),
+            'telemetry': telemetry.to_dict(),
+            'evaluation_cache': cache_report(telemetry)
+        }
+    
+    def _calculate_search_stats(
+        self,
+        results_df: pd.DataFrame,
+        n_iterations: int,
+        n_startup_trials: int,
+        pruned: int
+    ) -> Dict[str, Any]:
+        """Calculate statistics about TPE search process."""
+        obj_col = 'objective_value'
+        startup_results = results_df[results_df['iteration'] <= n_startup_trials]
+        model_results = results_df[results_df['iteration'] > n_startup_trials]
+        
+        stats = {
+            'total_evaluations': n_iterations,
+            'valid_configurations': len(results_df),
+            'pruned_configurations': pruned,
+            'n_startup_trials': n_startup_trials,
+            'best_objective': results_df[obj_col].max(),
+            'worst_objective': results_df[obj_col].min(),
+            'mean_objective': results_df[obj_col].mean(),
+            'median_objective': results_df[obj_col].median(),
+            'std_objective': results_df[obj_col].std()
+        }
+        
+        if not startup_results.empty:
+            stats['exploration_best'] = startup_results[obj_col].max()
+        if not model_results.empty:
+            stats['exploitation_best'] = model_results[obj_col].max()
+            stats['exploitation_mean'] = model_results[obj_col].mean()
+        
+        return stats
+
+
+def _build_dimensions(parameter_space: Dict[str, Any]) -> List[_Dimension]:
+    """
+    Dimensions of a parameter space.
+    
+    Raises:
+        ValueError: If a parameter is not a (min, max) tuple or non-empty list
+    """
+    dimensions = []
+    for name, config in parameter_space.items():
+        if isinstance(config, list) and config:
+            dimensions.append(_Dimension(name, 'categorical', choices=tuple(config)))
+        elif isinstance(config, tuple) and len(config) == 2 and config[0] < config[1]:
+            low, high = config
+            kind = 'int' if isinstance(low, int) and isinstance(high, int) else 'float'
+            dimensions.append(_Dimension(name, kind, low=low, high=high))
+        else:
+            raise ValueError(f"Unsupported parameter config for '{name}': {config}")
+    return dimensions
+
+
+def _choice_index(dimension: _Dimension, value: Any) -> int:
+    for index, choice in enumerate(dimension.choices):
+        if choice == value:
+            return index
+    raise ValueError(f"{value!r} is not a choice of '{dimension.name}'")
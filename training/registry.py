@@ -0,0 +1,243 @@
+"""
+Registry - Lazy Lookup of Training Strategies and Optimizers
+
+Training jobs name their strategy ('LIQUIDITY_SWEEP') and optimizer
+('bayesian'). The registry maps those names to 'module:Class' targets
+and imports only the requested classes, so a worker job no longer loads
+every strategy, every optimizer (including scikit-optimize) up front.
+
+    strategy_class = load_strategy('LIQUIDITY_SWEEP')
+    space = strategy_parameter_space('LIQUIDITY_SWEEP')
+    optimizer = create_optimizer('random', seed=42)
+
+Strategies are found, in order, among:
+1. Built-in and register_strategy() registrations
+2. Installed entry points in the 'trad.training.strategies' group
+   (name = job strategy name, value = 'module:Class')
+3. A 'module.path:ClassName' given directly as the strategy name, only
+   for modules under a prefix listed in TRAINING_STRATEGY_MODULES
+   (comma-separated, e.g. 'training.strategies,research.strategies';
+   unset = module paths are rejected). Job strategy names come from API
+   callers, so workers must not import arbitrary modules for them.
+
+Per-strategy job settings (min_trades, description) live on the spec,
+so new strategies plug in without touching rq_jobs.py.
+"""
+
+from dataclasses import dataclass
+from importlib import import_module
+from importlib.metadata import entry_points
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+import os
+
+log = logging.getLogger(__name__)
+
+
+# Entry point group scanned for third-party strategies
+STRATEGY_ENTRY_POINT_GROUP = 'trad.training.strategies'
+
+# Attributes a loaded class must have
+STRATEGY_ATTRIBUTES = ('generate_signals', 'get_parameter_space')
+OPTIMIZER_ATTRIBUTES = ('optimize',)
+
+
+@dataclass(frozen=True)
+class StrategySpec:
+    """Registered strategy (importable without loading the module)."""
+    name: str                # Job strategy name (e.g. 'LIQUIDITY_SWEEP')
+    target: str              # 'module.path:ClassName'
+    description: str = ''
+    min_trades: int = 5      # Minimum trades for a configuration to count
+
+
+@dataclass(frozen=True)
+class OptimizerSpec:
+    """Registered optimizer and how rq_jobs drives it."""
+    name: str                             # Job optimizer name (e.g. 'bayesian')
+    target: str                           # 'module.path:ClassName'
+    seed_arg: Optional[str] = None        # Constructor argument taking the job seed
+    iterations_arg: Optional[str] = None  # optimize() argument taking n_iterations
+    min_trades: Optional[int] = None      # Overrides the strategy's min_trades
+
+
+_STRATEGIES: Dict[str, StrategySpec] = {}
+_OPTIMIZERS: Dict[str, OptimizerSpec] = {}
+
+# Imported classes (target -> class)
+_loaded: Dict[str, Any] = {}
+
+
+def register_strategy(name: str, target: str, **metadata: Any) -> StrategySpec:
+    """
+    Register a strategy under a job strategy name.
+
+    Args:
+        name: Job strategy name
+        target: 'module.path:ClassName' (imported on first use)
+        **metadata: StrategySpec fields (description, min_trades)
+
+    Returns:
+        Registered StrategySpec
+    """
+    spec = StrategySpec(name=name, target=target, **metadata)
+    _STRATEGIES[name] = spec
+    return spec
+
+
+def register_optimizer(name: str, target: str, **options: Any) -> OptimizerSpec:
+    """Register an optimizer under a job optimizer name (see OptimizerSpec)."""
+    spec = OptimizerSpec(name=name, target=target, **options)
+    _OPTIMIZERS[name] = spec
+    return spec
+
+
+def strategy_spec(name: str) -> StrategySpec:
+    """
+    Spec of a strategy name (registrations, entry points, then module path).
+
+    Raises:
+        ValueError: If the strategy cannot be found
+    """
+    spec = _STRATEGIES.get(name)
+    if spec is not None:
+        return spec
+
+    for entry_point in entry_points(group=STRATEGY_ENTRY_POINT_GROUP):
+        if entry_point.name == name:
+            return register_strategy(name, entry_point.value)
+
+    if ':' in name:
+        module_path = name.partition(':')[0]
+        if any(
+            module_path == prefix or module_path.startswith(prefix + '.')
+            for prefix in allowed_strategy_modules()
+        ):
+            return StrategySpec(name=name, target=name)
+        raise ValueError(
+            f"Strategy module '{module_path}' is not allowed "
+            f"(set TRAINING_STRATEGY_MODULES to enable module paths)"
+        )
+
+    raise ValueError(
+        f"Unknown strategy '{name}'. "
+        f"Available strategies: {', '.join(available_strategies())}"
+    )
+
+
+def optimizer_spec(name: str) -> OptimizerSpec:
+    """
+    Spec of an optimizer name.
+
+    Raises:
+        ValueError: If the optimizer is not registered
+    """
+    spec = _OPTIMIZERS.get(name)
+    if spec is None:
+        raise ValueError(f"Unknown optimizer: {name}")
+    return spec
+
+
+def available_strategies() -> List[str]:
+    """Registered and entry point strategy names (nothing is imported)."""
+    names = list(_STRATEGIES)
+    for entry_point in entry_points(group=STRATEGY_ENTRY_POINT_GROUP):
+        if entry_point.name not in names:
+            names.append(entry_point.name)
+    return names
+
+
+def available_optimizers() -> List[str]:
+    return list(_OPTIMIZERS)
+
+
+def allowed_strategy_modules() -> List[str]:
+    """Module prefixes accepted as 'module.path:ClassName' strategy names."""
+    value = os.getenv('TRAINING_STRATEGY_MODULES', '')
+    return [prefix.strip() for prefix in value.split(',') if prefix.strip()]
+
+
+def load_strategy(name: str) -> Any:
+    """Strategy class for a job strategy name (imports its module only)."""
+    return _load(strategy_spec(name).target, STRATEGY_ATTRIBUTES)
+
+
+def strategy_parameter_space(name: str) -> Dict[str, Any]:
+    """Optimizer search space of a strategy (classmethod, no instance created)."""
+    return load_strategy(name).get_parameter_space()
+
+
+def create_optimizer(name: str, seed: Optional[int] = None) -> Any:
+    """
+    Optimizer instance for a job optimizer name (imports its module only).
+
+    Args:
+        name: Job optimizer name
+        seed: Job seed, passed to optimizers that take one
+    """
+    spec = optimizer_spec(name)
+    optimizer_class = _load(spec.target, OPTIMIZER_ATTRIBUTES)
+    if spec.seed_arg is not None:
+        return optimizer_class(**{spec.seed_arg: seed})
+    return optimizer_class()
+
+
+def _load(target: str, attributes: Tuple[str, ...] = ()) -> Any:
+    """Import 'module.path:ClassName' once (a class with the given attributes)."""
+    loaded = _loaded.get(target)
+    if loaded is not None:
+        return loaded
+
+    module_path, _, attribute = target.partition(':')
+    if not module_path or not attribute:
+        raise ValueError(f"Invalid target '{target}' (expected 'module.path:ClassName')")
+    try:
+        loaded = getattr(import_module(module_path), attribute)
+    except (ImportError, AttributeError) as e:
+        raise ValueError(f"Cannot load '{target}': {e}") from e
+    if not isinstance(loaded, type) or not all(hasattr(loaded, a) for a in attributes):
+        raise ValueError(
+            f"'{target}' is not a class with {', '.join(attributes) or 'the expected interface'}"
+        )
+
+    log.debug(f"Loaded {target}")
+    _loaded[target] = loaded
+    return loaded
+
+
+# Built-in strategies
+register_strategy(
+    'LIQUIDITY_SWEEP', 'training.strategies.liquidity_sweep:LiquiditySweepStrategy',
+    description='Key level pierce detection with volume confirmation'
+)
+register_strategy(
+    'CAPITULATION_REVERSAL', 'training.strategies.capitulation_reversal:CapitulationReversalStrategy',
+    description='Panic selling/buying reversal detection'
+)
+register_strategy(
+    'FAILED_BREAKDOWN', 'training.strategies.failed_breakdown:FailedBreakdownStrategy',
+    description='Wyckoff spring detection (failed breakdowns)',
+    min_trades=3  # Wyckoff springs are very rare patterns (10-30 trades/year)
+)
+
+# Built-in optimizers
+register_optimizer(
+    'bayesian', 'training.optimizers.bayesian:BayesianOptimizer',
+    seed_arg='random_state', iterations_arg='n_calls'
+)
+register_optimizer(
+    'random', 'training.optimizers.random_search:RandomSearchOptimizer',
+    seed_arg='seed', iterations_arg='n_iterations'
+)
+register_optimizer(
+    'grid', 'training.optimizers.grid_search:GridSearchOptimizer',
+    min_trades=10  # Deterministic: no seed, the grid defines the iterations
+)
+register_optimizer(
+    'halving', 'training.optimizers.successive_halving:SuccessiveHalvingOptimizer',
+    seed_arg='seed', iterations_arg='n_iterations'
+)
+register_optimizer(
+    'tpe', 'training.optimizers.tpe:TPEOptimizer',
+    seed_arg='seed', iterations_arg='n_iterations'
+)
@@ -0,0 +1,322 @@
+"""
+Resampler - Higher-Timeframe OHLCV Bars from One 1m Series
+
+Strategies that read several timeframes (1h + 5m, 4h / 1h / 15m) used to
+pull every timeframe separately from market_data or the exchange. The
+resampler builds all of them from a single 1m series instead:
+
+    bars_1h = resample_ohlcv(candles_1m, '1h')
+
+Bar semantics match exchange candles:
+- timestamp is the bar's open time (Unix ms, UTC-aligned; weekly bars
+  open on Monday 00:00 UTC)
+- open = first 1m open, close = last 1m close, high/low = extremes,
+  volume (and quote_volume / trade_count when present) = sum
+- a bar is complete once its last 1m candle has closed, or once a later
+  1m candle exists (gaps in the 1m feed still close the bar); the
+  trailing incomplete bar is dropped unless include_partial=True
+
+MultiTimeframeResampler keeps the same bars up to date as closed 1m
+candles arrive (O(timeframes) per candle), starting from a vectorized
+pass over the history:
+
+    resampler = MultiTimeframeResampler.from_history(candles_1m, ['15m', '1h', '4h'])
+    closed = resampler.update(candle)        # timeframes whose bar just closed
+    bars_1h = resampler.bars('1h')
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+import logging
+
+import numpy as np
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+
+BASE_TIMEFRAME = '1m'
+
+MINUTE_MS = 60_000
+
+# Weekly bars open on Monday 00:00 UTC (the Unix epoch is a Thursday)
+WEEK_OFFSET_MS = 4 * 1440 * MINUTE_MS
+
+# Timeframe unit -> minutes
+_UNIT_MINUTES = {'m': 1, 'h': 60, 'd': 1440, 'w': 10080}
+
+PRICE_COLUMNS = ('open', 'high', 'low', 'close')
+
+# Optional columns summed into each bar when present in the 1m data
+SUM_COLUMNS = ('volume', 'quote_volume', 'trade_count')
+
+
+def timeframe_ms(timeframe: str) -> int:
+    """
+    Length of a timeframe in milliseconds.
+
+    Args:
+        timeframe: Candle interval ('1m', '5m', '1h', '4h', '1d', '1w', ...)
+
+    Raises:
+        ValueError: If the timeframe is not <count><m|h|d|w>
+    """
+    try:
+        count, minutes = int(timeframe[:-1]), _UNIT_MINUTES[timeframe[-1]]
+    except (ValueError, KeyError, IndexError, TypeError):
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+    if count <= 0:
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+    return count * minutes * MINUTE_MS
+
+
+def bar_open_time(timestamps: Any, timeframe: str) -> np.ndarray:
+    """Open time of the timeframe bar containing each timestamp (Unix ms)."""
+    period = timeframe_ms(timeframe)
+    offset = WEEK_OFFSET_MS if timeframe.endswith('w') else 0
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    return (timestamps - offset) // period * period + offset
+
+
+def resample_ohlcv(
+    data: pd.DataFrame,
+    timeframe: str,
+    include_partial: bool = False,
+    base_timeframe: str = BASE_TIMEFRAME
+) -> pd.DataFrame:
+    """
+    Aggregate base candles into timeframe bars in one vectorized pass.
+
+    Args:
+        data: Base candles sorted by timestamp (timestamp = open time, Unix ms)
+              with columns timestamp, open, high, low, close, volume
+        timeframe: Target interval (a multiple of base_timeframe)
+        include_partial: Keep the trailing bar whose last base candle has
+                         not closed yet (df.attrs['partial'] tells whether
+                         the last row is such a bar)
+        base_timeframe: Interval of the input candles
+
+    Returns:
+        DataFrame with columns timestamp, open, high, low, close, volume
+        (+ quote_volume / trade_count when present in data)
+
+    Raises:
+        ValueError: If timeframe is not a multiple of base_timeframe, or
+                    timestamps are unsorted / duplicated
+    """
+    period, base_period = _check_timeframe(timeframe, base_timeframe)
+    sums = [column for column in SUM_COLUMNS if column in data.columns]
+
+    timestamps = data['timestamp'].to_numpy(dtype=np.int64)
+    if len(timestamps) == 0:
+        return pd.DataFrame(columns=['timestamp', *PRICE_COLUMNS, *sums])
+    if np.any(np.diff(timestamps) <= 0):
+        raise ValueError("Base candles must be sorted by timestamp without duplicates")
+
+    opens = bar_open_time(timestamps, timeframe)
+    starts = np.flatnonzero(np.r_[True, opens[1:] != opens[:-1]])
+    ends = np.r_[starts[1:], len(timestamps)] - 1
+
+    bars = {
+        'timestamp': opens[starts],
+        'open': data['open'].to_numpy(dtype=np.float64)[starts],
+        'high': np.maximum.reduceat(data['high'].to_numpy(dtype=np.float64), starts),
+        'low': np.minimum.reduceat(data['low'].to_numpy(dtype=np.float64), starts),
+        'close': data['close'].to_numpy(dtype=np.float64)[ends]
+    }
+    for column in sums:
+        bars[column] = np.add.reduceat(data[column].to_numpy(dtype=np.float64), starts)
+
+    frame = pd.DataFrame(bars)
+
+    # Trailing bar still waiting for its last base candle
+    partial = timestamps[-1] + base_period < opens[-1] + period
+    if partial and not include_partial:
+        frame = frame.iloc[:-1].reset_index(drop=True)
+    frame.attrs['partial'] = bool(partial and include_partial)
+    return frame
+
+
+def latest_closed_bar(
+    bar_timestamps: Any,
+    timestamps: Any,
+    timeframe: str,
+    base_timeframe: str = BASE_TIMEFRAME
+) -> np.ndarray:
+    """
+    Index of the latest timeframe bar closed at each base candle's close.
+
+    Aligns higher-timeframe bars to base candles without lookahead: a base
+    candle only sees bars that closed no later than the candle itself.
+
+    Args:
+        bar_timestamps: Open times of the timeframe bars (sorted)
+        timestamps: Open times of the base candles
+        timeframe: Interval of the bars
+        base_timeframe: Interval of the base candles
+
+    Returns:
+        int64 bar index per base candle (-1 before the first closed bar)
+    """
+    period, base_period = _check_timeframe(timeframe, base_timeframe)
+    bar_close = np.asarray(bar_timestamps, dtype=np.int64) + period
+    candle_close = np.asarray(timestamps, dtype=np.int64) + base_period
+    return np.searchsorted(bar_close, candle_close, side='right') - 1
+
+
+def _check_timeframe(timeframe: str, base_timeframe: str):
+    """(period, base period) in ms; raises ValueError unless a multiple of the base."""
+    period, base_period = timeframe_ms(timeframe), timeframe_ms(base_timeframe)
+    if period % base_period != 0:
+        raise ValueError(f"Timeframe {timeframe} is not a multiple of {base_timeframe}")
+    return period, base_period
+
+
+class MultiTimeframeResampler:
+    """
+    Incrementally maintained bars of several timeframes from closed base candles.
+
+    Closed bars are appended as soon as their last base candle arrives
+    (or a later candle shows the bar is over); the bar in progress is kept
+    separately and only returned with include_partial=True.
+
+    Example:
+        resampler = MultiTimeframeResampler.from_history(candles_1m, ['1h', '4h'])
+        for candle in feed:
+            if '1h' in resampler.update(candle):
+                df_1h = resampler.bars('1h')
+    """
+
+    def __init__(
+        self,
+        timeframes: Iterable[str],
+        base_timeframe: str = BASE_TIMEFRAME,
+        max_bars: Optional[int] = None
+    ):
+        """
+        Initialize MultiTimeframeResampler.
+
+        Args:
+            timeframes: Target intervals (multiples of base_timeframe)
+            base_timeframe: Interval of the candles passed to update()
+            max_bars: Closed bars kept per timeframe (None = unbounded)
+        """
+        self.timeframes = list(timeframes)
+        self.base_timeframe = base_timeframe
+        self.max_bars = max_bars
+        self.last_timestamp: Optional[int] = None
+
+        self._periods = {tf: _check_timeframe(tf, base_timeframe)[0] for tf in self.timeframes}
+        self._base_period = timeframe_ms(base_timeframe)
+        self._sums = ['volume']
+        self._closed: Dict[str, Dict[str, deque]] = {}
+        self._partial: Dict[str, Optional[Dict[str, float]]] = {tf: None for tf in self.timeframes}
+        self._reset_closed()
+
+    @classmethod
+    def from_history(
+        cls,
+        data: pd.DataFrame,
+        timeframes: Iterable[str],
+        base_timeframe: str = BASE_TIMEFRAME,
+        max_bars: Optional[int] = None
+    ) -> 'MultiTimeframeResampler':
+        """Resampler seeded with base candle history (one vectorized pass per timeframe)."""
+        resampler = cls(timeframes, base_timeframe, max_bars)
+        resampler._sums = [column for column in SUM_COLUMNS if column in data.columns] or ['volume']
+        resampler._reset_closed()
+        if len(data) == 0:
+            return resampler
+
+        for tf in resampler.timeframes:
+            bars = resample_ohlcv(data, tf, include_partial=True, base_timeframe=base_timeframe)
+            closed = bars.iloc[:-1] if bars.attrs['partial'] else bars
+            for column, values in resampler._closed[tf].items():
+                values.extend(closed[column].tolist())
+            if bars.attrs['partial']:
+                bar = bars.iloc[-1].to_dict()
+                bar['timestamp'] = int(bar['timestamp'])
+                resampler._partial[tf] = bar
+
+        resampler.last_timestamp = int(data['timestamp'].iloc[-1])
+        return resampler
+
+    def update(self, candle: Mapping[str, Any]) -> List[str]:
+        """
+        Add one closed base candle.
+
+        Candles at or before the last seen timestamp (re-sent or out of
+        order) are ignored.
+
+        Args:
+            candle: Mapping with timestamp (open time, Unix ms), open, high,
+                    low, close, volume
+
+        Returns:
+            Timeframes with at least one newly closed bar
+        """
+        timestamp = int(candle['timestamp'])
+        if self.last_timestamp is not None and timestamp <= self.last_timestamp:
+            log.debug(f"Ignoring base candle {timestamp} (last: {self.last_timestamp})")
+            return []
+        self.last_timestamp = timestamp
+
+        closed = []
+        for tf in self.timeframes:
+            period = self._periods[tf]
+            bar_open = int(bar_open_time(timestamp, tf))
+            bar = self._partial[tf]
+
+            # Gap in the feed: the previous bar ended without its last candle
+            if bar is not None and bar['timestamp'] != bar_open:
+                self._close(tf, bar)
+                closed.append(tf)
+                bar = None
+
+            if bar is None:
+                bar = {'timestamp': bar_open}
+                bar.update({column: float(candle[column]) for column in PRICE_COLUMNS})
+                bar.update({column: float(candle.get(column) or 0.0) for column in self._sums})
+            else:
+                bar['high'] = max(bar['high'], float(candle['high']))
+                bar['low'] = min(bar['low'], float(candle['low']))
+                bar['close'] = float(candle['close'])
+                for column in self._sums:
+                    bar[column] += float(candle.get(column) or 0.0)
+
+            if timestamp + self._base_period >= bar_open + period:
+                self._close(tf, bar)
+                self._partial[tf] = None
+                if tf not in closed:
+                    closed.append(tf)
+            else:
+                self._partial[tf] = bar
+
+        return closed
+
+    def bars(self, timeframe: str, include_partial: bool = False) -> pd.DataFrame:
+        """
+        Bars of a timeframe (same columns as resample_ohlcv).
+
+        Args:
+            timeframe: One of the resampler's timeframes
+            include_partial: Append the bar in progress (df.attrs['partial'])
+        """
+        frame = pd.DataFrame({column: list(values) for column, values in self._closed[timeframe].items()})
+        partial = include_partial and self._partial[timeframe] is not None
+        if partial:
+            frame = pd.concat([frame, pd.DataFrame([self._partial[timeframe]])], ignore_index=True)
+        frame['timestamp'] = frame['timestamp'].astype(np.int64)
+        frame.attrs['partial'] = partial
+        return frame
+
+    def _close(self, timeframe: str, bar: Dict[str, float]):
+        for column, values in self._closed[timeframe].items():
+            values.append(bar[column])
+
+    def _reset_closed(self):
+        columns = ['timestamp', *PRICE_COLUMNS, *self._sums]
+        self._closed = {
+            tf: {column: deque(maxlen=self.max_bars) for column in columns}
+            for tf in self.timeframes
+        }
@@ -7,6 +7,7 @@ These are standalone functions that can be serialized and executed by RQ.
 
 import logging
 import asyncio
+import json
 import os
 from typing import Dict, Any
 from datetime import datetime, timezone
@@ -174,31 +175,17 @@ async def _run_training_job_async(
     """
     from training.progress_tracker import ProgressTracker
     from training.data_collector import DataCollector
-    from training.optimizers.random_search import RandomSearchOptimizer
-    from training.optimizers.bayesian import BayesianOptimizer
-    from training.optimizers.grid_search import GridSearchOptimizer
-    from training.strategies.liquidity_sweep import LiquiditySweepStrategy
-    from training.strategies.capitulation_reversal import CapitulationReversalStrategy
-    from training.strategies.failed_breakdown import FailedBreakdownStrategy
     from training.configuration_writer import ConfigurationWriter
     from training.backtest_engine import BacktestEngine
+    from training.evaluation_cache import get_evaluation_cache
+    from training import registry
     
     log.info(f"Starting training job {job_id}: {strategy} {symbol} on {exchange} ({timeframe})")
     
-    # Map strategy names to classes
-    STRATEGY_MAP = {
-        'LIQUIDITY_SWEEP': LiquiditySweepStrategy,
-        'CAPITULATION_REVERSAL': CapitulationReversalStrategy,
-        'FAILED_BREAKDOWN': FailedBreakdownStrategy,
-    }
-    
-    # Get strategy class from name
-    strategy_class = STRATEGY_MAP.get(strategy)
-    if strategy_class is None:
-        raise ValueError(
-            f"Unknown strategy '{strategy}'. "
-            f"Available strategies: {', '.join(STRATEGY_MAP.keys())}"
-        )
+    # Resolve names before touching the database (imports only the requested classes)
+    strategy_spec = registry.strategy_spec(strategy)
+    optimizer_spec = registry.optimizer_spec(optimizer)
+    strategy_class = registry.load_strategy(strategy)
     
     log.info(f"Using strategy class: {strategy_class.__name__}")
     
@@ -255,20 +242,12 @@ async def _run_training_job_async(
         
         # Get parameter space
         log.info(f"🔧 Getting parameter space from strategy: {strategy_class.__name__}...")
-        temp_strategy = strategy_class({})  # Temp instance to get parameter space
-        parameter_space = temp_strategy.get_parameter_space()
+        parameter_space = strategy_class.get_parameter_space()
         log.info(f"✅ Parameter space obtained: {len(parameter_space)} parameters")
         
-        # Select optimizer with seed for reproducibility
+        # Select optimizer with seed for reproducibility (grid search is deterministic)
         log.info(f"🔧 Initializing {optimizer} optimizer with seed={seed}...")
-        if optimizer == 'bayesian':
-            opt = BayesianOptimizer(random_state=seed)  # ✅ WITH SEED
-        elif optimizer == 'random':
-            opt = RandomSearchOptimizer(seed=seed)  # ✅ WITH SEED
-        elif optimizer == 'grid':
-            opt = GridSearchOptimizer()  # No seed needed - deterministic by nature
-        else:
-            raise ValueError(f"Unknown optimizer: {optimizer}")
+        opt = registry.create_optimizer(optimizer, seed=seed)
         log.info(f"✅ Optimizer initialized: {opt.__class__.__name__} (seed={seed} for reproducibility)")
         
         # Shared state for progress tracking (no interpolation thread - relying on real callbacks)
@@ -278,76 +257,55 @@ async def _run_training_job_async(
         # Initialize Redis progress tracking
         r = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
         r.set(f"training_job:{job_id}:completed_count", 0)
-        r.set(f"training_job:{job_id}:total", n_iterations)
+        # Multi-fidelity optimizers backtest some configurations more than once
+        total_episodes = n_iterations
+        if hasattr(opt, 'planned_evaluations'):
+            total_episodes = opt.planned_evaluations(n_iterations, len(data))
+        r.set(f"training_job:{job_id}:total", total_episodes)
         
         # Create picklable progress callback with cumulative tracking
-        optimization_progress_callback = ProgressCallback(job_id, n_iterations)
+        optimization_progress_callback = ProgressCallback(job_id, total_episodes)
         log.info(f"✅ Progress callback created for job {job_id}")
         
-        # Determine min_trades threshold based on strategy
-        # FAILED_BREAKDOWN is extremely rare (10-30 trades/year), so we lower the threshold
-        if strategy == 'FAILED_BREAKDOWN':
-            min_trades_threshold = 3  # Wyckoff springs are very rare patterns
-        else:
-            min_trades_threshold = 5  # Standard threshold for other strategies
+        # min_trades threshold from the strategy (rare patterns use a lower one),
+        # unless the optimizer fixes its own
+        min_trades_threshold = optimizer_spec.min_trades or strategy_spec.min_trades
         
         log.info(f"Using min_trades={min_trades_threshold} for {strategy} strategy")
         
+        # Configurations earlier jobs already backtested on the same data are not rerun
+        evaluation_cache = get_evaluation_cache()
+        cache_scope = None
+        if evaluation_cache is not None:
+            cache_scope = evaluation_cache.scope(strategy_class, data, backtest_engine, data_filter_config)
+        
         # Run optimization with all required parameters
         # Run in executor to avoid blocking the event loop
         log.info(f"🚀 Starting {optimizer} optimization with {n_iterations} iterations...")
         import concurrent.futures
         loop = asyncio.get_event_loop()
         
+        optimize_kwargs = dict(
+            backtest_engine=backtest_engine,
+            data=data,
+            strategy_class=strategy_class,
+            parameter_space=parameter_space,
+            objective='sharpe_ratio',
+            min_trades=min_trades_threshold,
+            progress_callback=optimization_progress_callback,
+            early_abort=True,  # Skip the rest of hopeless backtests
+            n_jobs=-1,  # Use all CPU cores
+            evaluation_cache=cache_scope
+        )
+        if optimizer_spec.iterations_arg is not None:
+            optimize_kwargs[optimizer_spec.iterations_arg] = n_iterations
+        
         with concurrent.futures.ThreadPoolExecutor() as executor:
             log.info("✅ ThreadPoolExecutor created, submitting optimization task...")
-            if optimizer == 'bayesian':
-                # BayesianOptimizer with n_jobs for parallel initial points
-                result = await loop.run_in_executor(
-                    executor,
-                    lambda: opt.optimize(
-                        backtest_engine=backtest_engine,
-                        data=data,
-                        strategy_class=strategy_class,
-                        parameter_space=parameter_space,
-                        n_calls=n_iterations,
-                        objective='sharpe_ratio',
-                        min_trades=min_trades_threshold,
-                        progress_callback=optimization_progress_callback,
-                        n_jobs=-1  # Use all CPU cores
-                    )
-                )
-            elif optimizer == 'random':
-                # RandomSearchOptimizer with parallel execution enabled
-                result = await loop.run_in_executor(
-                    executor,
-                    lambda: opt.optimize(
-                        backtest_engine=backtest_engine,
-                        data=data,
-                        strategy_class=strategy_class,
-                        parameter_space=parameter_space,
-                        n_iterations=n_iterations,
-                        objective='sharpe_ratio',
-                        min_trades=min_trades_threshold,
-                        progress_callback=optimization_progress_callback,
-                        n_jobs=-1  # Use all CPU cores for parallel execution
-                    )
-                )
-            else:
-                # GridSearchOptimizer with parallel execution
-                result = await loop.run_in_executor(
-                    executor,
-                    lambda: opt.optimize(
-                        backtest_engine=backtest_engine,
-                        data=data,
-                        strategy_class=strategy_class,
-                        parameter_space=parameter_space,
-                        objective='sharpe_ratio',
-                        min_trades=10,
-                        progress_callback=optimization_progress_callback,
-                        n_jobs=-1  # Use all CPU cores
-                    )
-                )
+            result = await loop.run_in_executor(
+                executor,
+                lambda: opt.optimize(**optimize_kwargs)
+            )
         
         best_params = result['best_parameters']
         best_score = result['best_score']
@@ -391,6 +349,18 @@ async def _run_training_job_async(
             config_id,
             job_id
         )
+        
+        # Attach the optimizer's per-phase timing histograms (see training.telemetry)
+        telemetry = result.get('telemetry')
+        if telemetry:
+            try:
+                await conn.execute(
+                    "UPDATE training_jobs SET telemetry = $1::jsonb WHERE job_id = $2",
+                    json.dumps(telemetry),
+                    job_id
+                )
+            except Exception as e:
+                log.warning(f"Could not store telemetry for job {job_id}: {e}")
         await conn.close()
         log.info(f"Linked training job {job_id} to configuration {config_id}")
         
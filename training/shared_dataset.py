@@ -0,0 +1,251 @@
+"""
+Shared Dataset - One Memory-Mapped Copy of the Training Data for All Workers
+
+Parallel optimizers used to hand loky closures that captured the full
+OHLCV DataFrame, so the dataset was pickled, sent and unpickled for every
+task batch, and every worker held its own copy. The optimizers now publish
+the data once as memory-mapped column files and send a small handle:
+
+    with SharedDataset(data) as shared:
+        Parallel(n_jobs=8)(delayed(task)(shared.handle, batch) for batch in batches)
+
+    def task(dataset, batch):
+        data = resolve_dataset(dataset)   # read-only views, no copy
+
+Columns are .npy files in a shared directory (tmpfs /dev/shm when
+available, like the feature cache) and workers np.load() them with
+mmap_mode='r', so the pages are the same physical memory in every process
+and a 1M-candle dataset is resident once however many workers run.
+Workers keep the attached frames of the most recent datasets per process,
+so later batches of the same job attach for free.
+
+Frames are read-only: in-place writes raise, copies (df.copy(), adding
+columns to a copy) behave as usual. Object columns cannot be mapped and
+travel inline with the handle.
+
+Configuration (inherited by worker processes):
+    SHARED_DATASET_DIR      Base directory (default: /dev/shm/trad-shared-datasets)
+"""
+
+import os
+import shutil
+import tempfile
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple, Union
+import logging
+
+import numpy as np
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+
+# Attached frames kept per process (evicted frames unmap once unreferenced)
+MAX_ATTACHED = 2
+
+# File holding a non-RangeIndex
+INDEX_FILE = '__index__'
+
+
+def default_dataset_dir() -> str:
+    """Shared-memory directory when available, else the temp directory."""
+    base = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+    return os.path.join(base, 'trad-shared-datasets')
+
+
+@dataclass(frozen=True)
+class SharedDatasetHandle:
+    """Picklable reference to a SharedDataset (a few hundred bytes, whatever the row count)."""
+    name: str                    # Unique dataset name (also the directory name)
+    directory: str               # Directory holding one .npy file per column
+    n_rows: int
+    columns: Tuple[Any, ...]     # Column order of the source DataFrame
+    mapped: Tuple[bool, ...]     # Per column: memory-mapped (True) or inline (False)
+    range_index: Optional[Tuple[int, int, int]] = None  # (start, stop, step); None = INDEX_FILE
+    index_name: Any = None
+    inline: Dict[Any, np.ndarray] = field(default_factory=dict)  # Object columns
+    attrs: Dict[str, Any] = field(default_factory=dict)
+
+    def frame(self) -> pd.DataFrame:
+        """Read-only DataFrame over the shared columns (attached once per process)."""
+        return attach_dataset(self)
+
+
+class SharedDataset:
+    """
+    Owner side of a dataset shared with worker processes.
+
+    Writes each column once and removes the files on close(). Worker
+    processes that already attached keep valid mappings until they drop
+    their frames (unlinked tmpfs files live while mapped).
+
+    Example:
+        with SharedDataset(data) as shared:
+            results = Parallel(n_jobs=-1)(delayed(work)(shared.handle, i) for i in range(100))
+    """
+
+    def __init__(self, data: pd.DataFrame, directory: Optional[str] = None):
+        """
+        Publish a DataFrame.
+
+        Args:
+            data: DataFrame to share (unique column labels)
+            directory: Base directory (default: SHARED_DATASET_DIR or default_dataset_dir())
+
+        Raises:
+            ValueError: If column labels are not unique
+            OSError: If the columns cannot be written (e.g. /dev/shm full)
+        """
+        if not data.columns.is_unique:
+            raise ValueError("Shared datasets need unique column labels")
+
+        base = directory or os.getenv('SHARED_DATASET_DIR') or default_dataset_dir()
+        os.makedirs(base, exist_ok=True)
+        _remove_stale(base)
+
+        name = f"{os.getpid()}-{uuid.uuid4().hex}"
+        self.path = os.path.join(base, name)
+        os.makedirs(self.path)
+
+        try:
+            mapped = []
+            inline = {}
+            for position, column in enumerate(data.columns):
+                values = data.iloc[:, position].to_numpy()
+                if values.dtype == object:
+                    inline[column] = values
+                    mapped.append(False)
+                    continue
+                np.save(self._column_path(position), np.ascontiguousarray(values), allow_pickle=False)
+                mapped.append(True)
+
+            range_index = None
+            if isinstance(data.index, pd.RangeIndex):
+                range_index = (data.index.start, data.index.stop, data.index.step)
+            else:
+                np.save(os.path.join(self.path, f"{INDEX_FILE}.npy"), data.index.to_numpy(), allow_pickle=False)
+        except Exception:
+            shutil.rmtree(self.path, ignore_errors=True)
+            raise
+
+        self.handle = SharedDatasetHandle(
+            name=name,
+            directory=self.path,
+            n_rows=len(data),
+            columns=tuple(data.columns),
+            mapped=tuple(mapped),
+            range_index=range_index,
+            index_name=data.index.name,
+            inline=inline,
+            attrs=dict(data.attrs)
+        )
+        log.debug(f"Shared dataset {name}: {len(data)} rows, {sum(mapped)} mapped columns")
+
+    def close(self):
+        """Remove the column files (safe to call more than once)."""
+        _attached.pop(self.handle.name, None)
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def __enter__(self) -> 'SharedDataset':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _column_path(self, position: int) -> str:
+        return os.path.join(self.path, f"{position}.npy")
+
+
+def share_dataset(data: pd.DataFrame, directory: Optional[str] = None) -> Optional[SharedDataset]:
+    """
+    SharedDataset of data, or None when it cannot be published.
+
+    Optimizers fall back to sending the DataFrame itself on None.
+    """
+    try:
+        return SharedDataset(data, directory)
+    except (OSError, ValueError) as e:
+        log.warning(f"⚠️  Shared dataset unavailable, sending data to each task: {e}")
+        return None
+
+
+# Process-wide attached frames: dataset name -> DataFrame
+_attached: 'OrderedDict[str, pd.DataFrame]' = OrderedDict()
+
+
+def attach_dataset(handle: SharedDatasetHandle) -> pd.DataFrame:
+    """
+    Read-only DataFrame of a shared dataset, reused across calls in this process.
+
+    Args:
+        handle: SharedDataset.handle
+
+    Returns:
+        DataFrame whose mapped columns are read-only memory maps
+
+    Raises:
+        FileNotFoundError: If the owner already closed the dataset
+    """
+    frame = _attached.get(handle.name)
+    if frame is not None:
+        _attached.move_to_end(handle.name)
+        return frame
+
+    columns = {}
+    for position, (column, mapped) in enumerate(zip(handle.columns, handle.mapped)):
+        if mapped:
+            columns[column] = _load_mapped(handle.directory, str(position))
+        else:
+            columns[column] = handle.inline[column]
+
+    if handle.range_index is not None:
+        index = pd.RangeIndex(*handle.range_index, name=handle.index_name)
+    else:
+        index = pd.Index(_load_mapped(handle.directory, INDEX_FILE), name=handle.index_name)
+
+    frame = pd.DataFrame(columns, index=index, columns=list(handle.columns), copy=False)
+    frame.attrs.update(handle.attrs)
+
+    _attached[handle.name] = frame
+    if len(_attached) > MAX_ATTACHED:
+        _attached.popitem(last=False)
+    log.debug(f"Attached shared dataset {handle.name} ({handle.n_rows} rows)")
+    return frame
+
+
+def resolve_dataset(dataset: Union[pd.DataFrame, SharedDatasetHandle]) -> pd.DataFrame:
+    """DataFrame of a task's dataset argument (handles are attached, frames pass through)."""
+    if isinstance(dataset, SharedDatasetHandle):
+        return attach_dataset(dataset)
+    return dataset
+
+
+def _load_mapped(directory: str, name: str) -> np.ndarray:
+    """Read-only ndarray view of a column file (keeps the mapping alive)."""
+    path = os.path.join(directory, f"{name}.npy")
+    return np.load(path, mmap_mode='r', allow_pickle=False).view(np.ndarray)
+
+
+def _remove_stale(base: str):
+    """Remove datasets left behind by owner processes that no longer exist."""
+    try:
+        names = os.listdir(base)
+    except OSError:
+        return
+    for name in names:
+        pid = name.split('-', 1)[0]
+        if not pid.isdigit() or _pid_alive(int(pid)):
+            continue
+        shutil.rmtree(os.path.join(base, name), ignore_errors=True)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
@@ -0,0 +1,106 @@
+"""
+Source Digest - Content Hash of Modules and the training Modules They Import
+
+Persistent caches must be invalidated when the code producing their
+entries changes. Instead of hand-picked file lists, the dependencies are
+derived from the import statements: starting from a set of source files,
+every module of the training package they import (relative or
+absolute, at module level or inside functions) is followed recursively.
+
+    digest = source_digest([Path(inspect.getfile(strategy_class))])
+
+Imports outside the training package (NumPy, pandas, ...) are not
+followed; pin those through the environment.
+"""
+
+import ast
+import hashlib
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+# Root of the training package (imports resolving outside it are ignored)
+PACKAGE_DIR = Path(__file__).resolve().parent
+PACKAGE_NAME = PACKAGE_DIR.name
+
+
+def module_sources(paths: Iterable[Path]) -> List[Path]:
+    """
+    Source files plus every training module they import, transitively.
+
+    Args:
+        paths: Python source files to start from
+
+    Returns:
+        Sorted, de-duplicated list of existing source files
+    """
+    pending = [Path(path).resolve() for path in paths]
+    seen = set()
+
+    while pending:
+        path = pending.pop()
+        if path in seen or not path.is_file():
+            continue
+        seen.add(path)
+        try:
+            tree = ast.parse(path.read_bytes(), filename=str(path))
+        except (OSError, SyntaxError, ValueError):
+            continue
+        pending.extend(_imported_sources(path, tree))
+
+    return sorted(seen)
+
+
+def source_digest(paths: Iterable[Path]) -> str:
+    """Hex digest of module_sources(paths) (file names and contents)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in module_sources(paths):
+        try:
+            contents = path.read_bytes()
+        except OSError:
+            continue
+        digest.update(str(path.relative_to(PACKAGE_DIR.parent)).encode())
+        digest.update(contents)
+    return digest.hexdigest()
+
+
+def _imported_sources(path: Path, tree: ast.AST) -> List[Path]:
+    """Training-package source files imported anywhere in a parsed module."""
+    sources = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                sources += _resolve(_absolute_base(alias.name), [])
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = path.parent
+                for _ in range(node.level - 1):
+                    base = base.parent
+                if node.module:
+                    base = base.joinpath(*node.module.split('.'))
+            else:
+                base = _absolute_base(node.module or '')
+            # 'from . import x' may name submodules as well as attributes
+            sources += _resolve(base, [alias.name for alias in node.names])
+    return sources
+
+
+def _absolute_base(module: str) -> Optional[Path]:
+    """Directory path of an absolute module name inside the training package."""
+    parts = module.split('.')
+    if parts[0] != PACKAGE_NAME:
+        return None
+    return PACKAGE_DIR.joinpath(*parts[1:])
+
+
+def _resolve(base: Optional[Path], names: List[str]) -> List[Path]:
+    """Module file (or package __init__) at base, plus submodules among names."""
+    if base is None:
+        return []
+    try:
+        base.resolve().relative_to(PACKAGE_DIR)
+    except ValueError:
+        return []
+
+    sources = [base.with_suffix('.py'), base / '__init__.py']
+    sources += [base / f"{name}.py" for name in names if name != '*']
+    return [source for source in sources if source.is_file()]
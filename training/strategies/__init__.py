@@ -8,14 +8,29 @@ Available strategies:
 - LiquiditySweepStrategy: Key level pierce detection with volume confirmation
 - CapitulationReversalStrategy: Panic selling/buying reversal detection
 - FailedBreakdownStrategy: Wyckoff spring detection (failed breakdowns)
+
+Strategy modules are imported on first attribute access, so loading one
+strategy (see training.registry) does not import the others.
 """
 
-from .liquidity_sweep import LiquiditySweepStrategy
-from .capitulation_reversal import CapitulationReversalStrategy
-from .failed_breakdown import FailedBreakdownStrategy
+from importlib import import_module
+
+_MODULES = {
+    'LiquiditySweepStrategy': '.liquidity_sweep',
+    'CapitulationReversalStrategy': '.capitulation_reversal',
+    'FailedBreakdownStrategy': '.failed_breakdown'
+}
 
 __all__ = [
     'LiquiditySweepStrategy',
     'CapitulationReversalStrategy',
     'FailedBreakdownStrategy'
 ]
+
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -27,27 +27,20 @@ Exit Logic:
 Performance: ~85% effectiveness vs full implementation with paid data
 """
 
+import math
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, Mapping, Optional
 import logging
 
-log = logging.getLogger(__name__)
-
+from ..telemetry import timed
+from ..feature_cache import attach_fingerprint, cached_feature
+from ..trade_simulator import SIGNAL_BUY, SIGNAL_SELL
+from .context import StrategyContext
+from .signals import SparseSignals
+from .streaming import RollingWindow, candle_value
 
-@dataclass
-class PanicSignal:
-    """Detected panic/capitulation signal."""
-    timestamp: int
-    price: float
-    panic_score: float  # 0.0 to 1.0
-    volume_explosion: bool
-    price_velocity_extreme: bool
-    atr_explosion: bool
-    exhaustion_wick: bool
-    rsi_extreme: bool
-    orderbook_imbalance: Optional[float]  # None if L2 data unavailable
+log = logging.getLogger(__name__)
 
 
 class CapitulationReversalStrategy:
@@ -119,6 +112,9 @@ class CapitulationReversalStrategy:
         self.max_holding_periods = params.get('max_holding_periods', 50)
         self.lookback_periods = params.get('lookback_periods', 100)
         
+        # Incremental state for on_candle()
+        self._stream: Optional['CapitulationReversalStream'] = None
+        
         log.debug(f"CapitulationReversalStrategy initialized: {self.params}")
     
     def generate_signals(self, data: pd.DataFrame, progress_callback=None) -> pd.DataFrame:
@@ -133,85 +129,118 @@ class CapitulationReversalStrategy:
             DataFrame with columns: timestamp, signal, entry_price, sl_price, tp_price
         """
         log.info(f"Generating Capitulation Reversal signals: {len(data)} candles")
+        return self.evaluate(self.prepare(data), progress_callback=progress_callback)
+    
+    def on_candle(self, candle: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Incremental signal for the newest closed candle (live trading).
+        
+        Indicators and the panic / pressure / RSI windows are rolling state,
+        so a candle costs O(1). The returned row equals the last row of
+        generate_signals() on all candles streamed so far.
         
+        Args:
+            candle: Mapping with timestamp, open, high, low, close, volume, atr
+                    (optional: orderbook_imbalance)
+        
+        Returns:
+            Dict with timestamp, signal, stop_loss, take_profit, panic_score,
+            or None while warming up (first lookback_periods candles)
+        """
+        if self._stream is None:
+            self._stream = CapitulationReversalStream(self)
+        return self._stream.update(candle)
+    
+    def reset_stream(self):
+        """Discard the on_candle() state (e.g. after a gap in the candle feed)."""
+        self._stream = None
+    
+    @classmethod
+    def prepare(cls, data: pd.DataFrame) -> StrategyContext:
+        """
+        Parameter-independent stage: volume/ATR/velocity averages, RSI, wicks.
+        
+        Args:
+            data: DataFrame with columns: timestamp, open, high, low, close, volume, atr
+        
+        Returns:
+            StrategyContext shared by evaluate() calls with any parameters
+        """
         df = data.copy()
+        fingerprint = attach_fingerprint(df)
         
-        # Calculate indicators
-        df = self._calculate_indicators(df)
+        with timed('capitulation_reversal.indicators', len(df)):
+            df = cls._calculate_indicators(df)
         
-        # Detect panic events
-        panic_signals = self._detect_panic_events(df)
-        log.debug(f"Detected {len(panic_signals)} panic events")
+        return StrategyContext(df, fingerprint)
+    
+    def evaluate(self, context: StrategyContext, progress_callback=None) -> pd.DataFrame:
+        """
+        Parameter-dependent stage as a signals DataFrame (see generate_signals).
         
-        # Generate trading signals
-        signals = []
+        Args:
+            context: Output of prepare()
+            progress_callback: Optional callback for progress tracking
+        
+        Returns:
+            Signals DataFrame (see generate_signals)
+        """
+        return self.evaluate_sparse(context, progress_callback).to_frame(context.df['timestamp'].to_numpy())
+    
+    def evaluate_sparse(self, context: StrategyContext, progress_callback=None) -> SparseSignals:
+        """
+        Parameter-dependent stage: panic events and reversal entries.
         
-        # Calculate total iterations for progress tracking
-        total_iterations = len(df) - self.lookback_periods
-        update_frequency = max(1, total_iterations // 100)  # Update ~100 times (every 1%)
+        Panic scores depend only on the five panic thresholds and are
+        memoized on the context under them.
         
-        for i, idx in enumerate(range(self.lookback_periods, len(df))):
-            row = df.iloc[idx]
-            prev_rows = df.iloc[max(0, idx - 20):idx]
-            
-            signal_data = {
-                'timestamp': int(row['timestamp']),
-                'signal': 'HOLD',
-                'stop_loss': 0.0,
-                'take_profit': 0.0,
-                'panic_score': 0.0
-            }
-            
-            # Check for panic reversal opportunities
-            # LONG: Panic selling followed by recovery
-            long_signal, panic_score = self._detect_long_reversal(
-                current=row,
-                previous=prev_rows,
-                panic_signals=panic_signals
+        Args:
+            context: Output of prepare()
+            progress_callback: Optional callback for progress tracking
+        
+        Returns:
+            SparseSignals with the reversal entries (extra: panic_score)
+        """
+        df = context.df
+        
+        # In-progress update first: the job tracker only counts an
+        # episode's completion after it has seen it in flight
+        if progress_callback and len(df) > 0:
+            progress_callback(0, len(df), 'signal_generation')
+        
+        # Detect panic events
+        with timed('capitulation_reversal.panic_events', len(df)):
+            panic_score = context.memo(
+                'panic_score',
+                (
+                    self.volume_explosion_threshold,
+                    self.price_velocity_threshold,
+                    self.atr_explosion_threshold,
+                    self.exhaustion_wick_ratio,
+                    self.rsi_extreme_threshold
+                ),
+                lambda: self._detect_panic_events(df)
             )
-            
-            if long_signal:
-                signal_data['signal'] = 'BUY'
-                signal_data['stop_loss'] = row['close'] - (row['atr'] * self.atr_multiplier_sl)
-                signal_data['take_profit'] = row['close'] + (
-                    row['atr'] * self.atr_multiplier_sl * self.risk_reward_ratio
-                )
-                signal_data['panic_score'] = panic_score
-            
-            # SHORT: Panic buying (euphoria) followed by collapse
-            else:
-                short_signal, panic_score = self._detect_short_reversal(
-                    current=row,
-                    previous=prev_rows,
-                    panic_signals=panic_signals
-                )
-                
-                if short_signal:
-                    signal_data['signal'] = 'SELL'
-                    signal_data['stop_loss'] = row['close'] + (row['atr'] * self.atr_multiplier_sl)
-                    signal_data['take_profit'] = row['close'] - (
-                        row['atr'] * self.atr_multiplier_sl * self.risk_reward_ratio
-                    )
-                    signal_data['panic_score'] = panic_score
-            
-            signals.append(signal_data)
-            
-            # Fire progress callback periodically
-            if progress_callback and (i % update_frequency == 0 or i == total_iterations - 1):
-                progress_callback(i + 1, total_iterations, 'signal_generation')
+        log.debug(f"Detected {int((panic_score > 0).sum())} panic events")
         
-        # Convert to DataFrame
-        signals_df = pd.DataFrame(signals)
+        # Generate trading signals
+        with timed('capitulation_reversal.signals', len(df)):
+            signals = self._detect_reversals(df, panic_score)
+            
+            total_iterations = signals.n_candles - signals.start
+            if progress_callback and total_iterations > 0:
+                progress_callback(total_iterations, total_iterations, 'signal_generation')
         
         log.info(
             f"✅ Capitulation signals generated: "
-            f"{len(signals_df[signals_df['signal'] == 'BUY'])} BUY, "
-            f"{len(signals_df[signals_df['signal'] == 'SELL'])} SELL"
+            f"{signals.n_buy} BUY, "
+            f"{signals.n_sell} SELL"
         )
         
-        return signals_df
+        return signals
     
-    def _calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+    @classmethod
+    def _calculate_indicators(cls, df: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate all required indicators from OHLCV data.
         
@@ -223,25 +252,40 @@ class CapitulationReversalStrategy:
         - Wick ratios (upper/lower wick vs body)
         """
         # Volume indicators
-        df['volume_ma'] = df['volume'].rolling(window=20).mean()
+        df['volume_ma'] = cached_feature(
+            df, 'volume_ma', {'window': 20},
+            lambda: df['volume'].rolling(window=20).mean().to_numpy()
+        )
         df['volume_ratio'] = df['volume'] / df['volume_ma']
         
         # ATR indicators
-        df['atr_ma'] = df['atr'].rolling(window=20).mean()
+        df['atr_ma'] = cached_feature(
+            df, 'atr_ma', {'window': 20},
+            lambda: df['atr'].rolling(window=20).mean().to_numpy()
+        )
         df['atr_ratio'] = df['atr'] / df['atr_ma']
         
         # Price velocity (% change per candle)
         df['price_velocity'] = abs(df['close'] - df['open']) / df['open']
-        df['price_velocity_avg'] = df['price_velocity'].rolling(window=20).mean()
+        df['price_velocity_avg'] = cached_feature(
+            df, 'price_velocity_avg', {'window': 20},
+            lambda: df['price_velocity'].rolling(window=20).mean().to_numpy()
+        )
         
         # RSI (14-period)
-        df['rsi'] = self._calculate_rsi(df['close'], period=14)
+        df['rsi'] = cached_feature(
+            df, 'rsi', {'period': 14},
+            lambda: cls._calculate_rsi(df['close'], period=14).to_numpy()
+        )
         
         # Wick ratios
         df['body'] = abs(df['close'] - df['open'])
         df['upper_wick'] = df['high'] - df[['open', 'close']].max(axis=1)
         df['lower_wick'] = df[['open', 'close']].min(axis=1) - df['low']
-        df['wick_ratio'] = (df['upper_wick'] + df['lower_wick']) / (df['body'] + 0.0001)  # Avoid div by 0
+        df['wick_ratio'] = cached_feature(  # body + 0.0001 avoids div by 0
+            df, 'wick_ratio', {'body_epsilon': 0.0001},
+            lambda: ((df['upper_wick'] + df['lower_wick']) / (df['body'] + 0.0001)).to_numpy()
+        )
         
         # Candle direction
         df['bullish'] = df['close'] > df['open']
@@ -249,7 +293,8 @@ class CapitulationReversalStrategy:
         
         return df
     
-    def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
+    @staticmethod
+    def _calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
         """Calculate RSI indicator."""
         delta = prices.diff()
         gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
@@ -258,7 +303,7 @@ class CapitulationReversalStrategy:
         rsi = 100 - (100 / (1 + rs))
         return rsi
     
-    def _detect_panic_events(self, df: pd.DataFrame) -> List[PanicSignal]:
+    def _detect_panic_events(self, df: pd.DataFrame) -> np.ndarray:
         """
         Detect panic/capitulation events in price action.
         
@@ -270,184 +315,126 @@ class CapitulationReversalStrategy:
         5. RSI extremes (< 15 or > 85)
         
         Returns:
-            List of PanicSignal objects
+            Panic score per candle (0.0 where no panic event)
         """
-        panic_signals = []
+        volume_explosion = (df['volume_ratio'] >= self.volume_explosion_threshold).to_numpy()
+        price_velocity_extreme = (df['price_velocity'] >= self.price_velocity_threshold).to_numpy()
+        atr_explosion = (df['atr_ratio'] >= self.atr_explosion_threshold).to_numpy()
+        exhaustion_wick = (df['wick_ratio'] >= self.exhaustion_wick_ratio).to_numpy()
+        
+        # RSI extremes (< 15 for oversold, > 85 for overbought)
+        rsi = df['rsi'].to_numpy()
+        rsi_extreme = (rsi <= self.rsi_extreme_threshold) | (rsi >= (100 - self.rsi_extreme_threshold))
+        
+        # Weighted panic score (0.0 to 1.0)
+        panic_score = (
+            volume_explosion * 0.3 +         # 30% weight
+            price_velocity_extreme * 0.25 +  # 25% weight
+            atr_explosion * 0.2 +            # 20% weight
+            exhaustion_wick * 0.15 +         # 15% weight
+            rsi_extreme * 0.1                # 10% weight
+        )
         
-        for idx in range(20, len(df)):  # Need 20 candles for indicators
-            row = df.iloc[idx]
-            
-            # Check each panic indicator
-            volume_explosion = row['volume_ratio'] >= self.volume_explosion_threshold
-            price_velocity_extreme = row['price_velocity'] >= self.price_velocity_threshold
-            atr_explosion = row['atr_ratio'] >= self.atr_explosion_threshold
-            exhaustion_wick = row['wick_ratio'] >= self.exhaustion_wick_ratio
-            
-            # RSI extremes (< 15 for oversold, > 85 for overbought)
-            rsi_extreme = (row['rsi'] <= self.rsi_extreme_threshold or 
-                          row['rsi'] >= (100 - self.rsi_extreme_threshold))
-            
-            # Calculate panic score (0.0 to 1.0)
-            panic_score = sum([
-                volume_explosion * 0.3,      # 30% weight
-                price_velocity_extreme * 0.25, # 25% weight
-                atr_explosion * 0.2,         # 20% weight
-                exhaustion_wick * 0.15,      # 15% weight
-                rsi_extreme * 0.1            # 10% weight
-            ])
-            
-            # If panic score >= 0.4 (2+ strong indicators), record panic event
-            # Lowered from 0.6 to increase signal frequency to 20-50 trades/year
-            if panic_score >= 0.4:
-                # Get order book imbalance if available
-                orderbook_imbalance = row.get('orderbook_imbalance', None)
-                
-                panic_signals.append(PanicSignal(
-                    timestamp=int(row['timestamp']),
-                    price=row['close'],
-                    panic_score=panic_score,
-                    volume_explosion=volume_explosion,
-                    price_velocity_extreme=price_velocity_extreme,
-                    atr_explosion=atr_explosion,
-                    exhaustion_wick=exhaustion_wick,
-                    rsi_extreme=rsi_extreme,
-                    orderbook_imbalance=orderbook_imbalance
-                ))
-        
-        return panic_signals
+        # If panic score >= 0.4 (2+ strong indicators), record panic event
+        # Lowered from 0.6 to increase signal frequency to 20-50 trades/year
+        panic_score[panic_score < 0.4] = 0.0
+        panic_score[:20] = 0.0  # Need 20 candles for indicators
+        
+        return panic_score
     
-    def _detect_long_reversal(
-        self,
-        current: pd.Series,
-        previous: pd.DataFrame,
-        panic_signals: List[PanicSignal]
-    ) -> tuple[bool, float]:
+    def _detect_reversals(self, df: pd.DataFrame, panic_score: np.ndarray) -> SparseSignals:
         """
-        Detect LONG opportunity after panic selling (capitulation).
+        Detect reversal entries after panic events for every candle after the lookback.
         
-        Conditions:
-        1. Recent panic event detected (high panic score)
-        2. Multiple consecutive panic/bearish candles (2-4)
-        3. Recovery candle: bullish with strong volume
-        4. RSI was oversold during panic and is now recovering
-        5. Optional: Order book shows bid support (60%+ bids)
+        LONG (after panic selling / capitulation):
+        1. Panic event in the previous 15 candles
+        2. At least 3 bearish candles in the previous 15
+        3. Current candle bullish
+        4. Optional: order book bid support (imbalance >= threshold)
+        5. RSI oversold (< 35) in the previous 5 candles, now recovering (>= 25)
         
-        Returns:
-            (is_valid_signal, panic_score)
-        """
-        # 1. Check for recent panic event (last 10-15 candles - give more time window)
-        # FIXED: Expanded from 5 to 15 candles to catch panic events that happened earlier
-        recent_timestamps = previous.tail(15)['timestamp'].values
-        recent_panics = [
-            p for p in panic_signals 
-            if p.timestamp in recent_timestamps
-        ]
-        
-        if not recent_panics:
-            return False, 0.0
-        
-        # Get highest panic score
-        max_panic = max(recent_panics, key=lambda p: p.panic_score)
-        
-        # 2. SIMPLIFIED: Check if there were SOME bearish candles recently (not strict count)
-        # Just verify there was selling pressure in last 15 candles
-        bearish_count = sum(1 for _, row in previous.tail(15).iterrows() if row['bearish'])
-        
-        # Need at least SOME bearish candles (lowered threshold)
-        if bearish_count < 3:  # At least 3 bearish candles in last 15
-            return False, 0.0
-        
-        # 3. Check current candle is recovery (bullish + SOME volume)
-        # RELAXED: Just needs to be bullish, volume threshold removed entirely
-        is_bullish = current['close'] > current['open']
-        
-        if not is_bullish:
-            return False, 0.0
-        
-        # 4. Optional: Check order book imbalance (if L2 data available)
-        if 'orderbook_imbalance' in current and pd.notna(current['orderbook_imbalance']):
-            # Positive imbalance = more bids (buyers) than asks
-            if current['orderbook_imbalance'] < self.orderbook_imbalance_threshold:
-                return False, 0.0
-        
-        # 5. Check RSI recovery: was oversold (< 35) in recent panic, now recovering (>= 25)
-        # FIXED: Previously only entered if RSI < 30, which missed most recoveries
-        recent_rsi_values = previous.tail(5)['rsi'].values
-        was_oversold = any(rsi < 35 for rsi in recent_rsi_values if pd.notna(rsi))
-        is_recovering = current['rsi'] >= 25  # Allow entry during early recovery
-        
-        if was_oversold and is_recovering:
-            return True, max_panic.panic_score
-        
-        return False, 0.0
-    
-    def _detect_short_reversal(
-        self,
-        current: pd.Series,
-        previous: pd.DataFrame,
-        panic_signals: List[PanicSignal]
-    ) -> tuple[bool, float]:
-        """
-        Detect SHORT opportunity after panic buying (euphoria).
+        SHORT (after panic buying / euphoria) mirrors it: 3+ bullish candles,
+        bearish current candle, ask dominance, RSI > 65 recently and now <= 75.
+        LONG takes precedence when both match.
         
-        Conditions:
-        1. Recent panic buying detected (RSI > 85, volume spike)
-        2. Multiple consecutive bullish panic candles (2-4)
-        3. Reversal candle: bearish with strong volume
-        4. RSI was overbought during panic and is now declining
-        5. Optional: Order book shows ask resistance (60%+ asks)
+        All window conditions are rolling aggregates over the preceding
+        candles, so detection is linear in the number of candles.
         
         Returns:
-            (is_valid_signal, panic_score)
+            SparseSignals of the reversal entries (extra: panic_score)
         """
-        # 1. Check for recent euphoric buying (last 10-15 candles - give more time window)
-        # FIXED: Expanded from 5 to 15 candles to catch panic buying events earlier
-        recent_timestamps = previous.tail(15)['timestamp'].values
-        recent_panics = [
-            p for p in panic_signals 
-            if p.timestamp in recent_timestamps
-        ]
-        
-        if not recent_panics:
-            return False, 0.0
-        
-        max_panic = max(recent_panics, key=lambda p: p.panic_score)
-        
-        # 2. SIMPLIFIED: Check if there were SOME bullish candles recently (not strict count)
-        # Just verify there was buying pressure in last 15 candles
-        bullish_count = sum(1 for _, row in previous.tail(15).iterrows() if row['bullish'])
-        
-        # Need at least SOME bullish candles (lowered threshold)
-        if bullish_count < 3:  # At least 3 bullish candles in last 15
-            return False, 0.0
-        
-        # 3. Check current candle is reversal (bearish - volume threshold removed)
-        # RELAXED: Just needs to be bearish
-        is_bearish = current['close'] < current['open']
-        
-        if not is_bearish:
-            return False, 0.0
-        
-        # 4. Optional: Check order book imbalance (negative = more sellers)
-        if 'orderbook_imbalance' in current and pd.notna(current['orderbook_imbalance']):
-            # Negative imbalance = more asks (sellers) than bids
-            if current['orderbook_imbalance'] > -self.orderbook_imbalance_threshold:
-                return False, 0.0
-        
-        # 5. Check RSI reversal: was overbought (> 65) in recent panic, now declining (<= 75)
-        # FIXED: Previously only entered if RSI > 70, which missed most reversals
-        recent_rsi_values = previous.tail(5)['rsi'].values
-        was_overbought = any(rsi > 65 for rsi in recent_rsi_values if pd.notna(rsi))
-        is_declining = current['rsi'] <= 75  # Allow entry during early decline
-        
-        if was_overbought and is_declining:
-            return True, max_panic.panic_score
-        
-        return False, 0.0
+        def previous(values: np.ndarray, window: int, how: str) -> np.ndarray:
+            """Rolling max/sum over the `window` candles before each candle."""
+            rolling = pd.Series(values).rolling(window, min_periods=1)
+            result = rolling.max() if how == 'max' else rolling.sum()
+            return result.shift(1).fillna(0).to_numpy()
+        
+        start = min(max(self.lookback_periods, 0), len(df))
+        candles = np.arange(start, len(df))
+        
+        # 1. Highest panic score in the last 15 candles (0 = no recent panic)
+        recent_panic = previous(panic_score, 15, 'max')[candles]
+        
+        # 2. Selling / buying pressure in the last 15 candles
+        bearish_count = previous(df['bearish'].to_numpy(dtype=np.float64), 15, 'sum')[candles]
+        bullish_count = previous(df['bullish'].to_numpy(dtype=np.float64), 15, 'sum')[candles]
+        
+        # 5. RSI extremes in the last 5 candles, current RSI
+        rsi = df['rsi'].to_numpy()
+        was_oversold = previous((rsi < 35).astype(np.float64), 5, 'max')[candles] > 0
+        was_overbought = previous((rsi > 65).astype(np.float64), 5, 'max')[candles] > 0
+        rsi = rsi[candles]
+        
+        close = df['close'].to_numpy(dtype=np.float64)[candles]
+        open_ = df['open'].to_numpy(dtype=np.float64)[candles]
+        atr = df['atr'].to_numpy(dtype=np.float64)[candles]
+        
+        # 4. Optional order book filter (only where L2 data is present)
+        bid_support = np.ones(len(candles), dtype=bool)
+        ask_pressure = np.ones(len(candles), dtype=bool)
+        if 'orderbook_imbalance' in df.columns:
+            imbalance = df['orderbook_imbalance'].to_numpy(dtype=np.float64)[candles]
+            has_l2 = ~np.isnan(imbalance)
+            bid_support = ~has_l2 | (imbalance >= self.orderbook_imbalance_threshold)
+            ask_pressure = ~has_l2 | (imbalance <= -self.orderbook_imbalance_threshold)
+        
+        long = (
+            (recent_panic > 0)
+            & (bearish_count >= 3)
+            & (close > open_)
+            & bid_support
+            & was_oversold
+            & (rsi >= 25)
+        )
+        short = (
+            (recent_panic > 0)
+            & (bullish_count >= 3)
+            & (close < open_)
+            & ask_pressure
+            & was_overbought
+            & (rsi <= 75)
+        ) & ~long
+        
+        # Only entry candles get stop/target levels
+        entries = np.flatnonzero(long | short)
+        side = np.where(long[entries], SIGNAL_BUY, SIGNAL_SELL)
+        stop_distance = atr[entries] * self.atr_multiplier_sl
+        target_distance = stop_distance * self.risk_reward_ratio
+        
+        return SparseSignals.from_entries(
+            n_candles=len(df),
+            start=start,
+            index=candles[entries],
+            side=side,
+            stop_loss=close[entries] - side * stop_distance,
+            take_profit=close[entries] + side * target_distance,
+            panic_score=recent_panic[entries].astype(np.float64)
+        )
     
-    def get_parameter_space(self) -> Dict[str, Any]:
+    @classmethod
+    def get_parameter_space(cls) -> Dict[str, Any]:
         """
-        Get parameter search space for optimization.
+        Get parameter search space for optimization (no instance needed).
         
         Returns:
             Dict with parameter ranges suitable for optimizers
@@ -470,3 +457,132 @@ class CapitulationReversalStrategy:
             'max_holding_periods': [30, 50, 75],              # Discrete
             'lookback_periods': [50, 75, 100]                 # Shorter lookback (more signals)
         }
+
+
+class CapitulationReversalStream:
+    """
+    Rolling state behind CapitulationReversalStrategy.on_candle().
+    
+    Mirrors _calculate_indicators / _detect_panic_events / _detect_reversals
+    with fixed windows: 20-candle volume and ATR averages, 14-candle RSI
+    gains/losses, and the 15/5-candle panic, pressure and RSI windows.
+    """
+    
+    def __init__(self, strategy: 'CapitulationReversalStrategy'):
+        self.strategy = strategy
+        self.index = 0
+        self.previous_close = math.nan
+        
+        self.volume = RollingWindow(20)
+        self.atr = RollingWindow(20)
+        self.gains = RollingWindow(14)
+        self.losses = RollingWindow(14)
+        
+        self.previous_panic = RollingWindow(15)
+        self.previous_bearish = RollingWindow(15)
+        self.previous_bullish = RollingWindow(15)
+        self.previous_oversold = RollingWindow(5)
+        self.previous_overbought = RollingWindow(5)
+    
+    def update(self, candle: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        """Advance by one candle; signal row once past lookback_periods."""
+        strategy = self.strategy
+        t = self.index
+        self.index += 1
+        
+        open_ = candle_value(candle, 'open')
+        high = candle_value(candle, 'high')
+        low = candle_value(candle, 'low')
+        close = candle_value(candle, 'close')
+        volume = candle_value(candle, 'volume')
+        atr = candle_value(candle, 'atr')
+        
+        # Indicators (see _calculate_indicators)
+        self.volume.append(volume)
+        self.atr.append(atr)
+        volume_ratio = volume / self.volume.mean()
+        atr_ratio = atr / self.atr.mean()
+        price_velocity = abs(close - open_) / open_
+        
+        delta = close - self.previous_close
+        self.previous_close = close
+        self.gains.append(delta if delta > 0 else 0.0)
+        self.losses.append(-delta if delta < 0 else 0.0)
+        rsi = self._rsi(self.gains.mean(), self.losses.mean())
+        
+        body = abs(close - open_)
+        upper_wick = high - max(open_, close)
+        lower_wick = min(open_, close) - low
+        wick_ratio = (upper_wick + lower_wick) / (body + 0.0001)
+        
+        # Panic score (see _detect_panic_events)
+        panic_score = (
+            (volume_ratio >= strategy.volume_explosion_threshold) * 0.3 +
+            (price_velocity >= strategy.price_velocity_threshold) * 0.25 +
+            (atr_ratio >= strategy.atr_explosion_threshold) * 0.2 +
+            (wick_ratio >= strategy.exhaustion_wick_ratio) * 0.15 +
+            ((rsi <= strategy.rsi_extreme_threshold) or (rsi >= 100 - strategy.rsi_extreme_threshold)) * 0.1
+        )
+        if panic_score < 0.4 or t < 20:
+            panic_score = 0.0
+        
+        # Previous-candle windows (before adding the current candle)
+        recent_panic = self.previous_panic.max() if len(self.previous_panic) else 0.0
+        bearish_count = self.previous_bearish.sum()
+        bullish_count = self.previous_bullish.sum()
+        was_oversold = self.previous_oversold.max() > 0
+        was_overbought = self.previous_overbought.max() > 0
+        
+        self.previous_panic.append(panic_score)
+        self.previous_bearish.append(float(close < open_))
+        self.previous_bullish.append(float(close > open_))
+        self.previous_oversold.append(float(rsi < 35))
+        self.previous_overbought.append(float(rsi > 65))
+        
+        if t < max(strategy.lookback_periods, 0):
+            return None
+        
+        # Optional order book filter (only when the candle carries L2 data)
+        imbalance = candle_value(candle, 'orderbook_imbalance')
+        has_l2 = not math.isnan(imbalance)
+        bid_support = not has_l2 or imbalance >= strategy.orderbook_imbalance_threshold
+        ask_pressure = not has_l2 or imbalance <= -strategy.orderbook_imbalance_threshold
+        
+        long = (
+            recent_panic > 0
+            and bearish_count >= 3
+            and close > open_
+            and bid_support
+            and was_oversold
+            and rsi >= 25
+        )
+        short = not long and (
+            recent_panic > 0
+            and bullish_count >= 3
+            and close < open_
+            and ask_pressure
+            and was_overbought
+            and rsi <= 75
+        )
+        
+        stop_distance = atr * strategy.atr_multiplier_sl
+        target_distance = stop_distance * strategy.risk_reward_ratio
+        row = {'timestamp': int(candle['timestamp']), 'signal': 'HOLD',
+               'stop_loss': 0.0, 'take_profit': 0.0, 'panic_score': 0.0}
+        
+        if long:
+            row.update(signal='BUY', stop_loss=close - stop_distance,
+                       take_profit=close + target_distance, panic_score=recent_panic)
+        elif short:
+            row.update(signal='SELL', stop_loss=close + stop_distance,
+                       take_profit=close - target_distance, panic_score=recent_panic)
+        return row
+    
+    @staticmethod
+    def _rsi(gain: float, loss: float) -> float:
+        """RSI from average gain/loss with pandas division semantics."""
+        if math.isnan(gain) or math.isnan(loss):
+            return math.nan
+        if loss == 0:
+            return 100.0 if gain > 0 else math.nan
+        return 100 - (100 / (1 + gain / loss))
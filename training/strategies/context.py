@@ -0,0 +1,157 @@
+"""
+StrategyContext - Prepared Dataset State for Two-Stage Signal Generation
+
+Training strategies split signal generation into two stages:
+
+    context = StrategyClass.prepare(data)          # parameter-independent
+    signals = StrategyClass(params).evaluate(context)
+
+prepare() copies the data once and computes the indicators that do not
+depend on any parameter. evaluate() runs the parameter-dependent checks on
+the prepared frame; intermediate structures that depend only on a subset of
+the parameters (key levels, consolidation ranges, panic scores) are
+memoized on the context under that subset, so configurations sharing it
+reuse the structure.
+
+prepared_context() keeps the most recent contexts per process keyed by
+(strategy class, fingerprint of every data column), so optimizers and BacktestEngine
+pay for preparation once per dataset instead of once per configuration:
+
+    context = prepared_context(LiquiditySweepStrategy, data)
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Union
+import logging
+
+import pandas as pd
+
+from ..feature_cache import dataset_fingerprint
+from .signals import SparseSignals
+
+log = logging.getLogger(__name__)
+
+
+# Contexts kept per process (one per strategy class and dataset)
+MAX_CONTEXTS = 4
+
+
+class StrategyContext:
+    """
+    Prepared, parameter-independent state of one dataset.
+
+    evaluate() must treat df as read-only; anything parameter-dependent
+    that is worth sharing goes through memo().
+    """
+
+    def __init__(self, df: pd.DataFrame, fingerprint: str, max_memo: int = 64):
+        """
+        Args:
+            df: Prepared working copy (indicator columns added)
+            fingerprint: dataset_fingerprint() of the source data
+            max_memo: Memoized structures kept (least recently used dropped)
+        """
+        self.df = df
+        self.fingerprint = fingerprint
+        self.max_memo = max_memo
+        self.hits = 0
+        self.misses = 0
+        self._memo: 'OrderedDict[tuple[str, Hashable], Any]' = OrderedDict()
+
+    def memo(self, name: str, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Structure memoized on the parameter subset it depends on.
+
+        Args:
+            name: Structure name
+            key: Hashable tuple of the parameters the structure depends on
+            compute: Builds the structure on a miss
+
+        Returns:
+            Memoized structure (shared between evaluations, do not mutate)
+        """
+        memo_key = (name, key)
+        if memo_key in self._memo:
+            self.hits += 1
+            self._memo.move_to_end(memo_key)
+            return self._memo[memo_key]
+
+        self.misses += 1
+        value = compute()
+        self._memo[memo_key] = value
+        if len(self._memo) > self.max_memo:
+            self._memo.popitem(last=False)
+        return value
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+
+# Process-wide prepared contexts: (strategy class, fingerprint) -> context
+_contexts: 'OrderedDict[tuple[str, str], StrategyContext]' = OrderedDict()
+
+
+def prepared_context(strategy_class: Any, data: pd.DataFrame) -> StrategyContext:
+    """
+    Prepared context of a dataset, reused across calls in this process.
+
+    Args:
+        strategy_class: Strategy class with a prepare(data) classmethod
+        data: OHLCV DataFrame
+
+    Returns:
+        StrategyContext (prepared on first use)
+    """
+    # Every column: prepare() may read optional ones (e.g. order book data)
+    fingerprint = dataset_fingerprint(data, columns=sorted(map(str, data.columns)))
+    key = (f"{strategy_class.__module__}.{strategy_class.__qualname__}", fingerprint)
+
+    context = _contexts.get(key)
+    if context is not None:
+        _contexts.move_to_end(key)
+        return context
+
+    context = strategy_class.prepare(data)
+    _contexts[key] = context
+    if len(_contexts) > MAX_CONTEXTS:
+        _contexts.popitem(last=False)
+    log.debug(f"Prepared {strategy_class.__name__} context ({len(data)} candles)")
+    return context
+
+
+def clear_contexts():
+    """Drop every prepared context of this process."""
+    _contexts.clear()
+
+
+def strategy_signals(
+    strategy: Any,
+    data: pd.DataFrame,
+    progress_callback: Optional[Callable] = None,
+    context: Optional[StrategyContext] = None,
+    sparse: bool = False
+) -> Union[pd.DataFrame, SparseSignals]:
+    """
+    Signals of a strategy instance, through its prepared context when supported.
+
+    Strategies without the prepare/evaluate stages fall back to
+    generate_signals(data).
+
+    Args:
+        strategy: Strategy instance
+        data: OHLCV DataFrame
+        progress_callback: Optional callback(current, total, stage)
+        context: Context prepared from data (looked up via prepared_context by default)
+        sparse: Return SparseSignals when the strategy supports evaluate_sparse()
+
+    Returns:
+        Signals DataFrame, or SparseSignals (sparse=True and supported)
+    """
+    if not (hasattr(type(strategy), 'prepare') and hasattr(strategy, 'evaluate')):
+        return strategy.generate_signals(data, progress_callback=progress_callback)
+
+    if context is None:
+        context = prepared_context(type(strategy), data)
+    if sparse and hasattr(strategy, 'evaluate_sparse'):
+        return strategy.evaluate_sparse(context, progress_callback=progress_callback)
+    return strategy.evaluate(context, progress_callback=progress_callback)
@@ -29,13 +29,23 @@ Exit Logic:
 Performance: ~70% effectiveness vs full implementation with on-chain data
 """
 
+import bisect
+import math
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional, Tuple
+from collections import deque
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import logging
 
+from ..telemetry import timed
+from ..feature_cache import attach_fingerprint, cached_feature
+from ..trade_simulator import SIGNAL_BUY
+from .context import StrategyContext
+from .signals import SparseSignals
+from .streaming import candle_value
+
 log = logging.getLogger(__name__)
 
 
@@ -54,11 +64,13 @@ class PriceRange:
     """Identified consolidation range."""
     support: float
     resistance: float
-    start_idx: int
-    end_idx: int
+    start_idx: int          # First candle of the range
+    end_idx: int            # First candle after the range
     volume_avg: float
     touches_support: int
     touches_resistance: int
+    window_ends: Optional[np.ndarray] = None  # End index of every merged lookback window
+    window_touches: Optional[np.ndarray] = None  # Support + resistance touches per window
 
 
 @dataclass
@@ -73,6 +85,7 @@ class SpringSignal:
     orderbook_absorption: Optional[float]  # Bid volume at support
     large_buyer_ratio: Optional[float]  # Large buys vs sells
     wyckoff_phase: WyckoffPhase
+    recovery_idx: int = -1  # Candle index of the recovery (entry candle)
 
 
 class FailedBreakdownStrategy:
@@ -158,6 +171,9 @@ class FailedBreakdownStrategy:
         self.risk_reward_ratio = params.get('risk_reward_ratio', 2.0)
         self.max_holding_periods = params.get('max_holding_periods', 50)
         
+        # Incremental state for on_candle()
+        self._stream: Optional['FailedBreakdownStream'] = None
+        
         log.debug(f"FailedBreakdownStrategy initialized: {self.params}")
     
     def generate_signals(self, data: pd.DataFrame, progress_callback=None) -> pd.DataFrame:
@@ -181,71 +197,123 @@ class FailedBreakdownStrategy:
                 - 'HOLD': No action
         """
         log.info(f"Generating Failed Breakdown signals: {len(data)} candles")
+        return self.evaluate(self.prepare(data), progress_callback=progress_callback)
+    
+    def on_candle(self, candle: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Incremental signal for the newest closed candle (live trading).
+        
+        The lookback window, open ranges and recent breakdown candles are
+        rolling state, so a candle costs O(range_lookback_periods +
+        spring_max_duration). The returned row equals the last row of
+        generate_signals() on all candles streamed so far.
         
+        Args:
+            candle: Mapping with timestamp, open, high, low, close, volume, atr
+                    (optional: orderbook_depth)
+        
+        Returns:
+            Dict with timestamp, signal, stop_loss, take_profit,
+            accumulation_score, wyckoff_phase, or None while warming up
+            (first range_lookback_periods candles)
+        """
+        if self._stream is None:
+            self._stream = FailedBreakdownStream(self)
+        return self._stream.update(candle)
+    
+    def reset_stream(self):
+        """Discard the on_candle() state (e.g. after a gap in the candle feed)."""
+        self._stream = None
+    
+    @classmethod
+    def prepare(cls, data: pd.DataFrame) -> StrategyContext:
+        """
+        Parameter-independent stage: volume average, rolling highs/lows.
+        
+        Args:
+            data: DataFrame with columns: timestamp, open, high, low, close, volume, atr
+        
+        Returns:
+            StrategyContext shared by evaluate() calls with any parameters
+        """
         df = data.copy()
+        fingerprint = attach_fingerprint(df)
+        
+        with timed('failed_breakdown.indicators', len(df)):
+            df = cls._calculate_indicators(df)
+        
+        return StrategyContext(df, fingerprint)
+    
+    def evaluate(self, context: StrategyContext, progress_callback=None) -> pd.DataFrame:
+        """
+        Parameter-dependent stage as a signals DataFrame (see generate_signals).
+        
+        Args:
+            context: Output of prepare()
+            progress_callback: Optional callback for progress tracking
+        
+        Returns:
+            Signals DataFrame (see generate_signals)
+        """
+        return self.evaluate_sparse(context, progress_callback).to_frame(
+            context.df['timestamp'].to_numpy(),
+            fill={'wyckoff_phase': WyckoffPhase.UNKNOWN.value}
+        )
+    
+    def evaluate_sparse(self, context: StrategyContext, progress_callback=None) -> SparseSignals:
+        """
+        Parameter-dependent stage: ranges, springs and entry signals.
+        
+        Consolidation ranges depend only on range_lookback_periods and
+        range_tightness_threshold and are memoized on the context under them.
+        
+        Args:
+            context: Output of prepare()
+            progress_callback: Optional callback for progress tracking
+        
+        Returns:
+            SparseSignals with the spring entries
+            (extras: accumulation_score, wyckoff_phase)
+        """
+        df = context.df
         
-        # Calculate indicators
-        df = self._calculate_indicators(df)
+        # In-progress update first: the job tracker only counts an
+        # episode's completion after it has seen it in flight
+        if progress_callback and len(df) > 0:
+            progress_callback(0, len(df), 'signal_generation')
         
         # Identify price ranges (consolidation zones)
-        price_ranges = self._identify_ranges(df)
+        with timed('failed_breakdown.ranges', len(df)):
+            price_ranges = context.memo(
+                'ranges',
+                (self.range_lookback_periods, self.range_tightness_threshold),
+                lambda: self._identify_ranges(df)
+            )
         log.debug(f"Identified {len(price_ranges)} consolidation ranges")
         
         # Detect spring patterns
-        spring_signals = self._detect_springs(df, price_ranges)
+        with timed('failed_breakdown.springs', len(df)):
+            spring_signals = self._detect_springs(df, price_ranges)
         log.debug(f"Detected {len(spring_signals)} spring patterns")
         
         # Generate trading signals
-        signals = []
-        
-        # Calculate total iterations for progress tracking
-        total_iterations = len(df) - self.range_lookback_periods
-        update_frequency = max(1, total_iterations // 100)  # Update ~100 times (every 1%)
-        
-        for i, idx in enumerate(range(self.range_lookback_periods, len(df))):
-            row = df.iloc[idx]
-            
-            signal_data = {
-                'timestamp': int(row['timestamp']),
-                'signal': 'HOLD',
-                'stop_loss': 0.0,
-                'take_profit': 0.0,
-                'accumulation_score': 0.0,
-                'wyckoff_phase': 'UNKNOWN'
-            }
-            
-            # Check for valid spring entry
-            spring = self._validate_spring_entry(
-                current=row,
-                springs=spring_signals
-            )
-            
-            if spring and spring.accumulation_score >= self.accumulation_score_minimum:
-                signal_data['signal'] = 'BUY'
-                signal_data['stop_loss'] = spring.support_level - (row['atr'] * self.atr_multiplier_sl)
-                stop_distance = row['close'] - signal_data['stop_loss']
-                signal_data['take_profit'] = row['close'] + (stop_distance * self.risk_reward_ratio)
-                signal_data['accumulation_score'] = spring.accumulation_score
-                signal_data['wyckoff_phase'] = spring.wyckoff_phase.value
+        with timed('failed_breakdown.signals', len(df)):
+            signals = self._build_signals(df, spring_signals)
             
-            signals.append(signal_data)
-            
-            # Fire progress callback periodically
-            if progress_callback and (i % update_frequency == 0 or i == total_iterations - 1):
-                progress_callback(i + 1, total_iterations, 'signal_generation')
-        
-        # Convert to DataFrame
-        signals_df = pd.DataFrame(signals)
+            total_iterations = signals.n_candles - signals.start
+            if progress_callback and total_iterations > 0:
+                progress_callback(total_iterations, total_iterations, 'signal_generation')
         
         log.info(
             f"✅ Failed Breakdown signals generated: "
-            f"{len(signals_df[signals_df['signal'] == 'BUY'])} BUY, "
-            f"{len(signals_df[signals_df['signal'] == 'SELL'])} SELL"
+            f"{signals.n_buy} BUY, "
+            f"{signals.n_sell} SELL"
         )
         
-        return signals_df
+        return signals
     
-    def _calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+    @classmethod
+    def _calculate_indicators(cls, df: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate all required indicators from OHLCV data.
         
@@ -256,15 +324,24 @@ class FailedBreakdownStrategy:
         - Support/resistance identification
         """
         # Volume indicators
-        df['volume_ma'] = df['volume'].rolling(window=20).mean()
+        df['volume_ma'] = cached_feature(
+            df, 'volume_ma', {'window': 20},
+            lambda: df['volume'].rolling(window=20).mean().to_numpy()
+        )
         df['volume_ratio'] = df['volume'] / df['volume_ma']
         
         # Price range
         df['price_range'] = (df['high'] - df['low']) / df['low']
         
         # Rolling highs and lows (for range detection)
-        df['rolling_high'] = df['high'].rolling(window=20).max()
-        df['rolling_low'] = df['low'].rolling(window=20).min()
+        df['rolling_high'] = cached_feature(
+            df, 'rolling_high', {'window': 20},
+            lambda: df['high'].rolling(window=20).max().to_numpy()
+        )
+        df['rolling_low'] = cached_feature(
+            df, 'rolling_low', {'window': 20},
+            lambda: df['low'].rolling(window=20).min().to_numpy()
+        )
         df['rolling_range'] = (df['rolling_high'] - df['rolling_low']) / df['rolling_low']
         
         return df
@@ -279,56 +356,107 @@ class FailedBreakdownStrategy:
         - Duration of 50+ periods
         - Declining volume (accumulation)
         
+        Every lookback window ending before a candle is tested with rolling
+        max/min/mean arrays; touch counts are only computed for windows
+        passing the cheap tightness and volume checks. Overlapping valid
+        windows describe the same consolidation and are merged into one
+        interval as long as the merged band stays within the tightness
+        threshold.
+        
         Returns:
-            List of PriceRange objects
+            List of merged PriceRange objects (start_idx inclusive, end_idx exclusive)
         """
-        ranges = []
         lookback = self.range_lookback_periods
+        half = lookback // 2
+        if lookback < 2 or len(df) <= lookback:
+            return []
+        
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        volume = df['volume'].to_numpy(dtype=np.float64)
+        
+        # Window [idx - lookback, idx) statistics, indexed by idx
+        window_high, window_low, _ = self._window_stats(df)
+        first_half_vol = cached_feature(
+            df, 'window_first_half_volume', {'window': lookback},
+            lambda: df['volume'].rolling(half).mean().shift(lookback - half + 1).to_numpy()
+        )
+        second_half_vol = cached_feature(
+            df, 'window_second_half_volume', {'window': lookback},
+            lambda: df['volume'].rolling(lookback - half).mean().shift(1).to_numpy()
+        )
         
-        for idx in range(lookback, len(df)):
-            window = df.iloc[idx - lookback:idx]
-            
-            # Calculate range characteristics
-            high = window['high'].max()
-            low = window['low'].min()
-            range_size = (high - low) / low
-            
-            # Check if range is tight enough
-            if range_size > self.range_tightness_threshold:
-                continue
-            
-            # Check volume declining (accumulation sign)
-            first_half_vol = window.iloc[:lookback//2]['volume'].mean()
-            second_half_vol = window.iloc[lookback//2:]['volume'].mean()
-            volume_declining = second_half_vol < first_half_vol * 0.8
-            
-            if not volume_declining:
-                continue
-            
-            # Count support/resistance touches
-            support = low * 1.005  # Support zone (within 0.5%)
-            resistance = high * 0.995  # Resistance zone (within 0.5%)
-            
-            touches_support = sum(window['low'] <= support)
-            touches_resistance = sum(window['high'] >= resistance)
-            
-            # Need multiple touches to confirm range
-            if touches_support < 3 or touches_resistance < 3:
-                continue
-            
-            # Valid range found
+        # Tight band with declining volume (accumulation sign)
+        range_size = (window_high - window_low) / window_low
+        candidates = np.flatnonzero(
+            (range_size <= self.range_tightness_threshold)
+            & (second_half_vol < first_half_vol * 0.8)
+        )
+        candidates = candidates[candidates >= lookback]
+        if len(candidates) == 0:
+            return []
+        
+        # Support/resistance touches (within 0.5%) of each candidate window
+        windows = np.lib.stride_tricks.sliding_window_view
+        low_windows = windows(low, lookback)[candidates - lookback]
+        high_windows = windows(high, lookback)[candidates - lookback]
+        touches_support = (low_windows <= (window_low[candidates] * 1.005)[:, None]).sum(axis=1)
+        touches_resistance = (high_windows >= (window_high[candidates] * 0.995)[:, None]).sum(axis=1)
+        
+        # Need multiple touches to confirm range
+        confirmed = (touches_support >= 3) & (touches_resistance >= 3)
+        valid = candidates[confirmed]
+        valid_touches = (touches_support + touches_resistance)[confirmed]
+        
+        # Merge overlapping windows into intervals
+        intervals = []
+        for idx, touches in zip(valid, valid_touches):
+            support, resistance = window_low[idx], window_high[idx]
+            if intervals:
+                ends, window_touches, merged_support, merged_resistance = intervals[-1]
+                merged_support = min(merged_support, support)
+                merged_resistance = max(merged_resistance, resistance)
+                overlaps = idx - lookback < ends[-1]
+                if overlaps and (merged_resistance - merged_support) / merged_support <= self.range_tightness_threshold:
+                    ends.append(idx)
+                    window_touches.append(touches)
+                    intervals[-1] = (ends, window_touches, merged_support, merged_resistance)
+                    continue
+            intervals.append(([idx], [touches], support, resistance))
+        
+        ranges = []
+        for ends, window_touches, support, resistance in intervals:
+            start, end = ends[0] - lookback, ends[-1]
             ranges.append(PriceRange(
-                support=low,
-                resistance=high,
-                start_idx=idx - lookback,
-                end_idx=idx,
-                volume_avg=window['volume'].mean(),
-                touches_support=touches_support,
-                touches_resistance=touches_resistance
+                support=float(support),
+                resistance=float(resistance),
+                start_idx=int(start),
+                end_idx=int(end),
+                volume_avg=float(volume[start:end].mean()),
+                touches_support=int((low[start:end] <= support * 1.005).sum()),
+                touches_resistance=int((high[start:end] >= resistance * 0.995).sum()),
+                window_ends=np.asarray(ends, dtype=np.int64),
+                window_touches=np.asarray(window_touches, dtype=np.int64)
             ))
         
         return ranges
     
+    def _window_stats(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        High, low and mean volume of the range_lookback_periods window
+        before each candle ([idx - lookback, idx), NaN until available).
+        """
+        lookback = self.range_lookback_periods
+        params = {'window': lookback}
+        return (
+            cached_feature(df, 'window_high', params,
+                           lambda: df['high'].rolling(lookback).max().shift(1).to_numpy()),
+            cached_feature(df, 'window_low', params,
+                           lambda: df['low'].rolling(lookback).min().shift(1).to_numpy()),
+            cached_feature(df, 'window_volume', params,
+                           lambda: df['volume'].rolling(lookback).mean().shift(1).to_numpy())
+        )
+    
     def _detect_springs(
         self,
         df: pd.DataFrame,
@@ -345,83 +473,120 @@ class FailedBreakdownStrategy:
         5. Optional: Order book shows hidden bids (absorption)
         6. Optional: Large trades show buyer dominance
         
+        Every window of a merged range is scanned like the per-window
+        original: each of the 50 candles from a window's end is measured
+        against that window's support (window low) and average volume
+        (window mean), and scored with that window's touches. Windows of a
+        range often share their support, so the recovery of a breakdown is
+        searched once per (candle, support). Springs recovering on the same
+        candle are one entry: the best scoring one is kept (the first in
+        window order on ties).
+        
         Returns:
             List of SpringSignal objects
         """
         springs = []
         
+        timestamp = df['timestamp'].to_numpy()
+        low = df['low'].to_numpy(dtype=np.float64)
+        close = df['close'].to_numpy(dtype=np.float64)
+        volume = df['volume'].to_numpy(dtype=np.float64)
+        orderbook_depth = (
+            df['orderbook_depth'].to_numpy(dtype=np.float64) if 'orderbook_depth' in df.columns else None
+        )
+        large_trade_ratio = (
+            df['large_trade_ratio'].to_numpy(dtype=np.float64) if 'large_trade_ratio' in df.columns else None
+        )
+        
+        _, window_low, window_volume = self._window_stats(df)
+        reach = np.arange(50)
+        
         for price_range in ranges:
-            # Look for breakdown after range
-            for idx in range(price_range.end_idx, min(price_range.end_idx + 50, len(df))):
-                row = df.iloc[idx]
-                
-                # 1. Check if price broke below support
-                breakdown_distance = (price_range.support - row['low']) / price_range.support
-                if breakdown_distance < self.breakdown_depth:
-                    continue
-                
-                # 2. Check breakdown volume is WEAK (trap/shakeout)
-                breakdown_volume_ratio = row['volume'] / price_range.volume_avg
-                if breakdown_volume_ratio > self.breakdown_volume_threshold:
-                    continue  # Too much volume = real breakdown, not spring
-                
-                # 3. Look for recovery in next few candles
-                recovery_found = False
-                recovery_idx = None
-                recovery_volume = 0.0
-                
-                for j in range(idx + 1, min(idx + self.spring_max_duration, len(df))):
-                    recovery_row = df.iloc[j]
-                    
-                    # Check if recovered above support
-                    if recovery_row['close'] > price_range.support:
-                        recovery_found = True
-                        recovery_idx = j
-                        recovery_volume = recovery_row['volume'] / price_range.volume_avg
-                        break
+            ends = price_range.window_ends
+            touches = price_range.window_touches
+            if ends is None:
+                ends = np.array([price_range.end_idx], dtype=np.int64)
+                touches = np.array([price_range.touches_support + price_range.touches_resistance])
+            
+            # (window, candle) pairs within 50 candles of each window end,
+            # window by window like the per-window scan
+            windows = np.repeat(np.arange(len(ends)), len(reach))
+            candles = (ends[:, None] + reach).ravel()
+            in_data = candles < len(df)
+            windows, candles = windows[in_data], candles[in_data]
+            support = window_low[ends][windows]
+            volume_avg = window_volume[ends][windows]
+            
+            # 1. Price broke below support, 2. with WEAK volume (trap/shakeout)
+            breakdown_distance = (support - low[candles]) / support
+            breakdown_volume = volume[candles] / volume_avg
+            breakdowns = np.flatnonzero(
+                (breakdown_distance >= self.breakdown_depth)
+                & (breakdown_volume <= self.breakdown_volume_threshold)
+            )
+            
+            # Breakdowns recovering on the same candle are one spring: keep
+            # the best scoring one
+            range_springs: Dict[int, SpringSignal] = {}
+            recoveries: Dict[Tuple[int, float], int] = {}
+            
+            for k in breakdowns:
+                idx = int(candles[k])
                 
-                if not recovery_found:
+                # 3. Look for recovery (close back above support) in next few candles
+                key = (idx, float(support[k]))
+                recovery_idx = recoveries.get(key)
+                if recovery_idx is None:
+                    above = close[idx + 1:min(idx + self.spring_max_duration, len(df))] > support[k]
+                    recovery_idx = idx + 1 + int(above.argmax()) if above.any() else -1
+                    recoveries[key] = recovery_idx
+                if recovery_idx < 0:
                     continue
+                recovery_volume = volume[recovery_idx] / volume_avg[k]
                 
                 # 4. Check recovery volume is STRONG (smart money)
                 if recovery_volume < self.recovery_volume_threshold:
                     continue
                 
                 # 5. Calculate accumulation score
+                depth = orderbook_depth[recovery_idx] if orderbook_depth is not None else None
                 accumulation_score = self._calculate_accumulation_score(
-                    price_range=price_range,
-                    breakdown_volume=breakdown_volume_ratio,
+                    range_touches=int(touches[windows[k]]),
+                    breakdown_volume=breakdown_volume[k],
                     recovery_volume=recovery_volume,
                     recovery_speed=recovery_idx - idx,
-                    current_row=df.iloc[recovery_idx]
+                    orderbook_depth=depth
                 )
                 
-                # 6. Get optional data if available
-                orderbook_absorption = df.iloc[recovery_idx].get('orderbook_depth', None)
-                large_buyer_ratio = df.iloc[recovery_idx].get('large_trade_ratio', None)
+                previous = range_springs.get(recovery_idx)
+                if previous is not None and previous.accumulation_score >= accumulation_score:
+                    continue
                 
                 # Create spring signal
-                springs.append(SpringSignal(
-                    timestamp=int(df.iloc[recovery_idx]['timestamp']),
-                    support_level=price_range.support,
-                    breakdown_depth=breakdown_distance,
-                    breakdown_volume=breakdown_volume_ratio,
-                    recovery_volume=recovery_volume,
+                range_springs[recovery_idx] = SpringSignal(
+                    timestamp=int(timestamp[recovery_idx]),
+                    support_level=float(support[k]),
+                    breakdown_depth=float(breakdown_distance[k]),
+                    breakdown_volume=float(breakdown_volume[k]),
+                    recovery_volume=float(recovery_volume),
                     accumulation_score=accumulation_score,
-                    orderbook_absorption=orderbook_absorption,
-                    large_buyer_ratio=large_buyer_ratio,
-                    wyckoff_phase=WyckoffPhase.PHASE_D  # Recovery phase
-                ))
+                    orderbook_absorption=depth,
+                    large_buyer_ratio=large_trade_ratio[recovery_idx] if large_trade_ratio is not None else None,
+                    wyckoff_phase=WyckoffPhase.PHASE_D,  # Recovery phase
+                    recovery_idx=int(recovery_idx)
+                )
+            
+            springs.extend(range_springs.values())
         
         return springs
     
     def _calculate_accumulation_score(
         self,
-        price_range: PriceRange,
+        range_touches: int,
         breakdown_volume: float,
         recovery_volume: float,
         recovery_speed: int,
-        current_row: pd.Series
+        orderbook_depth: Optional[float] = None
     ) -> float:
         """
         Calculate accumulation score (0.0 to 1.0) based on Wyckoff principles.
@@ -433,6 +598,13 @@ class FailedBreakdownStrategy:
         - Range quality (more touches = better) = 15%
         - Order book absorption (if available) = 10%
         
+        Args:
+            range_touches: Support + resistance touches of the range window
+            breakdown_volume: Breakdown volume / window average volume
+            recovery_volume: Recovery volume / window average volume
+            recovery_speed: Candles from breakdown to recovery
+            orderbook_depth: Order book depth at the recovery candle (optional)
+        
         Returns:
             Score from 0.0 to 1.0
         """
@@ -454,60 +626,75 @@ class FailedBreakdownStrategy:
         score += speed_score * 0.20
         
         # 4. Range quality (support/resistance touches)
-        range_quality = min(1.0, (price_range.touches_support + price_range.touches_resistance) / 10)
+        range_quality = min(1.0, range_touches / 10)
         score += range_quality * 0.15
         
         # 5. Order book absorption (if available)
-        if 'orderbook_depth' in current_row and pd.notna(current_row['orderbook_depth']):
-            absorption_score = min(1.0, current_row['orderbook_depth'] / self.orderbook_absorption_threshold)
+        if orderbook_depth is not None and pd.notna(orderbook_depth):
+            absorption_score = min(1.0, orderbook_depth / self.orderbook_absorption_threshold)
             score += absorption_score * 0.10
         
         return min(1.0, score)
     
-    def _validate_spring_entry(
-        self,
-        current: pd.Series,
-        springs: List[SpringSignal]
-    ) -> Optional[SpringSignal]:
+    def _build_signals(self, df: pd.DataFrame, springs: List[SpringSignal]) -> SparseSignals:
         """
-        Validate if current candle is valid entry point for spring signal.
+        Turn springs into entries for every candle after the range lookback.
         
-        Entry criteria:
-        - Spring detected in current or previous candle
+        Entry criteria (at the spring's recovery candle):
+        - Highest scoring spring recovering on this candle
         - Accumulation score >= minimum threshold
-        - Price still near support (not already run up)
+        - Price still near support (not already run up, <= 3% above)
         
         Returns:
-            SpringSignal if valid entry, None otherwise
+            SparseSignals of the BUY entries
+            (extras: accumulation_score, wyckoff_phase)
         """
-        current_timestamp = int(current['timestamp'])
-        
-        # Find spring matching current timestamp
-        matching_springs = [
-            s for s in springs
-            if s.timestamp == current_timestamp
-        ]
-        
-        if not matching_springs:
-            return None
-        
-        # Get highest scoring spring
-        best_spring = max(matching_springs, key=lambda s: s.accumulation_score)
-        
-        # Check accumulation score meets minimum
-        if best_spring.accumulation_score < self.accumulation_score_minimum:
-            return None
-        
-        # Check price hasn't run too far from support already
-        distance_from_support = (current['close'] - best_spring.support_level) / best_spring.support_level
-        if distance_from_support > 0.03:  # More than 3% above support
-            return None
-        
-        return best_spring
+        start = min(max(self.range_lookback_periods, 0), len(df))
+        index, stop_loss, take_profit = [], [], []
+        accumulation_score, wyckoff_phase = [], []
+        
+        # Highest scoring spring per recovery candle
+        best: Dict[int, SpringSignal] = {}
+        for spring in springs:
+            current = best.get(spring.recovery_idx)
+            if current is None or spring.accumulation_score > current.accumulation_score:
+                best[spring.recovery_idx] = spring
+        
+        close = df['close'].to_numpy(dtype=np.float64)
+        atr = df['atr'].to_numpy(dtype=np.float64)
+        
+        for idx in sorted(best):
+            spring = best[idx]
+            if idx < start or spring.accumulation_score < self.accumulation_score_minimum:
+                continue
+            
+            # Check price hasn't run too far from support already
+            distance_from_support = (close[idx] - spring.support_level) / spring.support_level
+            if distance_from_support > 0.03:  # More than 3% above support
+                continue
+            
+            stop = spring.support_level - (atr[idx] * self.atr_multiplier_sl)
+            index.append(idx)
+            stop_loss.append(stop)
+            take_profit.append(close[idx] + ((close[idx] - stop) * self.risk_reward_ratio))
+            accumulation_score.append(spring.accumulation_score)
+            wyckoff_phase.append(spring.wyckoff_phase.value)
+        
+        return SparseSignals.from_entries(
+            n_candles=len(df),
+            start=start,
+            index=index,
+            side=np.full(len(index), SIGNAL_BUY),
+            stop_loss=stop_loss,
+            take_profit=take_profit,
+            accumulation_score=np.asarray(accumulation_score, dtype=np.float64),
+            wyckoff_phase=np.asarray(wyckoff_phase, dtype=object)
+        )
     
-    def get_parameter_space(self) -> Dict[str, Any]:
+    @classmethod
+    def get_parameter_space(cls) -> Dict[str, Any]:
         """
-        Get parameter search space for optimization.
+        Get parameter search space for optimization (no instance needed).
         
         Returns:
             Dict with parameter ranges suitable for optimizers
@@ -533,3 +720,189 @@ class FailedBreakdownStrategy:
             'risk_reward_ratio': (1.5, 4.0),                  # 1.5:1 to 4:1 (wider range)
             'max_holding_periods': [25, 40, 60, 80]           # Discrete (wider range)
         }
+
+
+class _StreamRange:
+    """Merged consolidation range tracked by FailedBreakdownStream."""
+    
+    def __init__(self, end: int, support: float, resistance: float, volume_avg: float, touches: int):
+        self.ends = [end]
+        self.supports = [support]        # Window low per end
+        self.volume_avgs = [volume_avg]  # Window mean volume per end
+        self.touches = [touches]         # Window support + resistance touches per end
+        self.support = support           # Merged band
+        self.resistance = resistance
+    
+    def extend(self, end: int, support: float, resistance: float, volume_avg: float, touches: int,
+               merged_support: float, merged_resistance: float):
+        self.ends.append(end)
+        self.supports.append(support)
+        self.volume_avgs.append(volume_avg)
+        self.touches.append(touches)
+        self.support = merged_support
+        self.resistance = merged_resistance
+
+
+class FailedBreakdownStream:
+    """
+    Rolling state behind FailedBreakdownStrategy.on_candle().
+    
+    Keeps the last range_lookback_periods candles to test the window ending
+    at each new candle, merges valid windows into ranges like
+    _identify_ranges, and keeps the last spring_max_duration candles to
+    find breakdowns recovering on the newest candle. Ranges are dropped
+    once no breakdown inside their 50-candle reach can still recover.
+    """
+    
+    def __init__(self, strategy: 'FailedBreakdownStrategy'):
+        self.strategy = strategy
+        self.index = 0
+        self.lookback = strategy.range_lookback_periods
+        
+        window = max(self.lookback, 0)
+        self.window_low = deque(maxlen=window)
+        self.window_high = deque(maxlen=window)
+        self.window_volume = deque(maxlen=window)
+        
+        # (low, close, volume) of the candles a breakdown may start on
+        self.recent = deque(maxlen=max(strategy.spring_max_duration - 1, 1))
+        self.ranges: List[_StreamRange] = []
+    
+    def update(self, candle: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        """Advance by one candle; signal row once past range_lookback_periods."""
+        strategy = self.strategy
+        t = self.index
+        self.index += 1
+        
+        low = candle_value(candle, 'low')
+        high = candle_value(candle, 'high')
+        close = candle_value(candle, 'close')
+        volume = candle_value(candle, 'volume')
+        atr = candle_value(candle, 'atr')
+        
+        # Window [t - lookback, t) ending at this candle
+        if self.lookback >= 2 and t >= self.lookback:
+            self._add_window(t)
+        
+        # Ranges no breakdown recovering from now on can belong to
+        earliest = t - strategy.spring_max_duration + 1
+        self.ranges = [r for r in self.ranges[:-1] if r.ends[-1] + 49 >= earliest] + self.ranges[-1:]
+        
+        best = self._best_spring(t, close, volume, candle_value(candle, 'orderbook_depth'))
+        
+        self.window_low.append(low)
+        self.window_high.append(high)
+        self.window_volume.append(volume)
+        self.recent.append((low, close, volume))
+        
+        if t < max(self.lookback, 0):
+            return None
+        
+        row = {'timestamp': int(candle['timestamp']), 'signal': 'HOLD', 'stop_loss': 0.0,
+               'take_profit': 0.0, 'accumulation_score': 0.0,
+               'wyckoff_phase': WyckoffPhase.UNKNOWN.value}
+        
+        if best is not None:
+            score, support = best
+            # Minimum score, and price not already run up (> 3% above support)
+            if score >= strategy.accumulation_score_minimum and (close - support) / support <= 0.03:
+                stop_loss = support - (atr * strategy.atr_multiplier_sl)
+                row.update(
+                    signal='BUY',
+                    stop_loss=stop_loss,
+                    take_profit=close + ((close - stop_loss) * strategy.risk_reward_ratio),
+                    accumulation_score=score,
+                    wyckoff_phase=WyckoffPhase.PHASE_D.value
+                )
+        return row
+    
+    def _add_window(self, t: int):
+        """Test the lookback window ending at t and merge it (see _identify_ranges)."""
+        strategy = self.strategy
+        lookback = self.lookback
+        half = lookback // 2
+        
+        lows = np.asarray(self.window_low)
+        highs = np.asarray(self.window_high)
+        volumes = list(self.window_volume)
+        support, resistance = float(lows.min()), float(highs.max())
+        
+        if not (resistance - support) / support <= strategy.range_tightness_threshold:
+            return
+        first_half_vol = math.fsum(volumes[:half]) / half
+        second_half_vol = math.fsum(volumes[half:]) / (lookback - half)
+        if not second_half_vol < first_half_vol * 0.8:
+            return
+        touches_support = int((lows <= support * 1.005).sum())
+        touches_resistance = int((highs >= resistance * 0.995).sum())
+        if touches_support < 3 or touches_resistance < 3:
+            return
+        volume_avg = math.fsum(volumes) / lookback
+        touches = touches_support + touches_resistance
+        
+        if self.ranges:
+            last = self.ranges[-1]
+            merged_support = min(last.support, support)
+            merged_resistance = max(last.resistance, resistance)
+            overlaps = t - lookback < last.ends[-1]
+            if overlaps and (merged_resistance - merged_support) / merged_support <= strategy.range_tightness_threshold:
+                last.extend(t, support, resistance, volume_avg, touches, merged_support, merged_resistance)
+                return
+        
+        self.ranges.append(_StreamRange(t, support, resistance, volume_avg, touches))
+    
+    def _best_spring(
+        self,
+        t: int,
+        close: float,
+        volume: float,
+        orderbook_depth: float
+    ) -> Optional[Tuple[float, float]]:
+        """(accumulation score, support) of the best spring recovering at t."""
+        strategy = self.strategy
+        offset = t - len(self.recent)  # Candle index of self.recent[0]
+        first = t - strategy.spring_max_duration + 1  # Earliest breakdown recovering at t
+        best = None
+        
+        for price_range in self.ranges:
+            ends = price_range.ends
+            
+            # Every window whose 50-candle reach holds a possible breakdown,
+            # in window order like _detect_springs
+            for k in range(bisect.bisect_left(ends, first - 49), len(ends)):
+                end = ends[k]
+                if end > t - 1:
+                    break
+                support = price_range.supports[k]
+                volume_avg = price_range.volume_avgs[k]
+                
+                # This candle must close back above the window's support
+                if not close > support:
+                    continue
+                recovery_volume = volume / volume_avg
+                if recovery_volume < strategy.recovery_volume_threshold:
+                    continue
+                
+                for idx in range(max(first, end), min(t - 1, end + 49) + 1):
+                    low_i, _, volume_i = self.recent[idx - offset]
+                    breakdown_distance = (support - low_i) / support
+                    breakdown_volume = volume_i / volume_avg
+                    if not (breakdown_distance >= strategy.breakdown_depth
+                            and breakdown_volume <= strategy.breakdown_volume_threshold):
+                        continue
+                    
+                    # ... and be the first close above it since the breakdown
+                    if any(self.recent[j - offset][1] > support for j in range(idx + 1, t)):
+                        continue
+                    
+                    score = strategy._calculate_accumulation_score(
+                        range_touches=price_range.touches[k],
+                        breakdown_volume=breakdown_volume,
+                        recovery_volume=recovery_volume,
+                        recovery_speed=t - idx,
+                        orderbook_depth=None if math.isnan(orderbook_depth) else orderbook_depth
+                    )
+                    if best is None or score > best[0]:
+                        best = (score, support)
+        
+        return best
@@ -0,0 +1,54 @@
+"""
+Support/Resistance Level Helpers
+
+Shared by the training strategies that derive key levels from swing
+points. Prices are clustered in one pass over the sorted array: each
+cluster keeps a running sum and count, so its mean is O(1) per price and
+the whole routine is O(n log n) (dominated by the sort).
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+def cluster_prices(prices: np.ndarray, min_distance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cluster prices within min_distance of the running cluster mean into levels.
+
+    Prices are visited in ascending order; a price joins the current
+    cluster while abs(price - mean) / mean <= min_distance, otherwise it
+    starts a new cluster.
+
+    Args:
+        prices: Swing prices (any order)
+        min_distance: Maximum relative distance from the cluster mean (0.005 = 0.5%)
+
+    Returns:
+        (level_prices, touch_counts) arrays, one entry per cluster in ascending price order
+    """
+    prices_sorted = np.sort(np.asarray(prices, dtype=np.float64))
+    if len(prices_sorted) == 0:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64)
+
+    # Cluster boundaries (index of each cluster's first price)
+    starts = [0]
+    values = prices_sorted.tolist()
+    total = values[0]
+    count = 1
+
+    for i in range(1, len(values)):
+        price = values[i]
+        mean = total / count
+        if abs(price - mean) / mean <= min_distance:
+            total += price
+            count += 1
+        else:
+            starts.append(i)
+            total = price
+            count = 1
+
+    starts = np.asarray(starts, dtype=np.int64)
+    counts = np.diff(np.append(starts, len(prices_sorted)))
+    level_prices = np.add.reduceat(prices_sorted, starts) / counts
+
+    return level_prices, counts
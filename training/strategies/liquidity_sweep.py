@@ -17,12 +17,22 @@ Exit Logic:
 - Max holding: max_holding_periods candles
 """
 
+import bisect
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional, Callable
+from collections import deque
+from typing import Dict, Any, List, Mapping, Optional, Callable
 from dataclasses import dataclass
 import logging
 
+from ..telemetry import timed
+from ..feature_cache import attach_fingerprint, cached_feature
+from ..trade_simulator import SIGNAL_BUY, SIGNAL_SELL
+from .levels import cluster_prices
+from .context import StrategyContext
+from .signals import SparseSignals
+from .streaming import RollingWindow, RunningMedian, candle_value
+
 log = logging.getLogger(__name__)
 
 
@@ -88,6 +98,9 @@ class LiquiditySweepStrategy:
         self.key_level_lookback = params.get('key_level_lookback', 100)
         self.min_level_touches = params.get('min_level_touches', 3)
         
+        # Incremental state for on_candle()
+        self._stream: Optional['LiquiditySweepStream'] = None
+        
         log.debug(f"LiquiditySweepStrategy initialized: {self.params}")
     
     def generate_signals(
@@ -113,110 +126,151 @@ class LiquiditySweepStrategy:
                 - 'SELL': Short entry  
                 - 'HOLD': No action
         """
-        import time
-        signal_gen_start = time.time()
-        
         log.info(f"Generating signals: {len(data)} candles")
+        return self.evaluate(self.prepare(data), progress_callback=progress_callback)
+    
+    def on_candle(self, candle: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Incremental signal for the newest closed candle (live trading).
+        
+        State is kept between calls, so a candle costs O(log n) apart from
+        re-clustering key levels when a new swing point is confirmed, which
+        is O(swings so far). The state grows with the stream (see
+        LiquiditySweepStream). The returned row equals the last row of
+        generate_signals() on all candles streamed so far.
         
+        Args:
+            candle: Mapping with timestamp, open, high, low, close, volume, atr
+        
+        Returns:
+            Dict with timestamp, signal, stop_loss, take_profit, or None while
+            warming up (first key_level_lookback candles)
+        """
+        if self._stream is None:
+            self._stream = LiquiditySweepStream(self)
+        return self._stream.update(candle)
+    
+    def reset_stream(self):
+        """Discard the on_candle() state (e.g. after a gap in the candle feed)."""
+        self._stream = None
+    
+    @classmethod
+    def prepare(cls, data: pd.DataFrame) -> StrategyContext:
+        """
+        Parameter-independent stage: swing highs/lows and volume average.
+        
+        Args:
+            data: DataFrame with columns: timestamp, open, high, low, close, volume, atr
+        
+        Returns:
+            StrategyContext shared by evaluate() calls with any parameters
+        """
         df = data.copy()
+        fingerprint = attach_fingerprint(df)
         
-        # Step 1: Identify key levels
-        level_start = time.time()
-        key_levels = self._identify_key_levels(df)
-        level_time = time.time() - level_start
-        log.debug(f"Found {len(key_levels)} key levels in {level_time:.2f}s")
+        with timed('liquidity_sweep.prepare', len(df)):
+            cls._find_swings(df)
+            df['volume_ma'] = cached_feature(
+                df, 'volume_ma', {'window': 20},
+                lambda: df['volume'].rolling(window=20).mean().to_numpy()
+            )
         
-        # Step 2: Calculate volume average
-        volume_start = time.time()
-        df['volume_ma'] = df['volume'].rolling(window=20).mean()
-        volume_time = time.time() - volume_start
-        log.debug(f"Volume MA calculation took {volume_time:.3f}s")
+        return StrategyContext(df, fingerprint)
+    
+    def evaluate(
+        self,
+        context: StrategyContext,
+        progress_callback: Optional[Callable] = None
+    ) -> pd.DataFrame:
+        """
+        Parameter-dependent stage as a signals DataFrame (see generate_signals).
         
-        # Step 3: Detect liquidity sweeps
-        sweep_start = time.time()
-        signals = []
+        Args:
+            context: Output of prepare()
+            progress_callback: Optional callback(current, total, stage)
         
-        # Pre-calculate price ranges for faster level filtering
-        price_tolerance = df['atr'].median() * 3  # Only check levels within 3 ATR
+        Returns:
+            Signals DataFrame (see generate_signals)
+        """
+        return self.evaluate_sparse(context, progress_callback).to_frame(context.df['timestamp'].to_numpy())
+    
+    def evaluate_sparse(
+        self,
+        context: StrategyContext,
+        progress_callback: Optional[Callable] = None
+    ) -> SparseSignals:
+        """
+        Parameter-dependent stage: key levels and sweep detection.
         
-        # Calculate total iterations for progress
-        total_iterations = len(df) - self.key_level_lookback
-        update_frequency = max(1, total_iterations // 100)  # Update ~100 times (every 1%)
+        Key levels depend only on min_distance_from_level and
+        min_level_touches and are memoized on the context under them.
         
-        for i, idx in enumerate(range(self.key_level_lookback, len(df))):
-            row = df.iloc[idx]
-            prev_rows = df.iloc[max(0, idx - 10):idx]
-            
-            signal_data = {
-                'timestamp': int(row['timestamp']),
-                'signal': 'HOLD',
-                'stop_loss': 0.0,
-                'take_profit': 0.0
-            }
-            
-            # Filter key levels to only those near current price (optimization)
-            price_min = row['close'] - price_tolerance
-            price_max = row['close'] + price_tolerance
-            relevant_levels = [lvl for lvl in key_levels if price_min <= lvl.price <= price_max]
-            
-            # Check for liquidity sweep at each relevant key level
-            for level in relevant_levels:
-                # LONG setup: Pierce below support, then reverse up
-                if level.type == 'SUPPORT':
-                    sweep = self._detect_long_sweep(
-                        current=row,
-                        previous=prev_rows,
-                        level=level
-                    )
-                    
-                    if sweep:
-                        signal_data['signal'] = 'BUY'
-                        signal_data['stop_loss'] = row['close'] - (row['atr'] * self.atr_multiplier_sl)
-                        signal_data['take_profit'] = row['close'] + (
-                            row['atr'] * self.atr_multiplier_sl * self.risk_reward_ratio
-                        )
-                        break
-                
-                # SHORT setup: Pierce above resistance, then reverse down
-                elif level.type == 'RESISTANCE':
-                    sweep = self._detect_short_sweep(
-                        current=row,
-                        previous=prev_rows,
-                        level=level
-                    )
-                    
-                    if sweep:
-                        signal_data['signal'] = 'SELL'
-                        signal_data['stop_loss'] = row['close'] + (row['atr'] * self.atr_multiplier_sl)
-                        signal_data['take_profit'] = row['close'] - (
-                            row['atr'] * self.atr_multiplier_sl * self.risk_reward_ratio
-                        )
-                        break
-            
-            signals.append(signal_data)
-            
-            # Fire progress callback periodically
-            if progress_callback and (i % update_frequency == 0 or i == total_iterations - 1):
-                progress_callback(i + 1, total_iterations, 'signal_generation')
+        Args:
+            context: Output of prepare()
+            progress_callback: Optional callback(current, total, stage)
         
-        sweep_time = time.time() - sweep_start
+        Returns:
+            SparseSignals with the sweep entries
+        """
+        import time
+        signal_gen_start = time.time()
+        
+        df = context.df
+        
+        # In-progress update first: the job tracker only counts an
+        # episode's completion after it has seen it in flight
+        if progress_callback and len(df) > 0:
+            progress_callback(0, len(df), 'signal_generation')
+        
+        # Step 1: Identify key levels
+        with timed('liquidity_sweep.levels', len(df)) as level_phase:
+            key_levels = context.memo(
+                'key_levels',
+                (self.min_distance_from_level, self.min_level_touches),
+                lambda: self._identify_key_levels(df)
+            )
+        level_time = level_phase.seconds
+        log.debug(f"Found {len(key_levels)} key levels in {level_time:.2f}s")
+        
+        # Step 2: Detect liquidity sweeps
+        with timed('liquidity_sweep.sweep', len(df)) as sweep_phase:
+            signals = self._detect_sweeps(df, key_levels)
+            
+            total_iterations = signals.n_candles - signals.start
+            if progress_callback and total_iterations > 0:
+                progress_callback(total_iterations, total_iterations, 'signal_generation')
         
-        # Convert to DataFrame
-        signals_df = pd.DataFrame(signals)
+        sweep_time = sweep_phase.seconds
         
-        total_time = time.time() - signal_gen_start
+        total_time = max(time.time() - signal_gen_start, 1e-9)
         
         log.info(
             f"✅ Signals generated: "
-            f"{len(signals_df[signals_df['signal'] == 'BUY'])} BUY, "
-            f"{len(signals_df[signals_df['signal'] == 'SELL'])} SELL, "
+            f"{signals.n_buy} BUY, "
+            f"{signals.n_sell} SELL, "
             f"Total: {total_time:.2f}s "
             f"(levels: {level_time/total_time*100:.1f}%, "
-            f"volume: {volume_time/total_time*100:.1f}%, "
             f"sweep_detection: {sweep_time/total_time*100:.1f}%)"
         )
         
-        return signals_df
+        return signals
+    
+    @staticmethod
+    def _find_swings(df: pd.DataFrame):
+        """Add swing_high / swing_low columns (2 candles on each side)."""
+        df['swing_high'] = cached_feature(df, 'swing_high', {'order': 2}, lambda: (
+            (df['high'] > df['high'].shift(1)) &
+            (df['high'] > df['high'].shift(2)) &
+            (df['high'] > df['high'].shift(-1)) &
+            (df['high'] > df['high'].shift(-2))
+        ).to_numpy())
+        
+        df['swing_low'] = cached_feature(df, 'swing_low', {'order': 2}, lambda: (
+            (df['low'] < df['low'].shift(1)) &
+            (df['low'] < df['low'].shift(2)) &
+            (df['low'] < df['low'].shift(-1)) &
+            (df['low'] < df['low'].shift(-2))
+        ).to_numpy())
     
     def _identify_key_levels(self, df: pd.DataFrame) -> List[KeyLevel]:
         """
@@ -228,22 +282,10 @@ class LiquiditySweepStrategy:
             List of KeyLevel objects
         """
         levels = []
-        lookback = self.key_level_lookback
         
-        # Find swing highs and lows
-        df['swing_high'] = (
-            (df['high'] > df['high'].shift(1)) &
-            (df['high'] > df['high'].shift(2)) &
-            (df['high'] > df['high'].shift(-1)) &
-            (df['high'] > df['high'].shift(-2))
-        )
-        
-        df['swing_low'] = (
-            (df['low'] < df['low'].shift(1)) &
-            (df['low'] < df['low'].shift(2)) &
-            (df['low'] < df['low'].shift(-1)) &
-            (df['low'] < df['low'].shift(-2))
-        )
+        # Find swing highs and lows (already present on a prepared frame)
+        if 'swing_high' not in df.columns or 'swing_low' not in df.columns:
+            self._find_swings(df)
         
         # Get swing prices
         swing_highs = df[df['swing_high']]['high'].values
@@ -251,171 +293,147 @@ class LiquiditySweepStrategy:
         
         # Cluster swing points into levels (within min_distance)
         # Resistance levels (from swing highs)
-        resistance_clusters = self._cluster_prices(swing_highs)
-        for price, count in resistance_clusters:
+        prices, counts = cluster_prices(swing_highs, self.min_distance_from_level)
+        for price, count in zip(prices, counts):
             if count >= self.min_level_touches:
                 levels.append(KeyLevel(
-                    price=price,
-                    strength=count,
+                    price=float(price),
+                    strength=int(count),
                     type='RESISTANCE'
                 ))
         
         # Support levels (from swing lows)
-        support_clusters = self._cluster_prices(swing_lows)
-        for price, count in support_clusters:
+        prices, counts = cluster_prices(swing_lows, self.min_distance_from_level)
+        for price, count in zip(prices, counts):
             if count >= self.min_level_touches:
                 levels.append(KeyLevel(
-                    price=price,
-                    strength=count,
+                    price=float(price),
+                    strength=int(count),
                     type='SUPPORT'
                 ))
         
         return levels
     
-    def _cluster_prices(self, prices: np.ndarray) -> List[tuple]:
+    def _detect_sweeps(self, df: pd.DataFrame, key_levels: List[KeyLevel]) -> SparseSignals:
         """
-        Cluster prices within min_distance into levels.
+        Detect liquidity sweeps at key levels for every candle after the lookback.
         
-        Returns:
-            List of (cluster_price, count) tuples
-        """
-        if len(prices) == 0:
-            return []
-        
-        prices_sorted = np.sort(prices)
-        clusters = []
-        current_cluster = [prices_sorted[0]]
-        
-        for price in prices_sorted[1:]:
-            # If within min_distance, add to current cluster
-            if abs(price - np.mean(current_cluster)) / np.mean(current_cluster) <= self.min_distance_from_level:
-                current_cluster.append(price)
-            else:
-                # Save current cluster, start new one
-                clusters.append((np.mean(current_cluster), len(current_cluster)))
-                current_cluster = [price]
-        
-        # Add last cluster
-        if current_cluster:
-            clusters.append((np.mean(current_cluster), len(current_cluster)))
-        
-        return clusters
-    
-    def _detect_long_sweep(
-        self,
-        current: pd.Series,
-        previous: pd.DataFrame,
-        level: KeyLevel
-    ) -> bool:
-        """
-        Detect LONG liquidity sweep setup.
+        Candle-wise conditions (pierce extreme, volume spike, reversal
+        count over the preceding candles) are computed once as rolling
+        masks. Levels within 3 ATR (median) of the close are then searched
+        in sorted level arrays:
         
-        Conditions:
-        1. Previous candle(s) pierced below support
-        2. Volume spike during pierce
-        3. Current candle(s) show reversal back above support
-        4. Reversal candles meet minimum count requirement
+        - SHORT: some resistance R in the band with close < R and
+          R + R*pierce_depth <= recent high. Valid R form a range starting
+          at the first level above the close, so only that level is checked.
+        - LONG: some support S in the band with S < close and
+          S - S*pierce_depth >= recent low. The first support satisfying
+          both lower bounds is checked against the close.
+        
+        Resistances are checked before supports, so SELL wins if both
+        sides sweep on the same candle.
         
         Returns:
-            True if valid long sweep detected
+            SparseSignals of the sweep entries
         """
-        # 1. Check if recent candles pierced below level
-        pierce_distance = level.price * self.pierce_depth
-        pierced_recently = any(
-            row['low'] <= (level.price - pierce_distance)
-            for _, row in previous.tail(self.reversal_candles + 1).iterrows()
-        )
-        
-        if not pierced_recently:
-            return False
-        
-        # 2. Check volume spike during pierce
-        volume_spiked = any(
-            row['volume'] >= (row.get('volume_ma', row['volume']) * self.volume_spike_threshold)
-            for _, row in previous.tail(self.reversal_candles + 1).iterrows()
-        )
+        start = min(max(self.key_level_lookback, 0), len(df))
         
-        if not volume_spiked:
-            return False
+        close = df['close'].to_numpy(dtype=np.float64)
+        open_ = df['open'].to_numpy(dtype=np.float64)
+        atr = df['atr'].to_numpy(dtype=np.float64)
         
-        # 3. Check reversal: current close above level
-        if current['close'] <= level.price:
-            return False
+        # Pierce / volume windows: the last reversal_candles + 1 candles
+        # before the current one (at most 10); reversal window: the last
+        # reversal_candles before it plus the current candle
+        pierce_window = max(min(self.reversal_candles + 1, 10), 1)
+        reversal_window = min(self.reversal_candles, 10)
         
-        # 4. Check reversal strength: bullish candle(s)
-        reversal_count = 0
-        for _, row in previous.tail(self.reversal_candles).iterrows():
-            if row['close'] > row['open']:  # Bullish candle
-                reversal_count += 1
-        
-        # Add current candle
-        if current['close'] > current['open']:
-            reversal_count += 1
-        
-        if reversal_count < self.reversal_candles:
-            return False
-        
-        return True
-    
-    def _detect_short_sweep(
-        self,
-        current: pd.Series,
-        previous: pd.DataFrame,
-        level: KeyLevel
-    ) -> bool:
-        """
-        Detect SHORT liquidity sweep setup.
-        
-        Conditions:
-        1. Previous candle(s) pierced above resistance
-        2. Volume spike during pierce
-        3. Current candle(s) show reversal back below resistance
-        4. Reversal candles meet minimum count requirement
-        
-        Returns:
-            True if valid short sweep detected
-        """
-        # 1. Check if recent candles pierced above level
-        pierce_distance = level.price * self.pierce_depth
-        pierced_recently = any(
-            row['high'] >= (level.price + pierce_distance)
-            for _, row in previous.tail(self.reversal_candles + 1).iterrows()
+        recent_low = cached_feature(
+            df, 'previous_low', {'window': pierce_window},
+            lambda: df['low'].rolling(pierce_window, min_periods=1).min().shift(1).to_numpy()
         )
-        
-        if not pierced_recently:
-            return False
-        
-        # 2. Check volume spike during pierce
-        volume_spiked = any(
-            row['volume'] >= (row.get('volume_ma', row['volume']) * self.volume_spike_threshold)
-            for _, row in previous.tail(self.reversal_candles + 1).iterrows()
+        recent_high = cached_feature(
+            df, 'previous_high', {'window': pierce_window},
+            lambda: df['high'].rolling(pierce_window, min_periods=1).max().shift(1).to_numpy()
+        )
+        spike = (df['volume'] >= df['volume_ma'] * self.volume_spike_threshold).astype(np.float64)
+        volume_spiked = spike.rolling(pierce_window, min_periods=1).max().shift(1).to_numpy() > 0
+        
+        bullish = close > open_
+        bearish = close < open_
+        if reversal_window > 0:
+            bullish_count = pd.Series(bullish.astype(np.int64)).rolling(
+                reversal_window, min_periods=1
+            ).sum().shift(1).fillna(0).to_numpy() + bullish
+            bearish_count = pd.Series(bearish.astype(np.int64)).rolling(
+                reversal_window, min_periods=1
+            ).sum().shift(1).fillna(0).to_numpy() + bearish
+        else:
+            bullish_count = bullish.astype(np.int64)
+            bearish_count = bearish.astype(np.int64)
+        
+        # Only levels within 3 ATR of the close are relevant
+        price_tolerance = df['atr'].median() * 3
+        price_min = close - price_tolerance
+        price_max = close + price_tolerance
+        
+        candles = np.arange(start, len(df))
+        
+        # SHORT: pierce above resistance, then close back below it
+        resistance = np.sort([lvl.price for lvl in key_levels if lvl.type == 'RESISTANCE']).astype(np.float64)
+        short = np.zeros(len(candles), dtype=bool)
+        if len(resistance) > 0:
+            pierce_above = resistance + resistance * self.pierce_depth
+            k = np.searchsorted(resistance, close[candles], side='right')
+            has_level = k < len(resistance)
+            k = np.minimum(k, len(resistance) - 1)
+            short = (
+                has_level
+                & (resistance[k] <= price_max[candles])
+                & (pierce_above[k] <= recent_high[candles])
+                & volume_spiked[candles]
+                & (bearish_count[candles] >= self.reversal_candles)
+            )
+        
+        # LONG: pierce below support, then close back above it
+        support = np.sort([lvl.price for lvl in key_levels if lvl.type == 'SUPPORT']).astype(np.float64)
+        long = np.zeros(len(candles), dtype=bool)
+        if len(support) > 0:
+            pierce_below = support - support * self.pierce_depth
+            k = np.maximum(
+                np.searchsorted(support, price_min[candles], side='left'),
+                np.searchsorted(pierce_below, recent_low[candles], side='left')
+            )
+            has_level = k < len(support)
+            k = np.minimum(k, len(support) - 1)
+            long = (
+                has_level
+                & (support[k] < close[candles])
+                & (support[k] <= price_max[candles])
+                & volume_spiked[candles]
+                & (bullish_count[candles] >= self.reversal_candles)
+            ) & ~short
+        
+        # Only entry candles get stop/target levels
+        entries = np.flatnonzero(short | long)
+        index = candles[entries]
+        side = np.where(short[entries], SIGNAL_SELL, SIGNAL_BUY)
+        stop_distance = atr[index] * self.atr_multiplier_sl
+        target_distance = stop_distance * self.risk_reward_ratio
+        
+        return SparseSignals.from_entries(
+            n_candles=len(df),
+            start=start,
+            index=index,
+            side=side,
+            stop_loss=close[index] - side * stop_distance,
+            take_profit=close[index] + side * target_distance
         )
-        
-        if not volume_spiked:
-            return False
-        
-        # 3. Check reversal: current close below level
-        if current['close'] >= level.price:
-            return False
-        
-        # 4. Check reversal strength: bearish candle(s)
-        reversal_count = 0
-        for _, row in previous.tail(self.reversal_candles).iterrows():
-            if row['close'] < row['open']:  # Bearish candle
-                reversal_count += 1
-        
-        # Add current candle
-        if current['close'] < current['open']:
-            reversal_count += 1
-        
-        if reversal_count < self.reversal_candles:
-            return False
-        
-        return True
     
-    def get_parameter_space(self) -> Dict[str, Any]:
+    @classmethod
+    def get_parameter_space(cls) -> Dict[str, Any]:
         """
-        Get parameter search space for optimization.
+        Get parameter search space for optimization (no instance needed).
         
         Returns:
             Dict with parameter ranges suitable for optimizers
@@ -431,3 +449,150 @@ class LiquiditySweepStrategy:
             'key_level_lookback': [50, 100, 150, 200], # Discrete
             'min_level_touches': [2, 3, 4, 5]         # Discrete
         }
+
+
+class LiquiditySweepStream:
+    """
+    Rolling state behind LiquiditySweepStrategy.on_candle().
+    
+    Swing points are confirmed two candles late (like the batch shift(-2)
+    checks) and kept sorted; key levels are re-clustered only when a new
+    swing arrives. The volume MA, previous-window extremes and spike /
+    reversal counts are fixed-size rolling windows.
+    
+    The state is not bounded: like the batch version, key levels come from
+    every swing point and the price tolerance from the median ATR of the
+    whole history. So swing_highs / swing_lows and the ATR RunningMedian
+    grow linearly with the number of candles streamed, and each new swing
+    re-clusters all swings of its side. Dropping old history would break
+    parity with generate_signals(); long-running processes that accept
+    that can cap memory with reset_stream() and a replay of a recent window.
+    """
+    
+    def __init__(self, strategy: 'LiquiditySweepStrategy'):
+        self.strategy = strategy
+        self.index = 0
+        
+        pierce_window = max(min(strategy.reversal_candles + 1, 10), 1)
+        reversal_window = min(strategy.reversal_candles, 10)
+        
+        self.highs = deque(maxlen=5)
+        self.lows = deque(maxlen=5)
+        self.swing_highs: List[float] = []
+        self.swing_lows: List[float] = []
+        self.levels_dirty = True
+        self.resistance = np.empty(0)
+        self.support = np.empty(0)
+        
+        self.volume = RollingWindow(20)
+        self.previous_high = RollingWindow(pierce_window)
+        self.previous_low = RollingWindow(pierce_window)
+        self.previous_spike = RollingWindow(pierce_window)
+        self.previous_bullish = RollingWindow(max(reversal_window, 0))
+        self.previous_bearish = RollingWindow(max(reversal_window, 0))
+        self.atr_median = RunningMedian()
+    
+    def update(self, candle: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        """Advance by one candle; signal row once past key_level_lookback."""
+        strategy = self.strategy
+        t = self.index
+        self.index += 1
+        
+        open_ = candle_value(candle, 'open')
+        high = candle_value(candle, 'high')
+        low = candle_value(candle, 'low')
+        close = candle_value(candle, 'close')
+        atr = candle_value(candle, 'atr')
+        
+        # Swing point two candles back is now confirmed (2 candles each side)
+        self.highs.append(high)
+        self.lows.append(low)
+        if len(self.highs) == 5:
+            h, l = self.highs, self.lows
+            if h[2] > h[1] and h[2] > h[0] and h[2] > h[3] and h[2] > h[4]:
+                bisect.insort(self.swing_highs, h[2])
+                self.levels_dirty = True
+            if l[2] < l[1] and l[2] < l[0] and l[2] < l[3] and l[2] < l[4]:
+                bisect.insort(self.swing_lows, l[2])
+                self.levels_dirty = True
+        
+        self.volume.append(candle_value(candle, 'volume'))
+        spike = candle_value(candle, 'volume') >= self.volume.mean() * strategy.volume_spike_threshold
+        bullish = close > open_
+        bearish = close < open_
+        self.atr_median.add(atr)
+        
+        # Previous-candle windows (before adding the current candle)
+        recent_high = self.previous_high.max()
+        recent_low = self.previous_low.min()
+        volume_spiked = self.previous_spike.max() > 0
+        bullish_count = self.previous_bullish.sum() + bullish
+        bearish_count = self.previous_bearish.sum() + bearish
+        
+        self.previous_high.append(high)
+        self.previous_low.append(low)
+        self.previous_spike.append(float(spike))
+        self.previous_bullish.append(int(bullish))
+        self.previous_bearish.append(int(bearish))
+        
+        if t < max(strategy.key_level_lookback, 0):
+            return None
+        
+        if self.levels_dirty:
+            self._update_levels()
+        
+        price_tolerance = self.atr_median.median() * 3
+        price_min = close - price_tolerance
+        price_max = close + price_tolerance
+        
+        # SHORT: first resistance above the close (see _detect_sweeps)
+        short = False
+        resistance = self.resistance
+        if len(resistance) > 0:
+            k = int(np.searchsorted(resistance, close, side='right'))
+            if k < len(resistance):
+                level = resistance[k]
+                short = bool(
+                    level <= price_max
+                    and level + level * strategy.pierce_depth <= recent_high
+                    and volume_spiked
+                    and bearish_count >= strategy.reversal_candles
+                )
+        
+        # LONG: first support past both lower bounds, below the close
+        long = False
+        support = self.support
+        if len(support) > 0 and not short:
+            k = max(
+                int(np.searchsorted(support, price_min, side='left')),
+                int(np.searchsorted(support - support * strategy.pierce_depth, recent_low, side='left'))
+            )
+            if k < len(support):
+                level = support[k]
+                long = bool(
+                    level < close
+                    and level <= price_max
+                    and volume_spiked
+                    and bullish_count >= strategy.reversal_candles
+                )
+        
+        stop_distance = atr * strategy.atr_multiplier_sl
+        target_distance = stop_distance * strategy.risk_reward_ratio
+        
+        if short:
+            return {'timestamp': int(candle['timestamp']), 'signal': 'SELL',
+                    'stop_loss': close + stop_distance, 'take_profit': close - target_distance}
+        if long:
+            return {'timestamp': int(candle['timestamp']), 'signal': 'BUY',
+                    'stop_loss': close - stop_distance, 'take_profit': close + target_distance}
+        return {'timestamp': int(candle['timestamp']), 'signal': 'HOLD',
+                'stop_loss': 0.0, 'take_profit': 0.0}
+    
+    def _update_levels(self):
+        """Re-cluster the swing points into sorted resistance / support arrays."""
+        strategy = self.strategy
+        prices, counts = cluster_prices(np.asarray(self.swing_highs), strategy.min_distance_from_level)
+        self.resistance = np.sort(prices[counts >= strategy.min_level_touches])
+        prices, counts = cluster_prices(np.asarray(self.swing_lows), strategy.min_distance_from_level)
+        self.support = np.sort(prices[counts >= strategy.min_level_touches])
+        self.levels_dirty = False
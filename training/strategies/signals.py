@@ -0,0 +1,121 @@
+"""
+SparseSignals - Entry-Only Signal Sets Aligned by Candle Index
+
+Strategy signal DataFrames are dense (one row per evaluated candle) and
+typically > 99% HOLD rows, and BacktestEngine used to merge them back onto
+the candles by timestamp on every evaluation. The training strategies now
+produce their entries as parallel arrays instead:
+
+    signals = strategy.evaluate_sparse(context)
+    signals.index        # int64 candle positions into the source data
+    signals.side         # int8 SIGNAL_BUY / SIGNAL_SELL
+    signals.stop_loss    # float64 per entry
+    signals.take_profit  # float64 per entry
+
+BacktestEngine aligns them by index (no merge), and to_frame() rebuilds
+the dense DataFrame generate_signals() returns for everything else.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..trade_simulator import SIGNAL_BUY, SIGNAL_SELL
+
+
+@dataclass
+class SparseSignals:
+    """Entries of one strategy evaluation (HOLD candles are omitted)."""
+    n_candles: int               # Candles the signals were generated from
+    index: np.ndarray            # int64 candle positions of entries (ascending)
+    side: np.ndarray             # int8: 1 = BUY, -1 = SELL
+    stop_loss: np.ndarray        # float64 per entry
+    take_profit: np.ndarray      # float64 per entry
+    start: int = 0               # First evaluated candle (warm-up candles before it)
+    extras: Dict[str, np.ndarray] = field(default_factory=dict)  # Per-entry strategy columns
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def n_buy(self) -> int:
+        return int((self.side == SIGNAL_BUY).sum())
+
+    @property
+    def n_sell(self) -> int:
+        return int((self.side == SIGNAL_SELL).sum())
+
+    @classmethod
+    def from_entries(
+        cls,
+        n_candles: int,
+        start: int,
+        index: np.ndarray,
+        side: np.ndarray,
+        stop_loss: np.ndarray,
+        take_profit: np.ndarray,
+        **extras: np.ndarray
+    ) -> 'SparseSignals':
+        """Build from per-entry arrays (converted to the canonical dtypes)."""
+        return cls(
+            n_candles=int(n_candles),
+            index=np.asarray(index, dtype=np.int64),
+            side=np.asarray(side, dtype=np.int8),
+            stop_loss=np.asarray(stop_loss, dtype=np.float64),
+            take_profit=np.asarray(take_profit, dtype=np.float64),
+            start=int(start),
+            extras={name: np.asarray(values) for name, values in extras.items()}
+        )
+
+    def dense(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Per-candle simulator arrays.
+
+        Returns:
+            (signal int8 codes, stop_loss, take_profit), each of length n_candles
+        """
+        signal = np.zeros(self.n_candles, dtype=np.int8)
+        stop_loss = np.zeros(self.n_candles, dtype=np.float64)
+        take_profit = np.zeros(self.n_candles, dtype=np.float64)
+        signal[self.index] = self.side
+        stop_loss[self.index] = self.stop_loss
+        take_profit[self.index] = self.take_profit
+        return signal, stop_loss, take_profit
+
+    def to_frame(self, timestamps: Any, fill: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """
+        Dense signals DataFrame (one row per evaluated candle).
+
+        Args:
+            timestamps: Candle timestamps of the source data
+            fill: Value of each extra column on HOLD rows (default 0.0)
+
+        Returns:
+            DataFrame with columns: timestamp, signal, stop_loss, take_profit
+            (+ one column per extra)
+        """
+        n = self.n_candles - self.start
+        rows = self.index - self.start
+
+        signal = np.full(n, 'HOLD', dtype=object)
+        signal[rows] = np.where(self.side == SIGNAL_BUY, 'BUY', 'SELL')
+        stop_loss = np.zeros(n)
+        stop_loss[rows] = self.stop_loss
+        take_profit = np.zeros(n)
+        take_profit[rows] = self.take_profit
+
+        columns = {
+            'timestamp': np.asarray(timestamps)[self.start:self.n_candles].astype(np.int64),
+            'signal': signal,
+            'stop_loss': stop_loss,
+            'take_profit': take_profit
+        }
+        for name, values in self.extras.items():
+            default = (fill or {}).get(name, 0.0)
+            column = np.full(n, default, dtype=object if isinstance(default, str) else np.float64)
+            column[rows] = values
+            columns[name] = column
+
+        return pd.DataFrame(columns)
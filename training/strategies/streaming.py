@@ -0,0 +1,88 @@
+"""
+Streaming Primitives for Incremental (on_candle) Signal Generation
+
+The training strategies offer on_candle(candle) next to generate_signals(data)
+so the live path can run the optimized parameters one closed candle at a
+time. Their stream state is built from these primitives instead of
+re-running the batch code on the whole history: RollingWindow is
+fixed-size (O(window) per candle), while RunningMedian keeps every value
+seen so far (O(log n) per candle, O(n) memory) because the batch versions
+take whole-history medians.
+
+Parity contract: the row on_candle() returns for candle t equals the last
+row of generate_signals(history[:t + 1]) - the batch output when that
+candle is the newest bar. Strategies whose batch version also looks at
+later candles (key levels from all swings, ranges extended by later
+windows) can differ from a full-history batch run for older candles.
+"""
+
+import heapq
+import math
+from collections import deque
+from typing import Any, Mapping
+
+
+def candle_value(candle: Mapping[str, Any], column: str) -> float:
+    """Float value of a candle column (NaN when missing or None)."""
+    value = candle.get(column)
+    return math.nan if value is None else float(value)
+
+
+class RollingWindow:
+    """Last `size` values of a series (rolling mean needs a full window)."""
+
+    def __init__(self, size: int):
+        self.size = max(int(size), 0)
+        self.values = deque(maxlen=self.size)
+
+    def append(self, value: float):
+        self.values.append(value)
+
+    def mean(self) -> float:
+        """Mean of a full window (NaN until `size` values were seen)."""
+        if self.size == 0 or len(self.values) < self.size:
+            return math.nan
+        return math.fsum(self.values) / self.size
+
+    def max(self) -> float:
+        """Max of the values seen so far in the window (NaN when empty)."""
+        return max(self.values) if self.values else math.nan
+
+    def min(self) -> float:
+        """Min of the values seen so far in the window (NaN when empty)."""
+        return min(self.values) if self.values else math.nan
+
+    def sum(self) -> float:
+        return math.fsum(self.values) if self.values else 0.0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class RunningMedian:
+    """Median of every non-NaN value seen so far (two heaps, O(log n) per value)."""
+
+    def __init__(self):
+        self._lower = []  # max-heap (negated)
+        self._upper = []  # min-heap
+
+    def add(self, value: float):
+        if math.isnan(value):
+            return
+        if self._lower and value > -self._lower[0]:
+            heapq.heappush(self._upper, value)
+        else:
+            heapq.heappush(self._lower, -value)
+
+        # Rebalance so len(lower) is len(upper) or len(upper) + 1
+        if len(self._lower) > len(self._upper) + 1:
+            heapq.heappush(self._upper, -heapq.heappop(self._lower))
+        elif len(self._upper) > len(self._lower):
+            heapq.heappush(self._lower, -heapq.heappop(self._upper))
+
+    def median(self) -> float:
+        if not self._lower:
+            return math.nan
+        if len(self._lower) > len(self._upper):
+            return -self._lower[0]
+        return (-self._lower[0] + self._upper[0]) / 2
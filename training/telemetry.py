@@ -0,0 +1,267 @@
+"""
+Telemetry - Phase Timing Histograms for Backtests and Strategies
+
+BacktestEngine and the training strategies wrap their phases (signal
+generation, trade simulation, metrics, key-level detection, ...) in
+timed() blocks. Outside a collect() block these only measure the duration
+for the existing log lines; inside one, every phase is recorded into the
+active TimingCollector as a histogram of durations plus candles processed
+and (optionally) peak traced allocations.
+
+Optimizers run each worker task inside collect(), return the task's
+collector with its results and merge them, so a whole job ends up with one
+histogram per phase:
+
+    with collect() as timings:
+        engine.run_backtest(data, strategy)
+    timings.to_dict()['phases']['backtest.trades']['total_seconds']
+
+Plain event counts (e.g. evaluation cache hits) travel the same way via
+count(name, n) and show up under 'counters'.
+"""
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+import logging
+
+log = logging.getLogger(__name__)
+
+
+# Upper bounds (ms) of the duration histogram buckets; the last bucket is open
+TIME_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, 60000)
+
+
+@dataclass
+class PhaseStats:
+    """Aggregated timings of one phase."""
+    count: int = 0
+    total_seconds: float = 0.0
+    min_seconds: float = float('inf')
+    max_seconds: float = 0.0
+    candles: int = 0
+    alloc_peak_bytes: int = 0      # Largest peak traced allocation of one run
+    alloc_total_bytes: int = 0     # Sum of per-run peaks (for the mean)
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(TIME_BUCKETS_MS) + 1))
+
+    def add(self, seconds: float, candles: int = 0, alloc_bytes: Optional[int] = None):
+        """Record one run of the phase."""
+        self.count += 1
+        self.total_seconds += seconds
+        self.min_seconds = min(self.min_seconds, seconds)
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.candles += candles
+        if alloc_bytes is not None:
+            self.alloc_peak_bytes = max(self.alloc_peak_bytes, alloc_bytes)
+            self.alloc_total_bytes += alloc_bytes
+
+        ms = seconds * 1000
+        bucket = next((k for k, bound in enumerate(TIME_BUCKETS_MS) if ms <= bound), len(TIME_BUCKETS_MS))
+        self.buckets[bucket] += 1
+
+    def merge(self, other: 'PhaseStats'):
+        """Fold another PhaseStats into this one."""
+        self.count += other.count
+        self.total_seconds += other.total_seconds
+        self.min_seconds = min(self.min_seconds, other.min_seconds)
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+        self.candles += other.candles
+        self.alloc_peak_bytes = max(self.alloc_peak_bytes, other.alloc_peak_bytes)
+        self.alloc_total_bytes += other.alloc_total_bytes
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready summary with the histogram keyed by bucket upper bound."""
+        labels = [f"<={bound}ms" for bound in TIME_BUCKETS_MS] + [f">{TIME_BUCKETS_MS[-1]}ms"]
+        return {
+            'count': self.count,
+            'total_seconds': round(self.total_seconds, 6),
+            'mean_seconds': round(self.total_seconds / self.count, 6) if self.count else 0.0,
+            'min_seconds': round(self.min_seconds, 6) if self.count else 0.0,
+            'max_seconds': round(self.max_seconds, 6),
+            'candles': self.candles,
+            'candles_per_sec': round(self.candles / self.total_seconds, 1) if self.total_seconds > 0 else None,
+            'alloc_peak_bytes': self.alloc_peak_bytes,
+            'alloc_mean_bytes': self.alloc_total_bytes // self.count if self.count else 0,
+            'histogram_ms': {label: n for label, n in zip(labels, self.buckets) if n}
+        }
+
+
+class TimingCollector:
+    """
+    Per-job phase timing histograms.
+
+    Picklable, so loky workers can return their collector with the task
+    results and the parent merges them.
+    """
+
+    def __init__(self, track_allocations: bool = False):
+        """
+        Args:
+            track_allocations: Record peak traced allocations per phase
+                               (starts tracemalloc, which slows Python code)
+        """
+        self.track_allocations = track_allocations
+        self.phases: Dict[str, PhaseStats] = {}
+        self.counters: Dict[str, int] = {}
+
+    def record(
+        self,
+        phase: str,
+        seconds: float,
+        candles: int = 0,
+        alloc_bytes: Optional[int] = None
+    ):
+        """Record one run of a phase."""
+        stats = self.phases.get(phase)
+        if stats is None:
+            stats = self.phases[phase] = PhaseStats()
+        stats.add(seconds, candles, alloc_bytes)
+
+    def count(self, name: str, n: int = 1):
+        """Add n to an event counter."""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def merge(self, other: Optional['TimingCollector']) -> 'TimingCollector':
+        """Fold another collector (e.g. from a worker task) into this one."""
+        if other is None:
+            return self
+        for phase, stats in other.phases.items():
+            if phase in self.phases:
+                self.phases[phase].merge(stats)
+            else:
+                self.phases[phase] = PhaseStats()
+                self.phases[phase].merge(stats)
+        for name, n in getattr(other, 'counters', {}).items():
+            self.count(name, n)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-ready report.
+
+        Each component's phases (prefix before the first '.') also get
+        their share of the component's total time, so the dominant phase
+        of e.g. liquidity_sweep is visible at a glance.
+        """
+        component_totals: Dict[str, float] = {}
+        for phase, stats in self.phases.items():
+            component = phase.split('.', 1)[0]
+            component_totals[component] = component_totals.get(component, 0.0) + stats.total_seconds
+
+        phases = {}
+        for phase in sorted(self.phases):
+            summary = self.phases[phase].to_dict()
+            total = component_totals[phase.split('.', 1)[0]]
+            summary['share'] = round(self.phases[phase].total_seconds / total, 4) if total > 0 else 0.0
+            phases[phase] = summary
+
+        return {
+            'track_allocations': self.track_allocations,
+            'phases': phases,
+            'counters': dict(sorted(self.counters.items()))
+        }
+
+
+# Collector receiving timed() phases in this process (None = not collecting)
+_active_collector: Optional[TimingCollector] = None
+
+# Open timed() blocks tracking allocations (for nested peak bookkeeping)
+_alloc_stack: List['timed'] = []
+
+
+@contextmanager
+def collect(collector: Optional[TimingCollector] = None) -> Iterator[TimingCollector]:
+    """
+    Record every timed() phase inside the block into a collector.
+
+    Args:
+        collector: Collector to fill (a new one by default)
+
+    Yields:
+        The active TimingCollector
+    """
+    global _active_collector
+
+    previous = _active_collector
+    _active_collector = collector if collector is not None else TimingCollector()
+
+    started_tracing = _active_collector.track_allocations and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    try:
+        yield _active_collector
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+        _active_collector = previous
+
+
+def count(name: str, n: int = 1):
+    """Add n to an event counter of the active collector (no-op outside collect())."""
+    if _active_collector is not None:
+        _active_collector.count(name, n)
+
+
+class timed:
+    """
+    Context manager timing one phase.
+
+    The duration is always available as .seconds (for log lines); it is
+    recorded only while a collect() block is active.
+
+    Example:
+        with timed('backtest.trades', candles=len(data)) as phase:
+            trade_log = simulate(...)
+        log.info(f"Trade simulation took {phase.seconds:.2f}s")
+    """
+
+    def __init__(self, phase: str, candles: int = 0):
+        self.phase = phase
+        self.candles = candles
+        self.seconds = 0.0
+        self._collector = None
+        self._track = False
+
+    def __enter__(self) -> 'timed':
+        self._collector = _active_collector
+        self._track = (
+            self._collector is not None
+            and self._collector.track_allocations
+            and tracemalloc.is_tracing()
+        )
+
+        if self._track:
+            # Keep the enclosing phase's peak before resetting it for this one
+            current, peak = tracemalloc.get_traced_memory()
+            if _alloc_stack:
+                _alloc_stack[-1]._peak = max(_alloc_stack[-1]._peak, peak)
+            tracemalloc.reset_peak()
+            self._base = current
+            self._peak = current
+            _alloc_stack.append(self)
+
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.seconds = time.perf_counter() - self._start
+
+        if self._collector is None:
+            return False
+
+        alloc_bytes = None
+        if self._track:
+            _alloc_stack.pop()
+            peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+            alloc_bytes = max(peak - self._base, 0)
+            if _alloc_stack:
+                _alloc_stack[-1]._peak = max(_alloc_stack[-1]._peak, peak)
+            tracemalloc.reset_peak()
+
+        if exc_type is None:
+            self._collector.record(self.phase, self.seconds, self.candles, alloc_bytes)
+        return False
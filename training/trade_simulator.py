@@ -0,0 +1,271 @@
+"""
+TradeSimulator - Array-Based Trade Simulation Core
+
+Resolves entries and exits over contiguous NumPy arrays instead of walking
+a merged DataFrame with iterrows(). BacktestEngine aligns signals to the
+candles once, hands the raw columns to simulate_trades(), and prices the
+resulting trades in a single vectorized pass.
+
+Exits are resolved event-driven: from each entry the simulator jumps
+straight to the exit candle using vectorized first-touch searches for
+SL/TP and binary searches for the next opposite signal. HOLD candles are
+never visited, so cost scales with the number of trades, not candles.
+
+Exit priority (identical to the original per-row loop):
+1. Stop-loss (wins when a candle touches both SL and TP, unless an
+   intrabar hook resolves the bar from lower-timeframe candles)
+2. Take-profit
+3. Maximum holding period (exit at close)
+4. Opposite signal (exit at close, new position opens on the same candle)
+5. End of data (exit at last close)
+"""
+
+import numpy as np
+from typing import Any, Callable, Optional, Tuple
+from dataclasses import dataclass
+import logging
+
+log = logging.getLogger(__name__)
+
+
+# Signal codes used by the simulator
+SIGNAL_HOLD = 0
+SIGNAL_BUY = 1
+SIGNAL_SELL = -1
+
+# Exit reason codes (index into EXIT_REASONS)
+EXIT_SL = 0
+EXIT_TP = 1
+EXIT_MAX_HOLD = 2
+EXIT_SIGNAL = 3
+EXIT_END_OF_DATA = 4
+
+EXIT_REASONS = ('SL', 'TP', 'MAX_HOLD', 'SIGNAL', 'END_OF_DATA')
+
+
+@dataclass
+class SimulatedTrades:
+    """
+    Raw trade records produced by simulate_trades().
+
+    Prices are the un-slipped levels (signal close / SL / TP / exit close);
+    fees, slippage and sizing are applied by BacktestEngine.
+    """
+    entry_idx: np.ndarray    # int64 candle index of entry
+    exit_idx: np.ndarray     # int64 candle index of exit
+    side: np.ndarray         # int8: 1 = LONG, -1 = SHORT
+    entry_price: np.ndarray  # float64 close at entry candle
+    exit_price: np.ndarray   # float64 SL/TP level or exit close
+    stop_loss: np.ndarray    # float64 stop-loss from the entry signal
+    take_profit: np.ndarray  # float64 take-profit from the entry signal
+    exit_reason: np.ndarray  # int8 code into EXIT_REASONS
+
+    def __len__(self) -> int:
+        return len(self.entry_idx)
+
+
+def encode_signals(signals: Any) -> np.ndarray:
+    """
+    Convert 'BUY'/'SELL'/'HOLD' labels to int8 signal codes.
+
+    Anything other than 'BUY' or 'SELL' (including NaN from the
+    timestamp merge) becomes SIGNAL_HOLD.
+    """
+    values = np.asarray(signals, dtype=object)
+    codes = np.zeros(len(values), dtype=np.int8)
+    codes[values == 'BUY'] = SIGNAL_BUY
+    codes[values == 'SELL'] = SIGNAL_SELL
+    return codes
+
+
+def simulate_trades(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    signal: np.ndarray,
+    stop_loss: np.ndarray,
+    take_profit: np.ndarray,
+    max_holding: int,
+    on_trade: Optional[Callable[[int, int, int, float], bool]] = None,
+    intrabar: Optional[Callable[[int, int, float, float], int]] = None
+) -> SimulatedTrades:
+    """
+    Simulate one-position-at-a-time trading over aligned candle arrays.
+    
+    For each entry the exit is the earliest of:
+    - first candle touching SL or TP (SL wins on the same candle)
+    - the max-hold candle (entry + max_holding)
+    - the next opposite signal
+    with the same priority order as the original per-row loop when
+    several land on one candle. Only signal candles and the candles
+    inside each open trade are ever inspected.
+    
+    Args:
+        high, low, close: Candle prices (float64, length n)
+        signal: int8 signal codes (SIGNAL_BUY / SIGNAL_SELL / SIGNAL_HOLD)
+        stop_loss, take_profit: Levels attached to each candle's signal
+        max_holding: Maximum candles to hold a position
+        on_trade: Optional hook called after each closed trade with
+            (entry_idx, exit_idx, side, exit_price); returning True stops
+            the simulation early (used for optimizer abort budgets)
+        intrabar: Optional hook called only for candles touching both SL
+            and TP with (candle_idx, side, sl, tp); returns EXIT_SL or
+            EXIT_TP (see training.intrabar.IntrabarData.resolver)
+    
+    Returns:
+        SimulatedTrades with one entry per closed position
+    """
+    n = len(close)
+    
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    signal = np.asarray(signal, dtype=np.int8)
+    stop_loss = np.asarray(stop_loss, dtype=np.float64)
+    take_profit = np.asarray(take_profit, dtype=np.float64)
+    
+    # Sorted candle indexes of every signal, and per side for opposite lookups
+    signal_idx = np.flatnonzero(signal)
+    buy_idx = np.flatnonzero(signal == SIGNAL_BUY)
+    sell_idx = np.flatnonzero(signal == SIGNAL_SELL)
+    
+    # Holding is checked from the candle after entry, so 0/1 behave the same
+    hold_limit = max(int(max_holding), 1)
+    
+    entry_idx, exit_idx, sides = [], [], []
+    exit_prices, reasons = [], []
+    
+    if len(signal_idx) == 0:
+        return _build_trades(
+            entry_idx, exit_idx, sides, exit_prices, reasons,
+            close, stop_loss, take_profit
+        )
+    
+    i = int(signal_idx[0])
+    
+    while True:
+        side = int(signal[i])
+        sl = stop_loss[i]
+        tp = take_profit[i]
+        
+        # Next opposite signal after entry
+        opposite = sell_idx if side == SIGNAL_BUY else buy_idx
+        k = np.searchsorted(opposite, i, side='right')
+        j_signal = int(opposite[k]) if k < len(opposite) else n
+        
+        j_max_hold = i + hold_limit
+        
+        # SL/TP can only matter up to the first forced exit
+        horizon = min(j_signal, j_max_hold, n - 1)
+        j_touch, touch_reason = _first_touch(high, low, i + 1, horizon, side, sl, tp)
+        
+        if j_touch >= 0:
+            j, reason = j_touch, touch_reason
+            if intrabar is not None and reason == EXIT_SL and _touches_tp(high, low, j, side, tp):
+                reason = intrabar(j, side, sl, tp)
+            price = sl if reason == EXIT_SL else tp
+        elif j_max_hold < n and j_max_hold <= j_signal:
+            j, reason, price = j_max_hold, EXIT_MAX_HOLD, close[j_max_hold]
+        elif j_signal < n:
+            j, reason, price = j_signal, EXIT_SIGNAL, close[j_signal]
+        else:
+            j, reason, price = n - 1, EXIT_END_OF_DATA, close[n - 1]
+        
+        entry_idx.append(i)
+        exit_idx.append(j)
+        sides.append(side)
+        exit_prices.append(price)
+        reasons.append(reason)
+        
+        if reason == EXIT_END_OF_DATA:
+            break
+        
+        if on_trade is not None and on_trade(i, j, side, price):
+            break
+        
+        # A signal on the exit candle opens the next position immediately
+        if signal[j] != SIGNAL_HOLD:
+            i = j
+            continue
+        
+        k = np.searchsorted(signal_idx, j, side='right')
+        if k >= len(signal_idx):
+            break
+        i = int(signal_idx[k])
+    
+    return _build_trades(
+        entry_idx, exit_idx, sides, exit_prices, reasons,
+        close, stop_loss, take_profit
+    )
+
+
+def _first_touch(
+    high: np.ndarray,
+    low: np.ndarray,
+    start: int,
+    stop: int,
+    side: int,
+    sl: float,
+    tp: float,
+    chunk: int = 64
+) -> Tuple[int, int]:
+    """
+    Find the first candle in [start, stop] touching SL or TP.
+    
+    Scans in geometrically growing chunks so short trades touch only a
+    handful of candles while long holds still finish in O(log) steps.
+    
+    Returns:
+        (candle_index, EXIT_SL/EXIT_TP), or (-1, -1) if neither is hit
+    """
+    pos = start
+    
+    while pos <= stop:
+        end = min(stop + 1, pos + chunk)
+        
+        if side == SIGNAL_BUY:
+            sl_hit = low[pos:end] <= sl
+            tp_hit = high[pos:end] >= tp
+        else:
+            sl_hit = high[pos:end] >= sl
+            tp_hit = low[pos:end] <= tp
+        
+        hit = sl_hit | tp_hit
+        if hit.any():
+            offset = int(hit.argmax())
+            return pos + offset, EXIT_SL if sl_hit[offset] else EXIT_TP
+        
+        pos = end
+        chunk *= 2
+    
+    return -1, -1
+
+
+def _touches_tp(high: np.ndarray, low: np.ndarray, j: int, side: int, tp: float) -> bool:
+    """True if candle j reaches the take-profit level."""
+    return high[j] >= tp if side == SIGNAL_BUY else low[j] <= tp
+
+
+def _build_trades(
+    entry_idx: list,
+    exit_idx: list,
+    sides: list,
+    exit_prices: list,
+    reasons: list,
+    close: np.ndarray,
+    stop_loss: np.ndarray,
+    take_profit: np.ndarray
+) -> SimulatedTrades:
+    """Pack per-trade lists into SimulatedTrades arrays."""
+    entries = np.asarray(entry_idx, dtype=np.int64)
+
+    return SimulatedTrades(
+        entry_idx=entries,
+        exit_idx=np.asarray(exit_idx, dtype=np.int64),
+        side=np.asarray(sides, dtype=np.int8),
+        entry_price=np.asarray(close, dtype=np.float64)[entries],
+        exit_price=np.asarray(exit_prices, dtype=np.float64),
+        stop_loss=np.asarray(stop_loss, dtype=np.float64)[entries],
+        take_profit=np.asarray(take_profit, dtype=np.float64)[entries],
+        exit_reason=np.asarray(reasons, dtype=np.int8)
+    )